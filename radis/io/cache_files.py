@@ -29,17 +29,20 @@ See Also
 # Note: don't import unicode_literals because it breaks the df.to_hdf of
 # save_to_hdf because of a stupid unicode/str error in Python 2.7
 import os
-from os.path import exists, splitext
+import shutil
+from os.path import exists, isdir, splitext
 from warnings import warn
 
+import numpy as np
+import pandas as pd
 from packaging.version import parse
 
 import radis
 
 try:
-    from .hdf5 import HDF5Manager
+    from .hdf5 import TIER_INDEX_COLUMNS, HDF5Manager
 except ImportError:  # if file is ran as a module
-    from radis.io.hdf5 import HDF5Manager
+    from radis.io.hdf5 import TIER_INDEX_COLUMNS, HDF5Manager
 from radis.misc.basics import compare_dict, is_float
 from radis.misc.printer import printm, printr
 from radis.misc.warning import DeprecatedFileWarning, IrrelevantFileWarning
@@ -63,6 +66,9 @@ def load_h5_cache_file(
     last_compatible_version=radis.config["OLDEST_COMPATIBLE_VERSION"],
     verbose=True,
     engine="pytables",
+    load_wavenum_min=None,
+    load_wavenum_max=None,
+    load_tiers=None,
 ):
     """Function to load a h5 cache file.
 
@@ -107,6 +113,16 @@ def load_h5_cache_file(
         Note that in such an example, the file data is not read. Only the
         file metadata is. If the metadata does not contain the key (e.g.: ``'wav'``)
         a :py:class:`~radis.misc.warning.DeprecatedFileWarning` is raised.
+    load_wavenum_min, load_wavenum_max: float
+        if the file has a wavenumber block index (see ``wav_block_index`` in
+        :py:func:`~radis.io.cache_files.save_to_hdf`), only the blocks of
+        lines that contain these wavenumbers are read. Else, the full file
+        is read.
+    load_tiers: function
+        if the lines of the file are grouped in tiers of linestrength (see
+        ``int_tiers`` in :py:func:`~radis.io.cache_files.save_to_hdf`),
+        function that returns the boolean array of the tiers to read from the
+        tier index. See :py:meth:`~radis.io.hdf5.HDF5Manager.load`
 
     Returns
     -------
@@ -118,7 +134,7 @@ def load_h5_cache_file(
     if not use_cached:
         return None
     elif use_cached == "regen" and exists(cachefile):
-        os.remove(cachefile)
+        _remove_cache_file(cachefile)
         if verbose:
             printm("Deleted h5 cache file : {0}".format(cachefile))
         return None
@@ -152,7 +168,7 @@ def load_h5_cache_file(
                         cachefile, str(err)
                     )
                 )
-            os.remove(cachefile)
+            _remove_cache_file(cachefile)
             return None
 
     # 4. File is not not deprecated: read the the extremum wavenumbers.    raise
@@ -180,7 +196,14 @@ def load_h5_cache_file(
     try:
         # Load file :
         manager = HDF5Manager(engine)
-        df = manager.load(cachefile, columns=columns, key="df")
+        df = manager.load(
+            cachefile,
+            columns=columns,
+            key="default",
+            wavenum_min=load_wavenum_min,
+            wavenum_max=load_wavenum_max,
+            tiers=load_tiers,
+        )
 
     except KeyError as err:  # An error happened during file reading.
         # Fail safe by deleting cache file (unless we explicitely wanted it
@@ -194,7 +217,7 @@ def load_h5_cache_file(
                     + "{0}:\n{1}\n".format(cachefile, str(err))
                     + "Deleting cache file to regenerate it"
                 )
-            os.remove(cachefile)
+            _remove_cache_file(cachefile)
             df = None
 
     return df
@@ -268,7 +291,7 @@ def check_cache_file(
         compare with ``np.isclose(a,b)`` rather than ``a==b``
     verbose: boolean
         print stuff
-     engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'guess'``
+     engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'npy'``, ``'guess'``
         which HDF5 library to use. If ``'guess'``, try to guess.
 
     Returns
@@ -290,7 +313,7 @@ def check_cache_file(
         return  # we dont want a cache file, no need to test it
     elif use_cached == "regen":
         if exists(fcache):
-            os.remove(fcache)
+            _remove_cache_file(fcache)
             if verbose:
                 print(("Deleted h5 cache file : {0}".format(fcache)))
     elif use_cached == "force":
@@ -323,7 +346,7 @@ def check_cache_file(
                             fcache, str(err)
                         )
                     )
-                os.remove(fcache)
+                _remove_cache_file(fcache)
 
     return
 
@@ -364,7 +387,7 @@ def check_not_deprecated(
         If the file was generated in a non-compatible version, an error is raised.
         (useful parameter to force regeneration of certain cache files after a
          breaking change in a new version)
-    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'guess'``
+    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'npy'``, ``'guess'``
         which HDF5 library to use. If ``'guess'``, try to guess.
     """
     if engine == "guess":
@@ -510,7 +533,7 @@ def check_relevancy(
     ----------------
     key: str
         dataset key in storer.
-    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'guess'``
+    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'npy'``, ``'guess'``
        which HDF5 library to use. If ``'guess'``, try to guess.
 
     Examples
@@ -571,6 +594,8 @@ def save_to_hdf(
     overwrite=True,
     verbose=True,
     engine="pytables",
+    wav_block_index=False,
+    int_tiers=False,
 ):
     """Save energy levels or lines to HDF5 file. Add metadata and version.
 
@@ -598,16 +623,29 @@ def save_to_hdf(
      verbose: bool
          If >=2, also warns if non numeric values are present (it would make
          calculations slower)
-    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'pytables-fixed'``
+    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'pytables-fixed'``, ``'npy'``
         which HDF5 library to use. Note: ``'vaex'``
-        uses ``'h5py'`` compatible HDF5. Default ``pytables``
+        uses ``'h5py'`` compatible HDF5. ``'npy'`` writes a directory of
+        memory-mappable ``.npy`` files, one per column. Default ``pytables``
+    wav_block_index: bool
+        if ``True``, lines must be sorted by wavenumber ``wav``. An index of
+        the wavenumbers of each block of lines is added to the file, so that
+        only the blocks relevant for a given spectral range are read later. See
+        :py:meth:`~radis.io.hdf5.HDF5Manager.add_block_index`. Default ``False``
+    int_tiers: bool
+        if ``True``, lines are grouped in tiers of reference linestrength
+        ``int`` (see :py:func:`~radis.io.cache_files.make_tiers`) and sorted
+        by wavenumber within each tier, and a tier index is added to the
+        file, so that tiers too weak for a given linestrength cutoff can be
+        skipped later. See :py:meth:`~radis.io.hdf5.HDF5Manager.add_tier_index`.
+        Replaces the wavenumber block index. Default ``False``
 
      Notes
      -----
      ``None`` values are not stored
     """
     # Check file
-    assert fname.endswith(".h5") or fname.endswith(".hdf5")
+    assert fname.endswith(".h5") or fname.endswith(".hdf5") or engine == "npy"
     assert "version" not in metadata
     # ... 'object' columns slow everything down (not fixed format strings!)
     if verbose >= 2:
@@ -620,6 +658,11 @@ def save_to_hdf(
     if exists(fname) and not overwrite:
         raise ValueError("File exist: {0}".format(fname))
 
+    # Group lines by tiers of linestrength
+    if int_tiers:
+        df, tier_index = make_tiers(df)
+        wav_block_index = False  # lines are only sorted within each tier
+
     # start by exporting dataframe
     manager = HDF5Manager(engine)
     manager.write(fname, df, append=False, key=key)
@@ -632,11 +675,80 @@ def save_to_hdf(
     metadata.update({"version": version})
 
     manager.add_metadata(fname, metadata)
+    if wav_block_index:
+        manager.add_block_index(fname, df["wav"], key=key)
+    if int_tiers:
+        manager.add_tier_index(fname, tier_index, key=key)
 
     if verbose >= 3:
         print("... saved {0} with metadata: {1}".format(fname, metadata))
 
 
+def make_tiers(df, El_step=1000):
+    """Group the lines of ``df`` in tiers of reference linestrength ``int``:
+    one tier per decade of linestrength (strongest first) and per ``El_step``
+    of lower state energy ``El``. Lines are sorted by wavenumber within each
+    tier.
+
+    Splitting the decades of linestrength by lower state energy keeps the
+    upper bound of the linestrength of a tier at high temperature close to
+    the linestrength of its strongest line.
+
+    Parameters
+    ----------
+    df: pandas DataFrame
+        lines
+    El_step: float (cm-1)
+        range of lower state energies of a tier. Default ``1000``
+
+    Returns
+    -------
+    df: pandas DataFrame
+        lines, grouped by tier
+    tier_index: pandas DataFrame
+        one row per tier, with columns ``start``, ``stop`` (rows of the tier),
+        ``int_max`` (largest reference linestrength), ``El_min`` and ``El_max``
+        (range of lower state energies, ``nan`` if ``El`` is not in ``df``)
+
+    See Also
+    --------
+    :py:meth:`~radis.io.hdf5.HDF5Manager.add_tier_index`
+    """
+    if len(df) == 0:
+        return df, pd.DataFrame(columns=TIER_INDEX_COLUMNS)
+    intensity = df["int"].values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tier = np.floor(np.log10(intensity))
+    tier[~(intensity > 0)] = -np.inf  # null linestrengths in the weakest tier
+    El = df["El"].values if "El" in df else np.full(len(df), np.nan)
+    El_bin = np.nan_to_num(np.floor(El / El_step), nan=-1)
+    order = np.lexsort((df["wav"].values, El_bin, -tier))
+    df = df.take(order).reset_index(drop=True)
+    tier, El_bin, El = tier[order], El_bin[order], El[order]
+
+    new_tier = (tier[1:] != tier[:-1]) | (El_bin[1:] != El_bin[:-1])
+    start = np.flatnonzero(np.r_[True, new_tier])
+    stop = np.r_[start[1:], len(df)]
+    tier_index = pd.DataFrame(
+        {
+            "start": start,
+            "stop": stop,
+            "int_max": np.maximum.reduceat(df["int"].values, start),
+            "El_min": np.minimum.reduceat(El, start),
+            "El_max": np.maximum.reduceat(El, start),
+        }
+    )
+    return df, tier_index
+
+
+def _remove_cache_file(fname):
+    """Delete cache file ``fname`` (a directory for the ``'npy'`` engine)"""
+    if isdir(fname):
+        shutil.rmtree(fname)
+    else:
+        os.remove(fname)
+
+
 def filter_metadata(arguments, discard_variables=["self", "verbose"]):
     """Filter arguments (created with  ``locals()`` at the beginning of the
     script) to extract metadata.
@@ -690,17 +802,61 @@ def cache_file_name(fname, engine="pytables"):
 
     Other Parameters
     ----------------
-    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``
-       which HDF5 library to use. Default ``pytables``
+    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'npy'``
+       which HDF5 library to use. Default ``pytables``. With ``'npy'``, the
+       cache file is a directory.
     """
     if engine in ["pytables", "pytables-fixed"]:
         return splitext(fname)[0] + ".h5"
     elif engine in ["h5py", "vaex"]:
         return splitext(fname)[0] + ".hdf5"
+    elif engine == "npy":
+        return splitext(fname)[0] + "_npy"
     else:
         raise ValueError(engine)
 
 
+def noneq_cache_file_name(fname, calc_Evib_harmonic_anharmonic=False):
+    """Return the name of the file where the non-LTE columns derived from the
+    line database ``fname`` (vibrational/rotational energies, degeneracies)
+    are cached.
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.base.BaseFactory._save_noneq_cache`
+    """
+    if calc_Evib_harmonic_anharmonic:
+        return splitext(fname)[0] + ".noneq_ha.h5"
+    return splitext(fname)[0] + ".noneq.h5"
+
+
+def bands_cache_file_name(fname):
+    """Return the name of the file where the band labels of the lines of the
+    line database ``fname`` are cached.
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.bands.BandFactory._save_bands_cache`
+    """
+    return splitext(fname)[0] + ".bands.h5"
+
+
+def reference_cache_file_name(fname, engine="pytables"):
+    """Return the name of the file where the reference columns derived from
+    the line database ``fname`` (upper state degeneracies, weighted transition
+    moments, Einstein coefficients, unscaled linestrengths) are cached.
+
+    With ``engine='npy'`` the cache is a directory of memory-mappable columns.
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.base.BaseFactory._save_reference_cache`
+    """
+    if engine == "npy":
+        return splitext(fname)[0] + ".ref_npy"
+    return splitext(fname)[0] + ".ref.h5"
+
+
 if __name__ == "__main__":
     import pytest
 
@@ -122,6 +122,8 @@ def cdsd2df(
     load_wavenum_min=None,
     load_wavenum_max=None,
     engine="pytables",
+    int_tiers=False,
+    load_tiers=None,
 ):
     """Convert a CDSD-HITEMP [1]_ or CDSD-4000 [2]_ file to a Pandas dataframe.
 
@@ -153,10 +155,24 @@ def cdsd2df(
         will be left untouched.
     load_wavenum_min, load_wavenum_max: float
         if not ``'None'``, only load the cached file if it contains data for
-        wavenumbers above/below the specified value. See :py:func`~radis.io.cache_files.load_h5_cache_file`.
+        wavenumbers above/below the specified value, and only read the blocks
+        of lines that contain these wavenumbers (lines are returned by blocks:
+        some lines outside of the range are also returned).
+        See :py:func`~radis.io.cache_files.load_h5_cache_file`.
         Default ``'None'``.
-    engine: 'pytables', 'vaex'
-        format for Hdf5 cache file. Default `pytables`
+    engine: 'pytables', 'vaex', 'npy'
+        format for Hdf5 cache file. With 'npy', the cache file is a directory
+        of memory-mapped columns, which are returned as read-only arrays.
+        Default `pytables`
+    int_tiers: bool
+        if ``True``, lines of the cache file are grouped in tiers of
+        linestrength, so that weak tiers can be skipped later with
+        ``load_tiers``. See :py:func:`~radis.io.cache_files.save_to_hdf`.
+        Default ``False``
+    load_tiers: function
+        if the cache file is grouped in tiers of linestrength, function that
+        returns the tiers to read. See :py:func:`~radis.io.cache_files.load_h5_cache_file`.
+        Default ``None``
 
     Returns
     -------
@@ -260,6 +276,9 @@ def cdsd2df(
             last_compatible_version=radis.config["OLDEST_COMPATIBLE_VERSION"],
             verbose=verbose,
             engine=engine,
+            load_wavenum_min=load_wavenum_min,
+            load_wavenum_max=load_wavenum_max,
+            load_tiers=load_tiers,
         )
         if df is not None:
             return df
@@ -275,6 +294,9 @@ def cdsd2df(
 
     # cached file mode but cached file doesn't exist yet (else we had returned)
     if cache:
+        # Sort lines by wavenumber, so that only the blocks of lines relevant
+        # for a spectral range are read from the cache file (see wav_block_index)
+        df.sort_values("wav", ignore_index=True, inplace=True)
         new_metadata = {
             # Last modification time of the original file :
             "last_modification": time.ctime(getmtime(fname)),
@@ -297,16 +319,17 @@ def cdsd2df(
                 overwrite=True,
                 verbose=verbose,
                 engine=engine,
+                wav_block_index=True,
+                int_tiers=int_tiers,
             )
         except PermissionError:
             if verbose:
                 print("An error occured in cache file generation. Lookup access rights")
             pass
 
-    # TODO : get only wavenum above/below 'load_only_wavenum_above', 'load_only_wavenum_below'
-    # by parsing df.wav.   Completely irrelevant files are discarded in 'load_h5_cache_file'
-    # but files that have partly relevant lines are fully loaded.
-    # Note : cache file is generated with the full line list.
+    # Note : cache file is generated with the full line list. Completely irrelevant
+    # files are discarded in 'load_h5_cache_file', and only the blocks of lines
+    # relevant for 'load_wavenum_min', 'load_wavenum_max' are read from the others.
 
     return df
 
@@ -26,7 +26,7 @@ from datetime import date
 import numpy as np
 import pandas as pd
 from dateutil.parser import parse as parse_date
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from numpy import DataSource
 
 LAST_VALID_DATE = (
@@ -362,6 +362,8 @@ class DatabaseManager(object):
             pbar_Ntot_estimate_factor = None
         Nlines_total = 0
         Ntotal_downloads = len(local_files)
+        # Parallelize either on files, or on the chunks of lines of each file
+        parallel_files = parallel and len(local_files) > self.minimum_nfiles
 
         def download_and_parse_one_file(urlname, local_file, Ndownload):
             if verbose:
@@ -383,18 +385,19 @@ class DatabaseManager(object):
                 self.ds,
                 urlname,
                 local_file,
-                pbar_active=(not parallel),
+                pbar_active=(not parallel_files),
                 pbar_t0=time() - t0,
                 pbar_Ntot_estimate_factor=pbar_Ntot_estimate_factor,
                 pbar_Nlines_already=Nlines_total,
                 pbar_last=(Ndownload == Ntotal_downloads),
+                parallel=parallel and not parallel_files,
             )
             # except Exception as err:
             #     raise IOError("Problem parsing `{0}`. Check the error above. It may arise if the file wasn't properly downloaded. Try to delete it".format(self.ds._findfile(urlname))) from err
 
             return Nlines
 
-        if parallel and len(local_files) > self.minimum_nfiles:
+        if parallel_files:
             nJobs = self.nJobs
             batch_size = self.batch_size
             if self.verbose:
@@ -453,19 +456,21 @@ class DatabaseManager(object):
         """
         engine = self.engine
         if engine == "pytables":
-            df_all = []
-            for local_file in local_files:
-                df_all.append(
-                    hdf2df(
-                        local_file,
-                        columns=columns,
-                        isotope=isotope,
-                        load_wavenum_min=load_wavenum_min,
-                        load_wavenum_max=load_wavenum_max,
-                        verbose=self.verbose,
-                        engine=engine,
-                    )
+            # Load files on several threads (accesses to the HDF5 files are
+            # serialized, but not the filtering), and concatenate them in order
+            n_jobs = max(1, min(effective_n_jobs(self.nJobs), len(local_files)))
+            df_all = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(hdf2df)(
+                    local_file,
+                    columns=columns,
+                    isotope=isotope,
+                    load_wavenum_min=load_wavenum_min,
+                    load_wavenum_max=load_wavenum_max,
+                    verbose=self.verbose,
+                    engine=engine,
                 )
+                for local_file in local_files
+            )
             return pd.concat(df_all)
 
         elif engine == "vaex":
@@ -6,6 +6,7 @@ Initial code borrowed from the `Exojax <https://github.com/HajimeKawahara/exojax
 code (which you should also have a look at !), by @HajimeKawahara, under MIT License.
 
 """
+import os
 import pathlib
 import warnings
 
@@ -599,30 +600,15 @@ class MdbExomol(object):
                 self.download(molec, [".trans.bz2"])
 
             if engine == "vaex":
-                if self.trans_file.with_suffix(".hdf5").exists():
-                    trans = vaex.open(self.trans_file.with_suffix(".hdf5"))
-                    cdt = 1
-                    if not np.isneginf(self.nurange[0]):
-                        cdt *= trans.nu_lines > self.nurange[0] - self.margin
-                    if not np.isinf(self.nurange[1]):
-                        cdt *= trans.nu_lines < self.nurange[1] - self.margin
-                    if not np.isneginf(self.crit):
-                        cdt *= trans.Sij0 > self.crit
-                    if cdt != 1:
-                        trans = trans[cdt]
-                    ndtrans = vaex.array_types.to_numpy(trans)
-
-                    # mask has been alraedy applied
-                    mask_needed = False
-                else:
+                if not self.trans_file.with_suffix(".hdf5").exists():
                     print(
                         "Note: Caching line transition data to the HDF5 format with vaex. After the second time, it will become much faster."
                     )
-                    trans = exomolapi.read_trans(self.trans_file, engine="vaex")
-                    ndtrans = vaex.array_types.to_numpy(trans)
+                    self._convert_trans(self.trans_file, ndstates)
+                ndtrans = self._read_trans_cache(self.trans_file.with_suffix(".hdf5"))
 
-                    # mask needs to be applied
-                    mask_needed = True
+                # mask has been already applied
+                mask_needed = False
             elif engine == "feather":
                 if self.trans_file.with_suffix(".feather").exists():
                     trans = pd.read_feather(self.trans_file.with_suffix(".feather"))
@@ -648,7 +634,7 @@ class MdbExomol(object):
                 self._quantumNumbers,
             ) = exomolapi.pickup_gE(ndstates, ndtrans, self.trans_file, dic_def)
 
-            if engine == "vaex" and self.trans_file.with_suffix(".hdf5").exists():
+            if engine == "vaex":
                 # if engine == 'feather' we recompute all the time
                 # Todo : we should get the column name instead ?
                 self.Sij0 = ndtrans[:, 4]
@@ -668,23 +654,10 @@ class MdbExomol(object):
                     T=self.Tref,
                 )
 
-                trans["nu_positive"] = mask_zeronu
-                if engine == "vaex":
-                    # exclude the lines whose nu_lines evaluated inside exomolapi.pickup_gE (thus sometimes different from the "nu_lines" column in trans) is not positive
-
-                    trans = trans[trans.nu_positive].extract()
-                    trans.drop("nu_positive", inplace=True)
-                else:
-                    if False in mask_zeronu:
-                        raise NotImplementedError(
-                            "some wavenumber is not defined;  masking not impleemtend so far in 'feather' engine"
-                        )
-
-                trans["nu_lines"] = self.nu_lines
-                trans["Sij0"] = self.Sij0
-
-                if engine == "vaex":
-                    trans.export(self.trans_file.with_suffix(".hdf5"))
+                if False in mask_zeronu:
+                    raise NotImplementedError(
+                        "some wavenumber is not defined;  masking not impleemtend so far in 'feather' engine"
+                    )
                 #  TODO : implement masking in 'feather' mode
 
         else:  # dic_def["numinf"] is not None
@@ -719,30 +692,15 @@ class MdbExomol(object):
                     # mask needs to be applied   (in feather mode we don't sleect wavneumbers)
                     mask_needed = True
                 elif engine == "vaex":
-                    if trans_file.with_suffix(".hdf5").exists():
-                        trans = vaex.open(trans_file.with_suffix(".hdf5"))
-                        cdt = 1
-                        if not np.isneginf(self.nurange[0]):
-                            cdt *= trans.nu_lines > self.nurange[0] - self.margin
-                        if not np.isinf(self.nurange[1]):
-                            cdt *= trans.nu_lines < self.nurange[1] - self.margin
-                        if not np.isneginf(self.crit):
-                            cdt *= trans.Sij0 > self.crit
-                        if cdt != 1:
-                            trans = trans[cdt]
-                        ndtrans = vaex.array_types.to_numpy(trans)
-
-                        # mask has been already applied
-                        mask_needed = False
-                    else:
+                    if not trans_file.with_suffix(".hdf5").exists():
                         print(
                             "Note: Caching line transition data to the HDF5 format with vaex. After the second time, it will become much faster."
                         )
-                        trans = exomolapi.read_trans(trans_file, engine="vaex")
-                        ndtrans = vaex.array_types.to_numpy(trans)
+                        self._convert_trans(trans_file, ndstates)
+                    ndtrans = self._read_trans_cache(trans_file.with_suffix(".hdf5"))
 
-                        # mask needs to be applied
-                        mask_needed = True
+                    # mask has been already applied
+                    mask_needed = False
                 self.trans_file.append(trans_file)
 
                 # compute gup and elower
@@ -758,7 +716,7 @@ class MdbExomol(object):
                         self._quantumNumbers,
                     ) = exomolapi.pickup_gE(ndstates, ndtrans, trans_file, dic_def)
 
-                    if engine == "vaex" and trans_file.with_suffix(".hdf5").exists():
+                    if engine == "vaex":
                         # Sij0x already stored in cache file
                         self.Sij0 = ndtrans[:, 4]
                     else:
@@ -777,19 +735,10 @@ class MdbExomol(object):
                             T=self.Tref,
                         )
 
-                        # exclude the lines whose nu_lines evaluated inside exomolapi.pickup_gE (thus sometimes different from the "nu_lines" column in trans) is not positive
-                        if engine == "vaex":
-                            trans["nu_positive"] = mask_zeronu
-                            trans = trans[trans.nu_positive].extract()
-                            trans.drop("nu_positive", inplace=True)
-                        else:
-                            if False in mask_zeronu:
-                                raise NotImplementedError(
-                                    "some wavenumber is not defined;  masking not impleemtend so far in 'feather' engine"
-                                )
-
-                        trans["nu_lines"] = self.nu_lines
-                        trans["Sij0"] = self.Sij0
+                        if False in mask_zeronu:
+                            raise NotImplementedError(
+                                "some wavenumber is not defined;  masking not impleemtend so far in 'feather' engine"
+                            )
                 else:  # k!=0
 
                     (
@@ -802,7 +751,7 @@ class MdbExomol(object):
                         mask_zeronu,
                         quantumNumbersx,
                     ) = exomolapi.pickup_gE(ndstates, ndtrans, trans_file, dic_def)
-                    if engine == "vaex" and trans_file.with_suffix(".hdf5").exists():
+                    if engine == "vaex":
                         # Sij0x already stored in cache file
                         Sij0x = ndtrans[:, 4]
                     else:
@@ -821,19 +770,10 @@ class MdbExomol(object):
                             T=self.Tref,
                         )
 
-                        # exclude the lines whose nu_lines evaluated inside exomolapi.pickup_gE (thus sometimes different from the "nu_lines" column in trans) is not positive
-                        if engine == "vaex":
-                            trans["nu_positive"] = mask_zeronu
-                            trans = trans[trans.nu_positive].extract()
-                            trans.drop("nu_positive", inplace=True)
-                        else:
-                            if False in mask_zeronu:
-                                raise NotImplementedError(
-                                    "some wavenumber is not defined;  masking not impleemtend so far in 'feather' engine"
-                                )
-
-                        trans["nu_lines"] = nulx
-                        trans["Sij0"] = Sij0x
+                        if False in mask_zeronu:
+                            raise NotImplementedError(
+                                "some wavenumber is not defined;  masking not impleemtend so far in 'feather' engine"
+                            )
 
                     self._A = np.hstack([self._A, Ax])
                     self.nu_lines = np.hstack([self.nu_lines, nulx])
@@ -847,12 +787,6 @@ class MdbExomol(object):
                             [self._quantumNumbers[key], quantumNumbersx[key]]
                         )
 
-                    if (
-                        engine == "vaex"
-                        and not trans_file.with_suffix(".hdf5").exists()
-                    ):
-                        trans.export(trans_file.with_suffix(".hdf5"))
-
         ### MASKING ###
         mask = (
             (self.nu_lines > self.nurange[0] - self.margin)
@@ -862,6 +796,49 @@ class MdbExomol(object):
 
         self.masking(mask, mask_needed)
 
+    def _convert_trans(self, trans_file, ndstates):
+        """Convert a transition file to its Vaex HDF5 cache file, one chunk of
+        transitions at a time, joining them against a memory-mapped lookup
+        table of the states.
+
+        See :py:func:`~radis.io.exomolapi.convert_trans`
+        """
+        flookup = self.states_file.with_suffix(".lookup.npy")
+        states_lookup = exomolapi.make_states_lookup(ndstates, flookup)
+        try:
+            exomolapi.convert_trans(
+                trans_file,
+                trans_file.with_suffix(".hdf5"),
+                states_lookup,
+                self.QTref,
+                Tref=self.Tref,
+            )
+        finally:
+            del states_lookup  # close the memory-map before deleting the file
+            os.remove(flookup)
+
+    def _read_trans_cache(self, fcache):
+        """Read the transitions of the Vaex HDF5 cache file ``fcache`` in
+        ``nurange`` (+/- ``margin``) and above ``crit``. The selection is done
+        on disk.
+
+        Returns:
+            transition numpy array (i_upper, i_lower, A, nu_lines, Sij0)
+        """
+        import vaex
+
+        trans = vaex.open(fcache)
+        cdt = 1
+        if not np.isneginf(self.nurange[0]):
+            cdt *= trans.nu_lines > self.nurange[0] - self.margin
+        if not np.isinf(self.nurange[1]):
+            cdt *= trans.nu_lines < self.nurange[1] + self.margin
+        if not np.isneginf(self.crit):
+            cdt *= trans.Sij0 > self.crit
+        if cdt != 1:
+            trans = trans[cdt]
+        return vaex.array_types.to_numpy(trans)
+
     def masking(self, mask, mask_needed=True):
         """applying mask and (re)generate jnp.arrays
 
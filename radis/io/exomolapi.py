@@ -161,6 +161,174 @@ def read_trans(transf, engine="vaex"):
     return dat
 
 
+def read_trans_chunks(transf, chunksize=10_000_000):
+    """Exomol IO for a transition file, read by chunks of lines
+
+    Note:
+        Same columns as :py:func:`~radis.io.exomolapi.read_trans`. Only one
+        chunk is in memory at a time, so that line lists larger than the
+        memory can be processed. Compression (``.bz2``) is inferred from the
+        file extension.
+
+    Args:
+        transf: transition file
+        chunksize: number of transitions per chunk
+    Returns:
+        iterator of transition data chunks in pandas DataFrame
+
+    """
+    return pd.read_csv(
+        transf,
+        sep=r"\s+",
+        header=None,
+        names=("i_upper", "i_lower", "A", "nu_lines"),
+        dtype={
+            "i_upper": np.int64,
+            "i_lower": np.int64,
+            "A": np.float64,
+            "nu_lines": np.float64,
+        },
+        chunksize=chunksize,
+    )
+
+
+def make_states_lookup(ndstates, fname):
+    """Write the energies, degeneracies and J of the states in a
+    memory-mapped array indexed by state counting number
+
+    Note:
+        Same layout as the ``newstates`` array of
+        :py:func:`~radis.io.exomolapi.pickup_gE`: states missing from the
+        states file have zero values.
+
+    Args:
+        ndstates: states numpy array - the i, E, g, J are in the 4 first columns
+        fname: ``.npy`` file to write
+    Returns:
+        read-only memory-mapped array ``lookup``, where ``lookup[i]`` is
+        (E, g, J) of state ``i``
+
+    """
+    iorig = np.array(ndstates[:, 0], dtype=int)
+    lookup = np.lib.format.open_memmap(
+        fname, mode="w+", dtype=np.float64, shape=(int(np.max(iorig)) + 1, 3)
+    )  # new files are filled with zeros
+    lookup[iorig, :] = ndstates[:, 1:4]
+    lookup.flush()
+    del lookup
+    return np.load(fname, mmap_mode="r")
+
+
+def convert_trans(
+    transf,
+    fcache,
+    states_lookup,
+    QTref,
+    Tref=296.0,
+    nurange=[-np.inf, np.inf],
+    crit=-np.inf,
+    chunksize=10_000_000,
+):
+    """Convert a transition file to a (column-based) Vaex HDF5 cache file,
+    one chunk of transitions at a time.
+
+    Each chunk is joined against the states lookup table to compute the
+    transition wavenumbers (E_upper - E_lower) and the linestrengths at
+    ``Tref`` (Sij0), filtered, and appended to the cache file. The cache file
+    has the same columns as the one written by
+    :py:class:`~radis.io.exomol.MdbExomol`: i_upper, i_lower, A, nu_lines, Sij0.
+
+    Note:
+        Memory usage is bounded by ``chunksize`` and the size of the states,
+        not by the number of transitions. Transitions with non-positive
+        wavenumbers are always discarded (see
+        :py:func:`~radis.io.exomolapi.pickup_gE`).
+
+    Args:
+        transf: transition file
+        fcache: Vaex HDF5 cache file to write
+        states_lookup: (E, g, J) of the states, indexed by state counting number.
+            See :py:func:`~radis.io.exomolapi.make_states_lookup`
+        QTref: partition function at ``Tref``
+        Tref: reference temperature (K)
+        nurange: only keep transitions in this wavenumber range (cm-1). The
+            range is stored in the cache file metadata. Default: all transitions.
+        crit: only keep transitions with Sij0 above this value
+        chunksize: number of transitions per chunk
+    Returns:
+        number of transitions written to ``fcache``
+
+    """
+    from radis.io.hdf5 import HDF5Manager
+    from radis.lbl.base import linestrength_from_Einstein
+
+    writer = HDF5Manager("vaex")
+    N_written = 0
+    N_zeronu = 0
+    for trans in read_trans_chunks(transf, chunksize=chunksize):
+        i_upper = trans["i_upper"].values
+        i_lower = trans["i_lower"].values
+        elower = states_lookup[i_lower, 0]
+        nu_lines = states_lookup[i_upper, 0] - elower
+
+        positive = nu_lines > 0.0
+        N_zeronu += len(nu_lines) - np.count_nonzero(positive)
+        mask = positive & (nu_lines > nurange[0]) & (nu_lines < nurange[1])
+        i_upper, i_lower, elower, nu_lines = (
+            i_upper[mask],
+            i_lower[mask],
+            elower[mask],
+            nu_lines[mask],
+        )
+        A = trans["A"].values[mask]
+        del trans
+
+        Sij0 = linestrength_from_Einstein(
+            A=A,
+            gu=states_lookup[i_upper, 1],
+            El=elower,
+            Ia=1,  #  Sij0 is a linestrength calculated without taking into account isotopic abundance (see MdbExomol)
+            nu=nu_lines,
+            Q=QTref,
+            T=Tref,
+        )
+        mask = Sij0 > crit
+        df = pd.DataFrame(
+            {
+                "i_upper": i_upper[mask],
+                "i_lower": i_lower[mask],
+                "A": A[mask],
+                "nu_lines": nu_lines[mask],
+                "Sij0": Sij0[mask],
+            }
+        )
+        if len(df) > 0:
+            writer.write(fcache, df, append=True)
+            N_written += len(df)
+
+    if N_written == 0:
+        raise ValueError(
+            f"No transitions of {transf} in range {nurange} with Sij0 > {crit}"
+        )
+    writer.combine_temp_batch_files(fcache)
+    writer.add_metadata(
+        fcache,
+        {"wavenum_min": nurange[0], "wavenum_max": nurange[1], "crit": crit},
+    )
+
+    if N_zeronu > 0:
+        print(
+            "WARNING: {0:,} transitions with the wavenumber=zero in {1} have been ignored.".format(
+                N_zeronu, transf
+            )
+        )
+        print(
+            "This is because the upper and lower state IDs in the transition file indicate the same energy level when referring to the states file for those transitions."
+        )
+
+    return N_written
+
+
 def read_states(statesf, dic_def, engine="vaex"):
     """Exomol IO for a state file
     Note:
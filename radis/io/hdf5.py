@@ -5,12 +5,17 @@ Created on Tue Jan 26 21:27:15 2021
 @author: erwan
 """
 
+import json
 import os
+import shutil
 import sys
-from os.path import exists, expanduser, splitext
+import threading
+from functools import wraps
+from os.path import exists, expanduser, isdir, join, splitext
 from time import time
 
 import h5py
+import numpy as np
 import pandas as pd
 from tables.exceptions import NoSuchNodeError
 
@@ -55,6 +60,31 @@ def update_pytables_to_vaex(fname, remove_initial=False, verbose=True, key="df")
     return fname_vaex
 
 
+_pytables_lock = threading.RLock()
+""" RLock: PyTables (and the HDF5 library below it) is not thread-safe. All
+accesses to ``'pytables'`` files are serialized so that database files can be
+loaded from several threads. See :py:func:`~radis.io.hdf5._pytables_serialized`"""
+
+
+def _pytables_serialized(method):
+    """Decorator for :py:class:`~radis.io.hdf5.HDF5Manager` methods: hold
+    :py:data:`~radis.io.hdf5._pytables_lock` if the engine is a PyTables one."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.engine in ["pytables", "pytables-fixed"]:
+            with _pytables_lock:
+                return method(self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+TIER_INDEX_COLUMNS = ["start", "stop", "int_max", "El_min", "El_max"]
+""" list: columns of the index of the tiers of lines of a line database file.
+See :py:meth:`~radis.io.hdf5.HDF5Manager.add_tier_index`"""
+
+
 class HDF5Manager(object):
     def __init__(self, engine=None):
         """Class to handle all memory-mapping-librairies with one common API
@@ -67,11 +97,15 @@ class HDF5Manager(object):
             'vaex'     > HDF5,  column-based
             'pytables' > Pandas's HDF5,  row-based
             'h5py'     > HDF5
+            'npy'      > directory of memory-mapped .npy files (one per column)
+                         and a JSON metadata file,  column-based
 
         Functions ::
 
             add_metadata
             read_metadata
+            add_block_index
+            read_block_index
             write
             load
             guess_engine
@@ -103,6 +137,7 @@ class HDF5Manager(object):
         else:
             raise NotImplementedError(self.engine)
 
+    @_pytables_serialized
     def write(
         self,
         file,
@@ -167,6 +202,22 @@ class HDF5Manager(object):
                 df.export_hdf5(file, group=key, mode="w")
             except AttributeError:  # case where df is not a Vaex dataFrame but (likely) a Pandas Dataframe
                 vaex.from_pandas(df).export_hdf5(file, group=key, mode="w")
+        elif self.engine == "npy":
+            if append:
+                raise NotImplementedError(
+                    "Cannot append to a 'npy' file. Write the full DataFrame at once"
+                )
+            path = _npy_path(file, key)
+            if exists(path):
+                shutil.rmtree(path)
+            os.makedirs(path)
+            for col in df.columns:
+                arr = np.asarray(df[col])
+                if arr.dtype == object:
+                    # object arrays cannot be memory-mapped : store as fixed-length strings
+                    arr = arr.astype(str)
+                np.save(join(path, f"{col}.npy"), arr, allow_pickle=False)
+            _write_npy_attrs(path, {"columns": list(df.columns), "metadata": {}})
         else:
             raise NotImplementedError(self.engine)
             # h5py is not designed to write Pandas DataFrames
@@ -208,6 +259,7 @@ class HDF5Manager(object):
             )
             self._close_temp_batch_files()
 
+    @_pytables_serialized
     def load(
         self,
         fname,
@@ -215,6 +267,9 @@ class HDF5Manager(object):
         where=None,
         key="default",
         none_if_empty=False,
+        wavenum_min=None,
+        wavenum_max=None,
+        tiers=None,
         **store_kwargs,
     ):
         """
@@ -233,16 +288,76 @@ class HDF5Manager(object):
             group to load from. If ``None``, load from root level. If ``'default'``,
             use engine's default (`/table` for `'vaex'`, `df` for `pytables`,
             root for `h5py` )
+        wavenum_min, wavenum_max: float
+            if the file has a block index (see :py:meth:`~radis.io.hdf5.HDF5Manager.add_block_index`),
+            only read the contiguous blocks of rows that contain wavenumbers
+            in this range. Lines on both sides of the range, in the same
+            blocks, are also returned. Ignored if the file has no block index.
+        tiers: function
+            if the lines of the file are grouped in tiers of linestrength (see
+            :py:meth:`~radis.io.hdf5.HDF5Manager.add_tier_index`), function
+            that takes the tier index (see :py:meth:`~radis.io.hdf5.HDF5Manager.read_tier_index`)
+            and returns a boolean array of the tiers to read. If ``None``, all
+            tiers are read. In both cases the rows of a tiered file are
+            returned sorted by wavenumber. Ignored if the file has no tier
+            index.
+
+            .. note::
+                in a tiered file the rows are not sorted by wavenumber
+                overall, so the block index cannot be used. With the ``'npy'``
+                engine, the ``wavenum_min``, ``wavenum_max`` range is searched
+                in each tier. With the other engines, the selected tiers are
+                read entirely, and the rows out of the range must be
+                discarded by the caller.
 
         Returns
         -------
         pd.DataFrame or vaex.DataFrame
         """
 
+        # Lines grouped in tiers : read the selected tiers only (all tiers if
+        # no selection), and sort them by wavenumber
+        if not isinstance(fname, list):
+            try:
+                tier_index = self.read_tier_index(fname, key=key)
+            except Exception:  # missing file or group : raised by _load_rows below
+                tier_index = None
+            if tier_index is not None:
+                if tiers is None:
+                    selected = np.ones(len(tier_index), dtype=bool)
+                else:
+                    selected = np.asarray(tiers(tier_index), dtype=bool)
+                return self._load_tiers(
+                    fname,
+                    tier_index,
+                    selected,
+                    columns,
+                    where,
+                    key,
+                    wavenum_min,
+                    wavenum_max,
+                    **store_kwargs,
+                )
+
+        # Rows to read, if the file is indexed by blocks of wavenumbers
+        start, stop = None, None
+        if (wavenum_min is not None or wavenum_max is not None) and not isinstance(
+            fname, list
+        ):
+            start, stop = self._get_block_range(fname, wavenum_min, wavenum_max, key)
+
+        return self._load_rows(fname, columns, where, key, start, stop, **store_kwargs)
+
+    def _load_rows(self, fname, columns, where, key, start, stop, **store_kwargs):
+        """Load rows ``start`` to ``stop`` of ``fname`` (all rows if ``None``).
+        See :py:meth:`~radis.io.hdf5.HDF5Manager.load`"""
+
         if self.engine in ["pytables", "pytables-fixed"]:
             fname = expanduser(fname)
             if key == "default":
                 key = "df"
+            if start is not None:
+                store_kwargs.update(start=start, stop=stop)
             try:
                 df = pd.read_hdf(
                     fname, columns=columns, where=where, key=key, **store_kwargs
@@ -299,9 +414,34 @@ class HDF5Manager(object):
                 raise OSError(
                     f"Cannot read {fname}, group `{key}` with Vaex HDF5 library (column-based). It may be a file generated by pytables (row-based). Try (1) using engine='pytables' in the calling function (`hdf2df`, `fetch_hitemp`, etc.)  ; (2) delete the file to re-download and re-parse it (this may take a lot of time !) ;  or (3, recommended) set `import radis; radis.config['AUTO_UPDATE_DATABASE'] = True` in your script to auto-update to Vaex HDF5 file"
                 ) from err
+            if start is not None:
+                df = df[start:stop]  # lazy : only these rows are read
 
             return df
 
+        elif self.engine == "npy":
+            if where is not None:
+                raise NotImplementedError(
+                    "`where` conditions are not implemented with the 'npy' engine. Use `wavenum_min`, `wavenum_max`"
+                )
+            assert len(store_kwargs) == 0
+            path = _npy_path(fname, key)
+            attrs = _read_npy_attrs(path)
+            if columns is None:
+                columns = attrs["columns"]
+            else:  # load only these columns (if they exist)
+                columns = [c for c in columns if c in attrs["columns"]]
+            # Memory-map the columns : data is only read when accessed, and is
+            # shared (page cache) between all processes that read the same file.
+            # Arrays are read-only.
+            df = pd.DataFrame(
+                {
+                    c: np.load(join(path, f"{c}.npy"), mmap_mode="r")[start:stop]
+                    for c in columns
+                },
+                copy=False,
+            )
+
         elif self.engine == "h5py":
             fname = expanduser(fname)
             # TODO: define default key ?
@@ -315,7 +455,7 @@ class HDF5Manager(object):
                     load_from = f[key]
                 out = {}
                 for k in load_from.keys():
-                    out[k] = f[k][()]
+                    out[k] = f[k][start:stop]
             return pd.DataFrame(out)
 
         else:
@@ -323,6 +463,133 @@ class HDF5Manager(object):
 
         return df
 
+    def _load_tiers(
+        self,
+        fname,
+        tier_index,
+        selected,
+        columns,
+        where,
+        key,
+        wavenum_min,
+        wavenum_max,
+        **store_kwargs,
+    ):
+        """Load the rows of the ``selected`` tiers of ``fname``, sorted by
+        wavenumber. See :py:meth:`~radis.io.hdf5.HDF5Manager.load`"""
+        ranges = tier_index.loc[selected, ["start", "stop"]].values.astype(np.int64)
+        if self.engine == "npy":
+            # rows of each tier are sorted by wavenumber : search the
+            # memory-mapped wavenumbers of the tier directly
+            wav = np.load(join(_npy_path(fname, key), "wav.npy"), mmap_mode="r")
+            for r in ranges:
+                tier_wav = wav[r[0] : r[1]]
+                if wavenum_max is not None:
+                    r[1] = r[0] + np.searchsorted(tier_wav, wavenum_max, side="right")
+                if wavenum_min is not None:
+                    r[0] += np.searchsorted(tier_wav, wavenum_min, side="left")
+                r[1] = max(r)
+        if len(ranges) == 0:
+            ranges = [(0, 0)]  # empty DataFrame, with all columns
+        frames = [
+            self._load_rows(
+                fname, columns, where, key, int(start), int(stop), **store_kwargs
+            )
+            for start, stop in ranges
+        ]
+
+        if self.engine == "vaex":
+            import vaex
+
+            df = vaex.concat(frames) if len(frames) > 1 else frames[0]
+            return df.sort("wav") if len(frames) > 1 else df
+        if len(frames) == 1:
+            return frames[0]
+        df = pd.concat(frames, ignore_index=True)
+        order = np.argsort(df["wav"].values, kind="stable")
+        return df.take(order).reset_index(drop=True)
+
+    @_pytables_serialized
+    def add_tier_index(self, fname, tier_index, key="default"):
+        """Add the index of the tiers of lines of ``fname``, so that
+        :py:meth:`~radis.io.hdf5.HDF5Manager.load` can skip the tiers of lines
+        that are too weak.
+
+        Rows of ``fname`` must be grouped by tier, and sorted by wavenumber
+        within each tier. The index is stored as the ``int_tier_index``
+        attribute of group ``key``.
+
+        Parameters
+        ----------
+        fname: str
+            filename
+        tier_index: pd.DataFrame
+            one row per tier, with columns ``start``, ``stop`` (rows of the tier
+            in ``fname``), ``int_max`` (largest reference linestrength),
+            ``El_min`` and ``El_max`` (range of lower state energies).
+            See :py:func:`~radis.io.cache_files.make_tiers`
+        key: str
+            group to add the index to. If ``'default'``, use engine's default
+            (`/table` for `'vaex'`, `df` for `pytables`, root for `h5py` )
+        """
+        values = np.asarray(tier_index[list(TIER_INDEX_COLUMNS)], dtype=np.float64)
+        if self.engine == "npy":
+            path = _npy_path(fname, key)
+            attrs = _read_npy_attrs(path)
+            attrs["int_tier_index"] = values.tolist()
+            _write_npy_attrs(path, attrs)
+            return
+        fname = expanduser(fname)
+        if self.engine in ["pytables", "pytables-fixed"]:
+            if key == "default":
+                key = "df"
+            with pd.HDFStore(fname, mode="a", complib="blosc", complevel=9) as f:
+                f.get_storer(key).attrs.int_tier_index = values
+        elif self.engine in ["h5py", "vaex"]:
+            if key == "default":
+                key = None if self.engine == "h5py" else r"/table"
+            with h5py.File(fname, "a") as hf:
+                attrs = hf.attrs if key is None else hf[key].attrs
+                attrs["int_tier_index"] = values
+        else:
+            raise NotImplementedError(self.engine)
+
+    @_pytables_serialized
+    def read_tier_index(self, fname, key="default"):
+        """Read the tier index of ``fname``, written by
+        :py:meth:`~radis.io.hdf5.HDF5Manager.add_tier_index`.
+
+        Returns
+        -------
+        pd.DataFrame
+            one row per tier, with columns ``start``, ``stop``, ``int_max``,
+            ``El_min``, ``El_max``. ``None`` if the file has no tier index.
+        """
+        if self.engine == "npy":
+            values = _read_npy_attrs(_npy_path(fname, key)).get("int_tier_index")
+        else:
+            fname = expanduser(fname)
+            if self.engine in ["pytables", "pytables-fixed"]:
+                if key == "default":
+                    key = "df"
+                with pd.HDFStore(fname, mode="r") as f:
+                    values = getattr(f.get_storer(key).attrs, "int_tier_index", None)
+            elif self.engine in ["h5py", "vaex"]:
+                if key == "default":
+                    key = None if self.engine == "h5py" else r"/table"
+                with h5py.File(fname, "r") as hf:
+                    attrs = hf.attrs if key is None else hf[key].attrs
+                    values = attrs.get("int_tier_index")
+            else:
+                raise NotImplementedError(self.engine)
+        if values is None:
+            return None
+        return pd.DataFrame(
+            np.asarray(values, dtype=np.float64).reshape(-1, len(TIER_INDEX_COLUMNS)),
+            columns=TIER_INDEX_COLUMNS,
+        )
+
+    @_pytables_serialized
     def add_metadata(
         self, fname: str, metadata: dict, key="default", create_empty_dataset=False
     ):
@@ -397,9 +664,166 @@ class HDF5Manager(object):
                     else:
                         hf[key].attrs.update(_h5_compatible(metadata))
 
+        elif self.engine == "npy":
+            path = _npy_path(fname, key)
+            if create_empty_dataset and not exists(path):
+                os.makedirs(path)
+                _write_npy_attrs(path, {"columns": [], "metadata": {}})
+            attrs = _read_npy_attrs(path)
+            attrs["metadata"].update(_h5_compatible(metadata))
+            _write_npy_attrs(path, attrs)
+
         else:
             raise NotImplementedError(self.engine)
 
+    @_pytables_serialized
+    def add_block_index(self, fname, wav, key="default", block_size=4096):
+        """Add an index of the wavenumbers of each block of rows of ``fname``,
+        so that :py:meth:`~radis.io.hdf5.HDF5Manager.load` can read only the
+        blocks relevant for a given wavenumber range.
+
+        The index is stored as the ``wav_block_index`` (min and max wavenumber
+        of each block) and ``wav_block_size`` attributes of group ``key``.
+        With the ``'npy'`` engine, the memory-mapped ``wav`` column is its own
+        index : the file is only flagged as sorted, and exact rows are read.
+
+        Parameters
+        ----------
+        fname: str
+            filename
+        wav: array
+            wavenumbers of all rows in ``fname``. Must be sorted.
+        key: str
+            group to add the index to. If ``None``, add at root level. If ``'default'``,
+            use engine's default (`/table` for `'vaex'`, `df` for `pytables`,
+            root for `h5py` )
+
+        Other Parameters
+        ----------------
+        block_size: int
+            minimum number of rows per block. Blocks are made larger for large
+            files, so that the index has less than 1000 blocks (attributes of
+            HDF5 files must remain small).
+        """
+        wav = np.asarray(wav)
+        if len(wav) == 0:
+            return
+        if np.any(np.diff(wav) < 0):
+            raise ValueError(f"Rows of {fname} must be sorted by wavenumber")
+        if self.engine == "npy":
+            path = _npy_path(fname, key)
+            attrs = _read_npy_attrs(path)
+            attrs["wav_sorted"] = True
+            _write_npy_attrs(path, attrs)
+            return
+        block_size = max(block_size, int(np.ceil(len(wav) / 1000)))
+        first_rows = np.arange(0, len(wav), block_size)
+        last_rows = np.minimum(first_rows + block_size, len(wav)) - 1
+        block_index = np.array([wav[first_rows], wav[last_rows]])
+
+        fname = expanduser(fname)
+        if self.engine in ["pytables", "pytables-fixed"]:
+            if key == "default":
+                key = "df"
+            with pd.HDFStore(fname, mode="a", complib="blosc", complevel=9) as f:
+                attrs = f.get_storer(key).attrs
+                attrs.wav_block_index = block_index
+                attrs.wav_block_size = block_size
+        elif self.engine in ["h5py", "vaex"]:
+            if key == "default":
+                key = None if self.engine == "h5py" else r"/table"
+            with h5py.File(fname, "a") as hf:
+                attrs = hf.attrs if key is None else hf[key].attrs
+                attrs["wav_block_index"] = block_index
+                attrs["wav_block_size"] = block_size
+        else:
+            raise NotImplementedError(self.engine)
+
+    @_pytables_serialized
+    def read_block_index(self, fname, key="default"):
+        """Read the wavenumber block index of ``fname``, written by
+        :py:meth:`~radis.io.hdf5.HDF5Manager.add_block_index`.
+
+        Returns
+        -------
+        block_size: int
+            number of rows per block
+        block_index: array (2 x number of blocks)
+            min and max wavenumbers of each block
+
+        Returns ``None`` if the file has no block index, or with the ``'npy'``
+        engine.
+        """
+        if self.engine == "npy":
+            return None
+        fname = expanduser(fname)
+        if self.engine in ["pytables", "pytables-fixed"]:
+            if key == "default":
+                key = "df"
+            with pd.HDFStore(fname, mode="r") as f:
+                attrs = f.get_storer(key).attrs
+                if "wav_block_index" not in attrs:
+                    return None
+                return int(attrs.wav_block_size), np.asarray(attrs.wav_block_index)
+        elif self.engine in ["h5py", "vaex"]:
+            if key == "default":
+                key = None if self.engine == "h5py" else r"/table"
+            with h5py.File(fname, "r") as hf:
+                attrs = hf.attrs if key is None else hf[key].attrs
+                if "wav_block_index" not in attrs:
+                    return None
+                return int(attrs["wav_block_size"]), attrs["wav_block_index"][()]
+        else:
+            raise NotImplementedError(self.engine)
+
+    @_pytables_serialized
+    def _get_block_range(self, fname, wavenum_min, wavenum_max, key="default"):
+        """Get the first and last rows of the blocks of ``fname`` that contain
+        wavenumbers between ``wavenum_min`` and ``wavenum_max``.
+
+        Returns
+        -------
+        start, stop: int
+            rows to read. ``None, None`` if the file has no block index.
+        """
+        if self.engine == "npy":
+            # rows sorted by wavenumber : search the memory-mapped wavenumbers
+            # directly (only a few pages of the file are read)
+            path = _npy_path(fname, key)
+            if not _read_npy_attrs(path).get("wav_sorted", False):
+                return None, None
+            wav = np.load(join(path, "wav.npy"), mmap_mode="r")
+            start = (
+                np.searchsorted(wav, wavenum_min, side="left")
+                if wavenum_min is not None
+                else 0
+            )
+            stop = (
+                np.searchsorted(wav, wavenum_max, side="right")
+                if wavenum_max is not None
+                else len(wav)
+            )
+            return int(start), int(max(start, stop))
+        block_index = self.read_block_index(fname, key=key)
+        if block_index is None:
+            return None, None
+        block_size, (block_wav_min, block_wav_max) = block_index
+        # blocks are sorted : find the first block that ends after wavenum_min,
+        # and the first block that starts after wavenum_max
+        first = (
+            np.searchsorted(block_wav_max, wavenum_min, side="left")
+            if wavenum_min is not None
+            else 0
+        )
+        last = (
+            np.searchsorted(block_wav_min, wavenum_max, side="right")
+            if wavenum_max is not None
+            else len(block_wav_min)
+        )
+        last = max(first, last)
+        return int(first * block_size), int(last * block_size)
+
+    @_pytables_serialized
     def read_metadata(self, fname: str, key="default") -> dict:
         """
         Other Parameters
@@ -459,6 +883,14 @@ class HDF5Manager(object):
                             print(f"Error reading metadata from {fname}")
                             raise err
 
+        elif self.engine == "npy":
+            if isinstance(fname, list):
+                metadata = [
+                    dict(_read_npy_attrs(_npy_path(f, key))["metadata"]) for f in fname
+                ]
+            else:
+                metadata = dict(_read_npy_attrs(_npy_path(fname, key))["metadata"])
+
         else:
             raise NotImplementedError(
                 f"'{self.engine}' is not implemented. Use 'pytables' or 'vaex' ?"
@@ -488,7 +920,9 @@ class HDF5Manager(object):
         # See if it looks like PyTables
         import tables
 
-        if tables.is_pytables_file(file):
+        if isdir(expanduser(file)):
+            engine = "npy"
+        elif tables.is_pytables_file(file):
             engine = "pytables"
         else:
             # Try Vaex
@@ -506,6 +940,34 @@ class HDF5Manager(object):
         return engine
 
 
+def _npy_path(fname, key="default"):
+    """Directory of the ``'npy'`` store ``fname``, group ``key``"""
+    fname = expanduser(fname)
+    if key in ["default", None]:
+        return fname
+    return join(fname, key.strip("/"))
+
+
+def _read_npy_attrs(path):
+    """Read the JSON attributes (column names, metadata) of a ``'npy'`` store"""
+    try:
+        with open(join(path, "attrs.json")) as f:
+            return json.load(f)
+    except FileNotFoundError as err:
+        raise FileNotFoundError(
+            f"{path} is not a 'npy' store (missing `attrs.json`)"
+        ) from err
+
+
+def _write_npy_attrs(path, attrs):
+    """Write the JSON attributes of a ``'npy'`` store"""
+    # write in a temporary file first, so that a store is never left with
+    # incomplete attributes
+    with open(join(path, "attrs.json.tmp"), "w") as f:
+        json.dump(attrs, f, default=lambda v: v.item())  # v: numpy scalars
+    os.replace(join(path, "attrs.json.tmp"), join(path, "attrs.json"))
+
+
 def hdf2df(
     fname,
     columns=None,
@@ -515,6 +977,7 @@ def hdf2df(
     verbose=True,
     store_kwargs={},
     engine="guess",
+    load_tiers=None,
 ):
     """Load a HDF5 line databank into a Pandas DataFrame.
 
@@ -530,15 +993,20 @@ def hdf2df(
         load only certain isotopes : ``'2'``, ``'1,2'``, etc. If ``None``, loads
         everything. Default ``None``.
     load_wavenum_min, load_wavenum_max: float (cm-1)
-        load only specific wavelength.
+        load only specific wavelength. Lines at ``load_wavenum_min`` or
+        ``load_wavenum_max`` are included.
 
     Other Parameters
     ----------------
     store_kwargs: dict
         arguments forwarded to :py:meth:`~pandas.io.pytables.read_hdf`
-    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'auto'``
+    engine: ``'h5py'``, ``'pytables'``, ``'vaex'``, ``'npy'``, ``'auto'``
         which HDF5 library to use. If ``'guess'``, try to guess. Note: ``'vaex'``
-        uses ``'h5py'`` compatible HDF5.
+        uses ``'h5py'`` compatible HDF5. With ``'npy'``, columns are read-only
+        memory-mapped arrays.
+    load_tiers: function
+        if the lines of the file are grouped in tiers of linestrength, function
+        that returns the tiers to read. See :py:meth:`~radis.io.hdf5.HDF5Manager.load`
 
     Returns
     -------
@@ -584,13 +1052,13 @@ def hdf2df(
         selection = True
         where = []
         if load_wavenum_min is not None:
-            where.append(f"wav > {load_wavenum_min}")
+            where.append(f"wav >= {load_wavenum_min}")
         if load_wavenum_max is not None:
-            where.append(f"wav < {load_wavenum_max}")
+            where.append(f"wav <= {load_wavenum_max}")
         if isotope:
             where.append(f'iso in {isotope.split(",")}')
 
-    elif engine == "vaex":
+    elif engine in ["vaex", "npy"]:
         # Selection is done after opening the file time in vaex
         # see end of this function
         where = None
@@ -599,7 +1067,15 @@ def hdf2df(
 
     # Load :
     manager = HDF5Manager(engine)
-    df = manager.load(fname, columns=columns, where=where, **store_kwargs)
+    if engine == "npy":
+        # only the rows in the wavenumber range are memory-mapped (if the file
+        # is sorted)
+        store_kwargs = dict(
+            store_kwargs, wavenum_min=load_wavenum_min, wavenum_max=load_wavenum_max
+        )
+    df = manager.load(
+        fname, columns=columns, where=where, tiers=load_tiers, **store_kwargs
+    )
 
     #  Selection in vaex
     if engine == "vaex":
@@ -608,9 +1084,9 @@ def hdf2df(
         selection = True
         b = True
         if load_wavenum_min is not None:
-            b *= df.wav > load_wavenum_min
+            b *= df.wav >= load_wavenum_min
         if load_wavenum_max is not None:
-            b *= df.wav < load_wavenum_max
+            b *= df.wav <= load_wavenum_max
         if isotope is not None:
             from radis.misc.basics import is_float
 
@@ -629,6 +1105,23 @@ def hdf2df(
             columns = [c for c in columns if c in df.columns]
         df = df.to_pandas_df(column_names=columns)
 
+    #  Selection in npy
+    elif engine == "npy":
+        selection = (
+            load_wavenum_min is not None
+            or load_wavenum_max is not None
+            or isotope is not None
+        )
+        b = np.ones(len(df), dtype=bool)
+        if load_wavenum_min is not None:
+            b &= df.wav.values >= load_wavenum_min
+        if load_wavenum_max is not None:
+            b &= df.wav.values <= load_wavenum_max
+        if isotope is not None:
+            b &= df.iso.isin([int(iso) for iso in str(isotope).split(",")]).values
+        if not b.all():  # else, keep the memory-mapped (read-only) columns
+            df = df[b].reset_index(drop=True)
+
     # Read and add metadata in the DataFrame
     metadata = manager.read_metadata(fname)
 
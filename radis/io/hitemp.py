@@ -16,11 +16,17 @@ from os.path import abspath, basename, exists, expanduser, join
 from typing import Union
 
 import numpy as np
+from joblib import Parallel, delayed
 
 try:
     from .dbmanager import DatabaseManager
     from .hdf5 import update_pytables_to_vaex
-    from .hitran import columns_2004, parse_global_quanta, parse_local_quanta
+    from .hitran import (
+        columns_2004,
+        get_quanta_format,
+        parse_global_quanta,
+        parse_local_quanta,
+    )
     from .tools import (
         _create_dtype,
         _get_linereturnformat,
@@ -29,7 +35,12 @@ try:
     )
 except ImportError:  # ran from here
     from radis.io.dbmanager import DatabaseManager
-    from radis.io.hitran import columns_2004, parse_global_quanta, parse_local_quanta
+    from radis.io.hitran import (
+        columns_2004,
+        get_quanta_format,
+        parse_global_quanta,
+        parse_local_quanta,
+    )
     from radis.io.hdf5 import update_pytables_to_vaex
     from radis.io.tools import (
         _create_dtype,
@@ -99,6 +110,59 @@ def get_last(b):
     return b[non_zero]
 
 
+def _read_chunks(gfile, dt, chunksize):
+    """Read ``gfile`` by chunks of ``chunksize`` lines of HITRAN 160-character
+    data, with dtype ``dt``. Yields a new array for each chunk."""
+    b = np.zeros(chunksize, dtype=dt)  # receives the HITRAN 160-character data.
+
+    for nbytes in iter(lambda: gfile.readinto(b), 0):
+
+        if not b[-1]:
+            # End of file flag within the chunk (but does not start
+            # with End of file flag) so nbytes != 0
+            b = get_last(b)
+
+        yield b
+
+        # Reinitialize for next read (the previous chunk may still be parsed)
+        b = np.zeros(chunksize, dtype=dt)
+
+
+def _parse_chunk(b, columns, linereturnformat, molecule, verbose):
+    """Convert a chunk ``b`` of HITRAN 160-character data to a DataFrame and
+    parse quanta. Executed by the workers of
+    :py:meth:`~radis.io.hitemp.HITEMPDatabaseManager.parse_to_local_file`
+
+    Returns
+    -------
+    Nlines: int
+        number of lines in the raw chunk
+    df: pd.DataFrame
+    """
+    # ... quanta with a fixed-width format are not decoded : they are parsed
+    # ... directly from the bytes of the records
+    raw_columns = []
+    for local in [True, False]:
+        quanta_format = get_quanta_format(molecule, local=local)
+        if quanta_format is not None:
+            raw_columns += list(quanta_format)
+
+    df = _ndarray2df(b, columns, linereturnformat, skip_columns=raw_columns)
+
+    # Post-processing :
+    # ... Add local quanta attributes, based on the HITRAN group
+    df = parse_local_quanta(df, molecule, verbose=verbose, raw=b)
+
+    # ... Add global quanta attributes, based on the HITRAN class
+    df = parse_global_quanta(df, molecule, verbose=verbose, raw=b)
+
+    # Switch 'P', 'Q', 'R' to -1, 0, 1
+    if "branch" in df:
+        replace_PQR_with_m101(df)
+
+    return len(b), df
+
+
 class HITEMPDatabaseManager(DatabaseManager):
     def __init__(
         self,
@@ -273,14 +337,27 @@ class HITEMPDatabaseManager(DatabaseManager):
         pbar_Ntot_estimate_factor=None,
         pbar_Nlines_already=0,
         pbar_last=True,
+        parallel=None,
     ):
         """Uncompress ``urlname`` into ``local_file``.
         Also add metadata
 
+        Parsing is pipelined : chunks of ``chunksize`` lines are uncompressed
+        and read in the main process, converted and parsed (quanta) by a pool
+        of ``nJobs`` workers, and written in order by the main process. At most
+        ``2 * nJobs`` chunks are in memory at the same time.
+
         Parameters
         ----------
         opener: an opener with an .open() command
-        gfile : file handler. Filename: for info"""
+        gfile : file handler. Filename: for info
+
+        Other Parameters
+        ----------------
+        parallel: bool, or ``None``
+            if ``True``, parse chunks on ``nJobs`` workers. If ``None``, use
+            the ``parallel`` attribute. Default ``None``.
+        """
 
         # Get linereturn (depends on OS, but file may also have been generated
         # on a different OS. Here we simply read the file to find out)
@@ -291,6 +368,8 @@ class HITEMPDatabaseManager(DatabaseManager):
 
         if not verbose:
             pbar_active = False
+        if parallel is None:
+            parallel = self.parallel
 
         linereturnformat = self.get_linereturn_format(opener, urlname, columns)
 
@@ -320,27 +399,29 @@ class HITEMPDatabaseManager(DatabaseManager):
 
             # assert not(exists(local_file))
 
-            b = np.zeros(chunksize, dtype=dt)  # receives the HITRAN 160-character data.
-
-            for nbytes in iter(lambda: gfile.readinto(b), 0):
-
-                if not b[-1]:
-                    # End of file flag within the chunk (but does not start
-                    # with End of file flag) so nbytes != 0
-                    b = get_last(b)
-
-                df = _ndarray2df(b, columns, linereturnformat)
-
-                # Post-processing :
-                # ... Add local quanta attributes, based on the HITRAN group
-                df = parse_local_quanta(df, molecule, verbose=verbose)
-
-                # ... Add global quanta attributes, based on the HITRAN class
-                df = parse_global_quanta(df, molecule, verbose=verbose)
+            # Reader : uncompress chunks of lines (lazy)
+            chunks = _read_chunks(gfile, dt, chunksize)
+
+            # Workers : convert chunks to DataFrames and parse quanta.
+            # ... chunks are read only when a worker is available (bounded
+            # ... memory) and DataFrames are returned in order
+            if parallel and self.nJobs != 1:
+                parsed_chunks = Parallel(
+                    n_jobs=self.nJobs, return_as="generator", pre_dispatch="2*n_jobs"
+                )(
+                    delayed(_parse_chunk)(
+                        b, columns, linereturnformat, molecule, verbose
+                    )
+                    for b in chunks
+                )
+            else:
+                parsed_chunks = (
+                    _parse_chunk(b, columns, linereturnformat, molecule, verbose)
+                    for b in chunks
+                )
 
-                # Switch 'P', 'Q', 'R' to -1, 0, 1
-                if "branch" in df:
-                    replace_PQR_with_m101(df)
+            # Writer
+            for Nlines_chunk, df in parsed_chunks:
 
                 writer.write(local_file, df, append=True)
 
@@ -349,7 +430,7 @@ class HITEMPDatabaseManager(DatabaseManager):
 
                 Nlines += len(df)
                 Nlines_tot += len(df)
-                Nlines_raw += len(b)
+                Nlines_raw += Nlines_chunk
                 if pbar_Ntot_estimate_factor is None:
                     pbar_Ntot_message = f"{Ntotal_lines_expected:,} lines"
                 else:
@@ -358,10 +439,6 @@ class HITEMPDatabaseManager(DatabaseManager):
                     Nlines_tot,
                     message=f"  Parsed {Nlines_tot:,} / {pbar_Ntot_message}. Wavenumber range {wmin:.2f}-{wmax:.2f} cm-1 is complete.",
                 )
-                # Reinitialize for next read
-                b = np.zeros(
-                    chunksize, dtype=dt
-                )  # receives the HITRAN 160-character data.
         writer.combine_temp_batch_files(local_file)  # used for vaex mode only
         if pbar_last:
             pb.update(
@@ -54,6 +54,7 @@ from radis.io.cache_files import cache_file_name, load_h5_cache_file, save_to_hd
 from radis.io.dbmanager import DatabaseManager
 from radis.io.tools import (
     drop_object_format_columns,
+    parse_fixed_width_bytes,
     parse_hitran_file,
     replace_PQR_with_m101,
 )
@@ -89,6 +90,70 @@ columns_2004 = OrderedDict(
 """ OrderedDict: parsing order of HITRAN 2004 format """
 # fmt: on
 
+# Fixed-width format of the quanta, to parse them directly from the bytes of
+# the records. Same formats as the regular expressions of the
+# _parse_HITRAN_class* and _parse_HITRAN_group* functions.
+# See radis.io.tools.parse_fixed_width_bytes for the syntax.
+# fmt: off
+HITRAN_GLOBAL_QUANTA_FORMAT = [
+    # molecules     # quanta fields: (name, width, characters)
+    (HITRAN_CLASS1, {"globu": [(None, 13, " "), ("vu", 2, "d")],
+                     "globl": [(None, 13, " "), ("vl", 2, "d")]}),
+    (HITRAN_CLASS4, {"globu": [(None, 7, " "), ("v1u", 2, "d"), ("v2u", 2, "d"), ("l2u", 2, "d"), ("v3u", 2, "d")],
+                     "globl": [(None, 7, " "), ("v1l", 2, "d"), ("v2l", 2, "d"), ("l2l", 2, "d"), ("v3l", 2, "d")]}),
+    (HITRAN_CLASS5, {"globu": [(None, 6, " "), ("v1u", 2, "d"), ("v2u", 2, "d"), ("l2u", 2, "d"), ("v3u", 2, "d"), ("ru", 1, "D")],
+                     "globl": [(None, 6, " "), ("v1l", 2, "d"), ("v2l", 2, "d"), ("l2l", 2, "d"), ("v3l", 2, "d"), ("rl", 1, "D")]}),
+    (HITRAN_CLASS6, {"globu": [(None, 9, " "), ("v1u", 2, "-d"), ("v2u", 2, "-d"), ("v3u", 2, "-d")],
+                     "globl": [(None, 9, " "), ("v1l", 2, "-d"), ("v2l", 2, "-d"), ("v3l", 2, "-d")]}),
+]
+""" list: fixed-width format of global quanta, for the HITRAN classes that are parsed.
+See :py:func:`~radis.io.hitran.parse_global_quanta` """
+HITRAN_LOCAL_QUANTA_FORMAT = [
+    (HITRAN_GROUP1, {"locu": [("ju", 3, "d"), ("Kau", 3, "-d"), ("Kcu", 3, "-d"), ("Fu", 5, "."), ("symu", 1, ".")],
+                     "locl": [("jl", 3, "d"), ("Kal", 3, "-d"), ("Kcl", 3, "-d"), ("Fl", 5, "."), ("syml", 1, ".")]}),
+    (HITRAN_GROUP2, {"locu": [(None, 10, " "), ("Fu", 5, ".")],
+                     "locl": [(None, 5, " "), ("branch", 1, "S"), ("jl", 3, "d"), ("syml", 1, "."), ("Fl", 5, ".")]}),
+]
+""" list: fixed-width format of local quanta, for the HITRAN groups that are parsed.
+See :py:func:`~radis.io.hitran.parse_local_quanta` """
+# fmt: on
+
+
+def get_quanta_format(mol, local=True):
+    """Fixed-width format of the local (or global) quanta of molecule ``mol``,
+    or ``None`` if they are not parsed. See :py:data:`~radis.io.hitran.HITRAN_LOCAL_QUANTA_FORMAT`
+    and :py:data:`~radis.io.hitran.HITRAN_GLOBAL_QUANTA_FORMAT`"""
+    for molecules, quanta_format in (
+        HITRAN_LOCAL_QUANTA_FORMAT if local else HITRAN_GLOBAL_QUANTA_FORMAT
+    ):
+        if mol in molecules:
+            return quanta_format
+    return None
+
+
+def _decode_raw_columns(df, raw, quanta_format):
+    """Add the quanta fields of the raw records ``raw`` that could not be
+    parsed to ``df``, as str. Inplace."""
+    if raw is None or quanta_format is None:
+        return
+    for field in quanta_format:
+        if field not in df:
+            df[field] = pd.Series(raw[field], index=df.index).str.decode("utf-8")
+
+
+def _parse_quanta_bytes(df, raw, quanta_format):
+    """Parse quanta directly from the fixed-width bytes of the raw records
+    ``raw`` (lines in the same order as ``df``), with :py:func:`~radis.io.tools.parse_fixed_width_bytes`
+
+    Returns a new DataFrame with the parsed quanta, in the same order as the
+    regular expressions would."""
+    parsed = {}
+    for field, fields_format in quanta_format.items():
+        parsed.update(parse_fixed_width_bytes(raw[field], fields_format))
+        if field in df:
+            del df[field]
+    return pd.concat([df, pd.DataFrame(parsed, index=df.index)], axis=1)
+
 
 def cast_to_int64_with_missing_values(dg, keys):
     """replace missing values of int64 columns with -1"""
@@ -106,6 +171,8 @@ def hit2df(
     load_wavenum_max=None,
     engine="pytables",
     parse_quanta=True,
+    int_tiers=False,
+    load_tiers=None,
 ):
     """Convert a HITRAN/HITEMP [1]_ file to a Pandas dataframe
 
@@ -129,13 +196,27 @@ def hit2df(
         will be left untouched.
     load_wavenum_min, load_wavenum_max: float
         if not ``'None'``, only load the cached file if it contains data for
-        wavenumbers above/below the specified value. See :py:func`~radis.io.cache_files.load_h5_cache_file`.
+        wavenumbers above/below the specified value, and only read the blocks
+        of lines that contain these wavenumbers (lines are returned by blocks:
+        some lines outside of the range are also returned).
+        See :py:func`~radis.io.cache_files.load_h5_cache_file`.
         Default ``'None'``.
-    engine: 'pytables', 'vaex'
-        format for Hdf5 cache file. Default `pytables`
+    engine: 'pytables', 'vaex', 'npy'
+        format for Hdf5 cache file. With 'npy', the cache file is a directory
+        of memory-mapped columns, which are returned as read-only arrays.
+        Default `pytables`
     parse_quanta: bool
         if ``True``, parse local & global quanta (required to identify lines
         for non-LTE calculations ; but sometimes lines are not labelled.)
+    int_tiers: bool
+        if ``True``, lines of the cache file are grouped in tiers of
+        linestrength, so that weak tiers can be skipped later with
+        ``load_tiers``. See :py:func:`~radis.io.cache_files.save_to_hdf`.
+        Default ``False``
+    load_tiers: function
+        if the cache file is grouped in tiers of linestrength, function that
+        returns the tiers to read. See :py:func:`~radis.io.cache_files.load_h5_cache_file`.
+        Default ``None``
 
     Returns
     -------
@@ -193,6 +274,9 @@ def hit2df(
             last_compatible_version=config["OLDEST_COMPATIBLE_VERSION"],
             verbose=verbose,
             engine=engine,
+            load_wavenum_min=load_wavenum_min,
+            load_wavenum_max=load_wavenum_max,
+            load_tiers=load_tiers,
         )
         if df is not None:
             return df
@@ -209,7 +293,18 @@ def hit2df(
 
     # %% Start reading the full file
 
-    df = parse_hitran_file(fname, columns)
+    # ... quanta with a fixed-width format are not decoded : they are parsed
+    # ... directly from the bytes of the records (see parse_local_quanta)
+    raw_columns = []
+    if parse_quanta:
+        for local in [True, False]:
+            quanta_format = get_quanta_format(mol, local=local)
+            if quanta_format is not None:
+                raw_columns += list(quanta_format)
+    if raw_columns:
+        df, raw = parse_hitran_file(fname, columns, raw_columns=raw_columns)
+    else:
+        df, raw = parse_hitran_file(fname, columns), None
 
     # %% Post processing
 
@@ -238,8 +333,9 @@ def hit2df(
     if parse_quanta:
         # Add local quanta attributes, based on the HITRAN group
         try:
-            df = parse_local_quanta(df, mol, verbose=verbose)
+            df = parse_local_quanta(df, mol, verbose=verbose, raw=raw)
         except ValueError as err:
+            _decode_raw_columns(df, raw, get_quanta_format(mol, local=True))
             # Empty strings (unlabelled lines) have been reported for HITEMP2010-H2O.
             # In this case, do not parse (makes non-equilibrium calculations impossible).
             # see https://github.com/radis/radis/issues/211
@@ -252,8 +348,9 @@ def hit2df(
 
         # Add global quanta attributes, based on the HITRAN class
         try:
-            df = parse_global_quanta(df, mol, verbose=verbose)
+            df = parse_global_quanta(df, mol, verbose=verbose, raw=raw)
         except ValueError as err:
+            _decode_raw_columns(df, raw, get_quanta_format(mol, local=False))
             # Empty strings (unlabelled lines) have been reported for HITEMP2010-H2O.
             # In this case, do not parse (makes non-equilibrium calculations impossible).
             # see https://github.com/radis/radis/issues/211
@@ -272,6 +369,9 @@ def hit2df(
 
     # cached file mode but cached file doesn't exist yet (else we had returned)
     if cache:
+        # Sort lines by wavenumber, so that only the blocks of lines relevant
+        # for a spectral range are read from the cache file (see wav_block_index)
+        df.sort_values("wav", ignore_index=True, inplace=True)
         new_metadata = {
             # Last modification time of the original file :
             "last_modification": time.ctime(getmtime(fname)),
@@ -295,6 +395,8 @@ def hit2df(
                 overwrite=True,
                 verbose=verbose,
                 engine=engine,
+                wav_block_index=True,
+                int_tiers=int_tiers,
             )
         except PermissionError:
             if verbose:
@@ -302,10 +404,9 @@ def hit2df(
                 print("An error occured in cache file generation. Lookup access rights")
             pass
 
-    # TODO : get only wavenum above/below 'load_wavenum_min', 'load_wavenum_max'
-    # by parsing df.wav.   Completely irrelevant files are discarded in 'load_h5_cache_file'
-    # but files that have partly relevant lines are fully loaded.
-    # Note : cache file is generated with the full line list.
+    # Note : cache file is generated with the full line list. Completely irrelevant
+    # files are discarded in 'load_h5_cache_file', and only the blocks of lines
+    # relevant for 'load_wavenum_min', 'load_wavenum_max' are read from the others.
 
     return df
 
@@ -976,7 +1077,7 @@ def _parse_HITRAN_group6(df, verbose=True):
 # %% Reading function
 
 
-def parse_local_quanta(df, mol, verbose=True):
+def parse_local_quanta(df, mol, verbose=True, raw=None):
     r"""
     Parameters
     ----------
@@ -985,8 +1086,21 @@ def parse_local_quanta(df, mol, verbose=True):
 
     mol: str
         molecule name
+
+    Other Parameters
+    ----------------
+    raw: numpy structured array, or ``None``
+        raw records of the lines of ``df`` (see ``raw_columns`` in
+        :py:func:`~radis.io.tools.parse_hitran_file`). If given, quanta are
+        parsed directly from the fixed-width bytes of the ``'locu'``, ``'locl'``
+        fields (see :py:data:`~radis.io.hitran.HITRAN_LOCAL_QUANTA_FORMAT`),
+        which is much faster than regular expressions on strings.
     """
 
+    quanta_format = get_quanta_format(mol, local=True)
+    if raw is not None and quanta_format is not None:
+        return _parse_quanta_bytes(df, raw, quanta_format)
+
     if mol in HITRAN_GROUP1:
         df = _parse_HITRAN_group1(df, verbose=verbose)
     elif mol in HITRAN_GROUP2:
@@ -1007,7 +1121,7 @@ def parse_local_quanta(df, mol, verbose=True):
     return df
 
 
-def parse_global_quanta(df, mol, verbose=True):
+def parse_global_quanta(df, mol, verbose=True, raw=None):
     r"""
 
     Parameters
@@ -1017,8 +1131,21 @@ def parse_global_quanta(df, mol, verbose=True):
 
     mol: str
         molecule name
+
+    Other Parameters
+    ----------------
+    raw: numpy structured array, or ``None``
+        raw records of the lines of ``df`` (see ``raw_columns`` in
+        :py:func:`~radis.io.tools.parse_hitran_file`). If given, quanta are
+        parsed directly from the fixed-width bytes of the ``'globu'``, ``'globl'``
+        fields (see :py:data:`~radis.io.hitran.HITRAN_GLOBAL_QUANTA_FORMAT`),
+        which is much faster than regular expressions on strings.
     """
 
+    quanta_format = get_quanta_format(mol, local=False)
+    if raw is not None and quanta_format is not None:
+        return _parse_quanta_bytes(df, raw, quanta_format)
+
     if mol in HITRAN_CLASS1:
         df = _parse_HITRAN_class1(df, verbose=verbose)
     elif mol in HITRAN_CLASS2:
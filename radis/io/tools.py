@@ -9,7 +9,7 @@ import numpy as np
 import pandas as pd
 
 
-def parse_hitran_file(fname, columns, count=-1):
+def parse_hitran_file(fname, columns, count=-1, raw_columns=()):
     """Parse a file under HITRAN ``par`` format. Parsing is done in binary
     format with :py:func:`numpy.fromfile` so it's as fast as possible.
 
@@ -24,11 +24,17 @@ def parse_hitran_file(fname, columns, count=-1):
     ----------------
     count: int
         number of lines to read. If ``-1`` reads all file.
+    raw_columns: list of str
+        these columns are not decoded in the DataFrame. If not empty, the
+        raw records are also returned, to parse these columns directly from
+        their fixed-width bytes (see :py:func:`~radis.io.tools.parse_fixed_width_bytes`)
 
     Returns
     -------
     df: pandas DataFrame
         dataframe with lines
+    data: numpy structured array
+        raw records, only if ``raw_columns``
 
     See Also
     --------
@@ -51,7 +57,10 @@ def parse_hitran_file(fname, columns, count=-1):
     data = _read_hitran_file(fname, columns, count, linereturnformat)
 
     # Return a Pandas dataframe
-    return _ndarray2df(data, columns, linereturnformat)
+    df = _ndarray2df(data, columns, linereturnformat, skip_columns=raw_columns)
+    if raw_columns:
+        return df, data
+    return df
 
 
 def _get_linereturnformat(data, columns, fname=""):
@@ -86,8 +95,13 @@ def _get_linereturnformat(data, columns, fname=""):
     return linereturnformat
 
 
-def _ndarray2df(data, columns, linereturnformat):
-    """ """
+def _ndarray2df(data, columns, linereturnformat, skip_columns=()):
+    """
+    Other Parameters
+    ----------------
+    skip_columns: list of str
+        columns not added to the DataFrame
+    """
 
     # ... Cast to new type
     # This requires to recast all the data already read, but is still the fastest
@@ -100,14 +114,13 @@ def _ndarray2df(data, columns, linereturnformat):
     data = _cast_to_dtype(data, dtype)
 
     # %% Create dataframe
-    df = pd.DataFrame(data.tolist(), columns=list(columns.keys()) + ["_linereturn"])
-
-    # Delete dummy column than handled the line return character
-    del df["_linereturn"]
+    # ... column by column (no intermediate Python tuples). The dummy column
+    # ... than handled the line return character is not added
+    df = pd.DataFrame({k: data[k] for k in columns if k not in skip_columns})
 
     # Update format
     for k, c in columns.items():
-        if c[1] == str:
+        if c[1] == str and k not in skip_columns:
             df[k] = df[k].str.decode("utf-8")
 
     # Strip whitespaces around PQR columns (due to 2 columns jumped)
@@ -117,6 +130,122 @@ def _ndarray2df(data, columns, linereturnformat):
     return df
 
 
+def parse_fixed_width_bytes(b, fields):
+    """Parse fields of the fixed-width bytes array ``b`` (ex: the ``'a15'``
+    quanta of HITRAN records), directly from the bytes, without creating
+    Python strings.
+
+    Equivalent to extracting the fields with a regular expression such as
+    ``r"[ ]{13}(?P<vu>[\d ]{2})"`` on the decoded strings, then converting
+    the integer fields with ``int()``, if ``fields`` spans the full width of
+    ``b`` (fields are always read from the first byte).
+
+    Parameters
+    ----------
+    b: np.ndarray of dtype ``'S{n}'``
+        fixed-width bytes
+    fields: list of tuple ``(name, width, characters)``
+        consecutive fields of ``b``, where ``characters`` is one of :
+
+        - ``' '``: blank (``[ ]``), not returned
+        - ``'d'``: integer padded with blanks (``[\d ]``)
+        - ``'-d'``: signed integer padded with blanks (``[\-\d ]``)
+        - ``'D'``: digits only (``\d``)
+        - ``'.'``: any character, returned as str (``.``)
+        - ``'S'``: non-blank characters, returned as str (``\S``)
+
+    Returns
+    -------
+    out: dict of arrays
+        int64 arrays for integer fields, object arrays of str for others.
+        Lines that do not match the format get ``-1`` (integer fields) or
+        ``nan`` (str fields) for all fields.
+
+    Raises
+    ------
+    ValueError:
+        if a field of a matching line is not a valid integer (ex: blank) ; as
+        ``int()`` would.
+    """
+    n = len(b)
+    width = b.dtype.itemsize
+    B = np.ascontiguousarray(b).view(np.uint8).reshape(n, width)
+
+    is_digit = (B >= 48) & (B <= 57)
+    is_blank = B == 32
+    is_minus = B == 45
+    is_any = (B != 0) & (B != 10)  # as regex ".", NUL is a missing character
+    is_space = is_blank | (B == 9) | ((B >= 10) & (B <= 13))
+    allowed = {
+        " ": is_blank,
+        "d": is_digit | is_blank,
+        "-d": is_digit | is_blank | is_minus,
+        "D": is_digit,
+        ".": is_any,
+        "S": is_any & ~is_space,
+    }
+
+    # Lines that match the format
+    match = np.ones(n, dtype=bool)
+    start = 0
+    for name, w, chars in fields:
+        match &= allowed[chars][:, start : start + w].all(axis=1)
+        start += w
+
+    out = {}
+    start = 0
+    for name, w, chars in fields:
+        field = B[:, start : start + w]
+        if chars in ["d", "-d", "D"]:
+            out[name] = _bytes_to_int64(field, match, name)
+        elif chars in [".", "S"]:
+            values = np.ascontiguousarray(field).view(f"S{w}").ravel()
+            try:
+                values = values.astype(f"U{w}")  # fast, ASCII only
+            except UnicodeDecodeError:
+                values = np.char.decode(values, "utf-8")
+            values = values.astype(object)
+            values[~match] = np.nan
+            out[name] = values
+        start += w
+
+    return out
+
+
+def _bytes_to_int64(field, match, name=""):
+    """Convert the fixed-width bytes ``field`` (2D uint8 array) of the lines
+    ``match`` to integers, as ``int()`` would ; ``-1`` for other lines.
+    See :py:func:`~radis.io.tools.parse_fixed_width_bytes`"""
+    n, w = field.shape
+    is_digit = (field >= 48) & (field <= 57)
+    non_blank = field != 32
+    # first and last non-blank characters
+    first = non_blank.argmax(axis=1)
+    last = w - 1 - non_blank[:, ::-1].argmax(axis=1)
+    pos = np.arange(w)
+    inside = (pos >= first[:, None]) & (pos <= last[:, None])
+    negative = is_digit.any(axis=1) & (field[np.arange(n), first] == 45)
+    # valid integers : optional "-", then digits, and blanks only around
+    digits = inside & ~(negative[:, None] & (pos == first[:, None]))
+    valid = (
+        non_blank.any(axis=1)
+        & (digits == (inside & is_digit)).all(axis=1)
+        & digits.any(axis=1)
+    )
+    if not valid[match].all():
+        i = np.argmax(match & ~valid)
+        raise ValueError(
+            f"invalid literal for int() with base 10: '{field[i].tobytes().decode()}' (`{name}`, line {i})"
+        )
+    # digits are contiguous : blanks and "-" are skipped
+    values = np.zeros(n, dtype=np.int64)
+    for j in range(w):
+        values = np.where(digits[:, j], values * 10 + field[:, j] - 48, values)
+    values[negative] *= -1
+    values[~match] = -1
+    return values
+
+
 def _read_hitran_file(fname, columns, count, linereturnformat):
     """
     Returns
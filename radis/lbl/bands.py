@@ -43,6 +43,7 @@ PRIVATE METHODS
 # TODO: merge common parts of BandList.eq_bands  and SpectrumFactory.eq_spectrum,
 # under a same function call
 
+from os.path import exists
 from time import time
 from warnings import warn
 
@@ -52,6 +53,7 @@ import pandas as pd
 from numpy import exp
 
 from radis.io.hitran import HITRAN_CLASS1, get_molecule
+from radis.lbl.base import _get_isotopes, noneq_key_columns
 from radis.lbl.broadening import BroadenFactory
 from radis.lbl.labels import (
     vib_lvl_name_cdsd_pc,
@@ -74,6 +76,11 @@ from radis.phys.units_astropy import convert_and_strip_units
 from radis.spectrum.equations import calc_radiance
 from radis.spectrum.spectrum import Spectrum
 
+bands_cached_columns = ["band", "viblvl_l", "viblvl_u"]
+""" list: columns of the line database that are persisted in the band cache
+file of the line database. See :py:meth:`~radis.lbl.bands.BandFactory._load_bands_cache`
+"""
+
 # %% BandFactory
 
 
@@ -207,6 +214,7 @@ class BandFactory(BroadenFactory):
         # %% Make sure database is loaded
         if self.df0 is None:
             raise AttributeError("Load databank first (.load_databank())")
+        self._check_skipped_tiers(Tgas)
 
         if not "band" in self.df0:
             self._add_bands()
@@ -222,6 +230,7 @@ class BandFactory(BroadenFactory):
         # First calculate the linestrength at given temperature
         self.calc_linestrength_eq(Tgas)
         self._cutoff_linestrength()
+        self._apply_lines_selection()  # lines are exported band by band
 
         # ----------------------------------------------------------------------
 
@@ -524,6 +533,7 @@ class BandFactory(BroadenFactory):
         self.profiler.start("band_calculation", 1)
         # %% Make sure database is loaded
         self._check_line_databank()
+        self._check_skipped_tiers()  # weak lines only skipped for eq_spectrum
         self._calc_noneq_parameters(vib_distribution, singleTvibmode)
 
         if self.df0 is None:
@@ -548,6 +558,7 @@ class BandFactory(BroadenFactory):
         # ----------------------------------------------------------------------
         # Cutoff linestrength
         self._cutoff_linestrength()
+        self._apply_lines_selection()  # lines are exported band by band
 
         # ----------------------------------------------------------------------
 
@@ -839,10 +850,78 @@ class BandFactory(BroadenFactory):
         verbose = self.verbose
         df = self.df0
 
-        add_bands(df, dbformat, lvlformat, verbose=verbose)  # updates df
+        if not "band" in df and not "band" in self._load_bands_cache(df):
+            add_bands(df, dbformat, lvlformat, verbose=verbose)  # updates df
+            self._save_bands_cache(df)
 
         return None  #  df already updated
 
+    def _get_bands_cache_file(self):
+        """Return the band cache file of the line database, or ``None`` if
+        the line database is not a local file or if cache files are not used.
+        See :py:func:`~radis.io.cache_files.bands_cache_file_name`
+        """
+        from radis.io.cache_files import bands_cache_file_name
+
+        if not self.params.db_use_cached or not self.params.dbpath:
+            return None
+        dbpath = self.params.dbpath.split(",")[0]
+        if not exists(dbpath):  # ex: 'fetched from hitran'
+            return None
+        return bands_cache_file_name(dbpath)
+
+    def _get_bands_cache_metadata(self, df):
+        """Metadata that identify the band labels of ``df``. Band labels only
+        depend on the quantum numbers of the lines (stored in the cache file,
+        see :py:data:`~radis.lbl.base.noneq_key_columns`), on ``dbformat`` and
+        on ``levelsfmt`` : unlike the non-LTE cache, they do not need the
+        energy levels."""
+        return {
+            "dbformat": self.params.dbformat,
+            "levelsfmt": self.params.levelsfmt,
+            "isotopes": {iso: "" for iso in _get_isotopes(df)},
+        }
+
+    def _load_bands_cache(self, df):
+        """Add the band labels (see :py:data:`~radis.lbl.bands.bands_cached_columns`)
+        of a previous run to the line database ``df``, if a valid band cache
+        file exists. See :py:meth:`~radis.lbl.base.BaseFactory._load_lines_cache`
+
+        Returns
+        -------
+        list: names of the columns added to ``df``
+        """
+        fcache = self._get_bands_cache_file()
+        if fcache is None or not exists(fcache):
+            return []
+
+        return self._load_lines_cache(
+            df,
+            fcache,
+            "pytables-fixed",
+            self._get_bands_cache_metadata(df),
+            noneq_key_columns,
+            bands_cached_columns,
+        )
+
+    def _save_bands_cache(self, df):
+        """Persist the band labels of the line database ``df`` in the band
+        cache file of the line database.
+        See :py:meth:`~radis.lbl.base.BaseFactory._save_lines_cache`"""
+        fcache = self._get_bands_cache_file()
+        if fcache is None:
+            return
+
+        self._save_lines_cache(
+            df,
+            fcache,
+            "pytables-fixed",
+            self._get_bands_cache_metadata(df),
+            noneq_key_columns,
+            bands_cached_columns,
+            "Band",
+        )
+
     # Broadening functions: band specific
 
     def _broaden_lines_bands(self, df):
@@ -1203,9 +1282,9 @@ def add_bands(df, dbformat, lvlformat, verbose=True):
 
             band_cdsd = viblvl_l_cdsd + "->" + viblvl_u_cdsd
 
-            df.loc[:, "viblvl_l"] = viblvl_l_cdsd
-            df.loc[:, "viblvl_u"] = viblvl_u_cdsd
-            df.loc[:, "band"] = band_cdsd
+            df["viblvl_l"] = viblvl_l_cdsd
+            df["viblvl_u"] = viblvl_u_cdsd
+            df["band"] = band_cdsd
 
             # Calculate HITRAN format too (to store them))
             if all_in(["v1l", "v2l", "l2l", "v3l"], df):
@@ -1213,9 +1292,9 @@ def add_bands(df, dbformat, lvlformat, verbose=True):
                 viblvl_u_hitran = vib_lvl_name_hitran(df.v1u, df.v2u, df.l2u, df.v3u)
                 band_hitran = viblvl_l_hitran + "->" + viblvl_u_hitran
 
-                df.loc[:, "viblvl_htrn_l"] = viblvl_l_hitran
-                df.loc[:, "viblvl_htrn_u"] = viblvl_u_hitran
-                df.loc[:, "band_htrn"] = band_hitran
+                df["viblvl_htrn_l"] = viblvl_l_hitran
+                df["viblvl_htrn_u"] = viblvl_u_hitran
+                df["band_htrn"] = band_hitran
 
         # 'radis' uses Dunham development based on v1v2l2v3 HITRAN convention
         elif lvlformat in ["radis"]:
@@ -1238,9 +1317,9 @@ def add_bands(df, dbformat, lvlformat, verbose=True):
             viblvl_u_hitran = vib_lvl_name_hitran(df.v1u, df.v2u, df.l2u, df.v3u)
             band_hitran = viblvl_l_hitran + "->" + viblvl_u_hitran
 
-            df.loc[:, "viblvl_l"] = viblvl_l_hitran
-            df.loc[:, "viblvl_u"] = viblvl_u_hitran
-            df.loc[:, "band"] = band_hitran
+            df["viblvl_l"] = viblvl_l_hitran
+            df["viblvl_u"] = viblvl_u_hitran
+            df["band"] = band_hitran
 
         else:
             raise NotImplementedError(
@@ -1263,9 +1342,9 @@ def add_bands(df, dbformat, lvlformat, verbose=True):
 
             vib_lvl_name = vib_lvl_name_hitran_class1
 
-            df.loc[:, "viblvl_l"] = vib_lvl_name(df["vl"])
-            df.loc[:, "viblvl_u"] = vib_lvl_name(df["vu"])
-            df.loc[:, "band"] = df["viblvl_l"] + "->" + df["viblvl_u"]
+            df["viblvl_l"] = vib_lvl_name(df["vl"])
+            df["viblvl_u"] = vib_lvl_name(df["vu"])
+            df["band"] = df["viblvl_l"] + "->" + df["viblvl_u"]
 
         else:
             raise NotImplementedError(
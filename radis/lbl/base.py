@@ -32,6 +32,10 @@ PRIVATE METHODS - CALCULATE SPECTROSCOPIC PARAMETERS
 - :py:meth:`radis.lbl.base.BaseFactory._add_ju`
 - :py:meth:`radis.lbl.base.BaseFactory._add_Eu`
 - :py:meth:`radis.lbl.base.BaseFactory._calc_noneq_parameters`
+- :py:meth:`radis.lbl.base.BaseFactory._load_noneq_cache`
+- :py:meth:`radis.lbl.base.BaseFactory._save_noneq_cache`
+- :py:meth:`radis.lbl.base.BaseFactory._load_reference_cache`
+- :py:meth:`radis.lbl.base.BaseFactory._save_reference_cache`
 - :py:meth:`radis.lbl.base.BaseFactory.calc_weighted_trans_moment`
 - :py:meth:`radis.lbl.base.BaseFactory.calc_einstein_coefficients`
 
@@ -64,6 +68,11 @@ Most methods are written in inherited class with the following inheritance schem
 """
 # TODO: move all CDSD dependant functions _add_Evib123Erot to a specific file for CO2.
 
+import hashlib
+import os
+from ast import literal_eval
+from os.path import exists, splitext
+
 import numpy as np
 import pandas as pd
 from astropy import units as u
@@ -80,7 +89,7 @@ try:  # Proper import
 except ImportError:  # if ran from here
     from radis.lbl.loader import KNOWN_LVLFORMAT, DatabankLoader, df_metadata
 
-from radis.misc.arrays import anynan
+from radis.misc.arrays import anynan, is_sorted
 from radis.misc.basics import all_in, is_float, transfer_metadata
 from radis.misc.debug import printdbg
 from radis.misc.log import printwarn
@@ -93,6 +102,36 @@ from radis.phys.convert import cm2J, nm2cm, nm_air2cm
 from radis.phys.units_astropy import convert_and_strip_units
 from radis.spectrum.utils import print_conditions
 
+noneq_cached_columns = (
+    ["ju", "Eu", "Evibu", "Evibl", "Erotu", "Erotl"]
+    + ["Evibu_h", "Evibu_a", "Evibl_h", "Evibl_a"]
+    + [f"Evib{i}{ul}{ha}" for i in "123" for ul in "ul" for ha in ["", "_h", "_a"]]
+    + ["gju", "gjl", "grotu", "grotl", "gvibu", "gvibl", "gu", "gl"]
+)
+""" list: columns of the line database that are derived from the energy levels
+and the line quantum numbers, and that are persisted in the non-LTE cache file
+of the line database. See :py:meth:`~radis.lbl.base.BaseFactory._load_noneq_cache`
+"""
+
+noneq_key_columns = (
+    ["wav", "iso", "El", "jl", "branch", "vu", "vl"]
+    + ["v1u", "v1l", "v2u", "v2l", "l2u", "l2l", "v3u", "v3l", "ru", "rl"]
+    + ["polyu", "polyl", "wangu", "wangl", "ranku", "rankl"]
+)
+""" list: columns stored in the non-LTE and band cache files to identify the lines
+of the line database (if they are in the line database)"""
+
+reference_cached_columns = ["gu", "Rs2", "Blu", "Bul", "Aul", "S0"]
+""" list: columns of the line database that only depend on the tabulated line
+parameters, the isotopic abundances and the reference temperature, and that are
+persisted in the reference cache file of the line database. See
+:py:meth:`~radis.lbl.base.BaseFactory._load_reference_cache`
+"""
+
+reference_key_columns = ["wav", "iso", "El", "jl", "int", "A", "gp"]
+""" list: columns stored in the reference cache file to check that it
+corresponds to the lines of the line database, row by row"""
+
 
 class BaseFactory(DatabankLoader):
 
@@ -168,6 +207,15 @@ class BaseFactory(DatabankLoader):
         # so far continuum is not exported by default because rescale functions
         # are not defined yet. #TODO
 
+        # zero-copy mode (see _reinitialize): indices of the lines of df1 kept by
+        # the linestrength cutoff (None if all lines are kept), and scratch
+        # buffers of the columns computed for each spectrum
+        self._lines_selection = None
+        self._scratch = {}
+        # last read of each lines cache file that missed lines, reused by the
+        # following save (see _read_lines_cache)
+        self._lines_cache_reads = {}
+
     # %% ======================================================================
     # PUBLIC METHODS
     # ------------------------
@@ -289,6 +337,10 @@ class BaseFactory(DatabankLoader):
     # _add_ju
     # _add_Eu
     # _calc_noneq_parameters
+    # _load_noneq_cache
+    # _save_noneq_cache
+    # _load_reference_cache
+    # _save_reference_cache
     # calc_weighted_trans_moment
     # calc_einstein_coefficients
     # =========================================================================
@@ -494,72 +546,19 @@ class BaseFactory(DatabankLoader):
             energies = self.get_energy_levels(molecule, iso, state)
 
             # only keep vibrational energies
-            # see text for how we define vibrational energy
-            index = ["p", "c"]
-            energies = energies.drop_duplicates(index, inplace=False)
-            # (work on a copy)
-
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
-            energies.set_index(index, inplace=True)
-
-            # Calculate vibrational / rotational levels for all transitions
-            def fillEvibu(r):
-                """
-                Note: we just did a groupby('polyu', 'wangu') so all
-                r.poluy, r.wangu etc. are the same in a group r
-
-                Implementation
-                ------
-                r.polyu.iloc[0],r.wangu.iloc[0],r.ranku.iloc[0]  : [0] because they're
-                            all the same
-                r.ju.iloc[0]  not necessary (same Tvib) but explicitely mentionning it
-                         yields a x20 on performances (60s -> 3s)
-                """
-                r["Evibu"] = energies.at[(r.polyu.iloc[0], r.wangu.iloc[0]), "Evib"]
-                return r
-
-            def fillEvibl(r):
-                # Not: p, c, j, n is a partition and we just did a groupby(these)
-                # so all r.poluy, r.wangu etc. are the same
-                r["Evibl"] = energies.at[(r.polyl.iloc[0], r.wangl.iloc[0]), "Evib"]
-                return r
-
-            #        df['Evibu'] = df.groupby(by=['polyu','wangu','ranku']).apply(fillEvibu)
-            #        df['Evibl'] = df.groupby('polyl','wangl','rankl').apply(Evibl, axis=1)
-            #        %timeit: 43.4s per loop
-
-            # total:  ~ 15s on 460k lines   (probably faster since neq==0.9.20)
-            #            try:
-            # ~ 6.6 s (probably faster since neq==0.9.20 (radis<1.0)
-            df = df.groupby(by=["polyu", "wangu"]).apply(fillEvibu)
-            # ~ 6.6 s (probably faster since neq==0.9.20 (radis<1.0)
-            df = df.groupby(by=["polyl", "wangl"]).apply(fillEvibl)
-            # TODO : use map(dict) version (see _add_EvibErot_CDSD_pcN)
-
-            #            except KeyError:
-            #                import traceback
-            #                traceback.print_exc()
-            #                raise KeyError("{0} -> An error (see above) occured that usually ".format(sys.exc_info()[1]) +
-            #                               "happens when the energy level is not referenced in the database. " +
-            #                               "Check your partition function calculator, and energies " +
-            #                               "for isotope {0} (Factory.parsum_calc['CO2'][{0}]['X'].df)".format(iso))
-
-            # Another version that failed because twice slower than apply() in that case
-            # ~ keep it for information
-            #        Evibdict = energies.set_index(['p','c','N'])['Evib']
-            #        Evibdict = Evibdict.drop_duplicates()
-            #        try:
-            #            dgb = df.groupby(by=['polyu', 'wangu', 'ranku'])
-            #            for (poly, wang, rank), idx in dgb.indices.items(): # ~ 3600 items for 460k lines -> total 15s
-            #                Evib = Evibdict[(poly, wang, rank)]             # ~ 7.15 µs
-            #                df.loc[idx, 'Evibu'] = Evib                     # ~ 4.38ms
-            #
-            #            dgb = df.groupby(by=['polyl', 'wangl', 'rankl'])
-            #            for (poly, wang, rank), idx in dgb.indices.items(): # ~ 3600 items for 460k lines -> total 15s
-            #                Evib = Evibdict[(poly, wang, rank)]             # ~ 7.15 µs
-            #                df.loc[idx, 'Evibl'] = Evib                     # ~ 4.38ms
+            # see text for how we define vibrational energy: first level of
+            # each (p, c) polyad. Lower and upper levels are resolved at once
+            # with int64 keys and a searchsorted (~6.6s x2 with groupby().apply()
+            # on 460k lines, -> < 0.1s)
+            (Evibl, Evibu) = lookup_levels(
+                energies,
+                ["p", "c"],
+                df,
+                [["polyl", "wangl"], ["polyu", "wangu"]],
+                ["Evib"],
+            )
 
-            return df.loc[idx, ["Evibl", "Evibu"]]
+            return np.hstack((Evibl, Evibu))
 
         #        df = df.groupby('iso').apply(lambda x: add_Evib_CDSD_pc_1iso(x, x.name))
 
@@ -647,22 +646,15 @@ class BaseFactory(DatabankLoader):
 
             # only keep vibrational energies
             # see text for how we define vibrational energy
-            index = ["p", "c", "N"]
-            energies = energies.drop_duplicates(index, inplace=False)
-            # (work on a copy)
-
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
-            energies.set_index(index, inplace=True)
-            Evib_dict = dict(list(zip(energies.index, energies.Evib)))
-
-            # Add lower state energy
-            df_pcN = df.set_index(["polyl", "wangl", "rankl"])
-            df["Evibl"] = df_pcN.index.map(Evib_dict.get).values
-            # Add upper state energy
-            df_pcN = df.set_index(["polyu", "wangu", "ranku"])
-            df["Evibu"] = df_pcN.index.map(Evib_dict.get).values
+            (Evibl, Evibu) = lookup_levels(
+                energies,
+                ["p", "c", "N"],
+                df,
+                [["polyl", "wangl", "rankl"], ["polyu", "wangu", "ranku"]],
+                ["Evib"],
+            )
 
-            return df.loc[:, ["Evibl", "Evibu"]]
+            return np.hstack((Evibl, Evibu))
 
         df["Evibl"] = np.nan
         df["Evibu"] = np.nan
@@ -759,28 +751,18 @@ class BaseFactory(DatabankLoader):
             # list of energy levels for given isotope
             energies = self.get_energy_levels(molecule, iso, state)
 
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
-            index = ["p", "c", "j", "N"]
-            #            energies.set_index(index, inplace=True) # cant get it work for some reason
-            # ... (it seems groupby().apply() is building some cache variables and
-            # ... I cant reset the index of energies properly)
-            energies = energies.set_index(index, inplace=False)
-            Evib_dict = dict(list(zip(energies.index, energies.Evib)))
-
-            # Add lower state energy
-            df_pcJN = df.set_index(["polyl", "wangl", "jl", "rankl"])
-            #            for i in df.index:
-            #                df.loc[i, 'Evibl'] = energies.at[i, 'Evib']
-            # the map below is crazy fast compared to above loop
-            df.loc[:, "Evibl"] = df_pcJN.index.map(Evib_dict.get).values
-            # Add upper state energy
-            df_pcJN = df.set_index(["polyu", "wangu", "ju", "ranku"])
-            #            for i in df.index:
-            #                df.loc[i, 'Evibu'] = energies.at[i, 'Evib']
-            # the map below is crazy fast compared to above loop
-            df.loc[:, "Evibu"] = df_pcJN.index.map(Evib_dict.get).values
+            (Evibl, Evibu) = lookup_levels(
+                energies,
+                ["p", "c", "j", "N"],
+                df,
+                [
+                    ["polyl", "wangl", "jl", "rankl"],
+                    ["polyu", "wangu", "ju", "ranku"],
+                ],
+                ["Evib"],
+            )
 
-            return df.loc[:, ["Evibl", "Evibu"]]
+            return np.hstack((Evibl, Evibu))
 
         #        df = df.groupby('iso').apply(lambda x: get_Evib_CDSD_pcJN_1iso(x, x.name))
 
@@ -870,66 +852,20 @@ class BaseFactory(DatabankLoader):
         def get_Evib123_CDSD_pc_1iso(df, iso):
             """Calculate Evib for a given isotope (energies are specific to a
             given isotope)"""
-            # TODO: implement with map() instead (much faster!! see get_Evib_CDSD_* )
-
             energies = self.get_energy_levels(molecule, iso, state)
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
 
             # only keep vibrational energies
-            # see text for how we define vibrational energy
-            index = ["p", "c"]
-            energies = energies.drop_duplicates(index, inplace=False)
-            # (work on a copy)
+            # see text for how we define vibrational energy: first level of
+            # each (p, c) polyad
+            (Evib123l, Evib123u) = lookup_levels(
+                energies,
+                ["p", "c"],
+                df,
+                [["polyl", "wangl"], ["polyu", "wangu"]],
+                ["Evib1", "Evib2", "Evib3"],
+            )
 
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
-            energies.set_index(index, inplace=True)
-
-            # Calculate vibrational / rotational levels for all transitions
-            def fillEvib123u(r):
-                """
-                Note: p, c, j, n is a partition and we just did a groupby(these)
-                # so all r.poluy, r.wangu etc. are the same
-
-                Implementation
-                ------
-                r.polyu.iloc[0],r.wangu.iloc[0],r.ranku.iloc[0]  : [0] because they're
-                            all the same
-                r.ju.iloc[0]  not necessary (same Tvib) but explicitely mentionning it
-                         yields a x20 on performances (60s -> 3s)
-                (probably faster since neq==0.9.20) (radis<1.0)
-                """
-                r["Evib1u"] = energies.at[(r.polyu.iloc[0], r.wangu.iloc[0]), "Evib1"]
-                r["Evib2u"] = energies.at[(r.polyu.iloc[0], r.wangu.iloc[0]), "Evib2"]
-                r["Evib3u"] = energies.at[(r.polyu.iloc[0], r.wangu.iloc[0]), "Evib3"]
-                return r
-
-            def fillEvib123l(r):
-                # Not: p, c, j, n is a partition and we just did a groupby(these)
-                # so all r.poluy, r.wangu etc. are the same
-                r["Evib1l"] = energies.at[(r.polyl.iloc[0], r.wangl.iloc[0]), "Evib1"]
-                r["Evib2l"] = energies.at[(r.polyl.iloc[0], r.wangl.iloc[0]), "Evib2"]
-                r["Evib3l"] = energies.at[(r.polyl.iloc[0], r.wangl.iloc[0]), "Evib3"]
-                return r
-
-            #        df['Evibu'] = df.groupby(by=['polyu','wangu','ranku']).apply(fillEvibu)
-            #        df['Evibl'] = df.groupby('polyl','wangl','rankl').apply(Evibl, axis=1)
-            #        %timeit: 43.4s per loop
-
-            #            try:  # total:  ~ 15s on 460k lines
-            # ~ 6.6 s   (probably faster since neq==0.9.20) (radis<1.0)
-            df = df.groupby(by=["polyu", "wangu"]).apply(fillEvib123u)
-            # ~ 6.6 s   (probably faster since neq==0.9.20) (radis<1.0)
-            df = df.groupby(by=["polyl", "wangl"]).apply(fillEvib123l)
-            #            except KeyError:
-            #                printr("{0} -> An error (see above) occured that usually ".format(sys.exc_info()[1]) +
-            #                       "happens when the energy level is not referenced in the database. " +
-            #                       "Check your partition function calculator, and energies " +
-            #                       "for isotope {0} (Factory.parsum_calc['CO2'][{0}]['X'].df)".format(iso))
-            #                raise
-
-            return df.loc[
-                :, ["Evib1l", "Evib2l", "Evib3l", "Evib1u", "Evib2u", "Evib3u"]
-            ]
+            return np.hstack((Evib123l, Evib123u))
 
         #        df = df.groupby('iso').apply(lambda x: get_Evib123_CDSD_pc_1iso(x, x.name))
 
@@ -1018,23 +954,11 @@ class BaseFactory(DatabankLoader):
             # TODO: for multi-molecule mode: add loops on molecules and states too
 
             # only keep vibrational energies
-            index = ["v"]
-            energies = energies.drop_duplicates(index, inplace=False)
-            # (work on a copy)
-
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
-            energies.set_index(index, inplace=True)
-            Evib_dict = dict(list(zip(energies.index, energies.Evib)))
-
-            # Add lower state energy
-            df_v = df.set_index(["vl"])
-            df["Evibl"] = df_v.index.map(Evib_dict.get).values
-
-            # Add upper state energy
-            df_v = df.set_index(["vu"])
-            df["Evibu"] = df_v.index.map(Evib_dict.get).values
+            (Evibl, Evibu) = lookup_levels(
+                energies, ["v"], df, [["vl"], ["vu"]], ["Evib"]
+            )
 
-            return df.loc[:, ["Evibl", "Evibu"]]
+            return np.hstack((Evibl, Evibu))
 
         df["Evibl"] = np.nan
         df["Evibu"] = np.nan
@@ -1121,33 +1045,15 @@ class BaseFactory(DatabankLoader):
             # (work on a copy)
             energies = energies.drop_duplicates("viblvl", inplace=False)
 
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
-            index = ["v1", "v2", "l2", "v3"]
-            energies.set_index(index, inplace=True)
-            Evib1_dict = dict(list(zip(energies.index, energies.Evib1)))
-            Evib2_dict = dict(list(zip(energies.index, energies.Evib2)))
-            Evib3_dict = dict(list(zip(energies.index, energies.Evib3)))
-
-            # Add lower state energy
-            df_v1v2l2v3 = df.set_index(["v1l", "v2l", "l2l", "v3l"])
-            #            for i in df.index:
-            #                df.loc[i, 'Evib1l'] = energies.at[i, 'Evib1']
-            # the map below is crazy fast compared to above loop
-            df["Evib1l"] = df_v1v2l2v3.index.map(Evib1_dict.get).values
-            df["Evib2l"] = df_v1v2l2v3.index.map(Evib2_dict.get).values
-            df["Evib3l"] = df_v1v2l2v3.index.map(Evib3_dict.get).values
-            # TODO @dev # performance: try getting all 3 values at the same time?
-            # with:  Evib123_dict = dict(list(zip(energies.index, (energies.Evib1, energies.Evib2, energies.Evib3))))
-
-            # Add upper state energy
-            df_v1v2l2v3 = df.set_index(["v1u", "v2u", "l2u", "v3u"])
-            df["Evib1u"] = df_v1v2l2v3.index.map(Evib1_dict.get).values
-            df["Evib2u"] = df_v1v2l2v3.index.map(Evib2_dict.get).values
-            df["Evib3u"] = df_v1v2l2v3.index.map(Evib3_dict.get).values
+            (Evib123l, Evib123u) = lookup_levels(
+                energies,
+                ["v1", "v2", "l2", "v3"],
+                df,
+                [["v1l", "v2l", "l2l", "v3l"], ["v1u", "v2u", "l2u", "v3u"]],
+                ["Evib1", "Evib2", "Evib3"],
+            )
 
-            return df.loc[
-                :, ["Evib1l", "Evib2l", "Evib3l", "Evib1u", "Evib2u", "Evib3u"]
-            ]
+            return np.hstack((Evib123l, Evib123u))
 
         #        df = df.groupby('iso').apply(lambda x: get_Evib123_RADIS_cls5_1iso(x, x.name))
 
@@ -1237,7 +1143,6 @@ class BaseFactory(DatabankLoader):
             and fetch the corresponding vibrational energy from the Energy Level
             Database.
             """
-            # TODO: implement with map() instead (much faster!! see get_Evib_CDSD_* )
 
             # Get the Energy Level Database
             energies = self.get_energy_levels(molecule, iso, state)
@@ -1246,54 +1151,15 @@ class BaseFactory(DatabankLoader):
             energies = energies.drop_duplicates("viblvl", inplace=False)
             # (work on a copy)
 
-            # reindexing to get a direct access to level database (instead of using df.v1==v1 syntax)
-            index = ["v1", "v2", "l2", "v3"]
-            energies.set_index(index, inplace=True)
-            Evib1_h_dict = dict(list(zip(energies.index, energies.Evib1_h)))
-            Evib1_a_dict = dict(list(zip(energies.index, energies.Evib1_a)))
-            Evib2_h_dict = dict(list(zip(energies.index, energies.Evib2_h)))
-            Evib2_a_dict = dict(list(zip(energies.index, energies.Evib2_a)))
-            Evib3_h_dict = dict(list(zip(energies.index, energies.Evib3_h)))
-            Evib3_a_dict = dict(list(zip(energies.index, energies.Evib3_a)))
-
-            # Add lower state energy
-            df_v1v2l2v3 = df.set_index(["v1l", "v2l", "l2l", "v3l"])
-            # the map below is crazy fast compared to above loop
-            df["Evib1l_h"] = df_v1v2l2v3.index.map(Evib1_h_dict.get).values
-            df["Evib1l_a"] = df_v1v2l2v3.index.map(Evib1_a_dict.get).values
-            df["Evib2l_h"] = df_v1v2l2v3.index.map(Evib2_h_dict.get).values
-            df["Evib2l_a"] = df_v1v2l2v3.index.map(Evib2_a_dict.get).values
-            df["Evib3l_h"] = df_v1v2l2v3.index.map(Evib3_h_dict.get).values
-            df["Evib3l_a"] = df_v1v2l2v3.index.map(Evib3_a_dict.get).values
-            # TODO @dev # performance: try getting all 3 values at the same time?
-            # with:  Evib123_dict = dict(list(zip(energies.index, (energies.Evib1, energies.Evib2, energies.Evib3))))
+            (Evib123l_ha, Evib123u_ha) = lookup_levels(
+                energies,
+                ["v1", "v2", "l2", "v3"],
+                df,
+                [["v1l", "v2l", "l2l", "v3l"], ["v1u", "v2u", "l2u", "v3u"]],
+                ["Evib1_h", "Evib1_a", "Evib2_h", "Evib2_a", "Evib3_h", "Evib3_a"],
+            )
 
-            # Add upper state energy
-            df_v1v2l2v3 = df.set_index(["v1u", "v2u", "l2u", "v3u"])
-            df["Evib1u_h"] = df_v1v2l2v3.index.map(Evib1_h_dict.get).values
-            df["Evib1u_a"] = df_v1v2l2v3.index.map(Evib1_a_dict.get).values
-            df["Evib2u_h"] = df_v1v2l2v3.index.map(Evib2_h_dict.get).values
-            df["Evib2u_a"] = df_v1v2l2v3.index.map(Evib2_a_dict.get).values
-            df["Evib3u_h"] = df_v1v2l2v3.index.map(Evib3_h_dict.get).values
-            df["Evib3u_a"] = df_v1v2l2v3.index.map(Evib3_a_dict.get).values
-
-            return df.loc[
-                :,
-                [
-                    "Evib1l_h",
-                    "Evib1l_a",
-                    "Evib2l_h",
-                    "Evib2l_a",
-                    "Evib3l_h",
-                    "Evib3l_a",
-                    "Evib1u_h",
-                    "Evib1u_a",
-                    "Evib2u_h",
-                    "Evib2u_a",
-                    "Evib3u_h",
-                    "Evib3u_a",
-                ],
-            ]
+            return np.hstack((Evib123l_ha, Evib123u_ha))
 
         # Slower than the version below:
         df["Evib1l_h"] = np.nan
@@ -1455,18 +1321,6 @@ class BaseFactory(DatabankLoader):
                 )
 
         # Make sure database has pre-computed non equilibrium quantities
-
-        # ... Make sure upper J' is calculated  (needed to compute populations)
-        if not "ju" in df:
-            self._add_ju(df)
-
-        # ... Make sure upper energy level is calculated (needed to compute populations)
-        if not "Eu" in df:
-            self._add_Eu(df)
-
-        # (Evib, Erot, etc.)
-        # This may be a bottleneck for a first calculation (has to calculate
-        # the nonequilibrium energies)
         calc_Evib_harmonic_anharmonic = vib_distribution in ["treanor"]
         if calc_Evib_harmonic_anharmonic:
             if singleTvibmode:
@@ -1486,6 +1340,25 @@ class BaseFactory(DatabankLoader):
             else:
                 required_columns = ["Evib1l", "Evib2l", "Evib3l"]
 
+        degeneracy_columns = ["gju", "gjl", "gvibu", "gvibl", "gu", "gl"]
+
+        # ... look them up in the non-LTE cache file of the line database first
+        # (skips the energy level lookups entirely)
+        if not all_in(["ju", "Eu"] + required_columns + degeneracy_columns, df):
+            self._load_noneq_cache(df, calc_Evib_harmonic_anharmonic)
+        columns_loaded = set(df.columns)
+
+        # ... Make sure upper J' is calculated  (needed to compute populations)
+        if not "ju" in df:
+            self._add_ju(df)
+
+        # ... Make sure upper energy level is calculated (needed to compute populations)
+        if not "Eu" in df:
+            self._add_Eu(df)
+
+        # (Evib, Erot, etc.)
+        # This may be a bottleneck for a first calculation (has to calculate
+        # the nonequilibrium energies)
         if not all_in(required_columns, df):
             if singleTvibmode:
                 self._add_EvibErot(
@@ -1508,15 +1381,525 @@ class BaseFactory(DatabankLoader):
             )
 
         # ... Make sure degeneracies are calculated
-        if not all_in(["gju", "gjl", "gvibu", "gvibl", "gu", "gl"], df):
+        if not all_in(degeneracy_columns, df):
             self._calc_degeneracies(df)
 
-        if not "Aul" in df:
+        # ... persist the new columns for the next runs
+        if set(df.columns) - columns_loaded:
+            self._save_noneq_cache(df, calc_Evib_harmonic_anharmonic)
+
+        # ... Einstein coefficients (from the reference cache file if possible)
+        if not "Aul" in df and not "Aul" in self._load_reference_cache(df):
             self.calc_weighted_trans_moment()
             self.calc_einstein_coefficients()
+            self._save_reference_cache(df)
 
         self.profiler.stop("check_non_eq_param", "Checked nonequilibrium parameters")
 
+    def _get_noneq_cache_file(self, calc_Evib_harmonic_anharmonic=False):
+        """Return the non-LTE cache file of the line database, or ``None`` if
+        the line database is not a local file or if cache files are not used.
+
+        The non-LTE cache file is stored next to the (first) line database
+        file, i.e. next to the line cache file. See
+        :py:func:`~radis.io.cache_files.noneq_cache_file_name`
+        """
+        from radis.io.cache_files import noneq_cache_file_name
+
+        if not self.params.db_use_cached or not self.params.dbpath:
+            return None
+        dbpath = self.params.dbpath.split(",")[0]
+        if not exists(dbpath):  # ex: 'fetched from hitran'
+            return None
+        return noneq_cache_file_name(dbpath, calc_Evib_harmonic_anharmonic)
+
+    def _get_noneq_cache_metadata(self, df, calc_Evib_harmonic_anharmonic):
+        """Metadata that identify the non-LTE columns of ``df``: ``levelsfmt``,
+        ``dbformat``, ``calc_Evib_harmonic_anharmonic``, and a hash of the
+        energy levels table of each isotope of ``df`` (``'isotopes'``).
+
+        The energy levels are hashed from the tables in memory (rather than
+        from the energy level files), so that energies redefined after loading
+        invalidate the cache too. The lines themselves are identified by the
+        :py:data:`~radis.lbl.base.noneq_key_columns` stored in the cache file.
+
+        Returns ``None`` if the energy levels are not loaded (ex:
+        ``load_energies=False``, or partition functions without energy
+        levels) : the non-LTE cache is not used.
+        """
+        molecule = self.input.molecule
+        state = self.input.state
+
+        levels_hashes = {}
+        for iso in _get_isotopes(df):
+            try:
+                energies = self.get_energy_levels(molecule, iso, state)
+            except (KeyError, AttributeError):  # no energy levels
+                return None
+            levels_hashes[iso] = hashlib.md5(
+                pd.util.hash_pandas_object(energies, index=False).values
+            ).hexdigest()
+
+        return {
+            "molecule": molecule,
+            "state": state,
+            "dbformat": self.params.dbformat,
+            "levelsfmt": self.params.levelsfmt,
+            "calc_Evib_harmonic_anharmonic": calc_Evib_harmonic_anharmonic,
+            "isotopes": levels_hashes,
+        }
+
+    def _load_noneq_cache(self, df, calc_Evib_harmonic_anharmonic=False):
+        """Add the non-LTE columns (energies, degeneracies : see
+        :py:data:`~radis.lbl.base.noneq_cached_columns`) of a previous run to
+        the line database ``df``, if a valid non-LTE cache file exists.
+
+        The cache file is validated with the metadata of
+        :py:meth:`~radis.lbl.base.BaseFactory._get_noneq_cache_metadata`,
+        and the lines of ``df`` are looked up in the cache file (see
+        :py:meth:`~radis.lbl.base.BaseFactory._load_lines_cache`). Columns
+        already in ``df`` are not replaced.
+
+        Returns
+        -------
+        list: names of the columns added to ``df``
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.base.BaseFactory._save_noneq_cache`
+        """
+        fcache = self._get_noneq_cache_file(calc_Evib_harmonic_anharmonic)
+        if fcache is None or not exists(fcache):
+            return []
+        metadata = self._get_noneq_cache_metadata(df, calc_Evib_harmonic_anharmonic)
+        if metadata is None:
+            return []
+
+        added = self._load_lines_cache(
+            df,
+            fcache,
+            "pytables-fixed",
+            metadata,
+            noneq_key_columns,
+            noneq_cached_columns,
+        )
+
+        if self.verbose >= 2 and added:
+            printg(f"Loaded non-LTE columns {added} from {fcache}")
+        return added
+
+    def _save_noneq_cache(self, df, calc_Evib_harmonic_anharmonic=False):
+        """Persist the non-LTE columns of the line database ``df`` (see
+        :py:data:`~radis.lbl.base.noneq_cached_columns`) in the non-LTE cache
+        file of the line database, so that they are not recomputed on the
+        next runs.
+
+        Lines of other wavenumber ranges or isotopes already in the cache file
+        are kept (see :py:meth:`~radis.lbl.base.BaseFactory._save_lines_cache`).
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.base.BaseFactory._load_noneq_cache`
+        """
+        fcache = self._get_noneq_cache_file(calc_Evib_harmonic_anharmonic)
+        if fcache is None:
+            return
+        metadata = self._get_noneq_cache_metadata(df, calc_Evib_harmonic_anharmonic)
+        if metadata is None:
+            return
+
+        columns = self._save_lines_cache(
+            df,
+            fcache,
+            "pytables-fixed",
+            metadata,
+            noneq_key_columns,
+            noneq_cached_columns,
+            "Non-LTE",
+        )
+
+        if self.verbose >= 2 and columns:
+            printg(f"Saved non-LTE columns {columns} in {fcache}")
+
+    def _read_lines_cache(self, df, fcache, engine, metadata, key_columns):
+        """Read the lines cache file ``fcache`` (see
+        :py:meth:`~radis.lbl.base.BaseFactory._save_lines_cache`).
+
+        If the file was read by a :py:meth:`~radis.lbl.base.BaseFactory._load_lines_cache`
+        that missed lines, and was not modified since, that read is reused
+        (once) : the save that follows a missed load does not read the file
+        again.
+
+        Returns
+        -------
+        df_cache: pandas DataFrame, or ``None``
+            lines of the cache file, sorted by wavenumber. ``None`` if the file
+            does not exist, is deprecated (then it is deleted, as line cache
+            files), or does not have the key columns of ``df``.
+        isotopes: dict
+            metadata of each isotope of the cache file
+        """
+        from radis.io.cache_files import load_h5_cache_file
+        from radis.io.hdf5 import HDF5Manager
+
+        metadata = metadata.copy()
+        del metadata["isotopes"]  # checked isotope per isotope
+
+        if not exists(fcache):
+            return None, {}
+        stat = os.stat(fcache)
+        signature = (engine, repr(metadata), stat.st_ino, stat.st_mtime_ns)
+        last_read = self._lines_cache_reads.pop(fcache, None)
+        if last_read is not None and last_read[0] == signature:
+            df_cache, isotopes = last_read[1]
+        else:
+            df_cache = load_h5_cache_file(
+                fcache,
+                True,
+                valid_if_metadata_is=metadata,
+                current_version=radis.__version__,
+                verbose=self.verbose,
+                engine=engine,
+            )
+            if df_cache is None:
+                return None, {}
+            file_metadata = HDF5Manager(engine).read_metadata(fcache, key="default")
+            if "isotopes" not in file_metadata:  # written by an older version
+                return None, {}
+            isotopes = literal_eval(file_metadata["isotopes"])
+            self._lines_cache_reads[fcache] = (signature, (df_cache, isotopes))
+        if not all_in(_get_key_columns(df, key_columns), df_cache):
+            return None, {}
+        return df_cache, isotopes
+
+    def _load_lines_cache(
+        self, df, fcache, engine, metadata, key_columns, cached_columns, cache=None
+    ):
+        """Add the ``cached_columns`` of the lines cache file ``fcache`` to the
+        line database ``df``, if all the lines of ``df`` are in the cache file.
+
+        The cache file covers all the lines of the line database computed so
+        far, whatever the wavenumber range, the isotopes or the columns loaded
+        by each factory (see
+        :py:meth:`~radis.lbl.base.BaseFactory._save_lines_cache`). It is
+        cropped to the wavenumber range of ``df``, and the lines of ``df``
+        are looked up with their ``key_columns``.
+
+        Parameters
+        ----------
+        df: pandas DataFrame
+            line database
+        fcache: str
+            cache file
+        engine: ``'pytables-fixed'``, ``'npy'``
+            cache file engine
+        metadata: dict
+            metadata that the cache file must match. ``metadata['isotopes']``
+            is a dictionary of the metadata of each isotope of ``df``, compared
+            to the metadata of the same isotopes in the cache file only.
+        key_columns: list
+            columns that identify the lines
+        cached_columns: list
+            columns to add to ``df``
+        cache: tuple, or ``None``
+            ``(df_cache, isotopes)`` content of the cache file, if already read
+            with :py:meth:`~radis.lbl.base.BaseFactory._read_lines_cache`
+
+        Returns
+        -------
+        list: names of the columns added to ``df``. Columns already in ``df``
+        are not replaced.
+        """
+        if cache is None:
+            cache = self._read_lines_cache(df, fcache, engine, metadata, key_columns)
+        df_cache, isotopes = cache
+        if df_cache is None or len(df) == 0:
+            return []
+        for iso, iso_metadata in metadata["isotopes"].items():
+            if isotopes.get(iso) != iso_metadata:
+                return []  # lines computed with other parameters
+
+        # Crop the cache file to the lines of df
+        keys = _get_key_columns(df, key_columns)
+        df_keys = _get_key_frame(df, keys)
+        wav = df_cache.wav.values
+        i0 = np.searchsorted(wav, df.wav.min(), side="left")
+        i1 = np.searchsorted(wav, df.wav.max(), side="right")
+        df_cache = df_cache.iloc[i0:i1]
+        added = [k for k in df_cache.columns if k in cached_columns and k not in df]
+        if not added:
+            return []
+
+        if len(df_cache) == len(df_keys) and all(
+            np.array_equal(df_keys[k].values, df_cache[k].values) for k in keys
+        ):
+            # same lines, in the same order : no lookup
+            values = {k: df_cache[k].values for k in added}
+        else:
+            df_lines = df_keys.merge(
+                df_cache[keys + added].drop_duplicates(keys),
+                on=keys,
+                how="left",
+                sort=False,
+                indicator=True,
+            )
+            if not (df_lines["_merge"] == "both").all():
+                return []  # some lines were never computed
+            values = {k: df_lines[k].values for k in added}
+
+        for k in added:
+            df[k] = values[k]
+        # all lines found : the read is not reused (see _read_lines_cache)
+        self._lines_cache_reads.pop(fcache, None)
+        return added
+
+    def _save_lines_cache(
+        self, df, fcache, engine, metadata, key_columns, cached_columns, name
+    ):
+        """Persist the ``cached_columns`` of the line database ``df`` in the
+        lines cache file ``fcache``, with the ``key_columns`` that identify
+        the lines.
+
+        The lines already in the cache file (ex: other wavenumber ranges or
+        isotopes of the same line database) are kept if they have the same
+        columns and isotope metadata, so that factories on different ranges
+        share the cache file rather than overwriting it. Columns of the cache
+        file that ``df`` does not have (ex: ``S0`` for GPU runs and ``Aul`` for
+        non-LTE runs) are first added to ``df``, so they are kept too. The
+        cache file is read once (or not at all, if it was just read by
+        :py:meth:`~radis.lbl.base.BaseFactory._load_lines_cache`), and
+        rewritten with the lines of ``df`` : pytables fixed-format and npy
+        cache files cannot be appended. The file is written
+        to a temporary file first and then renamed, so that concurrent
+        processes never read a partially written file.
+
+        Parameters are the same as
+        :py:meth:`~radis.lbl.base.BaseFactory._load_lines_cache`. ``name`` is
+        used in warnings.
+
+        Returns
+        -------
+        list: names of the columns saved
+        """
+        from radis.io.cache_files import _remove_cache_file, save_to_hdf
+
+        df_cache, cached_isotopes = self._read_lines_cache(
+            df, fcache, engine, metadata, key_columns
+        )
+        self._lines_cache_reads.pop(fcache, None)  # the file is rewritten below
+        # ... columns computed in a previous run are kept
+        self._load_lines_cache(
+            df,
+            fcache,
+            engine,
+            metadata,
+            key_columns,
+            cached_columns,
+            cache=(df_cache, cached_isotopes),
+        )
+
+        keys = _get_key_columns(df, key_columns)
+        columns = [k for k in cached_columns if k in df and k not in keys]
+        df_lines = _get_key_frame(df, keys)
+        for k in columns:
+            df_lines[k] = df[k].values
+        isotopes = metadata["isotopes"].copy()
+
+        # ... keep the other lines of the cache file
+        if df_cache is not None and all_in(keys + columns, df_cache):
+            valid = [
+                iso
+                for iso, iso_metadata in cached_isotopes.items()
+                if isotopes.get(iso, iso_metadata) == iso_metadata
+            ]
+            df_cache = df_cache.loc[df_cache.iso.isin(valid), keys + columns]
+            df_cache = df_cache.merge(
+                df_lines[keys], on=keys, how="left", sort=False, indicator=True
+            )
+            df_cache = df_cache[df_cache.pop("_merge") == "left_only"]
+            df_lines = pd.concat([df_cache, df_lines], ignore_index=True)
+            df_lines.sort_values("wav", kind="mergesort", inplace=True)
+            df_lines.reset_index(drop=True, inplace=True)
+            isotopes = {
+                **{iso: cached_isotopes[iso] for iso in valid},
+                **isotopes,
+            }
+
+        if engine == "npy":
+            ftemp = fcache + f".{os.getpid()}.tmp"
+        else:
+            ftemp = splitext(fcache)[0] + f".{os.getpid()}.tmp.h5"
+        try:
+            save_to_hdf(
+                df_lines,
+                ftemp,
+                metadata={**metadata, "isotopes": repr(isotopes)},
+                key="default" if engine == "npy" else "df",
+                verbose=self.verbose,
+                engine=engine,
+            )
+            if engine == "npy" and exists(fcache):
+                _remove_cache_file(fcache)  # directories cannot be replaced
+            os.replace(ftemp, fcache)
+        except OSError as err:  # ex: read-only database folder
+            if exists(ftemp):
+                _remove_cache_file(ftemp)
+            self.warn(
+                f"{name} cache file {fcache} could not be written: {err}",
+                "PerformanceWarning",
+            )
+            return []
+
+        return columns
+
+    def _get_reference_cache_file(self):
+        """Return the reference cache file of the line database and its
+        engine, or ``(None, None)`` if the line database is not a local file or
+        if cache files are not used.
+
+        The reference cache is memory-mapped (``'npy'`` engine) if the line
+        cache files are (see ``misc.cache_engine``). See
+        :py:func:`~radis.io.cache_files.reference_cache_file_name`
+        """
+        from radis.io.cache_files import reference_cache_file_name
+
+        if not self.params.db_use_cached or not self.params.dbpath:
+            return None, None
+        dbpath = self.params.dbpath.split(",")[0]
+        if not exists(dbpath):  # ex: 'fetched from hitran'
+            return None, None
+        engine = "npy" if self.misc.cache_engine == "npy" else "pytables-fixed"
+        return reference_cache_file_name(dbpath, engine=engine), engine
+
+    def _get_reference_cache_metadata(self, df):
+        """Metadata that identify the reference columns of ``df``:
+        ``dbformat``, reference temperature, and isotopic abundance and
+        reference partition function of each isotope of ``df``
+        (``'isotopes'``).
+
+        The lines themselves are identified by the
+        :py:data:`~radis.lbl.base.reference_key_columns` stored in the cache
+        file.
+        """
+        Tref = self.input.Tref
+        state = self.input.state
+        if "molecule" in df.attrs:
+            molecule = df.attrs["molecule"]  # ExoMol, which has no HITRAN-id
+        else:
+            molecule = get_molecule(df.attrs["id"])
+
+        references = {}
+        for iso in _get_isotopes(df):
+            # same abundance lookup as in fetch_exomol
+            try:
+                abundance = self.molparam.get(molecule, iso, "abundance")
+            except NotImplementedError:  # molecule not in HITRAN
+                abundance = radis.config["molparams"]["abundances"][molecule][str(iso)]
+            Qref = self._calc_Q(molecule, iso, state, Tref)
+            references[iso] = repr([float(abundance), float(Qref)])
+
+        return {
+            "molecule": molecule,
+            "dbformat": self.params.dbformat,
+            "Tref": Tref,
+            "terrestrial_abundances": self.molparam.terrestrial_abundances,
+            "isotopes": references,
+        }
+
+    def _load_reference_cache(self, df):
+        """Add the reference columns (see
+        :py:data:`~radis.lbl.base.reference_cached_columns`) of a previous run
+        to the line database ``df``, if a valid reference cache file exists.
+
+        The cache file is validated with the metadata of
+        :py:meth:`~radis.lbl.base.BaseFactory._get_reference_cache_metadata`,
+        and the lines of ``df`` are looked up in the cache file (see
+        :py:meth:`~radis.lbl.base.BaseFactory._load_lines_cache`). Columns
+        already in ``df`` are not replaced. With the ``'npy'`` engine, if ``df``
+        has the same lines as the cache file, the columns added are read-only
+        memory-mapped arrays.
+
+        Returns
+        -------
+        list: names of the columns added to ``df``
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.base.BaseFactory._save_reference_cache`
+        """
+        fcache, engine = self._get_reference_cache_file()
+        if fcache is None or not exists(fcache):
+            return []
+
+        added = self._load_lines_cache(
+            df,
+            fcache,
+            engine,
+            self._get_reference_cache_metadata(df),
+            reference_key_columns,
+            reference_cached_columns,
+        )
+
+        if self.verbose >= 2 and added:
+            printg(f"Loaded reference columns {added} from {fcache}")
+        return added
+
+    def _save_reference_cache(self, df):
+        """Persist the reference columns of the line database ``df`` (see
+        :py:data:`~radis.lbl.base.reference_cached_columns`) in the reference
+        cache file of the line database, so that they are not recomputed on
+        the next runs.
+
+        Columns already in the cache file for the lines of ``df`` are kept,
+        and so are lines of other wavenumber ranges or isotopes (see
+        :py:meth:`~radis.lbl.base.BaseFactory._save_lines_cache`).
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.base.BaseFactory._load_reference_cache`
+        """
+        fcache, engine = self._get_reference_cache_file()
+        if fcache is None:
+            return
+
+        # ... columns computed in a previous run (ex: S0 for GPU runs and Aul
+        # for non-LTE runs) are kept by _save_lines_cache
+        columns = self._save_lines_cache(
+            df,
+            fcache,
+            engine,
+            self._get_reference_cache_metadata(df),
+            reference_key_columns,
+            reference_cached_columns,
+            "Reference",
+        )
+
+        if self.verbose >= 2 and columns:
+            printg(f"Saved reference columns {columns} in {fcache}")
+
+    def _add_reference_gu(self, df1):
+        """Add the upper state degeneracies ``gu`` of the line database to
+        ``df1``.
+
+        Degeneracies are calculated once on ``df0`` (or read from the
+        reference cache file, see
+        :py:meth:`~radis.lbl.base.BaseFactory._load_reference_cache`) rather
+        than for every spectrum.
+        """
+        df0 = getattr(self, "df0", None)
+        if df0 is None:  # deleted with save_memory
+            if not "ju" in df1:
+                self._add_ju(df1)
+            self._calc_degeneracies(df1)
+            return
+
+        if not "gu" in df0 and not "gu" in self._load_reference_cache(df0):
+            if not "ju" in df0:
+                self._add_ju(df0)
+            self._calc_degeneracies(df0)
+            self._save_reference_cache(df0)
+        df1["gu"] = df0["gu"]  # aligned on the line index
+
     def _calc_degeneracies(self, df):
         """Calculate vibrational and rotational degeneracies.
 
@@ -1947,16 +2330,22 @@ class BaseFactory(DatabankLoader):
         air_pressure = self.input.pressure_mbar / 1013.25  # convert from mbar to atm
 
         if "Pshft" in df.columns:
-            df["shiftwav"] = df.wav + (df.Pshft * air_pressure)
+            self._set_scratch_column(df, "shiftwav", df.wav + (df.Pshft * air_pressure))
         else:
             self.warn(
                 "Pressure-shift coefficient not given in database: assumed 0 pressure shift",
                 "MissingPressureShiftWarning",
             )
-            df["shiftwav"] = df.wav
+            self._set_scratch_column(df, "shiftwav", df.wav)
 
         # Sorted lines is needed for sparse wavenumber range algorithm.
-        df.sort_values("shiftwav", inplace=True)
+        # Reordering the lines copies all columns : skip it if lines are already
+        # sorted (the line database is sorted by ``wav``, and pressure shifts
+        # rarely change the order), and in zero-copy mode, where ``df1`` must
+        # keep sharing its columns with ``df0`` (the sparse LDM sorts lines by
+        # spectral position itself, see sparse_add_at_grouped)
+        if not self.misc.zero_copy and not is_sorted(df.shiftwav.values):
+            df.sort_values("shiftwav", inplace=True)
 
         self.profiler.stop("calc_lineshift", "Calculated lineshift")
 
@@ -2005,6 +2394,12 @@ class BaseFactory(DatabankLoader):
 
         self.profiler.start("scaled_S0", 2, "... Scaling equilibrium linestrength")
 
+        # ... read from the reference cache file on the first call
+        if not "S0" in df0 and "S0" in self._load_reference_cache(df0):
+            self.profiler.stop("scaled_S0", "Scaled equilibrium linestrength")
+            return
+        first_call = "S0" not in df0
+
         gp = df0["gp"]
         A = df0["A"]
         wav = df0["wav"]
@@ -2016,6 +2411,9 @@ class BaseFactory(DatabankLoader):
 
         assert "S0" in self.df0
 
+        if first_call:
+            self._save_reference_cache(df0)
+
         self.profiler.stop("scaled_S0", "Scaled equilibrium linestrength")
 
         return
@@ -2224,7 +2622,7 @@ class BaseFactory(DatabankLoader):
             # 60, No. 5, pp. 665-710"
 
             # correct for Partition Function
-            df1["S"] = (
+            S = (
                 df1.int
                 * self.Qref_Qgas_ratio(df1, Tgas, Tref)
                 *
@@ -2241,21 +2639,98 @@ class BaseFactory(DatabankLoader):
             # Einstein A coefficient and the populations (see Klarenaar 2017 Eqn. 12)
 
             if not "gu" in df1:
-                if not "ju" in df1:
-                    self._add_ju(df1)
-                self._calc_degeneracies(df1)
+                self._add_reference_gu(df1)
 
             Ia = self.get_lines_abundance(df1)
-            df1["S"] = linestrength_from_Einstein(
+            S = linestrength_from_Einstein(
                 df1.A, df1.gu, df1.El, Ia, df1.wav, self.Qgas(df1, Tgas), Tgas
             )
 
+        self._set_scratch_column(df1, "S", S)
+
         assert "S" in self.df1
 
         self.profiler.stop("scaled_eq_linestrength", "Scaled equilibrium linestrength")
 
         return
 
+    def _calc_linestrength_eq_batch(self, Tgas):
+        """Calculate linestrength of all lines for several temperatures at once.
+
+        Vectorized version of :py:meth:`~radis.lbl.base.BaseFactory.calc_linestrength_eq`,
+        used by :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` when
+        called with an array of temperatures.
+
+        Parameters
+        ----------
+        Tgas: array (K)
+            gas temperatures  [size C]
+
+        Returns
+        -------
+        S: np.array   [shape N x C]
+            linestrength of all lines of ``self.df1``, for each temperature
+            (cm-1/(#.cm-2)). ``self.df1`` is not modified.
+        """
+
+        Tref = self.input.Tref
+        df1 = self.df1
+        Tgas = np.asarray(Tgas, dtype=np.float64)  # size C
+
+        def as_column(x):
+            # Line parameters as column vectors [N x 1], broadcast with conditions [C]
+            return x.values[:, None] if isinstance(x, pd.Series) else x
+
+        self.profiler.start(
+            "scaled_eq_linestrength", 2, "... Scaling equilibrium linestrength"
+        )
+
+        if self.molparam.terrestrial_abundances:
+            # Same as calc_linestrength_eq. Partition functions are computed
+            # for each temperature ; shape C, or N x C if several isotopes
+            Qref_Qgas = np.stack(
+                [
+                    np.asarray(self.Qref_Qgas_ratio(df1, T, Tref), dtype=np.float64)
+                    for T in Tgas
+                ],
+                axis=-1,
+            )
+            El = as_column(df1.El)
+            wav = as_column(df1.wav)
+            S = (
+                as_column(df1.int)
+                * Qref_Qgas
+                *
+                # ratio of Boltzman populations
+                exp(-hc_k * El * (1 / Tgas - 1 / Tref))
+                *
+                # effect of stimulated emission
+                (1 - exp(-hc_k * wav / Tgas))
+                / (1 - exp(-hc_k * wav / Tref))
+            )  # [cm-1/(molecules/cm-2)]
+
+        else:
+            if not "gu" in df1:
+                self._add_reference_gu(df1)
+
+            Qgas = np.stack(
+                [np.asarray(self.Qgas(df1, T), dtype=np.float64) for T in Tgas],
+                axis=-1,
+            )
+            S = linestrength_from_Einstein(
+                as_column(df1.A),
+                as_column(df1.gu),
+                as_column(df1.El),
+                as_column(self.get_lines_abundance(df1)),
+                as_column(df1.wav),
+                Qgas,
+                Tgas,
+            )
+
+        self.profiler.stop("scaled_eq_linestrength", "Scaled equilibrium linestrength")
+
+        return S
+
     # %%
     def calc_populations_eq(self, Tgas):
         """Calculate upper state population for all active transitions in
@@ -2894,6 +3369,9 @@ class BaseFactory(DatabankLoader):
         """Return lines if self.misc.export_lines is True, else get None."""
 
         if self.misc.export_lines:
+            if self.misc.zero_copy:
+                # copy the views of df0, and the scratch buffers of the next spectra
+                return self._get_selected_lines(list(self.df1.columns)).copy()
             return self.df1
         else:
             return None
@@ -3067,7 +3545,7 @@ class BaseFactory(DatabankLoader):
         # ... correct effect of stimulated emission
         line_strength /= 1 - exp(-hc_k * df.wav / Tref)
         line_strength *= 1 - df.gl / df.gu * nu / nl
-        df["S"] = line_strength
+        self._set_scratch_column(df, "S", line_strength)
 
         self.profiler.stop(
             "scaled_non_eq_linestrength", "scaled nonequilibrium linestrength"
@@ -3158,6 +3636,11 @@ class BaseFactory(DatabankLoader):
         Notes
         -----
 
+        In zero-copy mode (``self.misc.zero_copy``), the lines of ``self.df1``
+        are not selected : the indices of the lines kept are stored in
+        ``self._lines_selection``, and applied where lines are used. See
+        :py:meth:`~radis.lbl.base.BaseFactory._get_selected_lines`
+
         # TODO:
 
         turn linestrength cutoff criteria in 'auto' mode that adjusts linestrength
@@ -3173,6 +3656,8 @@ class BaseFactory(DatabankLoader):
         verbose = self.verbose
         df = self.df1
 
+        self._lines_selection = None
+
         if len(df) == 0:  # no lines
             self._Nlines_cutoff = None
             return
@@ -3228,18 +3713,23 @@ class BaseFactory(DatabankLoader):
                 + "cm-1/(#.cm-2)). See histogram"
             ) from err
 
-        # update df1:
-        self.df1 = pd.DataFrame(df[~b])
-        #        df.drop(b.index, inplace=True)   # performance: was not faster
-        # ... @dev performance: quite long to select here, but I couldn't find a faster
-        # ... alternative
-        # TODO: remove useless columns in df1 to save memory
-        # Note @EP : with Vaex; the selection should be updated here
-
-        # Ensures abundance, molar mass and partition functions are transfered
-        # (needed if they are attributes and not isotopes)
-        transfer_metadata(df, self.df1, [k for k in df_metadata if k in df.attrs])
-        # assert len(self.df1.attrs) > 0
+        if self.misc.zero_copy:
+            # keep the columns of df1 as views of df0 : the selection is applied
+            # where lines are used (see _get_selected_lines)
+            self._lines_selection = np.flatnonzero(~b.values)
+        else:
+            # update df1:
+            self.df1 = pd.DataFrame(df[~b])
+            #        df.drop(b.index, inplace=True)   # performance: was not faster
+            # ... @dev performance: quite long to select here, but I couldn't find a faster
+            # ... alternative
+            # TODO: remove useless columns in df1 to save memory
+            # Note @EP : with Vaex; the selection should be updated here
+
+            # Ensures abundance, molar mass and partition functions are transfered
+            # (needed if they are attributes and not isotopes)
+            transfer_metadata(df, self.df1, [k for k in df_metadata if k in df.attrs])
+            # assert len(self.df1.attrs) > 0
 
         # Store number of lines cut (for information)
         self._Nlines_cutoff = Nlines_cutoff
@@ -3248,6 +3738,126 @@ class BaseFactory(DatabankLoader):
 
         return
 
+    def _get_selected_lines(self, columns=[]):
+        """Return the lines of ``self.df1`` kept by the linestrength cutoff.
+
+        In zero-copy mode, :py:meth:`~radis.lbl.base.BaseFactory._cutoff_linestrength`
+        does not select the lines of ``self.df1``, whose columns remain views of
+        ``self.df0``, but stores the indices of the lines kept in
+        ``self._lines_selection``. The selection is applied here, where lines are
+        used, and only to the columns computed for the current conditions (the
+        columns that are not in ``self.df0``) and to the additional ``columns``.
+
+        Parameters
+        ----------
+        columns: list of str
+            columns of ``self.df0`` to select as well
+
+        Returns
+        -------
+        df: pandas DataFrame
+            ``self.df1`` if all lines are kept, else a new DataFrame of the lines
+            kept
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.base.BaseFactory._apply_lines_selection`
+        """
+        df = self.df1
+        selection = self._lines_selection
+        if selection is None:
+            return df
+
+        df_selected = pd.DataFrame(
+            {
+                k: df[k].values[selection]
+                for k in df.columns
+                if k not in self.df0.columns or k in columns
+            },
+            index=df.index[selection],
+            copy=False,
+        )
+        transfer_metadata(df, df_selected, [k for k in df_metadata if k in df.attrs])
+        return df_selected
+
+    def _apply_lines_selection(self):
+        """Replace ``self.df1`` with the lines kept by the linestrength cutoff,
+        with all their columns (in zero-copy mode, lines are copied). Used by
+        the calculations that filter lines again, or export them.
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.base.BaseFactory._get_selected_lines`
+        """
+        if self._lines_selection is not None:
+            self.df1 = self._get_selected_lines(list(self.df1.columns))
+            self._lines_selection = None
+
+    def _get_scratch_buffers(self):
+        """Return the scratch buffers of the columns computed for every
+        spectrum in zero-copy mode (``S``, ``shiftwav``, ``hwhm_*``).
+
+        Assigning a new column to a DataFrame copies it : instead, the buffers
+        are added to the read-only views of ``self.df0`` when ``self.df1`` is
+        created (see :py:meth:`~radis.lbl.base.BaseFactory._reinitialize`), and
+        are written in place by :py:meth:`~radis.lbl.base.BaseFactory._set_scratch_column`.
+        The buffers of the previous spectrum are reused.
+
+        Buffers are dropped if the number of lines changed. They are not used
+        in incremental mode (``self.misc.incremental``), where the lines of the
+        previous spectra are memoized.
+
+        Returns
+        -------
+        scratch: dict
+            {column: array}
+        """
+        if self.misc.incremental or any(
+            len(v) != len(self.df0) for v in self._scratch.values()
+        ):
+            self._scratch.clear()
+
+        scratch_columns = ["S", "shiftwav", "hwhm_lorentz", "hwhm_gauss"]
+        if self.params.broadening_method == "voigt":
+            scratch_columns.append("hwhm_voigt")
+
+        return {k: v for k, v in self._scratch.items() if k in scratch_columns}
+
+    def _set_scratch_column(self, df, column, values):
+        """Set the ``column`` of the lines ``df`` to ``values``.
+
+        If the column is a scratch buffer (zero-copy mode, see
+        :py:meth:`~radis.lbl.base.BaseFactory._get_scratch_buffers`), ``values``
+        are written in place. Else, the column is assigned, and in zero-copy
+        mode it becomes the scratch buffer of the next spectra.
+
+        Parameters
+        ----------
+        df: pandas DataFrame
+            lines (``self.df1``)
+        column: str
+        values: array, or pandas Series
+        """
+        values = np.asarray(values)
+        buffer = self._scratch.get(column)
+        if (
+            buffer is not None
+            and column in df
+            and buffer.dtype == values.dtype
+            and np.may_share_memory(df[column].values, buffer)
+        ):
+            np.copyto(buffer, values)
+            return
+
+        df[column] = values
+        if (
+            self.misc.zero_copy
+            and not self.misc.incremental
+            and not self.save_memory
+            and len(df) == len(self.df0)
+        ):
+            self._scratch[column] = df[column].values
+
     # %% ======================================================================
     # PRIVATE METHODS - UTILS
     # (cleaning)
@@ -3271,6 +3881,16 @@ class BaseFactory(DatabankLoader):
         It saves a lot of memory but prevents the user from calculating a new
         spectrum without reloading the database.
 
+        If ``self.misc.zero_copy`` is ``True``, ``self.df1`` is not a copy of
+        ``self.df0`` : its columns are read-only views of the ``self.df0`` columns,
+        and only the columns derived for the current conditions (linestrength,
+        broadening, etc.) are allocated, in scratch buffers reused from one
+        spectrum to the next (see :py:meth:`~radis.lbl.base.BaseFactory._get_scratch_buffers`).
+        The linestrength cutoff does not copy the lines either (see
+        :py:meth:`~radis.lbl.base.BaseFactory._get_selected_lines`).
+        This avoids duplicating the line database on every spectrum, while
+        keeping ``self.df0`` unchanged so the factory can be reused.
+
         Returns
         -------
 
@@ -3283,6 +3903,7 @@ class BaseFactory(DatabankLoader):
         self.profiler.start("reinitialize", 2)
 
         keep_initial_database = not self.save_memory
+        self._lines_selection = None
 
         self.profiler.start("copy_database", 3)
 
@@ -3291,7 +3912,11 @@ class BaseFactory(DatabankLoader):
             # Create new line Dataframe
             # ... Operate on a duplicate dataframe to make it possible to do different
             # ... runs without reloading database
-            self.df1 = self.df0.copy()
+            if self.misc.zero_copy:
+                self.df1 = _readonly_view(self.df0, self._get_scratch_buffers())
+            else:
+                self._scratch.clear()
+                self.df1 = self.df0.copy()
 
             # abundance and molar_mass should have been copied even if they are attributes
             # (only 1 molecule, 1 isotope) and not a column (line specific) in the database
@@ -3683,6 +4308,168 @@ def linestrength_from_Einstein(
     )
 
 
+def _readonly_view(df, scratch={}):
+    """Return a new DataFrame whose columns are read-only views of the columns
+    of ``df``, i.e. no line data is copied.
+
+    Columns added to the returned DataFrame are not added to ``df``, and any
+    in-place modification of the existing columns raises a ``ValueError``
+    instead of silently modifying ``df``.
+
+    Parameters
+    ----------
+    df: pandas DataFrame
+    scratch: dict
+        {column: array} writable arrays, added to the returned DataFrame
+        without copy
+
+    See Also
+    --------
+    :py:meth:`~radis.lbl.base.BaseFactory._reinitialize`
+    """
+    columns = {}
+    for k in df.columns:
+        v = df[k].values
+        if isinstance(v, np.ndarray):
+            v = v.view()
+            v.flags.writeable = False
+        columns[k] = v
+    columns.update(scratch)
+    df_view = pd.DataFrame(columns, index=df.index, copy=False)
+    df_view.attrs.update(df.attrs)
+    return df_view
+
+
+def _get_isotopes(df):
+    """Return the sorted list of the isotopes of the line database ``df``"""
+    if "iso" in df:
+        return sorted(int(iso) for iso in df.iso.unique())
+    return [int(df.attrs["iso"])]
+
+
+def _get_key_columns(df, key_columns):
+    """Return the ``key_columns`` that identify the lines of ``df`` in a
+    lines cache file. ``'iso'`` is always included, even if all lines have the
+    same isotope (see :py:func:`~radis.lbl.base._get_key_frame`)"""
+    return [k for k in key_columns if k in df or k == "iso"]
+
+
+def _get_key_frame(df, keys):
+    """Return a DataFrame with the ``keys`` columns of ``df``. If ``df`` has a
+    single isotope stored as an attribute, it is added as an ``'iso'`` column"""
+    df_keys = pd.DataFrame({k: df[k].values for k in keys if k in df})
+    if "iso" not in df:
+        df_keys["iso"] = int(df.attrs["iso"])
+    return df_keys[keys]
+
+
+def _pack_int64_keys(arrays):
+    """Pack tuples of quantum numbers into a single ``int64`` key.
+
+    Each column is shifted to start at 0 and the columns are combined in
+    mixed radix, so that two rows get the same key if and only if they have
+    the same quantum numbers. Non-integer columns (floats with ``NaN``,
+    strings, ...) are first factorized to dense integer codes.
+
+    Parameters
+    ----------
+    arrays: list of array
+        one array per quantum number, all of the same length.
+
+    Returns
+    -------
+    keys: array of int64
+
+    See Also
+    --------
+    :py:func:`~radis.lbl.base.lookup_levels`
+    """
+    keys = np.zeros(len(arrays[0]), dtype=np.int64)
+    span = 1
+    for a in arrays:
+        a = np.asarray(a)
+        if a.dtype.kind in "iub" and len(a):
+            vmin = a.min()
+            codes = a.astype(np.int64) - int(vmin)
+            radix = int(a.max()) - int(vmin) + 1
+        else:
+            codes, uniques = pd.factorize(a)  # NaN -> -1
+            codes = codes.astype(np.int64) + 1
+            radix = len(uniques) + 1
+        if span * radix >= 2 ** 63:
+            # re-densify the keys already packed to make room for this column
+            keys = pd.factorize(keys)[0].astype(np.int64)
+            span = int(keys.max()) + 1 if len(keys) else 1
+        keys *= radix
+        keys += codes
+        span *= radix
+    return keys
+
+
+def lookup_levels(levels, levels_keys, lines, lines_keys, columns):
+    """Look up the energies of the lower and upper levels of all lines.
+
+    Quantum numbers of the levels and of the lines are packed into ``int64``
+    keys with :py:func:`~radis.lbl.base._pack_int64_keys`. The level table is
+    sorted once and all lines are resolved with a single
+    :py:func:`numpy.searchsorted`, which replaces the ``groupby().apply()``
+    and ``map(dict)`` joins previously used in the ``_add_EvibErot_*`` methods.
+
+    Parameters
+    ----------
+    levels: pandas DataFrame
+        energy level table, ex: ``self.get_energy_levels(molecule, iso, state)``
+    levels_keys: list of str
+        quantum numbers that identify a level in ``levels``, ex: ``["p", "c"]``
+    lines: pandas DataFrame
+        line database
+    lines_keys: list of list of str
+        matching quantum numbers in ``lines``, one list per level to look up,
+        ex: ``[["polyl", "wangl"], ["polyu", "wangu"]]``
+    columns: list of str
+        columns of ``levels`` to fetch, ex: ``["Evib"]``
+
+    Returns
+    -------
+    values: array of shape ``(len(lines_keys), len(lines), len(columns))``
+        ``values[i, :, j]`` is ``levels[columns[j]]`` for the levels described
+        by ``lines_keys[i]``. Lines whose level is not in ``levels`` get ``NaN``.
+
+    Notes
+    -----
+    If several levels share the same key, the first one is used (same as
+    ``levels.drop_duplicates(levels_keys)``).
+    """
+    N = len(lines)
+    n_lvl = len(levels)
+    # Pack levels and lines together so they share the same offsets / codes
+    arrays = [
+        np.concatenate(
+            [np.asarray(levels[k])]
+            + [np.asarray(lines[line_keys[i]]) for line_keys in lines_keys]
+        )
+        for i, k in enumerate(levels_keys)
+    ]
+    keys = _pack_int64_keys(arrays)
+    levels_key, lines_key = keys[:n_lvl], keys[n_lvl:]
+
+    # Sort the levels once; stable sort so the first duplicate is kept
+    order = np.argsort(levels_key, kind="stable")
+    sorted_key = levels_key[order]
+    values = np.empty((len(lines_keys) * N, len(columns)), dtype=np.float64)
+    if n_lvl == 0:
+        values[:] = np.nan
+        return values.reshape(len(lines_keys), N, len(columns))
+    pos = np.searchsorted(sorted_key, lines_key, side="left")
+    np.minimum(pos, n_lvl - 1, out=pos)
+    found = sorted_key[pos] == lines_key
+    idx = order[pos]
+    for j, c in enumerate(columns):
+        values[:, j] = np.asarray(levels[c], dtype=np.float64)[idx]
+    values[~found] = np.nan
+    return values.reshape(len(lines_keys), N, len(columns))
+
+
 if __name__ == "__main__":
     from radis.test.lbl.test_base import _run_testcases
 
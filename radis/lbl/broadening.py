@@ -41,7 +41,10 @@ convolve them, apply them on all calculated range)
 - :py:meth:`radis.lbl.broadening.BroadenFactory._calc_lineshape`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._apply_lineshape`
+- :py:meth:`radis.lbl.broadening.BroadenFactory._apply_lineshape_voigt_jit`
+- :py:meth:`radis.lbl.broadening.BroadenFactory._stack_lineshapes_LDM`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+- :py:meth:`radis.lbl.broadening.BroadenFactory._broaden_lines_parallel`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._calc_broadening`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._calc_broadening_noneq`
 - :py:meth:`radis.lbl.broadening.BroadenFactory._find_weak_lines`
@@ -61,25 +64,29 @@ Formula in docstrings generated with :py:func:`~pytexit.pytexit.py2tex` ::
 
 """
 
+from collections import OrderedDict
 from warnings import warn
 
 import numpy as np
+import pandas as pd
+from joblib import effective_n_jobs
 from numba import float64, jit
 from numpy import arange, exp
 from numpy import log as ln
 from numpy import pi, sin, sqrt, trapz, zeros, zeros_like
+from scipy.fft import irfft, next_fast_len, rfft
 from scipy.signal import oaconvolve
 
 import radis
 from radis.db.references import doi
 from radis.lbl.base import BaseFactory
+from radis.lbl.loader import MiscParams
 from radis.misc.arrays import (
     add_at,
     arange_len,
     boolean_array_from_ranges,
-    non_zero_ranges_in_array,
     numpy_add_at,
-    sparse_add_at,
+    sparse_add_at_grouped,
 )
 from radis.misc.basics import is_float
 from radis.misc.debug import printdbg
@@ -729,6 +736,103 @@ def _whiting_jit(w_centered, wl, wv):
     return lineshape
 
 
+@jit(nopython=True, nogil=True, cache=True)
+def _voigt_sum_on_grid(
+    wbroad_centered,
+    hwhm_lorentz,
+    hwhm_voigt,
+    broadened_params,
+    I_low_in_left,
+    I_low_in_right,
+    frac_left,
+    frac_right,
+    sumoflines_calc,
+    symmetric=False,
+):
+    """Computes the Voigt lineshape of each line with the approximation of
+    :py:func:`~radis.lbl.broadening.whiting1968`, normalizes it, and adds it
+    directly on the spectral grid.
+
+    Fused version of :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape`
+    + :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape` : the
+    (B x N) matrix of lineshapes is never built, only one lineshape of size B
+    is kept in memory.
+
+    Parameters
+    ----------
+    wbroad_centered: array   [size B]
+        lineshape spectral range (centered on 0)
+    hwhm_lorentz, hwhm_voigt: array   [size N]
+        Lorentzian and Voigt HWHM of all lines
+    broadened_params: 2D array   [shape K x N]
+        parameters to broaden (ex: ``S`` for absorption, ``Ei`` for emission)
+    I_low_in_left, I_low_in_right: int array   [size N]
+        index of the lower lineshape limit on ``sumoflines_calc``, for the closest
+        grid point on the left (right) of the line center
+    frac_left, frac_right: array   [size N]
+        fraction of the line intensity distributed on the left (right) grid point
+    sumoflines_calc: 2D array   [shape K x W']
+        array on which lineshapes are summed. Modified in-place.
+    symmetric: bool
+        if ``True``, ``wbroad_centered`` is assumed symmetric around 0 and only
+        half of each lineshape is computed.
+
+    Notes
+    -----
+    Performances:
+
+    on a 23k lines, 1k points lineshape, 150k wavegrid case: 1.0s vs 4.2s
+    for the vectorized (B x N) version. Memory does not scale with the
+    number of lines.
+
+    Releases the GIL : can be run on several threads, see
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_parallel`
+    """
+    B = len(wbroad_centered)
+    K, W = sumoflines_calc.shape
+    lineshape = np.empty(B)
+    # only compute the right half of the lineshape if the range is symmetric
+    j_start = B // 2 if symmetric else 0
+    for i in range(len(hwhm_lorentz)):
+        # Voigt lineshape (see whiting1968; FWHM are used)
+        wl = 2 * hwhm_lorentz[i]
+        wv = 2 * hwhm_voigt[i]
+        wl_wv = wl / wv
+        for j in range(j_start, B):
+            w_wv = wbroad_centered[j] / wv
+            w_wv_2 = w_wv ** 2
+            w_wv_225 = w_wv_2 * sqrt(sqrt(abs(w_wv)))  # faster than **2.25
+            lineshape[j] = (
+                (1 - wl_wv) * exp(-2.772 * w_wv_2)
+                + wl_wv * 1 / (1 + 4 * w_wv_2)
+                + 0.016
+                * (1 - wl_wv)
+                * wl_wv
+                * (exp(-0.4 * w_wv_225) - 10 / (10 + w_wv_225))
+            )
+        for j in range(j_start):  # lineshape is even: mirror the right half
+            lineshape[j] = lineshape[B - 1 - j]
+        # Normalization (same as np.trapz in voigt_lineshape)
+        integral = 0.0
+        for j in range(B - 1):
+            integral += (
+                0.5
+                * (lineshape[j] + lineshape[j + 1])
+                * (wbroad_centered[j + 1] - wbroad_centered[j])
+            )
+        # Distribute on the left and right grid points
+        for k in range(K):
+            S_left = broadened_params[k, i] / integral * frac_left[i]
+            S_right = broadened_params[k, i] / integral * frac_right[i]
+            for j in range(B):
+                i_left = I_low_in_left[i] + j
+                i_right = I_low_in_right[i] + j
+                if 0 <= i_left < W:
+                    sumoflines_calc[k, i_left] += S_left * lineshape[j]
+                if 0 <= i_right < W:
+                    sumoflines_calc[k, i_right] += S_right * lineshape[j]
+
+
 # %% Tools
 
 
@@ -760,6 +864,11 @@ class BroadenFactory(BaseFactory):
         """ See :py:meth:`~radis.lbl.factory.SpectrumFactory`
         """
 
+        # Cache of LDM lineshape templates, reused between successive spectra.
+        # Least recently used templates are freed first. See _calc_lineshape_LDM
+        self._LDM_templates = OrderedDict()
+        self._LDM_templates_nbytes = 0
+
         # Try to use Cython ?
         self.use_cython = radis.config[
             "USE_CYTHON"
@@ -858,6 +967,86 @@ class BroadenFactory(BaseFactory):
 
         self.profiler.stop("calc_hwhm", "Calculate broadening HWHM")
 
+    def _calc_broadening_HWHM_batch(self, Tgas, pressure_mbar, mole_fraction):
+        """Calculate broadening HWHM of all lines for several conditions at once.
+
+        Vectorized version of :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_broadening_HWHM`,
+        used by :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` when
+        called with arrays of conditions.
+
+        Parameters
+        ----------
+        Tgas, pressure_mbar, mole_fraction: array
+            conditions   [size C]
+
+        Returns
+        -------
+        hwhm: dict
+            ``hwhm_lorentz``, ``hwhm_gauss`` (and ``hwhm_voigt`` with
+            ``broadening_method='voigt'``) of all lines of ``self.df1``, for each
+            condition   [shape N x C]. ``self.df1`` is not modified.
+        """
+        df = self.df1
+
+        def as_column(x):
+            # Line parameters as column vectors [N x 1], broadcast with conditions [C]
+            return x.values[:, None] if isinstance(x, pd.Series) else x
+
+        self.profiler.start("calc_hwhm", 2)
+
+        # convert from mbar to atm for linebroadening calculation
+        pressure_atm = np.asarray(pressure_mbar) / 1013.25
+        Tref = self.input.Tref
+        broadening_method = self.params.broadening_method
+        if broadening_method not in ["voigt", "convolve", "fft"]:
+            raise ValueError(
+                "Unexpected lineshape broadening algorithm : broadening_method={0}".format(
+                    broadening_method
+                )
+            )
+
+        # Same as _add_collisional_broadening_HWHM & _add_doppler_broadening_HWHM
+        if not "Tdpsel" in list(df.keys()):
+            self.warn(
+                "Self-broadening temperature coefficient `Tdpsel` not given in database: used `Tdpair` instead",
+                "MissingSelfBroadeningTdepWarning",
+                level=2,  # only appear if verbose>=2
+            )
+            Tdpsel = None  # will be corrected in pressure_broadening_HWHM()
+        else:
+            Tdpsel = as_column(df.Tdpsel)
+        if not "selbrd" in list(df.keys()):
+            self.warn(
+                "Self-broadening reference width `selbrd` not given in database: used air broadening reference width `airbrd` instead",
+                "MissingSelfBroadeningWarning",
+                level=2,  # only appear if verbose>=2
+            )
+            selbrd = as_column(df.airbrd)
+        else:
+            selbrd = as_column(df.selbrd)
+
+        gamma_lb = pressure_broadening_HWHM(
+            as_column(df.airbrd),
+            selbrd,
+            as_column(df.Tdpair),
+            Tdpsel,
+            pressure_atm,
+            mole_fraction,
+            Tgas,
+            Tref,
+        )
+        gamma_db = doppler_broadening_HWHM(
+            as_column(df.wav), as_column(self.get_molar_mass(df)), Tgas
+        )
+        hwhm = {"hwhm_lorentz": gamma_lb, "hwhm_gauss": gamma_db}
+        if broadening_method == "voigt":
+            # see voigt_broadening_HWHM
+            hwhm["hwhm_voigt"] = olivero_1977(2 * gamma_db, 2 * gamma_lb) / 2
+
+        self.profiler.stop("calc_hwhm", "Calculate broadening HWHM")
+
+        return hwhm
+
     def _calc_min_width(self, df):
         """Calculates the minimum FWHW of the lines
         and stores in self.min_width
@@ -1000,9 +1189,9 @@ class BroadenFactory(BaseFactory):
         )
 
         # Update dataframe
-        df["hwhm_voigt"] = wv
-        df["hwhm_lorentz"] = wl
-        df["hwhm_gauss"] = wg
+        self._set_scratch_column(df, "hwhm_voigt", wv)
+        self._set_scratch_column(df, "hwhm_lorentz", wl)
+        self._set_scratch_column(df, "hwhm_gauss", wg)
 
         return
 
@@ -1066,7 +1255,7 @@ class BroadenFactory(BaseFactory):
         )
 
         # Update dataframe
-        df["hwhm_lorentz"] = wl
+        self._set_scratch_column(df, "hwhm_lorentz", wl)
 
         return
 
@@ -1088,7 +1277,7 @@ class BroadenFactory(BaseFactory):
         # Note @EP: should we use the pressure-shifted wavenumber instead of df.wav?
 
         # Update dataframe
-        df["hwhm_gauss"] = wg
+        self._set_scratch_column(df, "hwhm_gauss", wg)
 
         return
 
@@ -1433,12 +1622,15 @@ class BroadenFactory(BaseFactory):
         # ------------------------------------
 
         def _init_w_axis(w_dat, log_p):
-            w_min = w_dat.min()
-            w_max = (
-                w_dat.max() + 1e-4
+            # Widths are taken on the fixed, global grid w = exp(log_p * k) (k integer)
+            # rather than starting at w_dat.min(), so that lineshapes of the
+            # grid points can be reused between spectra (see _LDM_templates)
+            k_min = np.floor(np.log(w_dat.min()) / log_p)
+            k_max = np.ceil(
+                np.log(w_dat.max() + 1e-4) / log_p
             )  # Add small number to prevent w_max falling outside of the grid
-            N = np.ceil((np.log(w_max) - np.log(w_min)) / log_p) + 1
-            return w_min * np.exp(log_p * np.arange(N))
+            k = np.arange(k_min, k_max + 1).astype(np.int64)
+            return np.exp(log_p * k), k
 
         log_pL = self.params.dxL  # LDM user params
         log_pG = self.params.dxG  # LDM user params
@@ -1446,49 +1638,38 @@ class BroadenFactory(BaseFactory):
         wL_dat = df.hwhm_lorentz.values * 2  # FWHM
         wG_dat = df.hwhm_gauss.values * 2  # FWHM
 
-        wL = _init_w_axis(wL_dat, log_pL)  # FWHM
+        wL, kL = _init_w_axis(wL_dat, log_pL)  # FWHM
         self.NwL = len(wL)
-        wG = _init_w_axis(wG_dat, log_pG)  # FWHM
+        wG, kG = _init_w_axis(wG_dat, log_pG)  # FWHM
         self.NwG = len(wG)
 
         # Calculate the Lineshape
         # -----------------------
 
-        line_profile_LDM = {}
         broadening_method = self.params.broadening_method
         if broadening_method == "voigt":
             jit = False  # not enough lines to make the just-in-time FORTRAN compilation useful
             wbroad_centered = self.wbroad_centered
 
-            # Non vectorized loop. Probably slightly slower, but this is not the bottleneck anyway.
-            # see commit 6474cb7e on 15/08/2019 for a vectorized version
-            for l in range(len(wG)):
-                line_profile_LDM[l] = {}
-                for m in range(len(wL)):
-                    wV_ij = olivero_1977(wG[l], wL[m])  # FWHM
-                    lineshape = voigt_lineshape(
-                        wbroad_centered, wL[m] / 2, wV_ij / 2, jit=jit
-                    )  # FWHM > HWHM
-                    line_profile_LDM[l][m] = lineshape
+            def calc_template(wG_l, wL_m):
+                wV_ij = olivero_1977(wG_l, wL_m)  # FWHM
+                return voigt_lineshape(
+                    wbroad_centered, wL_m / 2, wV_ij / 2, jit=jit
+                )  # FWHM > HWHM
+
+            template_key = (len(wbroad_centered),)
 
         elif broadening_method == "convolve":
             wbroad_centered = self.wbroad_centered
 
-            IG = [
-                gaussian_lineshape(wbroad_centered, wG[l] / 2) for l in range(len(wG))
-            ]  # FWHM>HWHM
-            IL = [
-                lorentzian_lineshape(wbroad_centered, wL[m] / 2) for m in range(len(wL))
-            ]  # FWHM>HWHM
-            # Non vectorized. See Voigt for vectorized.
-
-            # Get all combinations of Voigt lineshapes
-            for l in range(len(wG)):
-                line_profile_LDM[l] = {}
-                for m in range(len(wL)):
-                    lineshape = np.convolve(IL[m], IG[l], mode="same")
-                    lineshape /= np.trapz(lineshape, x=wbroad_centered)
-                    line_profile_LDM[l][m] = lineshape
+            def calc_template(wG_l, wL_m):
+                IG = gaussian_lineshape(wbroad_centered, wG_l / 2)  # FWHM>HWHM
+                IL = lorentzian_lineshape(wbroad_centered, wL_m / 2)  # FWHM>HWHM
+                lineshape = np.convolve(IL, IG, mode="same")
+                lineshape /= np.trapz(lineshape, x=wbroad_centered)
+                return lineshape
+
+            template_key = (len(wbroad_centered),)
 
         elif broadening_method == "fft":
             # Unlike real space methods ('convolve', 'voigt'), here we calculate
@@ -1501,36 +1682,67 @@ class BroadenFactory(BaseFactory):
 
             w_fold = (w_lineshape_ft, w_lineshape_ft[::-1])
 
-            # Get all combinations of Voigt lineshapes (in Fourier space)
-            for l in range(len(wG)):
-                line_profile_LDM[l] = {}
-                for m in range(len(wL)):
+            def calc_template(wG_l, wL_m):
+                # Voigt lineshape in Fourier space
+                lineshape = voigt_FT(w_lineshape_ft, wG_l / 2, wL_m / 2)
 
-                    line_profile_LDM[l][m] = voigt_FT(
-                        w_lineshape_ft, wG[l] / 2, wL[m] / 2
+                # Add folding until threshold is reached:
+                n = 1
+                while (
+                    voigt_FT(n / (2 * wstep), wG_l / 2, wL_m / 2)
+                    >= self.params.folding_thresh
+                ):
+                    lineshape += voigt_FT(
+                        n / (2 * wstep) + w_fold[n & 1], wG_l / 2, wL_m / 2
                     )
+                    n += 1
 
-                    # Add folding until threshold is reached:
-                    n = 1
-                    while (
-                        voigt_FT(n / (2 * wstep), wG[l] / 2, wL[m] / 2)
-                        >= self.params.folding_thresh
-                    ):
-                        line_profile_LDM[l][m] += voigt_FT(
-                            n / (2 * wstep) + w_fold[n & 1], wG[l] / 2, wL[m] / 2
-                        )
-                        n += 1
+                lineshape /= lineshape[0]
+                return lineshape
 
-                    line_profile_LDM[l][m] /= line_profile_LDM[l][m][0]
+            template_key = (len(w), self.params.folding_thresh)
 
         else:
             raise NotImplementedError(
                 "Broadening method with LDM: {0}".format(broadening_method)
             )
 
+        # Get all combinations of Voigt lineshapes; reuse the ones already
+        # computed for previous spectra.
+        template_key = (
+            broadening_method,
+            self.params.wstep,
+            log_pG,
+            log_pL,
+        ) + template_key
+        cache = self._LDM_templates
+        cache_enabled = self.misc.ldm_cache_memory > 0
+        line_profile_LDM = {}
+        n_computed = 0
+        for l in range(len(wG)):
+            line_profile_LDM[l] = {}
+            for m in range(len(wL)):
+                key = template_key + (kG[l], kL[m])
+                try:
+                    lineshape = cache[key]
+                    cache.move_to_end(key)  # most recently used
+                except KeyError:
+                    lineshape = calc_template(wG[l], wL[m])
+                    n_computed += 1
+                    if cache_enabled:
+                        lineshape.flags.writeable = False  # shared between spectra
+                        cache[key] = lineshape
+                        self._LDM_templates_nbytes += lineshape.nbytes
+                line_profile_LDM[l][m] = lineshape
+
+        # Free least recently used templates above memory budget
+        while cache and self._LDM_templates_nbytes > self.misc.ldm_cache_memory * 1e6:
+            _, lineshape = cache.popitem(last=False)
+            self._LDM_templates_nbytes -= lineshape.nbytes
+
         self.profiler.stop(
             "precompute_LDM_lineshapes",
-            f"Precomputed LDM lineshapes ({len(wL) * len(wG)})",
+            f"Precomputed LDM lineshapes ({n_computed} computed, {len(wL) * len(wG) - n_computed} reused)",
         )
 
         return line_profile_LDM, wL, wG, wL_dat, wG_dat
@@ -1636,20 +1848,9 @@ class BroadenFactory(BaseFactory):
 
         #        # Get spectrum range
         wavenumber = self.wavenumber  # final vector of wavenumbers (shape W)
-        wavenumber_calc = (
-            self.wavenumber_calc
-        )  # calculation vector of wavenumbers (shape W + space B on the sides)
 
         # Vectorize the chunk of lines
         S = broadened_param.reshape((1, -1))
-        shifted_wavenum = shifted_wavenum.reshape((1, -1))  # make it a row vector
-
-        # Get truncation array
-        wbroad_centered = self.wbroad_centered  # size (B,)
-        # index of truncation half width
-        iwbroad_half = len(wbroad_centered) // 2
-        ineighbour = arange_len(0, self.params.neighbour_lines, self.params.wstep)
-        itruncation = arange_len(0, self.truncation, self.params.wstep)
 
         # Calculate matrix of broadened parameter (for all lines)
         # ... Note @dev : this is the memory bottleneck !
@@ -1659,7 +1860,96 @@ class BroadenFactory(BaseFactory):
         # Apply line profile
 
         self.profiler.stop("init_vectors_apply", "Initialized vectors")
+
+        (
+            I_low_in_left,
+            I_low_in_right,
+            frac_left,
+            frac_right,
+            sumoflines_calc,
+            ioffset,
+        ) = self._get_lineshape_grid_indices(shifted_wavenum)
+
+        self.profiler.start("aggregate__lines", 3)
+
+        #        # Performance for lines below
+        #        # ----------
+        #        #
+        #        # on test case: 6.5k lines x 18.6k grid length
+        #        # normal: ~ 36 ms  called 9 times
+        #        # with @jit : ~ 200 ms called 9 times (worse!)
+        #        # see _apply_lineshape_voigt_jit for a version where the lineshape
+        #        # calculation and the summation are fused.
+
+        # summ all lines :
+        I_high_in_left = I_low_in_left + profile_S.shape[0] - 1
+        I_high_in_right = I_low_in_right + profile_S.shape[0] - 1
+        for i, (fr_left, fr_right, profS) in enumerate(
+            zip(frac_left, frac_right, profile_S.T)
+        ):
+            sumoflines_calc[I_low_in_left[i] : I_high_in_left[i] + 1] += fr_left * profS
+            sumoflines_calc[I_low_in_right[i] : I_high_in_right[i] + 1] += (
+                fr_right * profS
+            )
+
+        # Nomenclature for lines above:
+        # - low/high: start/end of a lineshape
+        # - left/right: closest spectral grid point on the left/right
+
+        self.profiler.stop("aggregate__lines", "Aggregate lines")
+
+        # Get valid range (discard wings of line profiles)
+        sumoflines_calc = sumoflines_calc[ioffset:-ioffset]
+        assert len(sumoflines_calc) == len(self.wavenumber_calc)
+        # Get valid range (discard neighbour lines)
+        sumoflines = sumoflines_calc[self.woutrange[0] : self.woutrange[1]]
+
+        return wavenumber, sumoflines
+
+    def _get_lineshape_grid_indices(self, shifted_wavenum, n_params=None):
+        """Get the closest grid points of each line (on the left and on the
+        right) and the corresponding start indices of their lineshapes on the
+        (padded) calculation grid.
+
+        Parameters
+        ----------
+        shifted_wavenum: (cm-1)     numpy array (size N = number of lines)
+            center wavelength (used to project broaded lineshapes )
+        n_params: int, or ``None``
+            if not ``None``, the summation array returned is 2D of shape
+            ``(n_params, W')``, to sum several broadened parameters at once.
+
+        Returns
+        -------
+        I_low_in_left, I_low_in_right: int array   [size N]
+            lower wavenumber limit of the lineshape on the summation array, for
+            the closest grid point on the left (right)
+        frac_left, frac_right: array   [size N]
+            fraction of the line intensity on the left (right) grid point
+        sumoflines_calc: array   [size W' = W + 2 * ioffset]
+            initialized (zeros) summation array
+        ioffset: int
+            offset to account for out-of-bound truncation
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape`,
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_voigt_jit`
+        """
         self.profiler.start("get_matching_line", 3)
+
+        wavenumber_calc = (
+            self.wavenumber_calc
+        )  # calculation vector of wavenumbers (shape W + space B on the sides)
+        shifted_wavenum = shifted_wavenum.reshape((1, -1))  # make it a row vector
+
+        # Get truncation array
+        wbroad_centered = self.wbroad_centered  # size (B,)
+        # index of truncation half width
+        iwbroad_half = len(wbroad_centered) // 2
+        ineighbour = arange_len(0, self.params.neighbour_lines, self.params.wstep)
+        itruncation = arange_len(0, self.truncation, self.params.wstep)
+
         # ... First get closest matching line (on the left, and on the right)
         # ... note @dev: wavenumber_calc must be sorted, which it is by construction.
         idcenter_left = (
@@ -1682,7 +1972,10 @@ class BroadenFactory(BaseFactory):
         ioffset = itruncation + 1
 
         # ... Initialize array on which to distribute the lineshapes
-        sumoflines_calc = zeros(len(wavenumber_calc) + 2 * ioffset)
+        if n_params is None:
+            sumoflines_calc = zeros(len(wavenumber_calc) + 2 * ioffset)
+        else:
+            sumoflines_calc = zeros((n_params, len(wavenumber_calc) + 2 * ioffset))
 
         # Note on performance: it isn't straightforward to vectorize the summation
         # of all lineshapes on the spectral range as some lines may be parly outside
@@ -1691,154 +1984,164 @@ class BroadenFactory(BaseFactory):
         # comparison beforehand and run 3 different loops
 
         # reminder: wavenumber_calc has size [neighbour_lines/wstep+vec_length+neighbour_lines/wstep]
-        vec_length = len(wavenumber)
+        vec_length = len(self.wavenumber)
         assert (
             len(wavenumber_calc) == vec_length + 2 * ineighbour
         )  # self.params.neighbour_lines/self.params.wstep
 
-        self.profiler.stop("get_matching_line", "Get closest matching line & fraction")
-        self.profiler.start("aggregate__lines", 3)
-
-        #        # Performance for lines below
-        #        # ----------
-        #        #
-        #        # on test case: 6.5k lines x 18.6k grid length
-        #        # normal: ~ 36 ms  called 9 times
-        #        # with @jit : ~ 200 ms called 9 times (worse!)
-
-        # summ all lines :
-
         # I_low_in_left: lower wavenumber limit of the line, left grid point
         # I_low_in_right: lower wavenumber limit of the line, right grid point
-        # I_high_in_left: higher wavenumber limit of the line, left grid point
-        # I_high_in_right: higher wavenumber limit of the line, right grid point
         I_low_in_left = idcenter_left - iwbroad_half + ioffset
         I_low_in_right = idcenter_right - iwbroad_half + ioffset
-        I_high_in_left = I_low_in_left + 2 * iwbroad_half
-        I_high_in_right = I_low_in_right + 2 * iwbroad_half
-        for i, (fr_left, fr_right, profS) in enumerate(
-            zip(frac_left, frac_right, profile_S.T)
-        ):
-            sumoflines_calc[I_low_in_left[i] : I_high_in_left[i] + 1] += fr_left * profS
-            sumoflines_calc[I_low_in_right[i] : I_high_in_right[i] + 1] += (
-                fr_right * profS
-            )
 
-        # Nomenclature for lines above:
-        # - low/high: start/end of a lineshape
-        # - left/right: closest spectral grid point on the left/right
+        self.profiler.stop("get_matching_line", "Get closest matching line & fraction")
 
-        self.profiler.stop("aggregate__lines", "Aggregate lines")
+        return (
+            I_low_in_left,
+            I_low_in_right,
+            frac_left,
+            frac_right,
+            sumoflines_calc,
+            ioffset,
+        )
+
+    def _apply_lineshape_voigt_jit(self, broadened_params, dg):
+        """Calculate the Voigt lineshape of each line, multiply it by all
+        `broadened_params` and project it on the correct wavelength given by
+        ``dg.shiftwav``, in a single compiled loop.
+
+        Equivalent to :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape`
+        followed by :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape`
+        with ``broadening_method='voigt'``, but the (B x N) matrix of lineshapes
+        is never built: memory does not scale with the number of lines.
+
+        Parameters
+        ----------
+        broadened_params: list of numpy arrays   [each of size N = number of lines]
+            parameters to apply lineshape to. Typically ``[S]`` for absorption,
+            or ``[S, Ei]`` to compute both absorption and emission with the
+            same lineshapes.
+        dg: pandas Dataframe    [length ``N``]
+            list of lines  (includes ``shiftwav``, ``hwhm_lorentz`` and
+            ``hwhm_voigt``)
+
+        Returns
+        -------
+        wavenumber: array (size W  = size of output wavenumbers)
+        sumoflines: list of arrays (size W)
+            sum of (broadened_param x line_profile), one per broadened parameter
+
+        See Also
+        --------
+        :py:func:`~radis.lbl.broadening._voigt_sum_on_grid`
+        """
+        for k in ["hwhm_voigt", "hwhm_lorentz"]:
+            if not k in dg:
+                raise KeyError(
+                    "{0}: Calculate broadening with ".format(k)
+                    + "calc_voigt_broadening_HWHM first"
+                )
+
+        (
+            I_low_in_left,
+            I_low_in_right,
+            frac_left,
+            frac_right,
+            sumoflines_calc,
+            ioffset,
+        ) = self._get_lineshape_grid_indices(
+            dg.shiftwav.values, n_params=len(broadened_params)
+        )
+
+        self.profiler.start("voigt_broadening_jit", 3)
+        _voigt_sum_on_grid(
+            np.asarray(self.wbroad_centered, dtype=np.float64),
+            np.asarray(dg.hwhm_lorentz.values, dtype=np.float64),
+            np.asarray(dg.hwhm_voigt.values, dtype=np.float64),
+            np.vstack(broadened_params).astype(np.float64),
+            I_low_in_left.astype(np.int64),
+            I_low_in_right.astype(np.int64),
+            np.asarray(frac_left, dtype=np.float64),
+            np.asarray(frac_right, dtype=np.float64),
+            sumoflines_calc,
+            symmetric=np.array_equal(self.wbroad_centered, -self.wbroad_centered[::-1]),
+        )
+        self.profiler.stop(
+            "voigt_broadening_jit", "Calculated and aggregated Voigt lineshapes (jit)"
+        )
 
         # Get valid range (discard wings of line profiles)
-        sumoflines_calc = sumoflines_calc[ioffset:-ioffset]
-        assert len(sumoflines_calc) == len(wavenumber_calc)
+        sumoflines_calc = sumoflines_calc[:, ioffset:-ioffset]
+        assert sumoflines_calc.shape[1] == len(self.wavenumber_calc)
         # Get valid range (discard neighbour lines)
-        sumoflines = sumoflines_calc[self.woutrange[0] : self.woutrange[1]]
+        sumoflines = [
+            sumoflines_calc[k, self.woutrange[0] : self.woutrange[1]]
+            for k in range(len(broadened_params))
+        ]
 
-        return wavenumber, sumoflines
+        return self.wavenumber, sumoflines
 
     def _get_indices(self, arr_i, axis):
         pos = np.interp(arr_i, axis, np.arange(axis.size))
         index = pos.astype(np.int32)
         return index, index + 1, pos - index
 
-    def _apply_lineshape_LDM(
-        self,
-        broadened_param,
-        line_profile_LDM,
-        shifted_wavenum,
-        wL,
-        wG,
-        wL_dat,
-        wG_dat,
-        optimization,
-    ):
-        """Multiply `broadened_param` by `line_profile` and project it on the
-        correct wavelength given by `shifted_wavenum`
+    def _stack_lineshapes_LDM(self, line_profile_LDM, NwG, NwL):
+        """Stack the lineshape templates of the LDM in a single array.
 
         Parameters
         ----------
-        broadened_param: pandas Series (or numpy array)   [size N = number of lines]
-            Series to apply lineshape to. Typically linestrength `S` for absorption,
-            or `nu * Aul / 4pi * DeltaE` for emission
-        line_profile_LDM:  dict
-            dict of line profiles ::
+        line_profile_LDM: dict
+            dict of line profiles ``line_profile_LDM[l][m]``, as returned by
+            :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`
+        NwG, NwL: int
+            number of Gaussian and Lorentzian widths in the LDM
 
-                lineshape = line_profile_LDM[gaussian_index][lorentzian_index]
+        Returns
+        -------
+        lineshapes: array   [shape B x NwG x NwL]
+            ``lineshapes[:, l, m] = line_profile_LDM[l][m]``. The spectral axis
+            is first, as in the LDM.
+        """
+        return np.moveaxis(
+            np.array(
+                [[line_profile_LDM[l][m] for m in range(NwL)] for l in range(NwG)]
+            ),
+            -1,
+            0,
+        )
 
-            If ``self.params.broadening_method == 'fft'``, templates are given
-            in Fourier space.
+    def _get_weights_LDM(self, shifted_wavenum, wL, wG, wL_dat, wG_dat, optimization):
+        """Get the indices and weights of all lines on the 2x2x2 bins of the
+        LDM (spectral position, Gaussian width, Lorentzian width)
 
-        shifted_wavenum: (cm-1)     pandas Series (size N = number of lines)
-            center wavelength (used to project broaded lineshapes )
-        wL: array       (size DL)
-            array of all Lorentzian widths in LDM
-        wG: array       (size DG)
-            array of all Gaussian widths in LDM
-        wL_dat: array    (size N)
-            FWHM of all lines. Used to lookup the LDM
-        wG_dat: array    (size N)
-            FWHM of all lines. Used to lookup the LDM
-        optimization :
-            if ``"min-RMS"`` weights optimized by analytical minimization of the RMS-error.
-            Otherwise, weights equal to their relative position in the grid.
+        Parameters
+        ----------
+        shifted_wavenum, wL, wG, wL_dat, wG_dat, optimization:
+            see :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
 
         Returns
         -------
-        sumoflines: array (size W  = size of output wavenumbers)
-            sum of (broadened_param x line_profile)
+        ki0, ki1, li0, li1, mi0, mi1: arrays   (size N = number of lines)
+            spectral, Gaussian and Lorentzian indices of the bins of each line
+        avi: array
+            spectral weight of the right bin ``ki1`` (``1 - avi`` on ``ki0``)
+        awV: tuple of 4 arrays
+            weights on the (Gaussian, Lorentzian) bins ``(li0, mi0)``,
+            ``(li0, mi1)``, ``(li1, mi0)``, ``(li1, mi1)``
+        """
+        wavenumber_calc = self.wavenumber_calc
 
-        Notes
-        -----
-        Units change during convolution::
+        # ... First get closest matching spectral point  (on the left, and on the right)
+        #         ... @dev: np.interp about 30% - 50% faster than np.searchsorted
 
-            [sumoflines] = [broadened_param] * cm
+        # LDM : Next calculate how the line is distributed over the 2x2x2 bins.
+        ki0, ki1, tvi = self._get_indices(shifted_wavenum, wavenumber_calc)
+        li0, li1, tGi = self._get_indices(np.log(wG_dat), np.log(wG))
+        mi0, mi1, tLi = self._get_indices(np.log(wL_dat), np.log(wL))
 
-        Reference
-        ---------
-        LDM implemented based on a code snippet from D.v.d.Bekerom.
-        See: https://github.com/radis/radis/issues/37
-
-        See Also
-        --------
-        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`
-        """
-
-        self.profiler.start("LDM_Initialized_vectors", 3)
-        # Get spectrum range
-        wavenumber = self.wavenumber  # get vector of wavenumbers (shape W)
-        wavenumber_calc = self.wavenumber_calc
-        broadening_method = self.params.broadening_method
-
-        # Get add-at method
-        # ... 1. allow user to use non-cython method (useful for tests ?)
-        # ... 2. write in the Spectrum object whether Cython was used or not
-        # ...    (either because deactivated, or because not installed)
-        if self.use_cython and add_at != numpy_add_at:
-            _add_at = add_at
-            self.misc.add_at_used = "cython"
-        else:
-            _add_at = numpy_add_at
-            self.misc.add_at_used = "numpy"
-        # Vectorize the chunk of lines
-        S = broadened_param
-
-        # ---------------------------
-        # Apply line profile
-
-        self.profiler.stop("LDM_Initialized_vectors", "Initialized vectors")
-        self.profiler.start("LDM_closest_matching_line", 3)
-        # ... First get closest matching spectral point  (on the left, and on the right)
-        #         ... @dev: np.interp about 30% - 50% faster than np.searchsorted
-
-        # LDM : Next calculate how the line is distributed over the 2x2x2 bins.
-        ki0, ki1, tvi = self._get_indices(shifted_wavenum, wavenumber_calc)
-        li0, li1, tGi = self._get_indices(np.log(wG_dat), np.log(wG))
-        mi0, mi1, tLi = self._get_indices(np.log(wL_dat), np.log(wL))
-
-        # Next assign simple weights:
-        if optimization == "min-RMS":
+        # Next assign simple weights:
+        if optimization == "min-RMS":
 
             dv = self.params.wstep
             dxvGi = dv / wG_dat
@@ -1885,237 +2188,427 @@ class BroadenFactory(BaseFactory):
             aLi = tLi
 
         # ... fractions on LDM grid
-        awV00 = (1 - aGi) * (1 - aLi)
-        awV01 = (1 - aGi) * aLi
-        awV10 = aGi * (1 - aLi)
-        awV11 = aGi * aLi
+        awV = (
+            (1 - aGi) * (1 - aLi),
+            (1 - aGi) * aLi,
+            aGi * (1 - aLi),
+            aGi * aLi,
+        )
 
-        Iv0 = S * (1 - avi)
-        Iv1 = S * avi
+        return ki0, ki1, li0, li1, mi0, mi1, avi, awV
 
-        self.profiler.stop(
-            "LDM_closest_matching_line", "Get closest matching line & fraction"
-        )
-        self.profiler.start("LDM_Distribute_lines", 3)
-        # ... Initialize array on which to distribute the lineshapes
+    def _init_LDM(self, NwG, NwL):
+        """Allocate a (dense) LDM for the current broadening method
+
+        Parameters
+        ----------
+        NwG, NwL: int
+            number of Gaussian and Lorentzian widths in the LDM
+
+        Returns
+        -------
+        LDM: array    [shape W' x NwG x NwL]
+            filled with zeros. ``W' = W + 2`` for ``'voigt'`` and ``'convolve'``
+            (one empty grid point on each side, for lines on the boundary), and
+            ``W' = 2W`` for ``'fft'``, where ``W`` is the size of
+            ``self.wavenumber_calc``
+        """
+        broadening_method = self.params.broadening_method
+        W = len(self.wavenumber_calc)
         if broadening_method in ["voigt", "convolve"]:
-            if self.params.sparse_ldm == True:
-                # LDM is constructed in a sparse-way later
-                pass
-            else:
-                LDM = np.zeros((len(wavenumber_calc) + 2, len(wG), len(wL)))
-                # +2 to allocate one empty grid point on each side : case where a line is on the boundary
-                ki0 += 1
-                ki1 += 1
+            # +2 to allocate one empty grid point on each side : case where a line is on the boundary
+            shape = (W + 2, NwG, NwL)
         elif broadening_method == "fft":
-            if self.params.sparse_ldm == True:
-                if self.verbose >= 2:
-                    print(
-                        "SPARSE optimisation not implemented with 'fft' mode. Use 'voigt' for analytical voigt, or radis.config['SPARSE_WAVERANGE'] = False"
-                    )
-            LDM = np.zeros(
-                (
-                    2 * len(wavenumber_calc),  # TO-DO: Add  + self.misc.zero_padding
-                    len(wG),
-                    len(wL),
-                )
-            )
+            shape = (2 * W, NwG, NwL)  # TO-DO: Add  + self.misc.zero_padding
         else:
             raise NotImplementedError(broadening_method)
+        return np.zeros(shape, dtype=self.params.dtype)
 
-        # Distribute all line intensities on the 2x2x2 bins.
-        if (
-            broadening_method in ["voigt", "convolve"]
-            and self.params.sparse_ldm == True
-        ):
+    def _distribute_lines_LDM(self, broadened_params, weights, LDMs):
+        """Add the intensity of all lines on the 2x2x2 bins of (dense) LDMs
 
-            import pandas as pd
-
-            df = pd.DataFrame(
-                {
-                    "ki0": ki0,
-                    "li0": li0,
-                    "li1": li1,
-                    "mi0": mi0,
-                    "mi1": mi1,
-                    "Iv0": Iv0,
-                    "Iv1": Iv1,
-                    "awV00": awV00,
-                    "awV01": awV01,
-                    "awV10": awV10,
-                    "awV11": awV11,
-                },
-                copy=False,
-            )
+        Parameters
+        ----------
+        broadened_params: list of arrays   [size N = number of lines]
+            linestrength `S`, or emission integral `Ei`
+        weights: tuple
+            as returned by :py:meth:`~radis.lbl.broadening.BroadenFactory._get_weights_LDM`
+        LDMs: list of arrays
+            one LDM per broadened param, as returned by
+            :py:meth:`~radis.lbl.broadening.BroadenFactory._init_LDM`.
+            Modified in place.
+        """
+        # add-at method chosen in _apply_lineshape(s)_LDM
+        _add_at = add_at if self.misc.add_at_used == "cython" else numpy_add_at
 
-            def get_non_zero_wranges(groupby_parameters, max_range, intensity_weight):
-                """Get coordinates of non-zero wave ranges for all lines
-                that share the same ``groupby_parameters``
-
-                Parameters
-                ----------
-                groupby_parameters: str
-                max_range: int
-
-                Examples
-                --------
-                ::
-                    LDM_ranges_00 = get_non_zero_wranges(groupby_parameters=["li0", "mi0"], max_range=len(wavenumber_calc))
-                """
-                # EP 31/10: the for loop over df.groupby is the current bottleneck
-                # (not even the sparse_add_at function !)
-                dgb = df.groupby(groupby_parameters, sort=False)
-                LDM_ranges = {}
-                LDM_reduced = {}
-                for groupby_param, group in dgb:
-                    truncation_pts = int(self.params.truncation // self.params.wstep)
-                    # note: truncation can be unique for each point of the LDM basis
-                    # (allow to have line-dependant truncatino, at least as all
-                    # lines with same truncation are grouped together in the LDM basis)
-
-                    ki0 = group.ki0.values
-                    Iv0 = group.Iv0.values
-                    Iv1 = group.Iv1.values
-                    weight = group[intensity_weight].values
-
-                    # build the list of non-empty ranges for all lines with this lineshape :
-                    ranges, I = sparse_add_at(
-                        ki0, Iv0, Iv1, weight, max_range, truncation_pts
-                    )
+        ki0, ki1, li0, li1, mi0, mi1, avi, awV = weights
+        # one empty grid point on the left side (see _init_LDM)
+        offset = 1 if self.params.broadening_method in ["voigt", "convolve"] else 0
 
-                    LDM_ranges[groupby_param] = ranges
+        # Distribute all line intensities on the 2x2x2 bins.
+        aw00, aw01, aw10, aw11 = awV
+        for ki, av in [(ki0, 1 - avi), (ki1, avi)]:
+            k = ki + offset
+            for S, LDM in zip(broadened_params, LDMs):
+                Iv = S * av
+                _add_at(LDM, k, li0, mi0, Iv * aw00)
+                _add_at(LDM, k, li0, mi1, Iv * aw01)
+                _add_at(LDM, k, li1, mi0, Iv * aw10)
+                _add_at(LDM, k, li1, mi1, Iv * aw11)
 
-                    # generate reduced array:
-                    b = boolean_array_from_ranges(ranges, len(I))
-                    I_reduced = I[b]
-                    LDM_reduced[groupby_param] = I_reduced
+    def _convolve_LDM(self, LDMs, line_profile_LDM, NwG, NwL):
+        """Convolve all cells of (dense) LDMs with their lineshape, and sum them.
 
-                return LDM_ranges, LDM_reduced
+        The lineshapes are transformed once for all LDMs.
 
-            w = wavenumber_calc
+        Parameters
+        ----------
+        LDMs: list of arrays
+            LDMs filled by :py:meth:`~radis.lbl.broadening.BroadenFactory._distribute_lines_LDM`
+        line_profile_LDM: dict
+            see :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+        NwG, NwL: int
+            number of Gaussian and Lorentzian widths in the LDM
 
-            LDM_ranges_00, LDM_reduced_00 = get_non_zero_wranges(
-                groupby_parameters=["li0", "mi0"],
-                max_range=len(w),
-                intensity_weight="awV00",
-            )
-            LDM_ranges_01, LDM_reduced_01 = get_non_zero_wranges(
-                groupby_parameters=["li0", "mi1"],
-                max_range=len(w),
-                intensity_weight="awV01",
-            )
-            LDM_ranges_10, LDM_reduced_10 = get_non_zero_wranges(
-                groupby_parameters=["li1", "mi0"],
-                max_range=len(w),
-                intensity_weight="awV10",
-            )
-            LDM_ranges_11, LDM_reduced_11 = get_non_zero_wranges(
-                groupby_parameters=["li1", "mi1"],
-                max_range=len(w),
-                intensity_weight="awV11",
-            )
+        Returns
+        -------
+        list of arrays   [size W  = size of output wavenumbers]
+            sum of (broadened_param x line_profile), one per LDM, on the valid
+            range (wings discarded), in float64
+        """
+        wavenumber_calc = self.wavenumber_calc
+        broadening_method = self.params.broadening_method
+        dtype = self.params.dtype
 
-            # Combine all LDM ranges:
-            all_keys = (
-                set(LDM_ranges_00.keys())
-                | set(LDM_ranges_01.keys())
-                | set(LDM_ranges_10.keys())
-                | set(LDM_ranges_11.keys())
-            )
-            LDM_ranges = {}
-            LDM_reduced = {}
-            #  (note : could be combined faster by combining the ranges directly, rather than geenrating the boolean arrays?)
-            for param in all_keys:
-                b = np.zeros(len(w), dtype=bool)
-                I = np.zeros(len(w))
-                if param in LDM_ranges_00:
-                    bi = boolean_array_from_ranges(LDM_ranges_00[param], len(w))
-                    I[bi] += LDM_reduced_00[param]
-                    b += bi
-                if param in LDM_ranges_01:
-                    bi = boolean_array_from_ranges(LDM_ranges_01[param], len(w))
-                    I[bi] += LDM_reduced_01[param]
-                    b += bi
-                if param in LDM_ranges_10:
-                    bi = boolean_array_from_ranges(LDM_ranges_10[param], len(w))
-                    I[bi] += LDM_reduced_10[param]
-                    b += bi
-                if param in LDM_ranges_11:
-                    bi = boolean_array_from_ranges(LDM_ranges_11[param], len(w))
-                    I[bi] += LDM_reduced_11[param]
-                    b += bi
-
-                # Sparse storage (coordinates & non-zeros ranges) :
-                if b.any():
-                    LDM_ranges[param] = non_zero_ranges_in_array(b)
-                    LDM_reduced[param] = I[b]
+        # Number of threads used by the FFTs (see scipy.fft)
+        workers = effective_n_jobs(self.misc.nJobs) if self.misc.parallel else 1
 
-        else:
-            _add_at(LDM, ki0, li0, mi0, Iv0 * awV00)
-            _add_at(LDM, ki0, li0, mi1, Iv0 * awV01)
-            _add_at(LDM, ki0, li1, mi0, Iv0 * awV10)
-            _add_at(LDM, ki0, li1, mi1, Iv0 * awV11)
-            _add_at(LDM, ki1, li0, mi0, Iv1 * awV00)
-            _add_at(LDM, ki1, li0, mi1, Iv1 * awV01)
-            _add_at(LDM, ki1, li1, mi0, Iv1 * awV10)
-            _add_at(LDM, ki1, li1, mi1, Iv1 * awV11)
-
-            if broadening_method in ["voigt", "convolve"]:
+        lineshapes = self._stack_lineshapes_LDM(line_profile_LDM, NwG, NwL)
+
+        sumoflines = []
+        if broadening_method in ["voigt", "convolve"]:
+            # Convolve all cells at once in Fourier space: a single batched
+            # real FFT of the LDM (along the spectral axis) is multiplied by
+            # the FFT of all lineshapes, and summed over all cells before a
+            # single inverse FFT. Equivalent to summing
+            # oaconvolve(LDM[:, l, m], lineshape[l][m], "same") over all (l, m)
+            lineshapes = lineshapes.astype(dtype, copy=False)  # shape (B, NwG, NwL)
+            B = lineshapes.shape[0]
+            n_fft = next_fast_len(len(wavenumber_calc) + B - 1, real=True)
+            lineshapes_FT = rfft(lineshapes, n_fft, axis=0, workers=workers)
+            for LDM in LDMs:
                 LDM = LDM[1:-1, :, :]
                 # 1:-1 to remove the empty grid point on each side
+                Ildm_FT = np.einsum(
+                    "fgl,fgl->f",
+                    rfft(LDM, n_fft, axis=0, workers=workers),
+                    lineshapes_FT,
+                )
+                # Back in real space ("same" mode, i.e. centered):
+                sumoflines.append(
+                    irfft(Ildm_FT, n_fft, workers=workers)[
+                        (B - 1) // 2 : (B - 1) // 2 + len(wavenumber_calc)
+                    ]
+                )
+
+        elif broadening_method == "fft":
+            # Single batched real FFT of the LDM (along the spectral axis),
+            # multiplied by the lineshapes of all cells (already in FT space) and
+            # summed over all cells before a single inverse FFT
+            lineshapes_FT = None
+            for LDM in LDMs:
+                LDM_FT = rfft(LDM, axis=0, workers=workers)
+                if lineshapes_FT is None:
+                    lineshapes_FT = lineshapes.astype(
+                        LDM_FT.dtype, copy=False
+                    )  # shape (F, NwG, NwL)
+                Ildm_FT = np.einsum("fgl,fgl->f", LDM_FT, lineshapes_FT)
+                # Back in real space:
+                sumoflines_calc = irfft(Ildm_FT, workers=workers)[
+                    : len(wavenumber_calc)
+                ]
+                sumoflines_calc /= self.params.wstep
+                sumoflines.append(sumoflines_calc)
+
+        else:
+            raise NotImplementedError(broadening_method)
+
+        # Get valid range (discard wings). Output spectral quantities are
+        # always in float64
+        return [
+            s[self.woutrange[0] : self.woutrange[1]].astype(np.float64, copy=False)
+            for s in sumoflines
+        ]
+
+    def _apply_lineshape_LDM(
+        self,
+        broadened_param,
+        line_profile_LDM,
+        shifted_wavenum,
+        wL,
+        wG,
+        wL_dat,
+        wG_dat,
+        optimization,
+    ):
+        """Multiply `broadened_param` by `line_profile` and project it on the
+        correct wavelength given by `shifted_wavenum`
+
+        Parameters
+        ----------
+        broadened_param: pandas Series (or numpy array)   [size N = number of lines]
+            Series to apply lineshape to. Typically linestrength `S` for absorption,
+            or `nu * Aul / 4pi * DeltaE` for emission
+        line_profile_LDM:  dict
+            dict of line profiles ::
+
+                lineshape = line_profile_LDM[gaussian_index][lorentzian_index]
+
+            If ``self.params.broadening_method == 'fft'``, templates are given
+            in Fourier space.
+
+        shifted_wavenum: (cm-1)     pandas Series (size N = number of lines)
+            center wavelength (used to project broaded lineshapes )
+        wL: array       (size DL)
+            array of all Lorentzian widths in LDM
+        wG: array       (size DG)
+            array of all Gaussian widths in LDM
+        wL_dat: array    (size N)
+            FWHM of all lines. Used to lookup the LDM
+        wG_dat: array    (size N)
+            FWHM of all lines. Used to lookup the LDM
+        optimization :
+            if ``"min-RMS"`` weights optimized by analytical minimization of the RMS-error.
+            Otherwise, weights equal to their relative position in the grid.
+
+        Returns
+        -------
+        sumoflines: array (size W  = size of output wavenumbers)
+            sum of (broadened_param x line_profile)
+
+        Notes
+        -----
+        Units change during convolution::
+
+            [sumoflines] = [broadened_param] * cm
+
+        Reference
+        ---------
+        LDM implemented based on a code snippet from D.v.d.Bekerom.
+        See: https://github.com/radis/radis/issues/37
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`
+        """
+
+        self.profiler.start("LDM_Initialized_vectors", 3)
+        # Get spectrum range
+        wavenumber = self.wavenumber  # get vector of wavenumbers (shape W)
+        wavenumber_calc = self.wavenumber_calc
+        broadening_method = self.params.broadening_method
+        dtype = self.params.dtype  # of the LDM and of the convolutions
+
+        # Get add-at method
+        # ... 1. allow user to use non-cython method (useful for tests ?)
+        # ... 2. write in the Spectrum object whether Cython was used or not
+        # ...    (either because deactivated, or because not installed)
+        if self.use_cython and add_at != numpy_add_at:
+            self.misc.add_at_used = "cython"
+        else:
+            self.misc.add_at_used = "numpy"
+        # Vectorize the chunk of lines
+        S = broadened_param
+
+        # ---------------------------
+        # Apply line profile
+
+        self.profiler.stop("LDM_Initialized_vectors", "Initialized vectors")
+        self.profiler.start("LDM_closest_matching_line", 3)
+        weights = self._get_weights_LDM(
+            shifted_wavenum, wL, wG, wL_dat, wG_dat, optimization
+        )
+        self.profiler.stop(
+            "LDM_closest_matching_line", "Get closest matching line & fraction"
+        )
+
+        if broadening_method == "fft" and self.params.sparse_ldm == True:
+            if self.verbose >= 2:
+                print(
+                    "SPARSE optimisation not implemented with 'fft' mode. Use 'voigt' for analytical voigt, or radis.config['SPARSE_WAVERANGE'] = False"
+                )
+
+        if not (
+            broadening_method in ["voigt", "convolve"]
+            and self.params.sparse_ldm == True
+        ):
+            # Dense LDM
+            self.profiler.start("LDM_Distribute_lines", 3)
+            LDM = self._init_LDM(len(wG), len(wL))
+            self._distribute_lines_LDM([S], weights, [LDM])
+            self.profiler.stop("LDM_Distribute_lines", "Distribute lines over LDM")
+            # All lines within each bins are convolved with the same lineshape.
+            # Let's do it:
+            self.profiler.start("LDM_convolve", 3)
+            (sumoflines,) = self._convolve_LDM(
+                [LDM], line_profile_LDM, len(wG), len(wL)
+            )
+            self.profiler.stop("LDM_convolve", "Convolve and sum on spectral range")
+            return wavenumber, sumoflines
+
+        # Sparse LDM
+        self.profiler.start("LDM_Distribute_lines", 3)
+        ki0, ki1, li0, li1, mi0, mi1, avi, awV = weights
+        awV00, awV01, awV10, awV11 = awV
+        Iv0 = S * (1 - avi)
+        Iv1 = S * avi
 
-        # All lines within each bins are convolved with the same lineshape.
-        # Let's do it:
+        # Get the intensity of all lines on the 2x2x2 bins, and the non-zero
+        # spectral ranges of each (l, m) cell of the LDM, in one pass
+        # (a single sort by (cell, position) then segment reductions, see
+        # sparse_add_at_grouped). Cells are indexed as l * (NwL+1) + m, so
+        # that out-of-grid indices (li1 = NwG, mi1 = NwL) can be discarded.
+        NwL1 = len(wL) + 1
+        key00 = li0.astype(np.int64) * NwL1 + mi0
+        key01 = li0.astype(np.int64) * NwL1 + mi1
+        key10 = li1.astype(np.int64) * NwL1 + mi0
+        key11 = li1.astype(np.int64) * NwL1 + mi1
+        keys, ranges_ptr, ranges, I_ptr, LDM_reduced = sparse_add_at_grouped(
+            key=np.hstack((key00, key01, key10, key11) * 2),
+            k=np.hstack((ki0,) * 4 + (ki1,) * 4).astype(np.int64),
+            I=np.hstack(
+                (
+                    Iv0 * awV00,
+                    Iv0 * awV01,
+                    Iv0 * awV10,
+                    Iv0 * awV11,
+                    Iv1 * awV00,
+                    Iv1 * awV01,
+                    Iv1 * awV10,
+                    Iv1 * awV11,
+                )
+            ),
+            max_range=len(wavenumber_calc),
+            truncation_pts=int(self.params.truncation // self.params.wstep),
+        )
+        LDM_reduced = LDM_reduced.astype(dtype, copy=False)
+        # note: truncation could be unique for each point of the LDM basis
+        # (allow to have line-dependant truncation, at least as all
+        # lines with same truncation are grouped together in the LDM basis)
 
         self.profiler.stop("LDM_Distribute_lines", "Distribute lines over LDM")
         self.profiler.start("LDM_convolve", 3)
 
         # For each value from the LDM, retrieve the lineshape and convolve all
         # corresponding lines with it before summing.
-        if broadening_method in ["voigt", "convolve"]:
+        # ... Initialize array on which to distribute the lineshapes
+        sumoflines_calc = zeros_like(wavenumber_calc, dtype=dtype)
+
+        # Only convolve the non-zero ranges of non-empty cells
+        # (ranges are different for each cell: convolve them one by one)
+        for j, key in enumerate(keys):
+            l, m = divmod(key, NwL1)
+            if l >= len(wG) or m >= len(wL):
+                continue  # out of the LDM grid (zero weight)
+            mask = boolean_array_from_ranges(
+                ranges[ranges_ptr[j] : ranges_ptr[j + 1]],
+                len(sumoflines_calc),
+            )
+            sumoflines_calc[mask] += oaconvolve(
+                LDM_reduced[I_ptr[j] : I_ptr[j + 1]],
+                line_profile_LDM[l][m].astype(dtype),
+                "same",
+            )
 
-            # ... Initialize array on which to distribute the lineshapes
-            sumoflines_calc = zeros_like(wavenumber_calc)
+        self.profiler.stop("LDM_convolve", "Convolve and sum on spectral range")
+        # Get valid range (discard wings). Output spectral quantities are
+        # always in float64
+        sumoflines = sumoflines_calc[self.woutrange[0] : self.woutrange[1]].astype(
+            np.float64, copy=False
+        )
 
-            for l in range(len(wG)):
-                for m in range(len(wL)):
-                    lineshape = line_profile_LDM[l][m]
+        return wavenumber, sumoflines
 
-                    if self.params.sparse_ldm == True:
-                        if (l, m) in LDM_ranges.keys():
-                            mask = boolean_array_from_ranges(
-                                LDM_ranges[(l, m)], len(sumoflines_calc)
-                            )
-                            sumoflines_calc[mask] += oaconvolve(
-                                LDM_reduced[(l, m)], lineshape, "same"
-                            )
-                    else:
-                        sumoflines_calc += oaconvolve(LDM[:, l, m], lineshape, "same")
+    def _apply_lineshapes_LDM(
+        self,
+        broadened_params,
+        line_profile_LDM,
+        shifted_wavenum,
+        wL,
+        wG,
+        wL_dat,
+        wG_dat,
+        optimization,
+    ):
+        """Same as :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+        for several broadened parameters (ex: ``S`` and ``Ei`` in non-equilibrium)
+        at once : the weights of the lines on the LDM and the Fourier
+        transform of the lineshapes are computed only once.
 
-        elif broadening_method == "fft":
-            # ... Initialize array in FT space
-            Ildm_FT = 1j * np.zeros(len(line_profile_LDM[0][0]))
-            for l in range(len(wG)):
-                for m in range(len(wL)):
-                    lineshape_FT = line_profile_LDM[l][m]
-                    Ildm_FT += np.fft.rfft(LDM[:, l, m]) * lineshape_FT
-            # Back in real space:
-            sumoflines_calc = np.fft.irfft(Ildm_FT)[: len(wavenumber_calc)]
-            sumoflines_calc /= self.params.wstep
+        Parameters
+        ----------
+        broadened_params: list of arrays
+            see ``broadened_param`` in :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
+
+        Other parameters are the same as :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_LDM`
 
+        Returns
+        -------
+        wavenumber, list of sumoflines
+        """
+        # Get add-at method
+        # ... 1. allow user to use non-cython method (useful for tests ?)
+        # ... 2. write in the Spectrum object whether Cython was used or not
+        # ...    (either because deactivated, or because not installed)
+        if self.use_cython and add_at != numpy_add_at:
+            self.misc.add_at_used = "cython"
         else:
-            raise NotImplementedError(broadening_method)
+            self.misc.add_at_used = "numpy"
+
+        if (
+            self.params.broadening_method in ["voigt", "convolve"]
+            and self.params.sparse_ldm == True
+        ):
+            # Sparse LDM is built with a single sort of all lines: done for each
+            # broadened parameter, without threads
+            return self.wavenumber, [
+                self._apply_lineshape_LDM(
+                    broadened_param,
+                    line_profile_LDM,
+                    shifted_wavenum,
+                    wL,
+                    wG,
+                    wL_dat,
+                    wG_dat,
+                    optimization,
+                )[1]
+                for broadened_param in broadened_params
+            ]
+
+        self.profiler.start("LDM_closest_matching_line", 3)
+        weights = self._get_weights_LDM(
+            shifted_wavenum, wL, wG, wL_dat, wG_dat, optimization
+        )
+        self.profiler.stop(
+            "LDM_closest_matching_line", "Get closest matching line & fraction"
+        )
+
+        self.profiler.start("LDM_Distribute_lines", 3)
+        LDMs = [self._init_LDM(len(wG), len(wL)) for _ in broadened_params]
+        self._distribute_lines_LDM(broadened_params, weights, LDMs)
+        self.profiler.stop("LDM_Distribute_lines", "Distribute lines over LDM")
 
+        self.profiler.start("LDM_convolve", 3)
+        sumoflines = self._convolve_LDM(LDMs, line_profile_LDM, len(wG), len(wL))
         self.profiler.stop("LDM_convolve", "Convolve and sum on spectral range")
-        # Get valid range (discard wings)
-        sumoflines = sumoflines_calc[self.woutrange[0] : self.woutrange[1]]
 
-        return wavenumber, sumoflines
+        return self.wavenumber, sumoflines
 
     def _broaden_lines(self, df):
         """Divide over chuncks not to process to many lines in memory at the
         same time (note that this is not where the parallelisation is done: all
-        lines are processed on the same core. )
+        lines are processed on the same core. See
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_parallel`)
 
         Parameters
         ----------
@@ -2178,7 +2671,14 @@ class BroadenFactory(BaseFactory):
                             estimated_time
                         )
                     )
-                if chunksize is None:
+                if self.params.broadening_method == "voigt":
+                    # Compute & sum lineshapes line by line in a compiled loop:
+                    # no (B x N) matrix of lineshapes, so no need for chunks
+                    (wavenumber, (abscoeff,)) = self._apply_lineshape_voigt_jit(
+                        [df.S.values], df
+                    )
+
+                elif chunksize is None:
 
                     # Deal with all lines directly (usually faster)
                     line_profile = self._calc_lineshape(df)  # usually the bottleneck
@@ -2231,7 +2731,8 @@ class BroadenFactory(BaseFactory):
     def _broaden_lines_noneq(self, df):
         """Divide over chuncks not to process to many lines in memory at the
         same time (note that this is not where the parallelisation is done: all
-        lines are processed on the same core)
+        lines are processed on the same core. See
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_parallel`)
 
         See _calc_lineshape for more information
         """
@@ -2267,18 +2768,8 @@ class BroadenFactory(BaseFactory):
                             estimated_time
                         )
                     )
-                (wavenumber, abscoeff) = self._apply_lineshape_LDM(
-                    df.S.values,
-                    line_profile_LDM,
-                    df.shiftwav.values,
-                    wL,
-                    wG,
-                    wL_dat,
-                    wG_dat,
-                    optimization,
-                )
-                (_, emisscoeff) = self._apply_lineshape_LDM(
-                    df.Ei.values,
+                (wavenumber, (abscoeff, emisscoeff)) = self._apply_lineshapes_LDM(
+                    [df.S.values, df.Ei.values],
                     line_profile_LDM,
                     df.shiftwav.values,
                     wL,
@@ -2301,9 +2792,10 @@ class BroadenFactory(BaseFactory):
                 # ... Convolve and sum on spectral range 0.3s
                 # @EP: #performance.
                 # unlike in the non LDM case, the nonequilibruum case here is ~2x
-                # the equilibrium case: only the closest matching line is common to the
-                # absorption & emission steps. The bottleneck is the distribution
-                # of the line over the LDM, which has to be done for both abscoeff & emisscoeff.
+                # the equilibrium case: only the closest matching line and the
+                # FFT of the lineshapes are common to the absorption & emission
+                # steps. The bottleneck is the distribution of the line over the
+                # LDM, which has to be done for both abscoeff & emisscoeff.
 
             elif optimization is None:
                 # printing estimated time
@@ -2314,7 +2806,15 @@ class BroadenFactory(BaseFactory):
                             estimated_time
                         )
                     )
-                if chunksize is None:
+                if self.params.broadening_method == "voigt":
+                    # Compute & sum lineshapes line by line in a compiled loop:
+                    # the lineshape is computed once for both coefficients
+                    (
+                        wavenumber,
+                        (abscoeff, emisscoeff),
+                    ) = self._apply_lineshape_voigt_jit([df.S.values, df.Ei.values], df)
+
+                elif chunksize is None:
                     # Deal with all lines directly (usually faster)
                     line_profile = self._calc_lineshape(df)  # usually the bottleneck
                     (wavenumber, abscoeff) = self._apply_lineshape(
@@ -2374,6 +2874,113 @@ class BroadenFactory(BaseFactory):
 
         return wavenumber, abscoeff, emisscoeff
 
+    def _broaden_lines_parallel(self, df, noneq=False):
+        """Split the lines in chunks of consecutive lines, broaden each chunk
+        on its own thread, and sum the partial absorption (and emission)
+        coefficients.
+
+        Used if :py:attr:`~radis.lbl.loader.MiscParams.parallel` is ``True``.
+
+        Parameters
+        ----------
+        df: DataFrame
+            line dataframe
+        noneq: bool
+            if ``True``, also compute the emission coefficient (see
+            :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_noneq`)
+
+        Returns
+        -------
+        wavenumber, abscoeff (, emisscoeff)
+            same as :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines`
+            (:py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_noneq`)
+
+        Notes
+        -----
+        Number of chunks is given by :py:attr:`~radis.lbl.loader.MiscParams.nJobs`
+        (see :class:`joblib.parallel.Parallel`).
+
+        With LDM ``optimization``, lines are not split in chunks : they are
+        distributed on a single LDM per broadened parameter, which is then
+        convolved once with ``nJobs`` FFT workers (see
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshapes_LDM`).
+        The distribution of the lines (``add_at``) holds the GIL and is not
+        threaded.
+
+        Threads are used rather than processes, so that the line database
+        does not have to be serialized for each worker. The compiled kernels
+        (:py:func:`~radis.lbl.broadening._voigt_sum_on_grid`), Numpy operations
+        and the FFT convolutions release the GIL.
+        """
+        from copy import copy
+
+        from joblib import Parallel, delayed
+
+        nJobs = max(1, min(effective_n_jobs(self.misc.nJobs), len(df)))
+        optimization = self.params.optimization
+
+        self.profiler.start("broaden_lines_parallel", 3)
+
+        if optimization in ("simple", "min-RMS"):
+            self.reftracker.add(doi["DIT-2020"], "algorithm")
+            if self.misc.zero_padding < 0 or self.misc.zero_padding > len(
+                self.wavenumber_calc
+            ):
+                self.misc.zero_padding = len(self.wavenumber_calc)
+            line_profile_LDM, wL, wG, wL_dat, wG_dat = self._calc_lineshape_LDM(df)
+            broadened_params = [df.S.values, df.Ei.values] if noneq else [df.S.values]
+            _, coeffs = self._apply_lineshapes_LDM(
+                broadened_params,
+                line_profile_LDM,
+                df.shiftwav.values,
+                wL,
+                wG,
+                wL_dat,
+                wG_dat,
+                optimization,
+            )
+
+        elif optimization is None:
+
+            def broaden_chunk(index):
+                # ... shallow copy : share all parameters, but use a separate Profiler
+                # ... (Profiler is not thread-safe)
+                sf = copy(self)
+                sf.misc = MiscParams()
+                sf.misc.update(self.misc)
+                sf.misc.parallel = False  # do not nest threads (ex: FFT workers)
+                sf.verbose = 0
+                sf._reset_profiler(0)
+                sf.profiler.start("broaden_chunk", 1)
+                sf.profiler.start("calc_line_broadening", 2)
+
+                dg = df.iloc[index]
+                if noneq:
+                    return sf._broaden_lines_noneq(dg)[1:]
+                else:
+                    return sf._broaden_lines(dg)[1:]
+
+            chunks = np.array_split(arange(len(df)), nJobs)
+            results = Parallel(n_jobs=nJobs, prefer="threads")(
+                delayed(broaden_chunk)(index) for index in chunks
+            )
+            # Sum partial coefficients of all chunks:
+            coeffs = [
+                np.sum(partial_coeffs, axis=0) for partial_coeffs in zip(*results)
+            ]
+
+        else:
+            raise ValueError(
+                "Unexpected value for optimization: {0}".format(optimization)
+            )
+
+        self.profiler.stop(
+            "broaden_lines_parallel",
+            f"Broadened lines in parallel ({nJobs} chunks)",
+        )
+
+        return (self.wavenumber, *coeffs)
+
     # %% Generate absorption profile which includes linebroadening factors
 
     def _calc_broadening(self):
@@ -2399,7 +3006,7 @@ class BroadenFactory(BaseFactory):
           number density (cm-3) to get (cm-1/#) unit.
 
         """
-        df = self.df1
+        df = self._get_selected_lines()
 
         self.profiler.start(
             "calc_line_broadening",
@@ -2419,7 +3026,10 @@ class BroadenFactory(BaseFactory):
                 + " may be inverted"
             )
 
-        (wavenumber, abscoeff) = self._broaden_lines(df)
+        if self.misc.parallel:
+            (wavenumber, abscoeff) = self._broaden_lines_parallel(df)
+        else:
+            (wavenumber, abscoeff) = self._broaden_lines(df)
         self.profiler.stop("calc_line_broadening", "Calculated line broadening")
 
         return wavenumber, abscoeff
@@ -2449,7 +3059,7 @@ class BroadenFactory(BaseFactory):
           number density (cm-3).
         """
 
-        df = self.df1
+        df = self._get_selected_lines()
 
         self.profiler.start(
             "calc_line_broadening",
@@ -2469,7 +3079,12 @@ class BroadenFactory(BaseFactory):
                 + " may be inverted"
             )
 
-        (wavenumber, abscoeff, emisscoeff) = self._broaden_lines_noneq(df)
+        if self.misc.parallel:
+            (wavenumber, abscoeff, emisscoeff) = self._broaden_lines_parallel(
+                df, noneq=True
+            )
+        else:
+            (wavenumber, abscoeff, emisscoeff) = self._broaden_lines_noneq(df)
 
         self.profiler.stop("calc_line_broadening", "Calculated line broadening")
         return wavenumber, abscoeff, emisscoeff
@@ -2511,23 +3126,16 @@ class BroadenFactory(BaseFactory):
         df = self.df1  # lines already scaled with current temperature, size N
 
         self.profiler.start("weak_lines", 2, "... classifying lines as weak or strong")
-        # Get approximate spectral absorption coefficient
-        rough_spectrum, S_density_on_grid, line2grid_proj_left = project_lines_on_grid(
-            df, wavenumber_calc, wstep
-        )
-
-        #     :
-        # ~ 1/(#.cm-2)
-        # Sizes:
-        # - rough_spectrum:     size W
-        # - S_density_on_grid:  size N
-        # - line2grid_proj:     size N
-
-        # Weak line criteria
-        # ... Compare line density (in 1/(#.cm-2) to sum)
-        line_is_weak = S_density_on_grid < (
-            weak_rel_intensity_threshold
-            * (rough_spectrum[line2grid_proj_left] - S_density_on_grid)
+        # Get approximate spectral absorption coefficient, and compare line
+        # density (in 1/(#.cm-2)) to the sum, in a single compiled pass
+        # (see project_lines_on_grid)
+        _, _, _, line_is_weak = _rough_sum_on_grid(
+            np.asarray(wavenumber_calc, dtype=np.float64),
+            wstep,
+            df.shiftwav.values,
+            df.hwhm_voigt.values * 2,  # HWHM > FWHM
+            np.atleast_2d(df.S.values),
+            weak_rel_intensity_threshold,
         )  # size N
 
         #        # DEBUG: plot weak lines and strong lines
@@ -2609,6 +3217,10 @@ class BroadenFactory(BaseFactory):
                     + "Choose either optimization=None either pseudo_continuum_threshold=0"
                 )
 
+            # Lines are split again in weak and strong lines : select the lines
+            # kept by the linestrength cutoff (zero-copy mode)
+            self._apply_lines_selection()
+
             # Calculate rough spectrum, label weak lines
             # ... only guess based on abscoeff. See Notes for noneq case.
             self._find_weak_lines(pseudo_continuum_threshold)
@@ -2719,7 +3331,11 @@ class BroadenFactory(BaseFactory):
         else:
             k_continuum = None
             self._Nlines_in_continuum = 0
-            self._Nlines_calculated = len(self.df1)
+            self._Nlines_calculated = (
+                len(self.df1)
+                if self._lines_selection is None
+                else len(self._lines_selection)
+            )
 
             if noneq:
                 j_continuum = None
@@ -2743,6 +3359,115 @@ class BroadenFactory(BaseFactory):
         return abscoeff_v
 
 
+@jit(nopython=True, cache=True, error_model="numpy")
+def _rough_sum_on_grid(
+    wavenumber, wstep, shiftwav, wv, intensities, weak_rel_intensity_threshold=0.0
+):
+    """Sum all lines on the spectral grid as rectangles of width
+    :math:`\\alpha \\cdot FWHM_{Voigt}`, and classify lines as weak or strong.
+
+    Compiled kernel of :py:func:`~radis.lbl.broadening.project_lines_on_grid`
+    and :py:func:`~radis.lbl.broadening.project_lines_on_grid_noneq`
+
+    Parameters
+    ----------
+    wavenumber: np.array
+        spectral grid. Size ``W``. Expected to be regular
+    wstep: float  (cm-1)
+        wavenumber step
+    shiftwav, wv: np.array
+        line positions and Voigt FWHM. Size ``N``
+    intensities: np.array
+        line intensities to project (ex: ``S``, ``Ei``). Shape ``K x N``
+    weak_rel_intensity_threshold: float
+        used for ``line_is_weak``, see
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._find_weak_lines`
+
+    Returns
+    -------
+    rough_spectra: np.array
+        rough spectrum of each intensity. Shape ``K x W``
+    densities_on_grid: np.array
+        average spectral intensity of each line. Shape ``K x N``
+    line2grid_projection_left: np.array
+        closest index of the center of each line on the spectral grid. Size ``N``
+    line_is_weak: np.array of bool
+        weak line criteria, based on the first intensity. Size ``N``
+
+    Notes
+    -----
+    Performance:
+
+    Test case:  6.5k lines, 18k grid points
+    - standard: 13.6 ms
+    - with @jit: 0.9 ms
+
+    Compiled once and cached on disk (``cache=True``), rather than recompiled
+    on every call. Divisions follow the Numpy error model (lines out of the
+    grid are not an error).
+    """
+    ALPHA = 2  # arbitrary.
+    len_grid = len(wavenumber)
+    K, N = intensities.shape
+
+    # rough_spectra has len_grid+2 because two points are used for out of
+    # range intensities. We crop at the end
+    rough_spectra = np.zeros((K, len_grid + 2))
+    densities_on_grid = np.empty((K, N))
+    line2grid_projection_left = np.empty(N, dtype=np.int64)
+    for i in range(N):
+        # ... First get closest matching line (left, and right):
+        iwav_on_grid_left = np.searchsorted(wavenumber, shiftwav[i]) - 1
+        iwav_on_grid_right = min(iwav_on_grid_left + 1, len_grid - 1)
+
+        # ... Get the fraction of each line distributed to the left and to the right.
+        dist_left = shiftwav[i] - wavenumber[iwav_on_grid_left]  # distance to left
+        dist_right = wavenumber[iwav_on_grid_right] - shiftwav[i]  # distance to right
+        dv = dist_left + dist_right
+        frac_left, frac_right = dist_right / dv, dist_left / dv
+
+        # ... express FWHM (in nm) in index
+        ihwhm_on_grid = np.int64(ALPHA * wv[i] / 2 // wstep)
+        ifwhm_on_grid = ihwhm_on_grid * 2 + 1  # make it odd (conserves center)
+
+        # ... infer min and max index to project lines. Out of range intensities
+        # ... are projected to index -1 and len_grid+1 (offset by 1)
+        imin_left = max(iwav_on_grid_left - ihwhm_on_grid, -1) + 1
+        imax_left = min(iwav_on_grid_left + ihwhm_on_grid, len_grid) + 1
+        imin_right = max(iwav_on_grid_right - ihwhm_on_grid, -1) + 1
+        imax_right = min(iwav_on_grid_right + ihwhm_on_grid, len_grid) + 1
+
+        for k in range(K):
+            # Get average intensity, assuming a rectangular profile of width FWHM
+            Iline_density = intensities[k, i] / (ifwhm_on_grid * wstep)
+            densities_on_grid[k, i] = Iline_density
+            rough_spectra[k, imin_left : imax_left + 1] += frac_left * Iline_density
+            rough_spectra[k, imin_right : imax_right + 1] += frac_right * Iline_density
+
+        # Nomenclature for lines above:
+        # - min/max: start/end of a lineshape
+        # - left/right: closest spectral grid point on the left/right
+
+        line2grid_projection_left[i] = iwav_on_grid_left
+
+    # crop out of range points
+    rough_spectra = rough_spectra[:, 1:-1]
+
+    # Weak line criteria
+    # ... Compare line density (in 1/(#.cm-2) to sum)
+    line_is_weak = np.empty(N, dtype=np.bool_)
+    for i in range(N):
+        S_density = densities_on_grid[0, i]
+        j = line2grid_projection_left[i]
+        if j < 0:  # same as Numpy indexing with negative index
+            j += len_grid
+        line_is_weak[i] = S_density < (
+            weak_rel_intensity_threshold * (rough_spectra[0, j] - S_density)
+        )
+
+    return rough_spectra, densities_on_grid, line2grid_projection_left, line_is_weak
+
+
 def project_lines_on_grid(df, wavenumber, wstep):
     """Quickly sums all lines on wavespace grid as rectangles of HWHM
     corresponding to ``hwhm_voigt`` and a spectral absorption coefficient value so
@@ -2772,109 +3497,30 @@ def project_lines_on_grid(df, wavenumber, wstep):
     line2grid_projection
         closest index of the center of each line in ``df`` on the spectral grid
         ``wavenumber``. Size ``N``
+
+    See Also
+    --------
+    :py:func:`~radis.lbl.broadening._rough_sum_on_grid`
     """
 
     shiftwav = df.shiftwav.values  # cm-1  ,   size N (number of lines)
     S = df.S.values  # cm/#  ~   cm-1/(#.cm-2)  ,   size N
     wv = df.hwhm_voigt.values * 2  # HWHM > FWHM
 
-    # ... First get closest matching line (left, and right):
-    iwav_on_grid_left = np.searchsorted(wavenumber, shiftwav.T, side="left").ravel() - 1
-    iwav_on_grid_right = np.minimum(iwav_on_grid_left + 1, len(wavenumber) - 1)
-
-    # ... Get the fraction of each line distributed to the left and to the right.
-    frac_left = (shiftwav - wavenumber[iwav_on_grid_left]).flatten()  # distance to left
-    frac_right = (
-        wavenumber[iwav_on_grid_right] - shiftwav
-    ).flatten()  # distance to right
-    dv = frac_left + frac_right
-    frac_left, frac_right = frac_right / dv, frac_left / dv
-
-    # ... express FWHM (in nm) in index
-    ALPHA = 2  # arbitrary.
-    ihwhm_on_grid = np.asarray(ALPHA * wv / 2 // wstep, dtype=np.int64)
-    ifwhm_on_grid = ihwhm_on_grid * 2 + 1  # make it odd (conserves center)
-    # ... infer min and max index to project lines (sides may be out of range)
-    imin_broadened_wav_on_grid_left = iwav_on_grid_left - ihwhm_on_grid
-    imax_broadened_wav_on_grid_left = iwav_on_grid_left + ihwhm_on_grid
-    imin_broadened_wav_on_grid_right = iwav_on_grid_right - ihwhm_on_grid
-    imax_broadened_wav_on_grid_right = iwav_on_grid_right + ihwhm_on_grid
-
-    # Get average intensity, assuming a rectangular profile of width FWHM
-    S_density_on_grid = S / (ifwhm_on_grid * wstep)  # ~ 1/(#.cm-2)
-
-    # Cut out of range points
-    # ... @dev: you should see imin_broadened_wav_on_grid as a projection array, with
-    # ... indexes where Intensity will be summed afterwards.
-    # ... here we project the out of range intensities to index -1 and len_grid+1
-    # ... (this is faster than )
-    len_grid = len(wavenumber)
-    imin_broadened_wav_offset_left = imin_broadened_wav_on_grid_left
-    imax_broadened_wav_offset_left = imax_broadened_wav_on_grid_left
-    imin_broadened_wav_offset_right = imin_broadened_wav_on_grid_right
-    imax_broadened_wav_offset_right = imax_broadened_wav_on_grid_right
-    imin_broadened_wav_offset_left[imin_broadened_wav_offset_left < 0] = -1
-    imin_broadened_wav_offset_right[imin_broadened_wav_offset_right < 0] = -1
-    imax_broadened_wav_offset_left[imax_broadened_wav_offset_left > len_grid] = len_grid
-    imax_broadened_wav_offset_right[
-        imax_broadened_wav_offset_right > len_grid
-    ] = len_grid
-    imin_broadened_wav_offset_left += 1
-    imax_broadened_wav_offset_left += 1
-    imin_broadened_wav_offset_right += 1
-    imax_broadened_wav_offset_right += 1
-
-    line2grid_projection_left = iwav_on_grid_left  # size N (number of lines)
-    line2grid_projection_right = iwav_on_grid_right  # size N (number of lines)
-    # ... deal with case where a new point is created (we dont want that)
-    # ... just offset it by one unit (we're working with wavenumber_calc anyway,
-    # ... these boundary points will be cropped by RADIS at the end of the calculation)
-    line2grid_projection_left[line2grid_projection_left == len(wavenumber)] = (
-        len(wavenumber) - 1
-    )
-    line2grid_projection_right[line2grid_projection_right == len(wavenumber)] = (
-        len(wavenumber) - 1
+    (
+        k_rough_spectrum,
+        S_density_on_grid,
+        line2grid_projection_left,
+        _,
+    ) = _rough_sum_on_grid(
+        np.asarray(wavenumber, dtype=np.float64),
+        wstep,
+        shiftwav,
+        wv,
+        np.atleast_2d(S),
     )
 
-    @jit(float64[:](), nopython=True)
-    def rough_sum_on_grid():
-        """Sum all lines linestrength density on a spectrum."""
-        # Performance
-        # ----------
-        #
-        # Test case:  6.5k lines, 18k grid points
-        # - standard: 13.6 ms
-        # - with @jit: 0.9 ms
-        #
-        # Array size
-        # ----------
-        # rough_spectrum has len_grid+2 because two points are used for out of
-        # range intensities. We crop at the end
-        rough_spectrum = np.zeros(len_grid + 2)
-        for i, (fr_left, fr_right, Iline_density) in enumerate(
-            zip(frac_left, frac_right, S_density_on_grid)
-        ):
-            imin_left = imin_broadened_wav_offset_left[i]
-            imax_left = imax_broadened_wav_offset_left[i]
-            imin_right = imin_broadened_wav_offset_right[i]
-            imax_right = imax_broadened_wav_offset_right[i]
-            rough_spectrum[imin_left : imax_left + 1] += fr_left * Iline_density
-            rough_spectrum[imin_right : imax_right + 1] += fr_right * Iline_density
-
-        # Nomenclature for lines above:
-        # - min/max: start/end of a lineshape
-        # - left/right: closest spectral grid point on the left/right
-
-        # crop out of range points
-        return rough_spectrum[1:-1]
-
-    # TODO: @dev #performance
-    # ... try with k_rough_spectrum.add.at()  ?
-    # ... but it probably wont ever be comparable with LDM.
-
-    k_rough_spectrum = rough_sum_on_grid()
-
-    return k_rough_spectrum, S_density_on_grid, line2grid_projection_left
+    return k_rough_spectrum[0], S_density_on_grid[0], line2grid_projection_left
 
 
 def project_lines_on_grid_noneq(df, wavenumber, wstep):
@@ -2894,8 +3540,6 @@ def project_lines_on_grid_noneq(df, wavenumber, wstep):
         spectral grid. Size ``W``. Expected to be regular
     wstep: float  (cm-1)
         wavenumber step
-    quantity: 'S' or 'Ei'
-        use 'S' for Linestrength, 'Ei' for emission integral. Default 'S'
 
     Returns
     -------
@@ -2928,103 +3572,19 @@ def project_lines_on_grid_noneq(df, wavenumber, wstep):
     Ei = df.Ei.values  # mW/cm3/sr
     wv = df.hwhm_voigt.values * 2  # HWHM > FWHM
 
-    # ... First get closest matching line (left, and right):
-    iwav_on_grid_left = np.searchsorted(wavenumber, shiftwav.T, side="left").ravel() - 1
-    iwav_on_grid_right = np.minimum(iwav_on_grid_left + 1, len(wavenumber) - 1)
-
-    # ... Get the fraction of each line distributed to the left and to the right.
-    frac_left = (shiftwav - wavenumber[iwav_on_grid_left]).flatten()  # distance to left
-    frac_right = (
-        wavenumber[iwav_on_grid_right] - shiftwav
-    ).flatten()  # distance to right
-    dv = frac_left + frac_right
-    frac_left, frac_right = frac_right / dv, frac_left / dv
-
-    # ... express FWHM (in nm) in index
-    ALPHA = 2  # arbitrary.
-    ihwhm_on_grid = np.asarray(ALPHA * wv / 2 // wstep, dtype=np.int64)
-    ifwhm_on_grid = ihwhm_on_grid * 2 + 1  # make it odd (conserves center)
-    # ... infer min and max index to project lines (sides may be out of range)
-    imin_broadened_wav_on_grid_left = iwav_on_grid_left - ihwhm_on_grid
-    imax_broadened_wav_on_grid_left = iwav_on_grid_left + ihwhm_on_grid
-    imin_broadened_wav_on_grid_right = iwav_on_grid_right - ihwhm_on_grid
-    imax_broadened_wav_on_grid_right = iwav_on_grid_right + ihwhm_on_grid
-
-    # Get average intensity, assuming a rectangular profile of width FWHM
-    S_density_on_grid = S / (ifwhm_on_grid * wstep)  # ~ 1/(#.cm-2)
-    Ei_density_on_grid = Ei / (ifwhm_on_grid * wstep)  # mW/cm3/sr/cm-1
-
-    # Cut out of range points
-    # ... @dev: you should see imin_broadened_wav_on_grid as a projection array, with
-    # ... indexes where Intensity will be summed afterwards.
-    # ... here we project the out of range intensities to index -1 and len_grid+1
-    # ... (this is faster than )
-    len_grid = len(wavenumber)
-    imin_broadened_wav_offset_left = imin_broadened_wav_on_grid_left
-    imax_broadened_wav_offset_left = imax_broadened_wav_on_grid_left
-    imin_broadened_wav_offset_right = imin_broadened_wav_on_grid_right
-    imax_broadened_wav_offset_right = imax_broadened_wav_on_grid_right
-    imin_broadened_wav_offset_left[imin_broadened_wav_offset_left < 0] = -1
-    imin_broadened_wav_offset_right[imin_broadened_wav_offset_right < 0] = -1
-    imax_broadened_wav_offset_left[imax_broadened_wav_offset_left > len_grid] = len_grid
-    imax_broadened_wav_offset_right[
-        imax_broadened_wav_offset_right > len_grid
-    ] = len_grid
-    imin_broadened_wav_offset_left += 1
-    imax_broadened_wav_offset_left += 1
-    imin_broadened_wav_offset_right += 1
-    imax_broadened_wav_offset_right += 1
-
-    line2grid_projection_left = iwav_on_grid_left  # size N (number of lines)
-    line2grid_projection_right = iwav_on_grid_right  # size N (number of lines)
-    # ... deal with case where a new point is created (we dont want that)
-    # ... just offset it by one unit (we're working with wavenumber_calc anyway,
-    # ... these boundary points will be cropped by RADIS at the end of the calculation)
-    line2grid_projection_left[line2grid_projection_left == len(wavenumber)] = (
-        len(wavenumber) - 1
-    )
-    line2grid_projection_right[line2grid_projection_right == len(wavenumber)] = (
-        len(wavenumber) - 1
+    (
+        (k_rough_spectrum, j_rough_spectrum),
+        (S_density_on_grid, Ei_density_on_grid),
+        line2grid_projection_left,
+        _,
+    ) = _rough_sum_on_grid(
+        np.asarray(wavenumber, dtype=np.float64),
+        wstep,
+        shiftwav,
+        wv,
+        np.vstack((S, Ei)),
     )
 
-    @jit(nopython=True)
-    def rough_sum_on_grid():
-        """Sum all lines linestrength density on a spectrum."""
-        # Performance
-        # ----------
-        #
-        # Test case:  6.5k lines, 18k grid points
-        # - standard: 13.6 ms
-        # - with @jit: 0.9 ms
-        #
-        # Array size
-        # ----------
-        # rough_spectrum has len_grid+2 because two points are used for out of
-        # range intensities. We crop at the end
-        k_rough_spectrum = np.zeros(len_grid + 2)
-        j_rough_spectrum = np.zeros(len_grid + 2)
-        for i in range(len(S_density_on_grid)):
-            imin_left = imin_broadened_wav_offset_left[i]
-            imax_left = imax_broadened_wav_offset_left[i]
-            imin_right = imin_broadened_wav_offset_right[i]
-            imax_right = imax_broadened_wav_offset_right[i]
-            k_rough_spectrum[imin_left : imax_left + 1] += (
-                frac_left[i] * S_density_on_grid[i]
-            )
-            k_rough_spectrum[imin_right : imax_right + 1] += (
-                frac_right[i] * S_density_on_grid[i]
-            )
-            j_rough_spectrum[imin_left : imax_left + 1] += (
-                frac_left[i] * Ei_density_on_grid[i]
-            )
-            j_rough_spectrum[imin_right : imax_right + 1] += (
-                frac_right[i] * Ei_density_on_grid[i]
-            )
-        # crop out of range points
-        return k_rough_spectrum[1:-1], j_rough_spectrum[1:-1]
-
-    k_rough_spectrum, j_rough_spectrum = rough_sum_on_grid()
-
     return (
         k_rough_spectrum,
         j_rough_spectrum,
@@ -104,6 +104,7 @@ from radis.phys.units import convert_emi2nm, convert_rad2nm
 from radis.phys.units_astropy import convert_and_strip_units
 from radis.spectrum.equations import calc_radiance
 from radis.spectrum.spectrum import Spectrum
+from radis.tools.database import SpecList
 
 c_cm = c * 100
 
@@ -226,7 +227,29 @@ class SpectrumFactory(BandFactory):
         the multiplication of lines over all spectral range takes too much memory
         and slows the system down. Chunksize let you change the default chunck
         size. If ``None``, all lines are processed directly. Usually faster but
-        can create memory problems. Default ``None``
+        can create memory problems. Not used with ``optimization=None`` and
+        ``broadening_method='voigt'``, where lineshapes are computed and summed
+        line by line without storing all of them (see
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._apply_lineshape_voigt_jit`).
+        Default ``None``
+    parallel: bool
+        if ``True``, lines are split in ``nJobs`` chunks of consecutive lines that
+        are broadened on separate threads. Partial absorption & emission
+        coefficients are summed afterwards. See
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._broaden_lines_parallel`.
+        Outside of line chunks, the LDM convolutions also use ``nJobs`` FFT
+        threads (see :py:mod:`scipy.fft`). Default ``False``.
+    nJobs: int
+        Number of threads (and line chunks) used if ``parallel``. Default ``-2``:
+        use all but 1 processors. See :class:`joblib.parallel.Parallel`
+    dtype: ``"float64"``, ``"float32"``
+        floating point precision of the broadening parameters of the line
+        database, and of the LDM ``optimization`` (lineshape database and
+        convolutions). ``"float32"`` halves the memory of the LDM, the largest
+        array of the calculation. Line positions, intensities and output
+        spectral quantities remain in float64 (see :py:data:`~radis.lbl.loader.float32_columns`).
+        Absorption coefficients then differ from float64 results by about
+        1e-6 of their maximum. Default ``"float64"``.
     optimization : ``"simple"``, ``"min-RMS"``, ``None``
         If either ``"simple"`` or ``"min-RMS"`` LDM optimization for lineshape calculation is used:
         - ``"min-RMS"`` : weights optimized by analytical minimization of the RMS-error (See: [Spectral-Synthesis-Algorithm]_)
@@ -386,6 +409,8 @@ class SpectrumFactory(BandFactory):
         pseudo_continuum_threshold=0,
         self_absorption=True,
         chunksize=None,
+        parallel=False,
+        nJobs=-2,
         optimization="simple",
         folding_thresh=1e-6,
         zero_padding=-1,
@@ -398,6 +423,7 @@ class SpectrumFactory(BandFactory):
         export_populations=None,
         export_lines=False,
         emulate_gpu=False,
+        dtype="float64",
         **kwargs,
     ):
 
@@ -432,7 +458,7 @@ class SpectrumFactory(BandFactory):
                     + "We recommended, for most cases: `truncation=300, neighbour_lines=0}`"
                 )
             )
-        for boolarg in [self_absorption, save_memory, export_lines]:
+        for boolarg in [self_absorption, save_memory, export_lines, parallel]:
             if boolarg not in [True, False]:
                 raise ValueError(
                     f"Expected boolean parameter. Got `{boolarg.__repr__()}`. Use `True` or `False`"
@@ -447,6 +473,10 @@ class SpectrumFactory(BandFactory):
 
         if not 0 <= pseudo_continuum_threshold < 1:
             raise ValueError("pseudo_continuum_threshold should be in [0-1]")
+        if dtype not in ["float64", "float32"]:
+            raise ValueError(
+                "dtype must be one of 'float64', 'float32'. Got {0}".format(dtype)
+            )
         if export_populations not in ["vib", "rovib", False, None] and not isinstance(
             export_populations, list
         ):
@@ -576,10 +606,18 @@ class SpectrumFactory(BandFactory):
         self.params.broadening_method = broadening_method
         self.params.optimization = optimization
         self.params.folding_thresh = folding_thresh
+        self.params.dtype = dtype
         self.misc.zero_padding = zero_padding
 
         # used to split lines into blocks not too big for memory
         self.misc.chunksize = chunksize
+        # used to broaden chunks of lines on several threads
+        self.misc.parallel = parallel
+        self.misc.nJobs = nJobs
+        # results of the last calculation stages (see _memoized_stage)
+        self._stages = {}
+        self._stages_df0 = None  # weak reference to the line database of the stages
+        self._stage_key = None
         # Other parameters:
         self.save_memory = save_memory
         self.autoupdatedatabase = False  # a boolean to automatically store calculated
@@ -630,13 +668,14 @@ class SpectrumFactory(BandFactory):
 
     def eq_spectrum(
         self, Tgas, mole_fraction=None, path_length=None, pressure=None, name=None
-    ) -> Spectrum:
+    ) -> Union[Spectrum, SpecList]:
         """Generate a spectrum at equilibrium.
 
         Parameters
         ----------
         Tgas: float or `~astropy.units.quantity.Quantity`
-            Gas temperature (K)
+            Gas temperature (K). If an array, spectra are computed for all
+            conditions at once : see *Batch mode* below.
         mole_fraction: float
             database species mole fraction. If None, Factory mole fraction is used.
         path_length: float or `~astropy.units.quantity.Quantity`
@@ -650,7 +689,7 @@ class SpectrumFactory(BandFactory):
 
         Returns
         -------
-        s : Spectrum
+        s : Spectrum, or SpecList
             Returns a :class:`~radis.spectrum.spectrum.Spectrum` object
 
                 Use the :meth:`~radis.spectrum.spectrum.Spectrum.get` method to get something
@@ -659,6 +698,28 @@ class SpectrumFactory(BandFactory):
                 Or directly the :meth:`~radis.spectrum.spectrum.Spectrum.plot` method
                 to plot it. See [1]_ to get an overview of all Spectrum methods
 
+            In batch mode, returns a :class:`~radis.tools.database.SpecList` of
+            all spectra, in the order of the input conditions.
+
+        Notes
+        -----
+        Batch mode: if any of ``Tgas``, ``mole_fraction``, ``path_length``,
+        ``pressure`` is an array (arrays are broadcast together), lines are
+        loaded once and linestrengths and broadening HWHM are computed for all
+        conditions at once as (lines x conditions) arrays. The wavenumber grid
+        is generated for each condition, as in separate calls (with
+        ``wstep="auto"``, it depends on the narrowest lines of each condition).
+        The Factory conditions in :py:attr:`~radis.lbl.loader.DatabankLoader.input`
+        are restored after the batch, and the memoized stages of the
+        incremental mode below are neither used nor updated. See
+        :py:meth:`~radis.lbl.factory.SpectrumFactory._eq_spectrum_batch`
+
+        Incremental mode: if ``sf.misc.incremental`` is ``True``, the stages of
+        the calculation are memoized and only the stages whose inputs changed
+        are recomputed. For instance, linestrengths are not recomputed when
+        only the ``pressure`` or the ``mole_fraction`` change. See
+        :py:meth:`~radis.lbl.factory.SpectrumFactory._memoized_stage`
+
         Examples
         --------
         ::
@@ -674,6 +735,9 @@ class SpectrumFactory(BandFactory):
             s1 = sf.eq_spectrum(Tgas=300, path_length=1, pressure=0.1)
             s2 = sf.eq_spectrum(Tgas=500, path_length=1, pressure=0.1)
 
+            # Batch mode:
+            spectra = sf.eq_spectrum(Tgas=np.linspace(300, 1000, 100), path_length=1, pressure=0.1)
+
         .. minigallery:: radis.lbl.SpectrumFactory.eq_spectrum
             :add-heading:
 
@@ -702,6 +766,15 @@ class SpectrumFactory(BandFactory):
         path_length = convert_and_strip_units(path_length, u.cm)
         pressure = convert_and_strip_units(pressure, u.bar)
 
+        # Batch mode (several conditions)
+        if any(
+            isinstance(x, (list, tuple, np.ndarray))
+            for x in [Tgas, mole_fraction, path_length, pressure]
+        ):
+            return self._eq_spectrum_batch(
+                Tgas, mole_fraction, path_length, pressure, name
+            )
+
         # update defaults
         if path_length is not None:
             self.input.path_length = path_length
@@ -722,9 +795,7 @@ class SpectrumFactory(BandFactory):
         self.input.Trot = Tgas  # just for info
 
         # Init variables
-        pressure_mbar = self.input.pressure_mbar
         mole_fraction = self.input.mole_fraction
-        path_length = self.input.path_length
         verbose = self.verbose
 
         # New Profiler object
@@ -748,38 +819,96 @@ class SpectrumFactory(BandFactory):
         if verbose:
             self.print_conditions("Calculating Equilibrium Spectrum")
 
-        # Check database, reset populations, create line dataframe to be scaled
+        # Check database
         # --------------------------------------------------------------------
         self._check_line_databank()
-        self._reinitialize()  # creates scaled dataframe df1 from df0
+        self._check_skipped_tiers(Tgas)
+        self._init_stages()
 
         # --------------------------------------------------------------------
 
-        # First calculate the linestrength at given temperature
-        self.calc_linestrength_eq(Tgas)  # scales S0 to S (equivalent to S0 in code)
-        self._cutoff_linestrength()
+        def calc_linestrength():
+            # reset populations, create line dataframe df1 to be scaled from df0
+            self._reinitialize()
+            # calculate the linestrength at given temperature
+            self.calc_linestrength_eq(Tgas)  # scales S0 to S (equivalent to S0 in code)
+            self._cutoff_linestrength()
+
+        self._memoized_stage(
+            "linestrength",
+            (Tgas,),
+            calc_linestrength,
+            ["_Nlines_cutoff", "_lines_selection"],
+        )
 
         # ----------------------------------------------------------------------
 
         # Calculate line shift
-        self.calc_lineshift()  # scales wav to shiftwav (equivalent to v0)
+        self._memoized_stage(
+            "lineshift", (self.input.pressure_mbar,), self.calc_lineshift
+        )  # scales wav to shiftwav (equivalent to v0)
 
         # ----------------------------------------------------------------------
         # Line broadening
 
         # ... calculate broadening  HWHM
-        self._calc_broadening_HWHM()
+        self._memoized_stage(
+            "broadening_HWHM",
+            (self.input.pressure_mbar, mole_fraction),
+            self._calc_broadening_HWHM,
+        )
 
         # ... generates all wstep related entities
         self._generate_wavenumber_arrays()
 
-        # ... find weak lines and calculate semi-continuum (optional)
-        I_continuum = self.calculate_pseudo_continuum()
-        # ... apply lineshape and get absorption coefficient
-        # ... (this is the performance bottleneck)
-        wavenumber, abscoeff_v = self._calc_broadening()
-        #    :         :
-        #   cm-1    1/(#.cm-2)
+        def calc_broadening():
+            # ... find weak lines and calculate semi-continuum (optional)
+            I_continuum = self.calculate_pseudo_continuum()
+            # ... apply lineshape and get absorption coefficient
+            # ... (this is the performance bottleneck)
+            wavenumber, abscoeff_v = self._calc_broadening()
+            #    :         :
+            #   cm-1    1/(#.cm-2)
+            return wavenumber, abscoeff_v, I_continuum
+
+        wavenumber, abscoeff_v, I_continuum = self._memoized_stage(
+            "broadening",
+            (),
+            calc_broadening,
+            ["_Nlines_calculated", "_Nlines_in_continuum", "NwL", "NwG"],
+        )
+
+        return self._generate_eq_spectrum(wavenumber, abscoeff_v, I_continuum, name)
+
+    def _generate_eq_spectrum(self, wavenumber, abscoeff_v, I_continuum, name=None):
+        """Generate the equilibrium :class:`~radis.spectrum.spectrum.Spectrum`
+        from the absorption coefficient of all lines, for the current conditions
+        (:py:attr:`~radis.lbl.loader.DatabankLoader.input`).
+
+        Used in :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` and
+        :py:meth:`~radis.lbl.factory.SpectrumFactory._eq_spectrum_batch`
+
+        Parameters
+        ----------
+        wavenumber: array (cm-1)
+            spectral grid
+        abscoeff_v: array  (1/(#.cm-2))
+            sum of the broadened linestrengths of all lines
+        I_continuum: array, or ``None``
+            pseudo-continuum (see
+            :py:meth:`~radis.lbl.broadening.BroadenFactory.calculate_pseudo_continuum`)
+        name: str
+            output Spectrum name
+
+        Returns
+        -------
+        s : Spectrum
+        """
+
+        Tgas = self.input.Tgas
+        pressure_mbar = self.input.pressure_mbar
+        mole_fraction = self.input.mole_fraction
+        path_length = self.input.path_length
 
         # ... add semi-continuum (optional)
         abscoeff_v = self._add_pseudo_continuum(abscoeff_v, I_continuum)
@@ -902,6 +1031,303 @@ class SpectrumFactory(BandFactory):
 
         return s
 
+    def _init_stages(self):
+        """Start the chain of memoized calculation stages of a new spectrum.
+
+        Memoized stages are dropped if the line database was reloaded, or if
+        ``self.misc.incremental`` is ``False``. Otherwise, the chain starts
+        from all the parameters and inputs that are not a condition of the
+        spectrum (``Tgas``, ``pressure``, ``mole_fraction``, ``path_length``).
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.factory.SpectrumFactory._memoized_stage`
+        """
+        import weakref
+
+        if not self.misc.incremental or (
+            self._stages_df0 is None or self._stages_df0() is not self.df0
+        ):
+            self._stages.clear()
+        self._stages_df0 = weakref.ref(self.df0) if self.misc.incremental else None
+
+        # Values evaluated during the calculation are replaced by their targets
+        params = dict(self.params)
+        params.update(wstep=self._wstep, sparse_ldm=self._sparse_ldm)
+        for k in ["wavenum_min_calc", "wavenum_max_calc"]:
+            del params[k]
+        inputs = {
+            k: v
+            for k, v in self.input.items()
+            if k
+            not in [
+                "Tgas",
+                "Tvib",
+                "Trot",
+                "pressure_mbar",
+                "mole_fraction",
+                "path_length",
+            ]
+        }
+        self._stage_key = (
+            tuple(sorted((k, repr(v)) for k, v in params.items())),
+            tuple(sorted((k, repr(v)) for k, v in inputs.items())),
+            self.molparam.terrestrial_abundances,
+            tuple(self.molparam.df["abundance"]),
+        )
+
+    def _memoized_stage(self, stage, depends_on, compute, attributes=[]):
+        """Run a stage of the spectrum calculation, or restore it if it was
+        already computed with the same inputs.
+
+        Stages are chained : the key of a stage includes the key of the previous
+        stage, so that a change in the inputs of a stage also invalidates all
+        the following stages. For instance, when only the ``pressure`` changes,
+        the linestrengths and the linestrength cutoff are restored, and the
+        lineshift, broadening HWHM and lineshapes are recomputed. When only the
+        ``path_length`` changes, the absorption coefficient itself is restored.
+
+        Only the last result of each stage is kept. Memoization is enabled
+        with ``self.misc.incremental``, else ``compute`` is always called.
+
+        Parameters
+        ----------
+        stage: str
+            name of the stage
+        depends_on: tuple
+            inputs the stage depends on, in addition to the previous stages
+        compute: function
+            computes the stage ; can update the line dataframe ``self.df1``
+        attributes: list of str
+            Factory attributes set by ``compute``, restored with the stage
+
+        Returns
+        -------
+        out:
+            output of ``compute``. Arrays are copies of the memoized arrays.
+
+        Notes
+        -----
+        Modifications of the line database ``self.df0`` or of the partition
+        functions are not tracked : set ``self.misc.incremental = False`` to
+        recompute all stages.
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.factory.SpectrumFactory._init_stages`
+        """
+
+        def copy_arrays(out):
+            if isinstance(out, tuple):
+                return tuple(copy_arrays(o) for o in out)
+            return out.copy() if isinstance(out, np.ndarray) else out
+
+        if not self.misc.incremental:
+            return compute()
+
+        self._stage_key = (self._stage_key, stage, depends_on)
+
+        memo = self._stages.get(stage)
+        if memo is not None and memo["key"] == self._stage_key:
+            self.df1 = memo["df1"].copy(deep=False)
+            for k, v in memo["attributes"].items():
+                setattr(self, k, v)
+            return copy_arrays(memo["out"])
+
+        out = compute()
+        self._stages[stage] = {
+            "key": self._stage_key,
+            # shallow copy : columns added by the next stages are not memoized
+            "df1": self.df1.copy(deep=False),
+            "attributes": {k: getattr(self, k, None) for k in attributes},
+            "out": copy_arrays(out),
+        }
+        return out
+
+    def _eq_spectrum_batch(
+        self, Tgas, mole_fraction=None, path_length=None, pressure=None, name=None
+    ):
+        """Generate equilibrium spectra for several conditions at once.
+
+        Called by :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`
+        if any of the conditions is an array. Lines are loaded and copied once
+        for all conditions, and linestrengths and broadening HWHM are computed
+        for all conditions at once as (lines x conditions) arrays (see
+        :py:meth:`~radis.lbl.base.BaseFactory._calc_linestrength_eq_batch` and
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_broadening_HWHM_batch`).
+        The linestrength cutoff, line shift, wavenumber grid and lineshape
+        broadening are computed condition by condition, as in
+        :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum`.
+
+        Parameters
+        ----------
+        Tgas: array (K)
+        mole_fraction: array, or ``None``
+        path_length: array (cm), or ``None``
+        pressure: array (bar), or ``None``
+            conditions, broadcast together. If ``None``, the Factory values
+            are used.
+        name: str
+            name of all output Spectra
+
+        Returns
+        -------
+        spectra: SpecList
+            :class:`~radis.tools.database.SpecList` of all spectra, in the order
+            of the input conditions. The Factory conditions
+            (:py:attr:`~radis.lbl.loader.DatabankLoader.input`) are restored.
+
+        Notes
+        -----
+        Conditions are processed by blocks, so that (lines x conditions) arrays
+        do not exceed :py:attr:`~radis.lbl.loader.MiscParams.batch_blocksize`
+        elements (default 1e7).
+
+        With LDM ``optimization``, the Lorentzian and Gaussian width axes of
+        each spectrum lie on the same global grid, and lineshape templates are
+        reused between spectra (see
+        :py:meth:`~radis.lbl.broadening.BroadenFactory._calc_lineshape_LDM`)
+        """
+        # Get conditions
+        if mole_fraction is None:
+            mole_fraction = self.input.mole_fraction
+        if path_length is None:
+            path_length = self.input.path_length
+        if pressure is None:
+            pressure_mbar = self.input.pressure_mbar
+        else:
+            pressure_mbar = np.asarray(pressure, dtype=np.float64) * 1e3
+        Tgas, mole_fraction, path_length, pressure_mbar = (
+            np.array(x, dtype=np.float64).ravel()
+            for x in np.broadcast_arrays(
+                Tgas, mole_fraction, path_length, pressure_mbar
+            )
+        )
+        self.input.rot_distribution = "boltzmann"  # equilibrium
+        self.input.vib_distribution = "boltzmann"  # equilibrium
+        verbose = self.verbose
+
+        # Check variables
+        self._check_inputs(mole_fraction.max(), Tgas.max())
+
+        # %% Common to all conditions
+        # --------------------------------------------------------------------
+
+        self._reset_profiler(verbose)
+        self.profiler.start("batch_preprocessing", 1)
+
+        # Check database, reset populations, create line dataframe (once)
+        self._check_line_databank()
+        self._check_skipped_tiers(Tgas)
+        self._reinitialize()  # creates scaled dataframe df1 from df0
+        df_batch = self.df1
+
+        # Blocks of conditions, so that (lines x conditions) arrays remain small
+        n_blocks = np.ceil(
+            len(Tgas) * max(len(df_batch), 1) / self.misc.batch_blocksize
+        )
+        blocks = np.array_split(np.arange(len(Tgas)), int(n_blocks))
+
+        self.profiler.stop(
+            "batch_preprocessing",
+            f"Preprocessed lines for {len(Tgas)} conditions ({len(blocks)} blocks)",
+        )
+
+        # %% Spectra
+        # --------------------------------------------------------------------
+
+        # Factory conditions are restored after the batch
+        input_conditions = {
+            k: self.input[k]
+            for k in [
+                "Tgas",
+                "Tvib",
+                "Trot",
+                "pressure_mbar",
+                "mole_fraction",
+                "path_length",
+            ]
+        }
+        try:
+            spectra = self._eq_spectrum_blocks(
+                df_batch, blocks, Tgas, mole_fraction, path_length, pressure_mbar, name
+            )
+        finally:
+            self.input.update(input_conditions)
+
+        return SpecList(*spectra)
+
+    def _eq_spectrum_blocks(
+        self, df_batch, blocks, Tgas, mole_fraction, path_length, pressure_mbar, name
+    ):
+        """Compute the equilibrium spectra of
+        :py:meth:`~radis.lbl.factory.SpectrumFactory._eq_spectrum_batch`, block
+        of conditions by block of conditions.
+
+        Returns
+        -------
+        spectra: list of Spectrum
+        """
+        verbose = self.verbose
+
+        spectra = []
+        for block in blocks:
+            # self.df1 holds the lines of the last condition (after cutoff):
+            # batch helpers must compute on all lines
+            self.df1 = df_batch
+            S_block = self._calc_linestrength_eq_batch(Tgas[block])
+            hwhm_block = self._calc_broadening_HWHM_batch(
+                Tgas[block], pressure_mbar[block], mole_fraction[block]
+            )
+
+            for j, i in enumerate(block):
+                # Update conditions
+                self.input.Tgas = float(Tgas[i])
+                self.input.Tvib = float(Tgas[i])  # just for info
+                self.input.Trot = float(Tgas[i])  # just for info
+                self.input.pressure_mbar = float(pressure_mbar[i])
+                self.input.mole_fraction = float(mole_fraction[i])
+                self.input.path_length = float(path_length[i])
+
+                # New Profiler object
+                self._reset_profiler(verbose)
+
+                # Retrieve Spectrum from database if it exists
+                if self.autoretrievedatabase:
+                    s = self._retrieve_from_database()
+                    if s is not None:
+                        spectra.append(s)
+                        continue
+
+                self.profiler.start("spectrum_calculation", 1)
+                self.profiler.start("spectrum_calc_before_obj", 2)
+
+                # Lines at these conditions. Shallow copy: the line database
+                # is not copied, only new columns are added
+                df1 = df_batch.copy(deep=False)
+                df1["S"] = S_block[:, j]
+                for k, v in hwhm_block.items():
+                    df1[k] = v[:, j]
+                self.df1 = df1
+                self._cutoff_linestrength()
+                self.calc_lineshift()  # scales wav to shiftwav (equivalent to v0)
+                # ... generates all wstep related entities (as in eq_spectrum :
+                # with wstep="auto", the grid depends on the condition)
+                self._generate_wavenumber_arrays()
+
+                # ... find weak lines and calculate semi-continuum (optional)
+                I_continuum = self.calculate_pseudo_continuum()
+                # ... apply lineshape and get absorption coefficient
+                wavenumber, abscoeff_v = self._calc_broadening()
+
+                spectra.append(
+                    self._generate_eq_spectrum(
+                        wavenumber, abscoeff_v, I_continuum, name
+                    )
+                )
+
+        return spectra
+
     def eq_spectrum_gpu(
         self,
         Tgas,
@@ -978,6 +1404,17 @@ class SpectrumFactory(BandFactory):
         path_length = convert_and_strip_units(path_length, u.cm)
         pressure = convert_and_strip_units(pressure, u.bar)
 
+        # Batch mode (several conditions) is only implemented on CPU
+        if any(
+            isinstance(x, (list, tuple, np.ndarray))
+            for x in [Tgas, mole_fraction, path_length, pressure]
+        ):
+            raise NotImplementedError(
+                "Arrays of conditions are not implemented on GPU. Use "
+                + "eq_spectrum() to compute them at once on CPU, or call "
+                + "eq_spectrum_gpu() for each condition"
+            )
+
         # update defaults
         if path_length is not None:
             self.input.path_length = path_length
@@ -1007,6 +1444,7 @@ class SpectrumFactory(BandFactory):
 
         # Check variables
         self._check_inputs(mole_fraction, max(flatten(Tgas)))
+        self._check_skipped_tiers()  # no linestrength cutoff on GPU
 
         # Retrieve Spectrum from database if it exists
         if self.autoretrievedatabase:
@@ -1558,6 +1996,7 @@ class SpectrumFactory(BandFactory):
         # Check line database and parameters, reset populations and scaled line dataframe
         # ----------
         self._check_line_databank()
+        self._check_skipped_tiers()  # weak lines only skipped for eq_spectrum
 
         # add nonequilibrium energies if needed (this may be a bottleneck
         # for a first calculation):
@@ -1774,8 +2213,10 @@ class SpectrumFactory(BandFactory):
         import radis
 
         self.profiler.start("generate_wavenumber_arrays", 2)
+        # lines kept by the linestrength cutoff
+        df = self._get_selected_lines()
         # calculates minimum FWHM of lines
-        self._calc_min_width(self.df1)
+        self._calc_min_width(df)
 
         # Setting wstep to optimal value and rounding it to a degree 3
         if self._wstep == "auto" or type(self.params.wstep) == list:
@@ -1832,7 +2273,7 @@ class SpectrumFactory(BandFactory):
 
         # Setting wstep to optimal value and rounding it to a degree 3
         if self._sparse_ldm == "auto":
-            sparsity = len(wavenumber_calc) / len(self.df1)
+            sparsity = len(wavenumber_calc) / len(df)
             self.params["sparse_ldm"] = (
                 sparsity > 1.0
             )  # works ; TODO : set a threshold based on more data
@@ -57,13 +57,19 @@ from uuid import uuid1
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 
 from radis import config
 from radis.db.classes import get_molecule
 from radis.db.molecules import getMolecule
 from radis.db.molparam import MolParams
 from radis.db.references import doi
-from radis.io.cache_files import cache_file_name
+from radis.io.cache_files import (
+    bands_cache_file_name,
+    cache_file_name,
+    noneq_cache_file_name,
+    reference_cache_file_name,
+)
 from radis.io.cdsd import cdsd2df
 from radis.io.exomol import fetch_exomol
 from radis.io.hdf5 import hdf2df
@@ -97,6 +103,7 @@ from radis.misc.warning import (
     default_warning_status,
     warn,
 )
+from radis.phys.constants import hc_k
 from radis.phys.convert import cm2nm
 from radis.tools.database import SpecDatabase
 from radis.tools.track_ref import RefTracker
@@ -217,6 +224,18 @@ See Also
 - 'cdsd-hitemp' (CDSD HITEMP): :data:`~radis.io.cdsd.columns_hitemp`,
 - 'cdsd-4000': (CDSD 4000) :data:`~radis.io.cdsd.columns_4000`,
 """
+float32_columns = ["airbrd", "selbrd", "Tdpair", "Tdpsel", "Pshft"]
+""" list: broadening and pressure-shift parameters, cast to the precision of the
+calculation with ``dtype="float32"``.
+Line positions ``wav`` and intensities (``int``, ``A``, ``S``) are always kept
+in float64 : in float32, lines around 2000 cm-1 would be shifted by up to
+~1e-4 cm-1, and intensities of weak lines would lose precision, or underflow
+(< 1e-38) at low temperature.
+
+See Also
+--------
+:py:meth:`~radis.lbl.loader.DatabankLoader._cast_float_columns`
+"""
 required_non_eq = [
     "branch",
     "jl",
@@ -450,6 +469,7 @@ class Parameters(ConditionDict):
         "dbpath",
         "dxL",
         "dxG",
+        "dtype",
         "export_lines",
         "export_populations",
         "folding_thresh",
@@ -495,6 +515,7 @@ class Parameters(ConditionDict):
         self.wavenum_min_calc = None  #: float: minimum calculated wavenumber (cm-1) initialized by SpectrumFactory
         self.waveunit = "cm-1"  #: waverange unit: should be cm-1.
         self.wstep = None  #: float: spectral resolution (cm-1)
+        self.dtype = "float64"  #: str: floating point precision of the line database and of the LDM: ``"float64"`` or ``"float32"``
         self.dxL = _lorentzian_step(
             0.01
         )  #: float : Lorentzian step for LDM lineshape database. Default _lorentzian_step(0.01)
@@ -539,6 +560,15 @@ class MiscParams(ConditionDict):
         "zero_padding",
         "memory_mapping_engine",
         "add_at_used",  # function used in DIT ; a Cython and a pure-Python version exist
+        "parallel",
+        "nJobs",
+        "ldm_cache_memory",
+        "zero_copy",
+        "incremental",
+        "cache_engine",
+        "int_tiers",
+        "load_Tgas_max",
+        "batch_blocksize",
     ]
 
     def __init__(self):
@@ -565,6 +595,16 @@ class MiscParams(ConditionDict):
         self.add_at_used = (
             ""  # function used in DIT ; a Cython and a pure-Python version exist
         )
+        self.parallel = False  #: bool: broaden chunks of lines on several threads
+        #: int: number of threads (and line chunks) if ``parallel``. See :class:`joblib.parallel.Parallel`
+        self.nJobs = -2
+        self.ldm_cache_memory = 500  #: float: memory (MB) of LDM lineshape templates kept between spectra. ``0`` to disable
+        self.zero_copy = False  #: bool: build ``df1`` from read-only views of the ``df0`` columns instead of a full copy. See :py:meth:`~radis.lbl.base.BaseFactory._reinitialize`
+        self.incremental = False  #: bool: memoize the stages of :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` and only recompute those whose inputs changed. See :py:meth:`~radis.lbl.factory.SpectrumFactory._memoized_stage`
+        self.cache_engine = "pytables"  #: str: format of the cache files of local line databases: ``'pytables'``, or ``'npy'`` (memory-mapped, read-only columns). See :py:class:`~radis.io.hdf5.HDF5Manager`
+        self.int_tiers = False  #: bool: group the lines of the cache files of local line databases in tiers of linestrength, when the cache files are generated. See :py:func:`~radis.io.cache_files.make_tiers`
+        self.load_Tgas_max = None  #: float: if not ``None``, skip the tiers of lines of the cache files that remain below the linestrength cutoff up to this temperature, when loading the database. See :py:meth:`~radis.lbl.loader.DatabankLoader._get_tier_selector`
+        self.batch_blocksize = 1e7  #: float: maximum number of (lines x conditions) elements of the arrays computed at once when :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` is called with arrays of conditions
 
 
 def format_paths(s):
@@ -574,6 +614,15 @@ def format_paths(s):
     return s
 
 
+def _is_memmap(a):
+    """Return whether the array ``a`` is (a view of) a memory-mapped array"""
+    while a is not None:
+        if isinstance(a, np.memmap):
+            return True
+        a = getattr(a, "base", None)
+    return False
+
+
 df_metadata = ["molecule", "iso", "id", "Ia", "molar_mass", "Qref", "Qvib", "Q"]
 """ list: metadata of line DataFrames :py:attr:`~radis.lbl.loader.DatabankLoader.df0`,
 :py:attr:`~radis.lbl.loader.DatabankLoader.df1`.
@@ -704,6 +753,10 @@ class DatabankLoader(object):
         :py:attr:`~self.radis.lbl.loader.DatabankLoader.df0`
         """
 
+        self._skipped_tiers = None
+        """tuple: ``(cutoff, Tgas_max)`` if tiers of weak lines were skipped
+        when loading the database. See :py:meth:`~radis.lbl.loader.DatabankLoader._get_tier_selector`"""
+
         # Temp variable to store databanks information
         self._databank_args = []
         self._databank_kwargs = {}
@@ -1393,6 +1446,7 @@ class DatabankLoader(object):
 
         self.df0 = df  # type : pd.DataFrame
         self.misc.total_lines = len(df)  # will be stored in Spectrum metadata
+        self._skipped_tiers = None
 
         # %% Init Partition functions (with energies)
         # ------------
@@ -1425,6 +1479,7 @@ class DatabankLoader(object):
                 )
 
         self._remove_unecessary_columns(df)
+        self._cast_float_columns(df)
 
         return
 
@@ -1740,8 +1795,17 @@ class DatabankLoader(object):
 
             filtered_path = [fname for fname in path]
             for fname in path:
-                if cache_file_name(fname) in path and cache_file_name(fname) != fname:
-                    filtered_path.remove(cache_file_name(fname))
+                for fcache in [
+                    cache_file_name(fname),
+                    cache_file_name(fname, engine="npy"),
+                    noneq_cache_file_name(fname),
+                    noneq_cache_file_name(fname, calc_Evib_harmonic_anharmonic=True),
+                    bands_cache_file_name(fname),
+                    reference_cache_file_name(fname),
+                    reference_cache_file_name(fname, engine="npy"),
+                ]:
+                    if fcache in filtered_path and fcache != fname:
+                        filtered_path.remove(fcache)
             new_paths += filtered_path
 
             # Raise errors if no file / print which files were selected.
@@ -2075,6 +2139,98 @@ class DatabankLoader(object):
 
         self.profiler.stop("check_line_databank", "Check line databank")
 
+    def _get_tier_selector(self):
+        """Returns the function that selects the tiers of lines of a cache file
+        to load (see :py:func:`~radis.io.cache_files.make_tiers`) : tiers whose
+        lines may be above the linestrength cutoff ``params.cutoff`` at any
+        temperature between ``Tref`` and ``misc.load_Tgas_max``.
+
+        Returns ``None`` (all tiers are loaded) if ``misc.load_Tgas_max`` is not
+        set, if there is no cutoff, or if abundances are not terrestrial.
+
+        Notes
+        -----
+        Between ``Tref`` and ``Tgas``, the partition function ratio and the
+        stimulated emission factor are lower than 1, so the linestrength of a
+        line is bounded by ``int * exp(hc_k * El * (1/Tref - 1/Tgas))``, which
+        increases with ``El`` and ``Tgas``.
+
+        Lines of skipped tiers are not counted in the linestrength cutoff error
+        (see ``warning_linestrength_cutoff``), nor in the pseudo-continuum of
+        weak lines (see ``pseudo_continuum_threshold``).
+
+        See Also
+        --------
+        :py:meth:`~radis.lbl.loader.DatabankLoader._check_skipped_tiers`
+        """
+        self._skipped_tiers = None
+
+        Tgas_max = self.misc.load_Tgas_max
+        cutoff = self.params.cutoff
+        Tref = self.input.Tref
+        if (
+            Tgas_max is None
+            or not cutoff > 0
+            or Tgas_max < Tref
+            or not self.molparam.terrestrial_abundances
+        ):
+            return None
+
+        def select_tiers(tier_index):
+            with np.errstate(over="ignore"):
+                S_max = tier_index.int_max.values * np.exp(
+                    hc_k * tier_index.El_max.values * (1 / Tref - 1 / Tgas_max)
+                )
+            # 1e-6 margin for rounding errors ; tiers with unknown El are kept
+            selected = ~(S_max * (1 + 1e-6) <= cutoff)
+            if not selected.all():
+                self._skipped_tiers = (cutoff, Tgas_max)
+            return selected
+
+        return select_tiers
+
+    def _check_skipped_tiers(self, Tgas=None):
+        """Make sure that the lines of the tiers skipped when loading the
+        database would also be below the linestrength cutoff of the current
+        calculation. See :py:meth:`~radis.lbl.loader.DatabankLoader._get_tier_selector`
+
+        Parameters
+        ----------
+        Tgas: float, list of float, or ``None``
+            gas temperature(s) of an equilibrium calculation. ``None`` for
+            other calculations, that do not support skipped tiers.
+        """
+        if self._skipped_tiers is None:
+            return
+        cutoff, Tgas_max = self._skipped_tiers
+
+        if Tgas is None:
+            raise NotImplementedError(
+                "Weak lines were skipped when loading the database "
+                + f"(misc.load_Tgas_max={Tgas_max}) : only equilibrium "
+                + "calculations with eq_spectrum() are supported. Reload the "
+                + "database with misc.load_Tgas_max=None"
+            )
+        Tgas = np.atleast_1d(Tgas)
+        if Tgas.min() < self.input.Tref or Tgas.max() > Tgas_max:
+            raise ValueError(
+                f"Tgas={Tgas.tolist()} K outside of [{self.input.Tref}, {Tgas_max}] K :"
+                + " weak lines skipped when loading the database may be above the "
+                + "linestrength cutoff. Reload the database with a higher "
+                + "misc.load_Tgas_max"
+            )
+        if self.params.cutoff < cutoff:
+            raise ValueError(
+                f"Linestrength cutoff ({self.params.cutoff}) lower than when "
+                + f"loading the database ({cutoff}) : weak lines skipped when "
+                + "loading the database may be above the cutoff. Reload the database"
+            )
+        if not self.molparam.terrestrial_abundances:
+            raise ValueError(
+                "Non-terrestrial abundances : weak lines skipped when loading "
+                + "the database may be above the linestrength cutoff. Reload the database"
+            )
+
     def _load_databank(
         self,
         database,
@@ -2169,8 +2325,138 @@ class DatabankLoader(object):
                 f"Expected a list or 'all' for `load_columns`, got `load_columns={load_columns}"
             )
 
+        # Weak tiers of lines to skip (cache files grouped by tiers only)
+        load_tiers = self._get_tier_selector()
+
         # subroutine load_and_concat
         # --------------------------------------
+        def load_file(i, filename, nfiles):
+            """Load, crop and filter one database file. Returns ``None`` if
+            the file is irrelevant."""
+
+            if __debug__:
+                printdbg("Loading {0}/{1}".format(i + 1, nfiles))
+
+            # Read all the lines
+            # ... this is where the cache files are read/generated.
+            try:
+                if dbformat in ["cdsd-hitemp", "cdsd-4000"]:
+                    if dbformat == "cdsd-4000":
+                        self.reftracker.add(
+                            doi["CDSD-4000"], "line database"
+                        )  # [CDSD-4000]_
+                    if dbformat == "cdsd-hitemp":
+                        self.warn(
+                            "Missing doi for CDSD-HITEMP. Use HITEMP-2010?",
+                            "MissingReferenceWarning",
+                        )
+                    df = cdsd2df(
+                        filename,
+                        version="hitemp" if dbformat == "cdsd-hitemp" else "4000",
+                        cache=db_use_cached,
+                        # load_columns=columns,  # not possible with "pytables-fixed"
+                        verbose=verbose,
+                        drop_non_numeric=True,
+                        load_wavenum_min=wavenum_min,
+                        load_wavenum_max=wavenum_max,
+                        engine=self.misc.cache_engine,
+                        int_tiers=self.misc.int_tiers,
+                        load_tiers=load_tiers,
+                    )
+                    # TODO: implement load_columns
+                elif dbformat in ["hitran", "hitemp"]:
+                    if dbformat == "hitran":
+                        self.reftracker.add(
+                            doi["HITRAN-2020"], "line database"
+                        )  # [HITRAN-2020]_
+                    if dbformat == "hitemp":
+                        self.reftracker.add(
+                            doi["HITEMP-2010"], "line database"
+                        )  # [HITEMP-2010]_
+                    df = hit2df(
+                        filename,
+                        cache=db_use_cached,
+                        # load_columns=columns,  # not possible with "pytables-fixed"
+                        verbose=verbose,
+                        drop_non_numeric=True,
+                        load_wavenum_min=wavenum_min,
+                        load_wavenum_max=wavenum_max,
+                        engine=self.misc.cache_engine,
+                        int_tiers=self.misc.int_tiers,
+                        load_tiers=load_tiers,
+                    )
+                elif dbformat in ["hdf5-radisdb", "hitemp-radisdb"]:
+                    if dbformat == "hitemp-radisdb":
+                        self.reftracker.add(
+                            doi["HITEMP-2010"], "line database"
+                        )  # [HITEMP-2010]_
+                    if dbformat == "hdf5-radisdb":
+                        self.warn(
+                            f"Missing doi reference for database used {filename}",
+                            "MissingReferenceWarning",
+                        )
+                    df = hdf2df(
+                        filename,
+                        columns=columns,
+                        # cache=db_use_cached,
+                        verbose=verbose,
+                        # drop_non_numeric=True,
+                        isotope=self.input.isotope
+                        if self.input.isotope != "all"
+                        else None,
+                        load_wavenum_min=wavenum_min,
+                        load_wavenum_max=wavenum_max,
+                        engine="guess",
+                        load_tiers=load_tiers,
+                    )
+                elif dbformat in ["exomol"]:
+                    # self.reftracker.add("10.1016/j.jqsrt.2020.107228", "line database")  # [ExoMol-2020]
+                    raise NotImplementedError("use fetch_databank('exomol')")
+
+                else:
+                    raise ValueError("Unknown dbformat: {0}".format(dbformat))
+            except IrrelevantFileWarning as err:
+                if db_use_cached == "force":
+                    raise
+                else:
+                    # Irrelevant file, just print and continue.
+                    if verbose >= 2:
+                        printg(str(err))
+                    return None
+
+            # Drop columns (helps fix some Memory errors)
+            dropped = []
+            for col in df.columns:
+                if col in drop_columns or (
+                    drop_columns == "all" and col not in drop_all_but_these
+                ):
+                    del df[col]
+                    dropped.append(col)
+            if verbose >= 2 and len(dropped) > 0:
+                print("Dropped columns: {0}".format(dropped))
+
+            # Crop to the wavenumber of interest
+            # TODO : is it still needed since we use load_only_wavenum_above ?
+            # ... (only if needed : memory-mapped columns would be copied)
+            b = (df.wav >= wavenum_min) & (df.wav <= wavenum_max)
+            if not b.all():
+                df = df[b]
+
+            if __debug__:
+                if len(df) == 0:
+                    printdbg(
+                        "File {0} loaded for nothing (out of range)".format(filename)
+                    )
+
+            # Select correct isotope(s)
+            if self.input.isotope != "all":
+                isotope = [float(k) for k in self.input.isotope.split(",")]
+                b = df.iso.isin(isotope)
+                if not b.all():
+                    df = df[b]
+
+            return df
+
         def load_and_concat(files):
             """Contatenate many files in RAM
             Parameters
@@ -2180,132 +2466,37 @@ class DatabankLoader(object):
                     [PATH/TO/01_1000-1150_HITEMP2010.par,
                      PATH/TO/01_1150-1300_HITEMP2010.par,
                      PATH/TO/01_1300-1500_HITEMP2010.par]
-            """
-
-            frames = []
-
-            for i, filename in enumerate(files):
-
-                if __debug__:
-                    printdbg("Loading {0}/{1}".format(i + 1, len(files)))
-
-                # Read all the lines
-                # ... this is where the cache files are read/generated.
-                try:
-                    if dbformat in ["cdsd-hitemp", "cdsd-4000"]:
-                        if dbformat == "cdsd-4000":
-                            self.reftracker.add(
-                                doi["CDSD-4000"], "line database"
-                            )  # [CDSD-4000]_
-                        if dbformat == "cdsd-hitemp":
-                            self.warn(
-                                "Missing doi for CDSD-HITEMP. Use HITEMP-2010?",
-                                "MissingReferenceWarning",
-                            )
-                        df = cdsd2df(
-                            filename,
-                            version="hitemp" if dbformat == "cdsd-hitemp" else "4000",
-                            cache=db_use_cached,
-                            # load_columns=columns,  # not possible with "pytables-fixed"
-                            verbose=verbose,
-                            drop_non_numeric=True,
-                            load_wavenum_min=wavenum_min,
-                            load_wavenum_max=wavenum_max,
-                            engine="pytables",
-                        )
-                        # TODO: implement load_columns
-                    elif dbformat in ["hitran", "hitemp"]:
-                        if dbformat == "hitran":
-                            self.reftracker.add(
-                                doi["HITRAN-2020"], "line database"
-                            )  # [HITRAN-2020]_
-                        if dbformat == "hitemp":
-                            self.reftracker.add(
-                                doi["HITEMP-2010"], "line database"
-                            )  # [HITEMP-2010]_
-                        df = hit2df(
-                            filename,
-                            cache=db_use_cached,
-                            # load_columns=columns,  # not possible with "pytables-fixed"
-                            verbose=verbose,
-                            drop_non_numeric=True,
-                            load_wavenum_min=wavenum_min,
-                            load_wavenum_max=wavenum_max,
-                            engine="pytables",
-                        )
-                    elif dbformat in ["hdf5-radisdb", "hitemp-radisdb"]:
-                        if dbformat == "hitemp-radisdb":
-                            self.reftracker.add(
-                                doi["HITEMP-2010"], "line database"
-                            )  # [HITEMP-2010]_
-                        if dbformat == "hdf5-radisdb":
-                            self.warn(
-                                f"Missing doi reference for database used {filename}",
-                                "MissingReferenceWarning",
-                            )
-                        df = hdf2df(
-                            filename,
-                            columns=columns,
-                            # cache=db_use_cached,
-                            verbose=verbose,
-                            # drop_non_numeric=True,
-                            isotope=self.input.isotope
-                            if self.input.isotope != "all"
-                            else None,
-                            load_wavenum_min=wavenum_min,
-                            load_wavenum_max=wavenum_max,
-                            engine="guess",
-                        )
-                    elif dbformat in ["exomol"]:
-                        # self.reftracker.add("10.1016/j.jqsrt.2020.107228", "line database")  # [ExoMol-2020]
-                        raise NotImplementedError("use fetch_databank('exomol')")
-
-                    else:
-                        raise ValueError("Unknown dbformat: {0}".format(dbformat))
-                except IrrelevantFileWarning as err:
-                    if db_use_cached == "force":
-                        raise
-                    else:
-                        # Irrelevant file, just print and continue.
-                        if verbose >= 2:
-                            printg(str(err))
-                        continue
 
-                # Drop columns (helps fix some Memory errors)
-                dropped = []
-                for col in df.columns:
-                    if col in drop_columns or (
-                        drop_columns == "all" and col not in drop_all_but_these
-                    ):
-                        del df[col]
-                        dropped.append(col)
-                if verbose >= 2 and len(dropped) > 0:
-                    print("Dropped columns: {0}".format(dropped))
-
-                # Crop to the wavenumber of interest
-                # TODO : is it still needed since we use load_only_wavenum_above ?
-                df = df[(df.wav >= wavenum_min) & (df.wav <= wavenum_max)]
-
-                if __debug__:
-                    if len(df) == 0:
-                        printdbg(
-                            "File {0} loaded for nothing (out of range)".format(
-                                filename
-                            )
-                        )
-
-                # Select correct isotope(s)
-                if self.input.isotope != "all":
-                    isotope = [float(k) for k in self.input.isotope.split(",")]
-                    df = df[df.iso.isin(isotope)]
+            Notes
+            -----
+            Files are loaded concurrently on :py:attr:`~radis.lbl.loader.MiscParams.nJobs`
+            threads (file I/O and numpy release the GIL ; accesses to PyTables
+            files are serialized, see :py:data:`~radis.io.hdf5._pytables_lock`),
+            then concatenated in order.
+            """
 
-                frames.append(df)
+            n_jobs = min(effective_n_jobs(self.misc.nJobs), len(files))
+            if n_jobs > 1:
+                frames = Parallel(n_jobs=n_jobs, prefer="threads")(
+                    delayed(load_file)(i, filename, len(files))
+                    for i, filename in enumerate(files)
+                )
+            else:
+                frames = [
+                    load_file(i, filename, len(files))
+                    for i, filename in enumerate(files)
+                ]
+            frames = [df for df in frames if df is not None]
 
             # Finally: Concatenate all
             if frames == []:
                 df = (
                     pd.DataFrame()
                 )  # a database empty error will be raised a few lines below
+            elif len(frames) == 1:
+                # no copy (keeps memory-mapped columns of 'npy' cache files)
+                df = frames[0]
+                df.index = pd.RangeIndex(len(df))  # reindex
             else:
                 df = pd.concat(frames, ignore_index=True)  # reindex
 
@@ -2413,6 +2604,7 @@ class DatabankLoader(object):
             )
 
         self._remove_unecessary_columns(df)
+        self._cast_float_columns(df)
 
         return df
 
@@ -2434,7 +2626,7 @@ class DatabankLoader(object):
                     + "calculates them independently then use MergeSlabs"
                 )
 
-            df.drop("id", axis=1, inplace=True)
+            del df["id"]  # inplace, without copying the other columns
             df_metadata.append("id")
             df.attrs["id"] = id_set[0]
         else:
@@ -2444,12 +2636,35 @@ class DatabankLoader(object):
             isotope_set = df.iso.unique()
 
             if len(isotope_set) == 1:
-                df.drop("iso", axis=1, inplace=True)
+                del df["iso"]
                 df_metadata.append("iso")
                 df.attrs["iso"] = isotope_set[0]
         else:
             assert "iso" in df.attrs
 
+    def _cast_float_columns(self, df):
+        """Cast the broadening and pressure-shift parameters of the line
+        database (:py:data:`~radis.lbl.loader.float32_columns`) to the
+        precision of the calculation ``self.params.dtype``.
+
+        Other columns are kept in their precision. Columns memory-mapped from
+        the cache files (``'npy'`` engine) are not cast, as casting would copy
+        them in memory.
+
+        Returns
+        -------
+        None: DataFrame updated inplace
+        """
+        dtype = np.dtype(self.params.dtype)
+        for k in float32_columns:
+            if (
+                k in df
+                and df[k].dtype.kind == "f"
+                and df[k].dtype != dtype
+                and not _is_memmap(df[k].values)
+            ):
+                df[k] = df[k].astype(dtype)
+
     def _get_isotope_list(self, molecule=None, df=None):
         """Returns list of isotopes for given molecule Parse the Input
         conditions (fast). If a line database is given, parse the line database
@@ -160,112 +160,92 @@ def SerialSlabs(*slabs, **kwargs) -> Spectrum:
         return slabs[0]
 
     else:
-        # recursively calculate serial slabs
+        # Solve all slabs at once : we get the radiance and transmittance of
+        # all slabs on a common wavespace, and solve the RTE in one pass
+        # (see _solve_serial_rte) rather than adding slabs 2 by 2
         slabs = list(slabs)
+        for s in slabs:
+            _check_valid(s)  # check it is a spectrum
 
-        # Recursively deal with the rest of Spectra --> call it s
-        sn = slabs.pop(-1)  # type: Spectrum
-        _check_valid(sn)  # check it is a spectrum
-        s = SerialSlabs(
-            *slabs,
-            resample=resample_wavespace,
-            out=out_of_bounds,
-            modify_inputs=modify_inputs
-        )
-
-        # Now calculate sn and s in Serial
-        quantities = {}
-        unitsn = sn.units
+        # Units of the last slab are used for all quantities
+        unitsn = slabs[-1].units
 
-        # make sure we use the same wavespace type (even if sn is in 'nm' and s in 'cm-1')
-        # also make sure we use the same units
-        waveunit = s.get_waveunit()
+        # make sure we use the same wavespace type (even if slabs are in 'nm' and 'cm-1')
+        waveunit = slabs[0].get_waveunit()
 
-        # Make all our slabs copies with the same wavespace range
-        # (note: wavespace range may be different for different quantities, but
-        # equal for all slabs)
-        s, sn = resample_slabs(
-            waveunit, resample_wavespace, out_of_bounds, modify_inputs, s, sn
-        )
+        # If all slabs already have radiance and transmittance on the same
+        # wavespace, we use them directly. Else, we work on copies with the same
+        # wavespace range (note: wavespace range may be different for
+        # different quantities, but equal for all slabs)
+        rte_quantities = ["radiance_noslit", "transmittance_noslit"]
+        use_inputs = all(
+            s.get_waveunit() == waveunit
+            and "wavespace" in s._q
+            and all(k in s._q for k in rte_quantities)
+            for s in slabs
+        ) and _same_wavespace([s._q["wavespace"] for s in slabs])
+        if not use_inputs:
+            slabs = resample_slabs(
+                waveunit, resample_wavespace, out_of_bounds, modify_inputs, *slabs
+            )
         try:
-            w = s._q["wavespace"]
+            w = slabs[0]._q["wavespace"]
         except KeyError:
             raise KeyError(
                 "Cannot calculate the RTE if non convoluted quantities "
-                + "are not defined. Got: {0}".format(s.get_vars())
+                + "are not defined. Got: {0}".format(slabs[0].get_vars())
             )
 
         # Get all data
         # -------------
 
-        I, In, T, Tn = None, None, None, None
-
         # To make it easier, the radiative transfer equation is solved with 'radiance_noslit' and
         # 'transmittance_noslit' only. Here we first try to get these quantities:
-
-        # ... get sn quantities
-        try:
-            sn.update("transmittance_noslit", verbose=verbose)
-        except ValueError:
-            pass
-        else:
-            Tn = sn.get(
-                "transmittance_noslit",
-                wunit=waveunit,
-                Iunit=unitsn["transmittance_noslit"],
-                copy=False,
-            )[1]
-        try:
-            sn.update("radiance_noslit", verbose=verbose)
-        except ValueError:
-            pass
-        else:
-            In = sn.get(
-                "radiance_noslit",
-                wunit=waveunit,
-                Iunit=unitsn["radiance_noslit"],
-                copy=False,
-            )[1]
-        # ... get s quantities
-        try:
-            s.update("transmittance_noslit", verbose=verbose)
-        except ValueError:
-            pass
-        else:
-            T = s.get(
-                "transmittance_noslit",
-                wunit=waveunit,
-                Iunit=unitsn["transmittance_noslit"],
-                copy=False,
-            )[1]
-        try:
-            s.update("radiance_noslit", verbose=verbose)
-        except ValueError:
-            pass
-        else:
-            I = s.get(
-                "radiance_noslit",
-                wunit=waveunit,
-                Iunit=unitsn["radiance_noslit"],
-                copy=False,
-            )[1]
+        I_all, T_all = [], []
+        for s in slabs:
+            for k, q_all in [
+                ("transmittance_noslit", T_all),
+                ("radiance_noslit", I_all),
+            ]:
+                if not use_inputs:  # we're working on copies
+                    try:
+                        s.update(k, verbose=verbose)
+                    except ValueError:
+                        q_all.append(None)
+                        continue
+                q_all.append(s.get(k, wunit=waveunit, Iunit=unitsn[k], copy=False)[1])
 
         # Solve radiative transfer equation
         # ---------------------------------
+        quantities = {}
 
-        if I is not None and In is not None:
-            # case where we may use SerialSlabs just to compute the products of all transmittances
-            quantities["radiance_noslit"] = (w, I * Tn + In)
-
-        if T is not None:  # note that we dont need the transmittance in the inner
-            # slabs to calculate the total radiance
-            quantities["transmittance_noslit"] = (w, Tn * T)
+        has_I = all(I is not None for I in I_all)
+        if has_I and not all(T is not None for T in T_all[1:]):
+            # note that we dont need the transmittance of the first slab to
+            # calculate the total radiance
+            raise ValueError(
+                "Cannot calculate the radiance along the line-of-sight: "
+                + "transmittance_noslit could not be calculated for slabs "
+                + "{0}".format(
+                    [s.get_name() for s, T in zip(slabs[1:], T_all[1:]) if T is None]
+                )
+            )
+        # note: we may use SerialSlabs just to compute the products of all transmittances
+        I, T = _solve_serial_rte(I_all if has_I else None, T_all)
+        if I is not None:
+            quantities["radiance_noslit"] = (w, I)
+        if T is not None:
+            quantities["transmittance_noslit"] = (w, T)
 
         # Update conditions
         # -----------------
 
         # Get conditions (if they're different, fill with 'N/A')
-        conditions = intersect(s.conditions, sn.conditions)
+        conditions = slabs[0].conditions
+        cond_units = slabs[0].cond_units
+        for s in slabs[1:]:
+            conditions = intersect(conditions, s.conditions)
+            cond_units = intersect(cond_units, s.cond_units)
         conditions["waveunit"] = waveunit
         if "thermal_equilibrium" in conditions:
             conditions["thermal_equilibrium"] = False
@@ -277,19 +257,25 @@ def SerialSlabs(*slabs, **kwargs) -> Spectrum:
             "lines_calculated",
             "lines_cutoff",
         ]:  # sum of all
-            if cond in s.conditions and cond in sn.conditions:
-                conditions[cond] = s.conditions[cond] + sn.conditions[cond]
-                if cond in s.cond_units and cond in sn.cond_units:
-                    assert s.cond_units == sn.cond_units
-        cond_units = intersect(s.cond_units, sn.cond_units)
+            if in_all(cond, [s.conditions for s in slabs]):
+                conditions[cond] = sum([s.conditions[cond] for s in slabs])
+                if in_all(cond, [s.cond_units for s in slabs]):
+                    assert all(
+                        s.cond_units[cond] == slabs[0].cond_units[cond]
+                        for s in slabs[1:]
+                    )
 
         # Update references
         # -----------------
         # (just add everything)
-        references = {**s.references, **sn.references}
+        references = {}
+        for s in slabs:
+            references.update(s.references)
 
         # name
-        name = _serial_slab_names(s, sn)
+        name = slabs[0].get_name()
+        for s in slabs[1:]:
+            name = _serial_slab_names(name, s.get_name())
 
         return Spectrum(
             quantities=quantities,
@@ -302,10 +288,54 @@ def SerialSlabs(*slabs, **kwargs) -> Spectrum:
         )
 
 
-def _serial_slab_names(s, sn):
-    # type: (Spectrum, Spectrum) -> Spectrum
-    name_s = s.get_name()
-    name_sn = sn.get_name()
+def _solve_serial_rte(I_all, T_all):
+    # type: (list, list) -> (np.ndarray, np.ndarray)
+    r"""Solve the radiative transfer equation along a line-of-sight of N slabs.
+
+    Total radiance is the radiance of each slab, attenuated by all the slabs
+    between it and the observer :
+
+    .. math::
+        I_{\lambda} = \sum_{i=0}^{N-1} I_{\lambda, i} \prod_{j=i+1}^{N-1} \tau_{\lambda, j}
+
+    The cumulative products are computed in a single pass over the slabs,
+    from the farthest to the observer, with in-place operations on the whole
+    spectral range : ``I = I * T_i + I_i``. No intermediate Spectrum is created.
+
+    Parameters
+    ----------
+    I_all: list of arrays, or 2D array, or ``None``
+        radiance of the N slabs. First slab is the farthest from the observer.
+        If ``None``, only the transmittance is calculated.
+    T_all: list of arrays, or 2D array
+        transmittance of the N slabs. Transmittance of the first slab is not
+        needed for the radiance, and can be ``None``.
+
+    Returns
+    -------
+    I, T: arrays
+        total radiance as seen by the observer, and total transmittance.
+        ``None`` if they cannot be calculated.
+
+    See Also
+    --------
+    :func:`~radis.los.slabs.SerialSlabs`
+    """
+    I, T = None, None
+    if all(Ti is not None for Ti in T_all):
+        T = np.array(T_all[0], dtype=float)  # copy
+        for Ti in T_all[1:]:
+            T *= Ti
+    if I_all is not None:
+        I = np.array(I_all[0], dtype=float)  # copy
+        for Ii, Ti in zip(I_all[1:], T_all[1:]):
+            I *= Ti
+            I += Ii
+    return I, T
+
+
+def _serial_slab_names(name_s, name_sn):
+    # type: (str, str) -> str
     if "//" in name_s and not ">>" in name_s:
         name_s = "({0})".format(name_s)
     if "//" in name_sn:
@@ -351,6 +381,23 @@ def _has_quantity(quantity, *slabs):
     return b
 
 
+def _same_wavespace(wl):
+    # type: (list) -> bool
+    """Returns whether all wavespaces in list ``wl`` are the same"""
+    try:
+        assert all([(w == wl[0]).all() for w in wl[1:]])
+    except AssertionError:
+        # ok if wavespace is the same within some tolerance
+        #   @dev: testing with == first is 10x faster and works in most cases.
+        if all([allclose(w, wl[0]) for w in wl[1:]]):
+            return True
+        return False
+    except:  # ex:  different lengths
+        return False
+    else:
+        return True
+
+
 def resample_slabs(
     waveunit, resample_wavespace, out_of_bounds="nan", modify_inputs=False, *slabs
 ):
@@ -396,20 +443,6 @@ def resample_slabs(
         resampled copies of inputs Spectra. All now have the same wavespace
     """
 
-    def same_wavespace(wl):
-        try:
-            assert all([(w == wl[0]).all() for w in wl[1:]])
-        except AssertionError:
-            # ok if wavespace is the same within some tolerance
-            #   @dev: testing with == first is 10x faster and works in most cases.
-            if all([allclose(w, wl[0]) for w in wl[1:]]):
-                return True
-            return False
-        except:  # ex:  different lengths
-            return False
-        else:
-            return True
-
     # Work on copies
     if not modify_inputs:
         slabs = [s.copy(copy_lines=False) for s in slabs]
@@ -426,7 +459,7 @@ def resample_slabs(
         slabsk = [s for s in slabs if k in s.get_vars()]  # note that these are
         # references to the actual Spectrum copy
         wl = [s.get(k, wunit=waveunit, copy=False)[0] for s in slabsk]
-        if not same_wavespace(wl):
+        if not _same_wavespace(wl):
             # resample slabs if allowed
             if resample_wavespace == "never":
                 raise ValueError(
@@ -736,7 +769,9 @@ def MergeSlabs(*slabs, **kwargs) -> Spectrum:
                 printdbg("... merge: calculating abscoeff k=sum(k_i)")
             abscoeff_eq = np.sum(
                 [
-                    s.get("abscoeff", wunit=waveunit, Iunit=units0["abscoeff"])[1]
+                    s.get(
+                        "abscoeff", wunit=waveunit, Iunit=units0["abscoeff"], copy=False
+                    )[1]
                     for s in slabs
                 ],
                 axis=0,
@@ -750,7 +785,12 @@ def MergeSlabs(*slabs, **kwargs) -> Spectrum:
                 printdbg("... merge: calculating emisscoeff j=sum(j_i)")
             emisscoeff_eq = np.sum(
                 [
-                    s.get("emisscoeff", wunit=waveunit, Iunit=units0["emisscoeff"])[1]
+                    s.get(
+                        "emisscoeff",
+                        wunit=waveunit,
+                        Iunit=units0["emisscoeff"],
+                        copy=False,
+                    )[1]
                     for s in slabs
                 ],
                 axis=0,
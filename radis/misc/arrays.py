@@ -26,6 +26,7 @@ Functions to deal with numpy arrays:
 - :py:func:`~radis.misc.arrays.count_nans`
 - :py:func:`~radis.misc.arrays.logspace`
 - :py:func:`~radis.misc.arrays.numpy_add_at`
+- :py:func:`~radis.misc.arrays.sparse_add_at_grouped`
 
 
 
@@ -737,6 +738,117 @@ def sparse_add_at(ki0, Iv0, Iv1, weight, max_range, truncation_pts):
     return np.array(L), I
 
 
+def sparse_add_at_grouped(key, k, I, max_range, truncation_pts):
+    """Sum intensities ``I`` at positions ``k`` separately for each ``key``,
+    and return the non-zero ranges (extended by ``truncation_pts`` on each side)
+    of all keys at once.
+
+    Vectorized equivalent of calling :py:func:`~radis.misc.arrays.sparse_add_at`
+    on each group of a ``groupby(key)`` : a single sort by ``(key, k)`` followed
+    by segment reductions, without any Python loop over the groups.
+
+    Parameters
+    ----------
+    key: int array   [size N]
+        group identifier of each point (ex: ``l * NwL + m`` for the LDM cell
+        ``(l, m)``)
+    k: int array   [size N]
+        position of each point on the spectral grid. Points outside of
+        ``[0, max_range)`` are discarded.
+    I: float array   [size N]
+        intensity of each point
+    max_range: int
+        length of the spectral grid
+    truncation_pts: int
+        number of grid points around each point to include in its range
+
+    Returns
+    -------
+    keys: int array   [size K]
+        unique keys, sorted
+    ranges_ptr: int array   [size K+1]
+        the non-zero ranges of ``keys[j]`` are ``ranges[ranges_ptr[j]:ranges_ptr[j+1]]``
+    ranges: int array   [shape R x 2]
+        (start, stop) of all non-zero ranges, for all keys
+    I_ptr: int array   [size K+1]
+        the intensities of ``keys[j]`` are ``I_reduced[I_ptr[j]:I_ptr[j+1]]``
+    I_reduced: float array
+        intensities on the non-zero ranges (zero-padded around each point),
+        concatenated for all ranges and all keys
+
+    Examples
+    --------
+    ::
+
+        keys, ranges_ptr, ranges, I_ptr, I_reduced = sparse_add_at_grouped(
+            key, k, I, len(w), 100
+        )
+        for j in range(len(keys)):
+            mask = boolean_array_from_ranges(
+                ranges[ranges_ptr[j] : ranges_ptr[j + 1]], len(w)
+            )
+            out[mask] += np.convolve(I_reduced[I_ptr[j] : I_ptr[j + 1]], lineshape, "same")
+
+    See Also
+    --------
+    :py:func:`~radis.misc.arrays.sparse_add_at`
+    """
+    n = truncation_pts
+
+    valid = (k >= 0) & (k < max_range)
+    key, k, I = key[valid], k[valid], I[valid]
+    if len(key) == 0:
+        return (
+            np.zeros(0, dtype=np.int64),
+            np.zeros(1, dtype=np.int64),
+            np.zeros((0, 2), dtype=np.int64),
+            np.zeros(1, dtype=np.int64),
+            np.zeros(0, dtype=I.dtype),
+        )
+
+    # Sort by key, then by position
+    order = np.lexsort((k, key))
+    key, k, I = key[order], k[order], I[order]
+
+    # Sum all intensities on the same (key, position)  (equivalent of "add-at")
+    first = np.ones(len(key), dtype=bool)
+    first[1:] = (key[1:] != key[:-1]) | (k[1:] != k[:-1])
+    I = np.add.reduceat(I, np.flatnonzero(first))
+    key, k = key[first], k[first]
+
+    # Split in ranges : a new range starts for a new key, or if the
+    # [k-n, k+n+1) intervals of consecutive points do not overlap
+    new_range = np.ones(len(key), dtype=bool)
+    new_range[1:] = (key[1:] != key[:-1]) | (k[1:] - k[:-1] > 2 * n + 1)
+    range_id = np.cumsum(new_range) - 1
+    last_in_range = np.append(new_range[1:], True)
+    range_start = np.maximum(k[new_range] - n, 0).astype(np.int64)
+    range_stop = np.minimum(k[last_in_range] + n + 1, max_range).astype(np.int64)
+    range_key = key[new_range]
+
+    # Intensities on all ranges, concatenated
+    lengths = range_stop - range_start
+    range_offset = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=range_offset[1:])
+    I_reduced = np.zeros(range_offset[-1], dtype=I.dtype)
+    I_reduced[range_offset[range_id] + k - range_start[range_id]] = I
+
+    # CSR-like pointers of each key
+    key_first_range = np.ones(len(range_key), dtype=bool)
+    key_first_range[1:] = range_key[1:] != range_key[:-1]
+    keys = range_key[key_first_range]
+    ranges_ptr = np.append(np.flatnonzero(key_first_range), len(range_key))
+    I_ptr = range_offset[ranges_ptr]
+
+    return (
+        keys,
+        ranges_ptr,
+        np.stack((range_start, range_stop), axis=1),
+        I_ptr,
+        I_reduced,
+    )
+
+
 if __name__ == "__main__":
     import pytest
 
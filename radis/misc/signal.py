@@ -14,10 +14,13 @@ Resampling  & smoothing.
 
 """
 
+from collections import OrderedDict
+
 import numpy as np
 from numpy import abs, isnan, linspace, nan, trapz, zeros_like
 from scipy.interpolate import splev, splrep
 from scipy.linalg import solveh_banded
+from scipy.sparse import csr_matrix
 
 from radis.misc.arrays import (
     anynan,
@@ -37,6 +40,7 @@ def resample(
     ext="error",
     energy_threshold=5e-3,
     print_conservation=True,
+    method="spline",
 ):
     """Resample (xspace, vector) on a new space (xspace_new) of evenly
     distributed data and whose bounds are taken as the same as `xspace`.
@@ -45,6 +49,12 @@ def resample(
     is the same as the initial xspace, times a resolution factor. Verifies energy
     conservation on the intersecting range at the end.
 
+    With ``method='linear'`` or ``method='binning'``, resampling is done with
+    a sparse resampling matrix instead (see :py:func:`~radis.misc.signal.get_resampling_matrix`),
+    which is cached for a given pair of grids : this is much faster when the
+    same grids are used repeatedly (ex: in a fit loop), and several vectors
+    can be resampled at once.
+
 
     Parameters
     ----------
@@ -72,6 +82,18 @@ def resample(
         Default 5e-3 (0.5%)
     print_conservation: boolean
         if True, prints energy conservation
+    method: ``'spline'``, ``'linear'``, ``'binning'``
+        ``'spline'``: spline interpolation of order ``k`` (FITPACK).
+        ``'linear'``: linear interpolation with a cached sparse matrix. Same
+        result as ``'spline'`` with ``k=1``, but faster on repeated calls.
+        ``'binning'``: area-conserving binning with a cached sparse matrix :
+        each new point is the average of the linear interpolant of ``vector``
+        over its bin (bin edges halfway between points of ``xspace_new``).
+        Recommended when resampling on a much coarser grid.
+        With ``'linear'`` and ``'binning'``, ``vector`` can be 2D (one vector
+        per row) and ``ext`` a list (one value per row); NaNs in ``vector`` are
+        only propagated to the new points they contribute to, and ``k`` is ignored.
+        Default ``'spline'``.
 
 
     Returns
@@ -93,9 +115,26 @@ def resample(
 
     See Also
     --------
-    :py:meth:`~radis.spectrum.spectrum.Spectrum.resample`
+    :py:meth:`~radis.spectrum.spectrum.Spectrum.resample`,
+    :py:func:`~radis.misc.signal.get_resampling_matrix`
     """
 
+    if method in ["linear", "binning"]:
+        return _resample_with_matrix(
+            xspace,
+            vector,
+            xspace_new,
+            method=method,
+            ext=ext,
+            energy_threshold=energy_threshold,
+            print_conservation=print_conservation,
+        )
+    elif method != "spline":
+        raise ValueError(
+            "Unexpected value for `method`: {0}. Use one of 'spline', 'linear', "
+            "'binning'".format(method)
+        )
+
     if len(xspace) != len(vector):
         raise ValueError(
             "vector and xspace should have the same length. "
@@ -190,6 +229,43 @@ def resample(
             )
 
     # Check energy conservation:
+    _check_energy_conservation(
+        xspace,
+        vector,
+        b,
+        xspace_new,
+        vector_new,
+        b_new,
+        energy_threshold,
+        print_conservation,
+    )
+
+    # Reverse again
+    if reverse:
+        # xspace_new = xspace_new[::-1]
+        vector_new = vector_new[::-1]
+
+    return vector_new
+
+
+def _check_energy_conservation(
+    xspace,
+    vector,
+    b,
+    xspace_new,
+    vector_new,
+    b_new,
+    energy_threshold,
+    print_conservation,
+):
+    """Compare integrals of ``vector`` and ``vector_new`` on the intersecting
+    range (masks ``b`` and ``b_new``). Raises a ValueError if the relative
+    difference is above ``energy_threshold``.
+
+    See Also
+    --------
+    :py:func:`~radis.misc.signal.resample`
+    """
 
     # ... calculate energy
     energy0 = abs(trapz(vector[b], x=xspace[b]))
@@ -222,12 +298,239 @@ def resample(
     if print_conservation:
         print("Resampling - Energy conservation: {0:.5g}%".format(energy_ratio * 100))
 
-    # Reverse again
+
+_RESAMPLING_MATRIX_CACHE = OrderedDict()
+"""OrderedDict: last resampling matrices computed by :py:func:`~radis.misc.signal.get_resampling_matrix`,
+as ``{key: (xspace, xspace_new, R, b_new)}``. See ``RESAMPLING_MATRIX_CACHE_SIZE``"""
+
+RESAMPLING_MATRIX_CACHE_SIZE = 8
+"""int: number of resampling matrices kept in cache"""
+
+
+def get_resampling_matrix(xspace, xspace_new, method="linear"):
+    """Get the sparse matrix ``R`` that resamples a vector defined on
+    ``xspace`` onto ``xspace_new``, i.e. ``vector_new = R @ vector``.
+
+    Matrices are cached (last ``RESAMPLING_MATRIX_CACHE_SIZE`` pairs of
+    grids) : calling the function again with the same grids (same values,
+    not necessarily the same arrays) returns the stored matrix.
+
+    Parameters
+    ----------
+    xspace: array
+        space on which vectors are defined. Must be sorted (increasing or decreasing).
+    xspace_new: array
+        space on which to resample. For ``'binning'``, must be sorted too.
+    method: ``'linear'``, ``'binning'``
+        ``'linear'``: linear interpolation (2 non-zero elements per row).
+        ``'binning'``: average of the linear interpolant of the vector over
+        the bin of each new point, which conserves the area. Bin edges are
+        halfway between points of ``xspace_new``.
+
+    Returns
+    -------
+    R: scipy.sparse.csr_matrix
+        resampling matrix, of shape ``(len(xspace_new), len(xspace))``. Rows
+        of points outside of ``xspace`` are empty.
+    b_new: boolean array
+        points of ``xspace_new`` inside the range of ``xspace``
+
+    Examples
+    --------
+    ::
+
+        R, b_new = get_resampling_matrix(w, w_exp)
+        I_exp = R @ I
+
+    See Also
+    --------
+    :py:func:`~radis.misc.signal.resample`
+    """
+    xspace = np.asarray(xspace)
+    xspace_new = np.asarray(xspace_new)
+
+    key = (
+        method,
+        len(xspace),
+        xspace[0],
+        xspace[-1],
+        len(xspace_new),
+        xspace_new[0],
+        xspace_new[-1],
+    )
+    if key in _RESAMPLING_MATRIX_CACHE:
+        x, x_new, R, b_new = _RESAMPLING_MATRIX_CACHE[key]
+        if (x is xspace or np.array_equal(x, xspace)) and (
+            x_new is xspace_new or np.array_equal(x_new, xspace_new)
+        ):
+            _RESAMPLING_MATRIX_CACHE.move_to_end(key)
+            return R, b_new
+
+    R, b_new = _build_resampling_matrix(xspace, xspace_new, method)
+
+    # Store copies : arrays may be modified in place afterwards
+    _RESAMPLING_MATRIX_CACHE[key] = (xspace.copy(), xspace_new.copy(), R, b_new)
+    if len(_RESAMPLING_MATRIX_CACHE) > RESAMPLING_MATRIX_CACHE_SIZE:
+        _RESAMPLING_MATRIX_CACHE.popitem(last=False)
+
+    return R, b_new
+
+
+def _build_resampling_matrix(xspace, xspace_new, method):
+    """Compute the resampling matrix. See :py:func:`~radis.misc.signal.get_resampling_matrix`"""
+
+    N = len(xspace)
+    if N < 2:
+        raise ValueError("Resampling requires at least 2 points in xspace")
+    if is_sorted(xspace):
+        x = xspace
+        reverse = False
+    elif is_sorted_backward(xspace):
+        x = xspace[::-1]
+        reverse = True
+    else:
+        raise ValueError(
+            "Resampling requires wavespace to be sorted. It is not! Use .sort()? "
+        )
+
+    b_new = (xspace_new >= x[0]) & (xspace_new <= x[-1])
+
+    if method == "linear":
+        rows = np.arange(len(xspace_new))[b_new]
+        x_new = xspace_new[b_new]
+        j = np.clip(np.searchsorted(x, x_new, side="right") - 1, 0, N - 2)
+        theta = (x_new - x[j]) / (x[j + 1] - x[j])
+        rows = np.hstack((rows, rows))
+        cols = np.hstack((j, j + 1))
+        weights = np.hstack((1 - theta, theta))
+
+    elif method == "binning":
+        if is_sorted(xspace_new):
+            order = np.arange(len(xspace_new))
+        elif is_sorted_backward(xspace_new):
+            order = np.arange(len(xspace_new))[::-1]
+        else:
+            raise ValueError(
+                "Binning requires the new wavespace to be sorted. It is not!"
+            )
+        if len(xspace_new) < 2:
+            raise ValueError("Binning requires at least 2 points in xspace_new")
+        x_new = xspace_new[order]
+        # Bin edges, halfway between new points
+        edges = np.empty(len(x_new) + 1)
+        edges[1:-1] = (x_new[1:] + x_new[:-1]) / 2
+        edges[0] = x_new[0] - (x_new[1] - x_new[0]) / 2
+        edges[-1] = x_new[-1] + (x_new[-1] - x_new[-2]) / 2
+        # Split the common range into segments that are within a single bin
+        # and a single interval of xspace : the linear interpolant integral is
+        # then exactly  length * (value at the segment center)
+        lo, hi = max(edges[0], x[0]), min(edges[-1], x[-1])
+        points = np.hstack((edges, x))
+        points = np.unique(points[(points >= lo) & (points <= hi)])
+        length = np.diff(points)
+        center = (points[1:] + points[:-1]) / 2
+        bins = np.searchsorted(edges, center) - 1
+        j = np.clip(np.searchsorted(x, center) - 1, 0, N - 2)
+        theta = (center - x[j]) / (x[j + 1] - x[j])
+        # ... normalize by the bin length actually covered by xspace
+        covered = np.bincount(bins, weights=length, minlength=len(x_new))
+        norm = length / covered[bins]
+        rows = order[np.hstack((bins, bins))]
+        cols = np.hstack((j, j + 1))
+        weights = np.hstack((norm * (1 - theta), norm * theta))
+
+    else:
+        raise ValueError(
+            "Unexpected value for `method`: {0}. Use one of 'linear', "
+            "'binning'".format(method)
+        )
+
     if reverse:
-        # xspace_new = xspace_new[::-1]
-        vector_new = vector_new[::-1]
+        cols = N - 1 - cols
 
-    return vector_new
+    # note : duplicates (same row & column) are summed
+    R = csr_matrix((weights, (rows, cols)), shape=(len(xspace_new), N))
+    # ... drop zero weights (ex: new points on an old point), else the matrix
+    # ... product would propagate NaNs of points that do not contribute
+    R.eliminate_zeros()
+
+    return R, b_new
+
+
+def _resample_with_matrix(
+    xspace,
+    vector,
+    xspace_new,
+    method="linear",
+    ext="error",
+    energy_threshold=5e-3,
+    print_conservation=True,
+):
+    """Resample one or several vectors (rows of a 2D ``vector``) with a
+    cached sparse matrix. See :py:func:`~radis.misc.signal.resample`"""
+
+    xspace = np.asarray(xspace)
+    xspace_new = np.asarray(xspace_new)
+    vector = np.asarray(vector)
+    if vector.shape[-1] != len(xspace):
+        raise ValueError(
+            "vector and xspace should have the same length. "
+            + "Got {0}, {1}".format(vector.shape[-1], len(xspace))
+        )
+
+    # one filling value per vector
+    vectors = np.atleast_2d(vector)
+    if isinstance(ext, (list, tuple)):
+        if len(ext) != len(vectors):
+            raise ValueError(
+                "Expected one `ext` per vector. Got {0} for {1} vectors".format(
+                    len(ext), len(vectors)
+                )
+            )
+        ext_list = ext
+    else:
+        ext_list = [ext] * len(vectors)
+    for e in ext_list:
+        if e == "extrapolate":
+            raise NotImplementedError(
+                "ext='extrapolate' is only implemented with method='spline'"
+            )
+        elif e not in [0, "0", 1, "1", nan, "nan", "error"]:
+            raise ValueError("Unexpected value for `ext`: {0}".format(e))
+
+    R, b_new = get_resampling_matrix(xspace, xspace_new, method=method)
+
+    if "error" in ext_list and not b_new.all():
+        raise ValueError(
+            "{0} points of the new space are outside the range of the original "
+            "space ({1:.5g}-{2:.5g})".format((~b_new).sum(), xspace.min(), xspace.max())
+        )
+
+    # Resample all vectors at once
+    vectors_new = (R @ vectors.T).T
+
+    # Fill out of boundary values (rows of R are empty : filled with 0 already)
+    b = (xspace >= xspace_new.min()) & (xspace <= xspace_new.max())
+    for vector_i, vector_new, e in zip(vectors, vectors_new, ext_list):
+        if e in [1, "1"]:
+            vector_new[~b_new] = 1
+        elif e in [nan, "nan"]:
+            vector_new[~b_new] = nan
+        # Check energy conservation:
+        _check_energy_conservation(
+            xspace,
+            vector_i,
+            b,
+            xspace_new,
+            vector_new,
+            b_new,
+            energy_threshold,
+            print_conservation,
+        )
+
+    if vector.ndim == 1:
+        return vectors_new[0]
+    return vectors_new
 
 
 def resample_even(
@@ -54,7 +54,7 @@ from warnings import warn
 
 import astropy.units as u
 import numpy as np
-from numpy import abs, diff
+from numpy import abs
 
 from radis.db.references import doi
 
@@ -2364,6 +2364,7 @@ class Spectrum(object):
         store=True,
         slit_dispersion=None,
         slit_dispersion_threshold=0.01,
+        slit_dispersion_method="slices",
         auto_recenter_crop=True,
         verbose=True,
         inplace=True,
@@ -2394,6 +2395,10 @@ class Spectrum(object):
                 format must be 2-columns with wavelengths and intensity (doesn't have to be normalized)
                 It is recommended to truncate the input slit function to its minimum useful spectral
                 extension (see Notes of :func:`~radis.tools.slit.convolve_with_slit`).
+            If :py:class:`~radis.tools.slit.SlitPlan`:
+                reuse the slit and convolution precomputed for the spectral grid of
+                the Spectrum. The other slit parameters (``unit``, ``shape``,
+                ``norm_by``, ``mode``, ``slit_dispersion``, etc.) are those of the plan.
         unit: ``'nm'`` or ``'cm-1'``
             unit of slit_function (FWHM, or imported file)
         shape: ``'triangular'``, ``'trapezoidal'``, ``'gaussian'``, or any of :data:`~radis.tools.slit.SLIT_SHAPES`
@@ -2476,6 +2481,17 @@ class Spectrum(object):
         slit_dispersion_warning_threshold: float
             if not ``None``, check that slit dispersion is about constant (< ``threshold`` change)
             on the calculated range. Default 0.01 (1%). See :func:`~radis.tools.slit.offset_dilate_slit_function`
+        slit_dispersion_method: ``'slices'``, ``'exact'``
+            how to correct the slit function for the slit dispersion:
+
+            - ``'slices'`` cuts the spectral range in slices where the slit
+              dispersion changes by less than ``slit_dispersion_threshold``, and
+              convolves each slice with its dilated slit.
+            - ``'exact'`` dilates the slit at each point of the spectral range,
+              and applies all the dilated slits at once with a sparse banded
+              matrix. No boundary effects between slices.
+
+            Default ``'slices'``
         inplace: bool
             if ``True``, adds convolved arrays directly in the Spectrum. If
             ``False``, returns a new Spectrum with only the convolved arrays.
@@ -2512,9 +2528,15 @@ class Spectrum(object):
 
         Implementation:
 
-        :func:`~radis.tools.slit.convolve_with_slit` is applied to
+        the slit convolution of :class:`~radis.tools.slit.SlitPlan` (same as
+        :func:`~radis.tools.slit.convolve_with_slit`) is applied to
         all quantities in :meth:`~radis.spectrum.spectrum.Spectrum.get_vars`
-        that ends with _noslit. Generate a triangular instrumental slit function
+        that ends with _noslit, in a single call on the stacked quantities
+        (the Fourier transform of the slit is shared). Build a :class:`~radis.tools.slit.SlitPlan` once
+        and give it as ``slit_function`` to apply the same slit to many spectra
+        calculated on the same spectral grid.
+
+        Generate a triangular instrumental slit function
         (or any other shape depending of shape=) with base
         ``slit_function_base`` (Uses the central wavelength of the spectrum
         for the slit function generation)
@@ -2550,17 +2572,12 @@ class Spectrum(object):
         --------
         :func:`~radis.tools.slit.get_slit_function`,
         :func:`~radis.tools.slit.convolve_with_slit`,
+        :class:`~radis.tools.slit.SlitPlan`,
         :ref:`the Spectrum page <label_spectrum>`
         """
         # TODO: add warning if FWHM >= wstep(spectrum)/5
 
-        from radis.tools.slit import (
-            cast_waveunit,
-            convolve_with_slit,
-            get_slit_function,
-            normalize_slit,
-            offset_dilate_slit_function,
-        )
+        from radis.tools.slit import SlitPlan, cast_waveunit
 
         # Check inputs
         # ---------
@@ -2579,132 +2596,56 @@ class Spectrum(object):
                 + f"Available arrays in Spectrum : {self.get_vars()}"
             )
 
-        # Forward relevant inputs to convolution instead of slit function generation
-        kwargsconvolve = {}
-        for kw in ["slit_dispersion", "verbose"]:
-            if kw in kwargs:
-                kwargsconvolve.update({kw: kwargs.pop(kw)})
-
-        # For non evenyly distributed cases we take the minimum wstep among the
-        # spectral range (and resample in convolve_with_slit)
-        # Note: by construction all variables now have the same wavespace
         w = self._q["wavespace"]  # non convoluted wavespace
-        wstep = abs(diff(w)).min()
-        assert wstep > 0
         waveunit = self.get_waveunit()
 
-        if __debug__:
-            printdbg(
-                "apply_slit: {0} in {1}, center `{2}`{1}, applied in waveunit {3}".format(
-                    slit_function, unit, center_wavespace, waveunit
-                )
-            )
-
-        if center_wavespace is None:
-            # center_wavespace should be ~ unit
-            center_wavespace = w[len(w) // 2]  # w ~ waveunit
-            if waveunit == "cm-1" and unit == "nm":
-                center_wavespace = cm2nm(center_wavespace)  # wavenum > wavelen
-            elif waveunit == "nm" and unit == "cm-1":
-                center_wavespace = nm2cm(center_wavespace)  # wavelen > wavenum
-
-        # Get slit once and for all (and convert the slit unit
-        # to the Spectrum `waveunit` if wavespaces are different)
+        # Get slit once and for all (and convert the slit unit to the Spectrum
+        # `waveunit` if wavespaces are different), and precompute the convolution
         # -------
-        wslit0, Islit0 = get_slit_function(
-            slit_function,
-            unit=unit,
-            norm_by=norm_by,
-            shape=shape,
-            center_wavespace=center_wavespace,
-            return_unit=waveunit,
-            wstep=wstep,
-            auto_recenter_crop=auto_recenter_crop,
-            verbose=verbose,
-            plot=plot_slit,
-            *args,
-            **kwargs,
-        )
-
-        # Check if dispersion is specified
-        if slit_dispersion is not None:
-            if waveunit == "nm":
-                w_nm = w
-                wslit0_nm = wslit0
-            else:
-                w_nm = cm2nm(w)
-                wslit0_nm = cm2nm(wslit0)
-            slice_windows = _cut_slices(
-                w_nm, wslit0_nm, slit_dispersion, slit_dispersion_threshold
-            )
+        if isinstance(slit_function, SlitPlan):
+            plan = slit_function
+            plan.check_grid(w, waveunit)
         else:
-            slice_windows = [np.ones_like(w, dtype=bool)]
-
-        # Create dictionary to store convolved
-        I_conv_slices = {}
-        for qns in varlist:
-            # Convolve and store the output in a new variable name (quantity name minus `_noslit`)
-            # Create if requireds
-
-            q = qns[:-7]  # new name  (minus '_noslit')
-            w_conv_slices = []
-            I_conv_slices[q] = []
-
-        # Loop over all waverange slices (needed if slit changes over the spectral range)
-        for islice, slice_window in enumerate(slice_windows):
-
-            # Scale slit
-            if slit_dispersion is not None:
-                # apply spectrometer linear dispersion function.
-                # dont forget it has to be added in nm and not cm-1
-                wslit, Islit = offset_dilate_slit_function(
-                    wslit0_nm,
-                    Islit0,
-                    w_nm[slice_window],
-                    slit_dispersion,
-                    threshold=slit_dispersion_threshold,
-                    verbose=verbose,
-                )
-                # Convert it back if needed
-                if waveunit == "cm-1":
-                    wslit = nm2cm(wslit)
-                # We need to renormalize now that Islit has changed
-                wslit, Islit = normalize_slit(wslit, Islit, norm_by=norm_by)
-            else:
-                wslit = wslit0
-                Islit = Islit0  # no need to renormalize it
-
-            # Apply to all variables
-            # ---------
-            for i, q in enumerate(I_conv_slices.keys()):
-                # Convolve and store the output in a new variable name (quantity name minus `_noslit`)
-                # Create if requireds
-
-                qns = q + "_noslit"
-                w_window = w[slice_window]
-                I_window = self._q[qns][slice_window]
-
-                # Apply convolution
-                w_conv_window, I_conv_window = convolve_with_slit(
-                    w_window,
-                    I_window,
-                    wslit,
-                    Islit,
-                    mode=mode,
-                    wunit=waveunit,
-                    verbose=verbose,
-                    assert_evenly_spaced=False,
-                    # assumes Spectrum is correct by construction
-                    **kwargsconvolve,
+            if __debug__:
+                printdbg(
+                    "apply_slit: {0} in {1}, center `{2}`{1}, applied in waveunit {3}".format(
+                        slit_function, unit, center_wavespace, waveunit
+                    )
                 )
+            plan = SlitPlan(
+                w,
+                slit_function,
+                unit=unit,
+                shape=shape,
+                center_wavespace=center_wavespace,
+                norm_by=norm_by,
+                mode=mode,
+                waveunit=waveunit,
+                slit_dispersion=slit_dispersion,
+                slit_dispersion_threshold=slit_dispersion_threshold,
+                slit_dispersion_method=slit_dispersion_method,
+                auto_recenter_crop=auto_recenter_crop,
+                plot_slit=plot_slit,
+                verbose=verbose,
+                *args,
+                **kwargs,
+            )
+        unit = plan.unit
+        norm_by = plan.norm_by
 
-                if i == 0:
-                    w_conv_slices.append(w_conv_window)
-                I_conv_slices[q].append(I_conv_window)
+        # Apply to all variables at once (one row per variable)
+        # ---------
+        I_noslit = np.vstack([self._q[qns] for qns in varlist])
+        w_conv, I_conv_all = plan.convolve(I_noslit)
+        I_conv = {}
+        for qns, I_conv_q in zip(varlist, I_conv_all):
+            # Store the output in a new variable name (quantity name minus `_noslit`)
+            q = qns[:-7]  # new name  (minus '_noslit')
+            I_conv[q] = I_conv_q
 
         # Get units
         new_units = {}
-        for q in I_conv_slices.keys():
+        for q in I_conv.keys():
             qns = q + "_noslit"
 
             # Get units
@@ -2721,9 +2662,8 @@ class Spectrum(object):
             else:
                 raise ValueError("Unknown normalization type: {0}".format(norm_by))
 
-        # Merge and store all variables
+        # Store all variables
         # ---------
-        w_conv = np.hstack(w_conv_slices)
         if inplace:
             if len(self._q["wavespace"]) != len(w_conv) or not np.allclose(
                 self._q["wavespace"], w_conv
@@ -2731,12 +2671,9 @@ class Spectrum(object):
                 raise AssertionError(
                     "Wavespace of convolved arrays is different, cannot store it in the same Spectrum. You can use Spectrum.apply_slit(inplace=False) to return a new spectrum with only the convolved arrays"
                 )
-            for q in I_conv_slices.keys():
-                # Merge all slices
-                I_conv = np.hstack(I_conv_slices[q])
-
+            for q in I_conv.keys():
                 # Store
-                self._q[q] = I_conv
+                self._q[q] = I_conv[q]
 
                 # Get units
                 self.units[q] = new_units[q]
@@ -2747,10 +2684,8 @@ class Spectrum(object):
                 "wavespace": w_conv
             }  # a copy will be created in Spectrum creation
 
-            for q in I_conv_slices.keys():
-
-                # Merge all slices
-                quantities[q] = np.hstack(I_conv_slices[q])
+            for q in I_conv.keys():
+                quantities[q] = I_conv[q]
 
             s_out = Spectrum(
                 quantities,
@@ -2764,15 +2699,15 @@ class Spectrum(object):
 
         # Store slit in Spectrum, in the Spectrum unit
         if store:
-            s_out._slit["wavespace"] = wslit0  # in 'waveunit'
-            s_out._slit["intensity"] = Islit0
+            s_out._slit["wavespace"] = plan.wslit  # in 'waveunit'
+            s_out._slit["intensity"] = plan.Islit
 
         # Update conditions
-        s_out.conditions["slit_function"] = slit_function
+        s_out.conditions["slit_function"] = plan.slit_function
         s_out.conditions["slit_unit"] = unit  # input slit unit
-        s_out.conditions["slit_dispersion"] = slit_dispersion
-        s_out.conditions["slit_dispersion_threshold"] = slit_dispersion_threshold
-        s_out.conditions["slit_shape"] = shape
+        s_out.conditions["slit_dispersion"] = plan.slit_dispersion
+        s_out.conditions["slit_dispersion_threshold"] = plan.slit_dispersion_threshold
+        s_out.conditions["slit_shape"] = plan.shape
         # TODO: probably removed after Spectrum is stored.
         s_out.conditions["norm_by"] = norm_by
 
@@ -3386,6 +3321,7 @@ class Spectrum(object):
         print_conservation=False,
         inplace=True,
         if_conflict_drop=None,
+        method="spline",
         **kwargs,
     ):
         """Resample spectrum over a new wavelength/wavenumber range.
@@ -3440,6 +3376,13 @@ class Spectrum(object):
         inplace: boolean
             if ``True``, modifies the Spectrum object directly. Else, returns
             a copy. Default ``True``.
+        method: ``'spline'``, ``'linear'``, ``'binning'``
+            ``'spline'``: each quantity is interpolated separately.
+            ``'linear'`` (linear interpolation) or ``'binning'`` (area-conserving
+            binning): all quantities are resampled at once with a sparse
+            resampling matrix, which is cached for a given pair of grids. Much
+            faster when resampling repeatedly on the same grid, ex. in a fit loop.
+            See :func:`radis.misc.signal.get_resampling_matrix`. Default ``'spline'``.
         **kwargs: **dict
             all other arguments are sent to :func:`radis.misc.signal.resample`
 
@@ -3528,21 +3471,38 @@ class Spectrum(object):
         # ... air2vacuum conversion in particular is quite slow, but has been
         # ... done once for all with get_wavelength() above )
 
-        for (k, I) in s._q.items():
-            if k == "wavespace":
-                continue
-            fill_with = get_filling(k)
-            Inew = resample(
-                w,
-                I,
-                w_new,
-                ext=fill_with,
-                energy_threshold=energy_threshold,
-                print_conservation=False,
-                **kwargs,
-            )
+        if method == "spline":
+            for (k, I) in s._q.items():
+                if k == "wavespace":
+                    continue
+                fill_with = get_filling(k)
+                Inew = resample(
+                    w,
+                    I,
+                    w_new,
+                    ext=fill_with,
+                    energy_threshold=energy_threshold,
+                    print_conservation=False,
+                    **kwargs,
+                )
 
-            s._q[k] = Inew
+                s._q[k] = Inew
+        else:
+            # Resample all quantities at once with the same resampling matrix
+            keys = [k for k in s._q if k != "wavespace"]
+            if len(keys) > 0:
+                I_new = resample(
+                    w,
+                    np.vstack([s._q[k] for k in keys]),
+                    w_new,
+                    ext=[get_filling(k) for k in keys],
+                    energy_threshold=energy_threshold,
+                    print_conservation=False,
+                    method=method,
+                    **kwargs,
+                )
+                for k, Inew in zip(keys, I_new):
+                    s._q[k] = Inew
         # update wavespace
         s._q["wavespace"] = w_new
 
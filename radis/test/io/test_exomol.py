@@ -119,6 +119,62 @@ def test_calc_exomol_vs_hitemp(verbose=True, plot=True, *args, **kwargs):
     )
 
 
+@pytest.mark.fast
+def test_convert_trans(tmp_path, *args, **kwargs):
+    """Check that the chunked conversion of a transition file gives the same
+    transitions as the in-memory join of :py:func:`~radis.io.exomolapi.pickup_gE`
+    """
+    import bz2
+
+    import numpy as np
+    import vaex
+
+    from radis.io import exomolapi
+    from radis.lbl.base import linestrength_from_Einstein
+
+    rng = np.random.default_rng(0)
+
+    # Synthetic states (i, E, g, J) and transitions (i_upper, i_lower, A)
+    Nstates, Ntrans = 50, 1000
+    ndstates = np.column_stack(
+        (
+            np.arange(1, Nstates + 1),
+            np.sort(rng.uniform(0, 5000, Nstates)),
+            rng.integers(1, 10, Nstates),
+            rng.integers(0, 30, Nstates),
+        )
+    ).astype(float)
+    i1, i2 = rng.integers(1, Nstates + 1, (2, Ntrans))
+    ndtrans = np.column_stack(
+        (np.maximum(i1, i2), np.minimum(i1, i2), rng.uniform(0.1, 10, Ntrans))
+    )  # (a few transitions with i_upper == i_lower are discarded)
+    transf = tmp_path / "X__test.trans.bz2"
+    with bz2.open(transf, "wt") as f:
+        for iu, il, A in ndtrans:
+            f.write(f"{int(iu):12d} {int(il):12d} {A!r}\n")
+
+    QTref = 100.0
+    dic_def = {"Landé": False, "lifetime": False, "quantum_labels": []}
+    A, nu_lines, elower, gup, _, _, _, _ = exomolapi.pickup_gE(
+        ndstates, ndtrans, transf, dic_def
+    )
+    Sij0 = linestrength_from_Einstein(A, gup, elower, 1, nu_lines, QTref, 296.0)
+
+    lookup = exomolapi.make_states_lookup(ndstates, tmp_path / "lookup.npy")
+    for nurange, crit in [([-np.inf, np.inf], -np.inf), ([1000, 3000], 1e-30)]:
+        fcache = tmp_path / f"X__test_{nurange[0]}.hdf5"
+        exomolapi.convert_trans(
+            transf, fcache, lookup, QTref, nurange=nurange, crit=crit, chunksize=77
+        )
+        trans = vaex.open(str(fcache))
+        mask = (nu_lines > nurange[0]) & (nu_lines < nurange[1]) & (Sij0 > crit)
+        assert len(trans) == mask.sum()
+        assert np.allclose(trans.A.values, A[mask], rtol=1e-12)
+        assert np.array_equal(trans.nu_lines.values, nu_lines[mask])
+        assert np.allclose(trans.Sij0.values, Sij0[mask], rtol=1e-12)
+        trans.close()
+
+
 if __name__ == "__main__":
     test_exomol_parsing_functions()
     test_calc_exomol_spectrum()
@@ -53,6 +53,57 @@ def test_relevant_files_filter():
     ]
 
 
+@pytest.mark.fast
+def test_parse_to_local_file_parallel(*args, **kwargs):
+    """Test the pipelined parsing of a HITEMP file (chunks of lines parsed on
+    several workers, written in order) against the serial parsing, offline
+    with a local compressed file.
+    """
+    import bz2
+    import shutil
+    from os.path import join
+    from tempfile import mkdtemp
+
+    from numpy import DataSource
+
+    from radis.io.hdf5 import hdf2df
+    from radis.test.utils import getTestFile
+
+    tempdir = mkdtemp()
+    try:
+        # a local "download"
+        urlname = join(tempdir, "05_HITEMP2019.par.bz2")
+        with open(getTestFile("hitran_co_3iso_2000_2300cm.par"), "rb") as f:
+            with bz2.open(urlname, "wb") as fz:
+                fz.write(f.read())
+
+        ldb = HITEMPDatabaseManager(
+            "HITEMP-CO-TEST-PARALLEL",
+            "CO",
+            local_databases=tempdir,
+            engine="pytables",
+            verbose=False,
+            chunksize=100,  # several chunks
+        )
+        ldb.nJobs = 2
+        # Dont look online for the number of lines :
+        ldb.base_url, ldb.Nlines, ldb.wmin, ldb.wmax = urlname, 0, 2000, 2300
+
+        dfs = []
+        for parallel in [False, True]:
+            local_file = join(tempdir, f"CO_parallel{parallel}.h5")
+            Nlines = ldb.parse_to_local_file(
+                DataSource(tempdir), urlname, local_file, parallel=parallel
+            )
+            dfs.append(hdf2df(local_file, engine="pytables", verbose=False))
+            assert len(dfs[-1]) == Nlines
+
+        assert Nlines > 2 * ldb.chunksize
+        assert dfs[0].equals(dfs[1])
+    finally:
+        shutil.rmtree(tempdir)
+
+
 @pytest.mark.needs_connection
 def test_fetch_hitemp_OH_pytables(verbose=True, *args, **kwargs):
     """Test proper download of HITEMP OH database, with two engines.
@@ -426,6 +477,7 @@ def test_parse_hitemp_missing_labels_issue280(*args, **kwargs):
 
 if __name__ == "__main__":
     test_relevant_files_filter()
+    test_parse_to_local_file_parallel()
     test_fetch_hitemp_OH_pytables()
     test_fetch_hitemp_OH_vaex()
     test_partial_loading()
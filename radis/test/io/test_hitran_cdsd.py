@@ -218,6 +218,217 @@ def test_irrelevant_file_loading(*args, **kwargs):
         )
 
 
+@pytest.mark.fast
+def test_partial_cache_loading(*args, **kwargs):
+    """check that only the blocks of lines relevant for the requested wavenumber
+    range are read from cache files (see
+    :py:meth:`~radis.io.hdf5.HDF5Manager.add_block_index`)"""
+
+    from radis.io.cache_files import cache_file_name
+    from radis.io.hdf5 import HDF5Manager
+
+    fname = getTestFile("hitran_2016_H2O_2iso_2000_2100cm.par")
+
+    # Cache file is sorted by wavenumber, and indexed by blocks of lines
+    df_full = hit2df(fname, cache="regen")
+    assert (np.diff(df_full.wav) >= 0).all()
+    manager = HDF5Manager("pytables")
+    fcache = cache_file_name(fname, engine="pytables")
+    block_size, block_index = manager.read_block_index(fcache)
+    assert block_index.shape == (2, int(np.ceil(len(df_full) / block_size)))
+
+    # Use small blocks for the test file
+    manager.add_block_index(fcache, df_full.wav, block_size=10)
+
+    df = hit2df(fname, load_wavenum_min=2040, load_wavenum_max=2060)
+    assert len(df) < len(df_full)
+    b = (df.wav >= 2040) & (df.wav <= 2060)
+    b_full = (df_full.wav >= 2040) & (df_full.wav <= 2060)
+    assert b.sum() == b_full.sum() > 0
+    assert (df[b].wav.values == df_full[b_full].wav.values).all()
+    # only the blocks on each side of the range are read
+    assert (~b).sum() <= 2 * 10
+
+    # No wavenumber range : the full file is read
+    assert len(hit2df(fname)) == len(df_full)
+
+
+@pytest.mark.fast
+def test_tiered_cache_loading(*args, **kwargs):
+    """check that the tiers of weak lines of a cache file grouped by tiers of
+    linestrength are skipped (see :py:func:`~radis.io.cache_files.make_tiers`)"""
+
+    import shutil
+    import tempfile
+
+    from radis.io.cache_files import cache_file_name
+    from radis.io.hdf5 import HDF5Manager
+
+    tempdir = tempfile.mkdtemp()
+    fname = os.path.join(tempdir, "hitran_co_3iso_2000_2300cm.par")
+    shutil.copy(getTestFile("hitran_co_3iso_2000_2300cm.par"), fname)
+
+    try:
+        for engine in ["pytables", "npy"]:
+            df_full = hit2df(fname, cache="regen", engine=engine, int_tiers=True)
+            fcache = cache_file_name(fname, engine=engine)
+            tier_index = HDF5Manager(engine).read_tier_index(fcache)
+            assert tier_index.stop.max() == len(df_full)
+
+            # All tiers : same lines, sorted by wavenumber
+            df = hit2df(fname, engine=engine, load_tiers=lambda t: t.int_max > 0)
+            assert df.equals(df_full)
+
+            # No tier selector : all tiers, also sorted by wavenumber
+            df = hit2df(fname, engine=engine)
+            assert (np.diff(df.wav) >= 0).all()
+            assert df.equals(df_full)
+
+            # Strong tiers only
+            df = hit2df(
+                fname,
+                engine=engine,
+                load_wavenum_min=2100,
+                load_wavenum_max=2200,
+                load_tiers=lambda t: t.int_max >= 1e-22,
+            )
+            b = (df.wav >= 2100) & (df.wav <= 2200)
+            b_full = (df_full.wav >= 2100) & (df_full.wav <= 2200)
+            assert (df.int >= 1e-22).all()
+            assert b.sum() == (b_full & (df_full.int >= 1e-22)).sum() > 0
+            assert (np.diff(df.wav) >= 0).all()
+    finally:
+        shutil.rmtree(tempdir)
+
+
+@pytest.mark.fast
+def test_npy_cache_engine(verbose=True, *args, **kwargs):
+    """check cache files with the memory-mapped ``'npy'`` engine of
+    :py:class:`~radis.io.hdf5.HDF5Manager` : same content as with ``'pytables'``,
+    read-only columns, exact partial loading, and line database of a
+    :py:class:`~radis.lbl.factory.SpectrumFactory` (``misc.cache_engine``)"""
+
+    from radis import SpectrumFactory
+    from radis.io.cache_files import cache_file_name
+    from radis.io.hdf5 import HDF5Manager, hdf2df
+    from radis.lbl.loader import _is_memmap
+
+    fname = getTestFile("hitran_co_3iso_2000_2300cm.par")
+
+    df_ref = hit2df(fname, cache="regen", verbose=verbose)
+    hit2df(fname, cache="regen", engine="npy", verbose=verbose)
+    df = hit2df(fname, engine="npy", verbose=verbose)
+    assert df.equals(df_ref)
+    assert not df.wav.values.flags.writeable  # memory-mapped
+
+    # Partial loading : exact range (no blocks)
+    df = hit2df(fname, engine="npy", load_wavenum_min=2100, load_wavenum_max=2200)
+    assert len(df) == ((df_ref.wav >= 2100) & (df_ref.wav <= 2200)).sum()
+
+    fcache = cache_file_name(fname, engine="npy")
+    assert HDF5Manager.guess_engine(fcache) == "npy"
+
+    # ... lines on the range bounds are loaded, as with 'pytables'
+    wmin, wmax = df_ref.wav.iloc[10], df_ref.wav.iloc[-10]
+    for f in [cache_file_name(fname), fcache]:
+        df = hdf2df(f, load_wavenum_min=wmin, load_wavenum_max=wmax)
+        assert df.wav.min() == wmin and df.wav.max() == wmax
+        assert len(df) == ((df_ref.wav >= wmin) & (df_ref.wav <= wmax)).sum()
+    assert not df.wav.values.flags.writeable  # 'npy' : no selection copy
+
+    df = hdf2df(fcache, isotope="1", load_wavenum_min=2100, load_wavenum_max=2200)
+    assert (df.iso == 1).all()
+    assert df.attrs["wavenum_min"] == df_ref.wav.min()
+
+    # Line database of a SpectrumFactory : no copy of the columns
+    abscoeff = []
+    for cache_engine in ["pytables", "npy"]:
+        sf = SpectrumFactory(
+            2100, 2200, molecule="CO", isotope="all", wstep=0.01, verbose=False
+        )
+        sf.misc.cache_engine = cache_engine
+        sf.load_databank(path=fname, format="hitran", parfuncfmt="hapi")
+        assert sf.df0.wav.values.flags.writeable == (cache_engine == "pytables")
+        abscoeff.append(sf.eq_spectrum(1000).get("abscoeff")[1])
+    assert (abscoeff[0] == abscoeff[1]).all()
+
+    # ... memory-mapped columns are not cast (copied) in float32 computation mode
+    sf = SpectrumFactory(
+        2100,
+        2200,
+        molecule="CO",
+        isotope="all",
+        wstep=0.01,
+        dtype="float32",
+        verbose=False,
+    )
+    sf.misc.cache_engine = "npy"
+    sf.load_databank(path=fname, format="hitran", parfuncfmt="hapi")
+    assert _is_memmap(sf.df0.airbrd.values)
+    assert sf.df0.airbrd.dtype == np.float64
+
+
+@pytest.mark.fast
+def test_parse_quanta_bytes(verbose=True, *args, **kwargs):
+    """check that quanta parsed directly from the fixed-width bytes of the
+    records are the same as quanta parsed from strings with regular expressions"""
+
+    import pandas as pd
+
+    from radis.io.hitran import (
+        columns_2004,
+        get_quanta_format,
+        parse_global_quanta,
+        parse_local_quanta,
+    )
+    from radis.io.tools import parse_fixed_width_bytes, parse_hitran_file
+
+    for file, molecule in [
+        ("hitran_co_3iso_2000_2300cm.par", "CO"),  # class 1, group 2
+        ("hitran_co2_626_bandhead_4165_4200nm.par", "CO2"),  # class 5, group 2
+        ("hitran_2016_H2O_2iso_2000_2100cm.par", "H2O"),  # class 6, group 1
+    ]:
+        fname = getTestFile(file)
+        df_str = parse_hitran_file(fname, columns_2004)
+        df_str = parse_local_quanta(df_str, molecule)
+        df_str = parse_global_quanta(df_str, molecule)
+
+        raw_columns = list(get_quanta_format(molecule, local=True)) + list(
+            get_quanta_format(molecule, local=False)
+        )
+        df, raw = parse_hitran_file(fname, columns_2004, raw_columns=raw_columns)
+        df = parse_local_quanta(df, molecule, raw=raw)
+        df = parse_global_quanta(df, molecule, raw=raw)
+
+        assert df.equals(df_str)
+
+    # Lines that do not match the format ; negative values
+    b = np.array(
+        [
+            b"         " + b" 1 2-3",
+            b"         " + b"10 1 1",
+            b"   x     " + b" 1 1 1",  # not blank
+            b"         " + b" 1-1 1",  # "-" not allowed in v2
+        ]
+    )
+    fields = [(None, 9, " "), ("v1", 2, "-d"), ("v2", 2, "d"), ("v3", 2, "-d")]
+    regex = r"[ ]{9}(?P<v1>[\-\d ]{2})(?P<v2>[\d ]{2})(?P<v3>[\-\d ]{2})"
+    out = parse_fixed_width_bytes(b, fields)
+    expected = pd.Series(b).str.decode("utf-8").str.extract(regex)
+    expected = expected.fillna(-1).astype(np.int64)
+    for name in ["v1", "v2", "v3"]:
+        assert (out[name] == expected[name].values).all()
+    assert out["v1"].tolist() == [1, 10, -1, -1]
+    assert out["v2"].tolist() == [2, 1, -1, -1]
+    assert out["v3"].tolist() == [-3, 1, -1, -1]
+
+    # Blank integers raise an error, as int() does on strings
+    with pytest.raises(ValueError):
+        parse_fixed_width_bytes(
+            np.array([b"         1"]), [("v1", 8, "d"), ("v2", 2, "d")]
+        )
+
+
 def _run_example(verbose=False):
     from radis import SpectrumFactory
 
@@ -298,6 +509,10 @@ def _run_testcases(verbose=True, *args, **kwargs):
     test_local_hitran_h2o(verbose=verbose, *args, **kwargs)
     test_local_hitemp_file(verbose=verbose, *args, **kwargs)
     test_irrelevant_file_loading()
+    test_partial_cache_loading()
+    test_tiered_cache_loading()
+    test_npy_cache_engine(verbose=verbose)
+    test_parse_quanta_bytes(verbose=verbose)
     test_cache_regeneration(verbose=verbose, *args, **kwargs)
     return True
 
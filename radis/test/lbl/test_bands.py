@@ -98,6 +98,57 @@ def test_plot_all_CO2_bandheads(verbose=True, plot=False, *args, **kwargs):
     return True
 
 
+@pytest.mark.fast
+def test_eq_bands_without_energies(tmp_path, verbose=False, *args, **kwargs):
+    """Test that band labels do not need the energy levels (database loaded
+    with the default ``load_energies=False``), and are persisted in the band
+    cache file of the line database.
+
+    See :py:meth:`~radis.lbl.bands.BandFactory._save_bands_cache`
+    """
+    import os
+    import shutil
+
+    from radis.io.cache_files import bands_cache_file_name, noneq_cache_file_name
+    from radis.test.utils import getTestFile
+
+    dbpath = str(tmp_path / "hitran_co_3iso_2000_2300cm.par")
+    shutil.copy(getTestFile("hitran_co_3iso_2000_2300cm.par"), dbpath)
+
+    def factory():
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            molecule="CO",
+            isotope="1,2",
+            verbose=verbose,
+        )
+        sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+        sf.load_databank(path=dbpath, format="hitran", parfuncfmt="hapi")
+        return sf
+
+    s_bands = factory().eq_bands(Tgas=1000)
+    assert len(s_bands) > 1
+    assert os.path.exists(bands_cache_file_name(dbpath))
+    assert not os.path.exists(noneq_cache_file_name(dbpath))
+
+    # New factory : band labels are read from the cache file
+    import radis.lbl.bands
+
+    def fail(*args, **kwargs):
+        raise AssertionError("band labels should not be computed again")
+
+    add_bands = radis.lbl.bands.add_bands
+    radis.lbl.bands.add_bands = fail
+    try:
+        sf = factory()
+        sf.eq_bands(Tgas=1000)
+    finally:
+        radis.lbl.bands.add_bands = add_bands
+    assert "band" in sf.df0
+    assert sorted(sf.df0.band.unique()) == sorted(s_bands)
+
+
 def run_testcases(verbose=True, plot=False, warnings=True, *args, **kwargs):
 
     test_plot_all_CO2_bandheads(plot=plot)
@@ -719,7 +719,217 @@ def test_get_waverange(*args, **kwargs):
         get_waverange(wmin=1 * u.cm, wmax=2 * u.cm, wunit="cm-1")
 
 
+@pytest.mark.fast
+def test_lookup_levels(*args, **kwargs):
+    """Test the int64-keyed level join of :py:func:`radis.lbl.base.lookup_levels`
+    used in the ``_add_EvibErot_*`` methods, against a dictionary lookup."""
+
+    import pandas as pd
+
+    from radis.lbl.base import lookup_levels
+
+    rng = np.random.default_rng(0)
+    levels = pd.DataFrame(
+        {
+            "p": rng.integers(0, 10, 500),
+            "c": rng.integers(1, 5, 500),
+            "Evib": rng.random(500) * 1e4,
+            "Evib1": rng.random(500) * 1e4,
+        }
+    )
+    lines = pd.DataFrame(
+        {
+            "polyl": rng.integers(0, 12, 2000),  # some levels do not exist
+            "wangl": rng.integers(1, 5, 2000),
+            "polyu": rng.integers(0, 10, 2000),
+            "wangu": rng.integers(-1, 5, 2000),
+        }
+    )
+
+    Evibl, Evibu = lookup_levels(
+        levels,
+        ["p", "c"],
+        lines,
+        [["polyl", "wangl"], ["polyu", "wangu"]],
+        ["Evib", "Evib1"],
+    )
+
+    # Reference: first level of each (p, c) group, as with drop_duplicates()
+    ref = levels.drop_duplicates(["p", "c"]).set_index(["p", "c"])
+    for E, keys in [(Evibl, ["polyl", "wangl"]), (Evibu, ["polyu", "wangu"])]:
+        index = lines.set_index(keys).index
+        for j, col in enumerate(["Evib", "Evib1"]):
+            expected = index.map(dict(zip(ref.index, ref[col])).get).values
+            assert np.array_equal(E[:, j], expected.astype(float), equal_nan=True)
+    assert np.isnan(Evibl).any()  # missing levels are returned as NaN
+
+    # Non-integer quanta are factorized
+    levels["c"] = levels["c"].astype(float)
+    Evibu_f = lookup_levels(levels, ["p", "c"], lines, [["polyu", "wangu"]], ["Evib"])
+    assert np.array_equal(Evibu_f[0], Evibu[:, :1], equal_nan=True)
+
+
+@pytest.mark.fast
+def test_noneq_cache(tmp_path, verbose=True, *args, **kwargs):
+    """Test that the non-LTE columns (Evib, Erot, degeneracies) are
+    persisted next to the line database, and reused by a new factory without
+    looking up the energy levels again.
+
+    See :py:meth:`~radis.lbl.base.BaseFactory._save_noneq_cache`
+    """
+    import os
+    import shutil
+
+    from radis.io.cache_files import noneq_cache_file_name
+    from radis.test.utils import getTestFile
+
+    # cache files are written next to the line database : use a copy
+    dbpath = str(tmp_path / "hitran_co_3iso_2000_2300cm.par")
+    shutil.copy(getTestFile("hitran_co_3iso_2000_2300cm.par"), dbpath)
+    fcache = noneq_cache_file_name(dbpath)
+    database = dict(path=dbpath, format="hitran", parfuncfmt="hapi", levelsfmt="radis")
+
+    def calc(wavenum_min=2000, wavenum_max=2300, **kwargs):
+        sf = SpectrumFactory(
+            wavenum_min=wavenum_min,
+            wavenum_max=wavenum_max,
+            molecule="CO",
+            isotope="1,2",
+            verbose=verbose,
+            **kwargs,
+        )
+        sf.load_databank(**database, load_columns="noneq")
+        return sf, sf.non_eq_spectrum(Tvib=2000, Trot=1000)
+
+    # First run : calculates and persists the non-LTE columns
+    sf1, s1 = calc()
+    assert os.path.exists(fcache)
+
+    # New factory : non-LTE columns are loaded from the cache
+    sf2 = SpectrumFactory(
+        wavenum_min=2000, wavenum_max=2300, molecule="CO", isotope="1,2", verbose=0
+    )
+    sf2.load_databank(**database, load_columns="noneq")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("energy levels should not be looked up again")
+
+    sf2._add_EvibErot = fail
+    s2 = sf2.non_eq_spectrum(Tvib=2000, Trot=1000)
+    for k in ["Evibu", "Evibl", "Erotu", "Erotl", "gu", "gl"]:
+        assert np.array_equal(sf1.df0[k], sf2.df0[k])
+    assert np.array_equal(s1.get("abscoeff")[1], s2.get("abscoeff")[1])
+
+    # Factories on different ranges share the cache file of the line database
+    os.remove(fcache)
+    calc(2000, 2150)
+    calc(2150, 2300)
+    sf2 = SpectrumFactory(
+        wavenum_min=2000, wavenum_max=2300, molecule="CO", isotope="1,2", verbose=0
+    )
+    sf2.load_databank(**database, load_columns="noneq")
+    sf2._add_EvibErot = fail
+    sf2.non_eq_spectrum(Tvib=2000, Trot=1000)
+    for k in ["Evibu", "Evibl", "Erotu", "Erotl", "gu", "gl"]:
+        assert np.array_equal(sf1.df0[k], sf2.df0[k])
+
+    # Modified energy levels invalidate the cache
+    sf3 = SpectrumFactory(
+        wavenum_min=2000, wavenum_max=2300, molecule="CO", isotope="1,2", verbose=0
+    )
+    sf3.load_databank(**database, load_columns="noneq", load_energies=True)
+    energies = sf3.get_energy_levels("CO", 1, "X")
+    energies["Evib"] += 1
+    sf3.non_eq_spectrum(Tvib=2000, Trot=1000)
+    idx = sf3.df0.iso == 1
+    assert np.allclose(sf3.df0.Evibu[idx], sf1.df0.Evibu[idx] + 1)
+
+
+@pytest.mark.fast
+def test_reference_cache(tmp_path, verbose=True, *args, **kwargs):
+    """Test that the reference Einstein coefficients are persisted next to the
+    line database (HDF5 or memory-mapped), and reused by a new factory.
+
+    See :py:meth:`~radis.lbl.base.BaseFactory._save_reference_cache`
+    """
+    import os
+    import shutil
+
+    from radis.io.cache_files import _remove_cache_file, reference_cache_file_name
+    from radis.test.utils import getTestFile
+
+    # cache files are written next to the line database : use a copy
+    dbpath = str(tmp_path / "hitran_co_3iso_2000_2300cm.par")
+    shutil.copy(getTestFile("hitran_co_3iso_2000_2300cm.par"), dbpath)
+
+    def factory(engine, wavenum_min=2000, wavenum_max=2300):
+        sf = SpectrumFactory(
+            wavenum_min=wavenum_min,
+            wavenum_max=wavenum_max,
+            molecule="CO",
+            isotope="1,2",
+            verbose=verbose,
+        )
+        sf.load_databank(
+            path=dbpath,
+            format="hitran",
+            parfuncfmt="hapi",
+            levelsfmt="radis",
+            load_columns="noneq",
+        )
+        sf.misc.cache_engine = engine
+        return sf
+
+    for engine in ["pytables", "npy"]:
+        fcache = reference_cache_file_name(dbpath, engine=engine)
+        if os.path.exists(fcache):
+            _remove_cache_file(fcache)
+
+        # First run : calculates and persists the reference columns
+        sf1 = factory(engine)
+        s1 = sf1.non_eq_spectrum(Tvib=2000, Trot=1000)
+        assert os.path.exists(fcache)
+
+        # New factory : reference columns are loaded from the cache
+        sf2 = factory(engine)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Einstein coefficients should not be recomputed")
+
+        sf2.calc_weighted_trans_moment = fail
+        s2 = sf2.non_eq_spectrum(Tvib=2000, Trot=1000)
+        for k in ["Rs2", "Aul", "Blu", "Bul"]:
+            assert np.array_equal(sf1.df0[k], sf2.df0[k])
+        assert np.array_equal(s1.get("abscoeff")[1], s2.get("abscoeff")[1])
+
+        # A different reference temperature invalidates the cache
+        sf3 = factory(engine)
+        sf3.input.Tref = 300
+        sf3.non_eq_spectrum(Tvib=2000, Trot=1000)
+        assert not np.array_equal(sf1.df0.Rs2, sf3.df0.Rs2)
+
+        # Factories on different ranges share the cache file of the line database
+        _remove_cache_file(fcache)
+        factory(engine, 2000, 2150).non_eq_spectrum(Tvib=2000, Trot=1000)
+        factory(engine, 2150, 2300).non_eq_spectrum(Tvib=2000, Trot=1000)
+        sf2 = factory(engine)
+        sf2.calc_weighted_trans_moment = fail
+        sf2.non_eq_spectrum(Tvib=2000, Trot=1000)
+        for k in ["Rs2", "Aul", "Blu", "Bul"]:
+            assert np.array_equal(sf1.df0[k], sf2.df0[k])
+
+    # Line databases without a HITRAN id (ExoMol) are identified by their name
+    df = sf1.df0.copy()
+    df.attrs = {k: v for k, v in sf1.df0.attrs.items() if k != "id"}
+    df.attrs["molecule"] = "CO"
+    assert sf1._get_reference_cache_metadata(df) == sf1._get_reference_cache_metadata(
+        sf1.df0
+    )
+
+
 def _run_testcases(verbose=True, plot=True):
+    from pathlib import Path
+    from tempfile import TemporaryDirectory
 
     test_linestrength_calculations()
     test_export_populations(plot=plot, verbose=verbose)
@@ -728,6 +938,11 @@ def _run_testcases(verbose=True, plot=True):
     test_optically_thick_limit_1iso(plot=plot, verbose=verbose)
     test_optically_thick_limit_2iso(plot=plot, verbose=verbose)
     test_get_waverange()
+    test_lookup_levels()
+    with TemporaryDirectory() as tmp_path:
+        test_noneq_cache(Path(tmp_path), verbose=verbose)
+    with TemporaryDirectory() as tmp_path:
+        test_reference_cache(Path(tmp_path), verbose=verbose)
 
 
 if __name__ == "__main__":
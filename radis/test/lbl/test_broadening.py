@@ -505,6 +505,287 @@ def test_broadening_LDM_noneq(verbose=True, plot=False, *args, **kwargs):
     assert res <= 1e-4
 
 
+@pytest.mark.fast
+def test_voigt_sum_on_grid(verbose=True, *args, **kwargs):
+    """Test the compiled kernel that computes and sums Voigt lineshapes line
+    by line (used with ``optimization=None``) against the vectorized
+    (lineshape matrix) version"""
+
+    import numpy as np
+
+    from radis.lbl.broadening import _voigt_sum_on_grid, voigt_lineshape
+    from radis.lbl.factory import _generate_broadening_range
+
+    rng = np.random.default_rng(0)
+    N = 200  # lines
+    wbroad_centered = _generate_broadening_range(0.01, 2)
+    B = len(wbroad_centered)
+    W = 3 * B
+    hwhm_lorentz = rng.uniform(0.01, 0.2, N)
+    hwhm_voigt = hwhm_lorentz + rng.uniform(0.01, 0.2, N)
+    S = rng.uniform(0, 1, (2, N))
+    I_low_in_left = rng.integers(0, W - B - 1, N)
+    I_low_in_right = I_low_in_left + 1
+    frac_left = rng.uniform(0, 1, N)
+    frac_right = 1 - frac_left
+
+    # Reference: matrix of lineshapes (B x N)
+    line_profile = voigt_lineshape(
+        np.outer(wbroad_centered, np.ones(N)),
+        hwhm_lorentz.reshape((1, -1)),
+        hwhm_voigt.reshape((1, -1)),
+    )
+    ref = np.zeros((2, W))
+    for k in range(2):
+        for i in range(N):
+            ref[k, I_low_in_left[i] : I_low_in_left[i] + B] += (
+                frac_left[i] * S[k, i] * line_profile[:, i]
+            )
+            ref[k, I_low_in_right[i] : I_low_in_right[i] + B] += (
+                frac_right[i] * S[k, i] * line_profile[:, i]
+            )
+
+    for symmetric in [True, False]:
+        sumoflines = np.zeros((2, W))
+        _voigt_sum_on_grid(
+            wbroad_centered,
+            hwhm_lorentz,
+            hwhm_voigt,
+            S,
+            I_low_in_left,
+            I_low_in_right,
+            frac_left,
+            frac_right,
+            sumoflines,
+            symmetric=symmetric,
+        )
+        if verbose:
+            print(
+                "symmetric={0}: max relative error {1:.2e}".format(
+                    symmetric, np.abs(sumoflines - ref).max() / ref.max()
+                )
+            )
+        assert np.allclose(sumoflines, ref, rtol=1e-10, atol=0)
+
+
+@pytest.mark.fast
+def test_broadening_parallel(verbose=True, *args, **kwargs):
+    """Test that broadening chunks of lines on several threads (``parallel=True``)
+    gives the same results as the sequential calculation, with and without LDM,
+    at equilibrium and nonequilibrium"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    for optimization, broadening_method, sparse_ldm in [
+        ("simple", "voigt", True),
+        ("simple", "voigt", False),  # threads fill a single dense LDM
+        ("simple", "fft", False),
+        (None, "voigt", False),
+    ]:
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            wstep=0.01,
+            truncation=5,
+            isotope="1,2,3",
+            optimization=optimization,
+            verbose=False,
+            warnings={
+                "MissingSelfBroadeningWarning": "ignore",
+                "NegativeEnergiesWarning": "ignore",
+                "HighTemperatureWarning": "ignore",
+            },
+        )
+        sf.params.broadening_method = broadening_method
+        sf.params.sparse_ldm = sparse_ldm
+        sf.load_databank("HITRAN-CO-TEST", load_columns="noneq")
+
+        s_seq = sf.eq_spectrum(Tgas=1000)
+        s_noneq_seq = sf.non_eq_spectrum(Tvib=2000, Trot=1000)
+
+        sf.misc.parallel = True
+        sf.misc.nJobs = 3
+        s_par = sf.eq_spectrum(Tgas=1000)
+        s_noneq_par = sf.non_eq_spectrum(Tvib=2000, Trot=1000)
+
+        res = get_residual(s_seq, s_par, "abscoeff")
+        res_noneq = get_residual(s_noneq_seq, s_noneq_par, "abscoeff") + get_residual(
+            s_noneq_seq, s_noneq_par, "emisscoeff"
+        )
+        if verbose:
+            print(
+                f"optimization={optimization}, {broadening_method}, "
+                + f"sparse={sparse_ldm}: residuals {res:.1e}, {res_noneq:.1e}"
+            )
+        assert res < 1e-6
+        assert res_noneq < 1e-6
+
+
+@pytest.mark.fast
+def test_broadening_LDM_cache(verbose=True, *args, **kwargs):
+    """Test that LDM lineshape templates are reused between spectra, that
+    the cache memory budget is respected, and that results do not depend on
+    the cache"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    for broadening_method in ["voigt", "fft"]:
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            wstep=0.01,
+            isotope="1,2,3",
+            optimization="simple",
+            broadening_method=broadening_method,
+            verbose=False,
+            warnings={
+                "MissingSelfBroadeningWarning": "ignore",
+                "NegativeEnergiesWarning": "ignore",
+                "HighTemperatureWarning": "ignore",
+            },
+            **({"truncation": 5} if broadening_method == "voigt" else {}),
+        )
+        sf.load_databank("HITRAN-CO-TEST")
+
+        s1 = sf.eq_spectrum(Tgas=1000)
+        n_templates = len(sf._LDM_templates)
+        assert n_templates == sf.NwG * sf.NwL
+        s2 = sf.eq_spectrum(Tgas=1050)
+        # Only the new Gaussian widths were computed:
+        assert len(sf._LDM_templates) < n_templates + sf.NwG * sf.NwL
+
+        # Same results without cache
+        sf.misc.ldm_cache_memory = 0
+        s1_nocache = sf.eq_spectrum(Tgas=1000)
+        s2_nocache = sf.eq_spectrum(Tgas=1050)
+        res = get_residual(s1, s1_nocache, "abscoeff") + get_residual(
+            s2, s2_nocache, "abscoeff"
+        )
+        if verbose:
+            print(f"{broadening_method}: residual without cache {res:.1e}")
+        assert res == 0
+        # Memory budget (here 0) is respected
+        assert len(sf._LDM_templates) == 0
+        assert sf._LDM_templates_nbytes == 0
+
+
+@pytest.mark.fast
+def test_broadening_float32(verbose=True, *args, **kwargs):
+    """Test the accuracy of the ``dtype="float32"`` computation mode against
+    float64, for the LDM (dense and sparse) and the line-by-line lineshapes.
+
+    Absorption coefficients are expected to differ by about 1e-6 of their
+    maximum (float32 epsilon is ~1e-7)"""
+
+    import numpy as np
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    for optimization, broadening_method, sparse_ldm in [
+        ("simple", "voigt", True),
+        ("simple", "voigt", False),
+        ("min-RMS", "fft", False),
+        (None, "voigt", False),
+    ]:
+        abscoeff = {}
+        for dtype in ["float64", "float32"]:
+            sf = SpectrumFactory(
+                wavenum_min=2000,
+                wavenum_max=2300,
+                wstep=0.002,
+                isotope="1,2,3",
+                optimization=optimization,
+                broadening_method=broadening_method,
+                dtype=dtype,
+                verbose=False,
+                warnings={
+                    "MissingSelfBroadeningWarning": "ignore",
+                    "NegativeEnergiesWarning": "ignore",
+                    "HighTemperatureWarning": "ignore",
+                },
+                **({"truncation": 5} if broadening_method == "voigt" else {}),
+            )
+            sf.load_databank("HITRAN-CO-TEST")
+            sf._sparse_ldm = sf.params.sparse_ldm = sparse_ldm
+
+            # Broadening parameters are loaded in single precision ; line
+            # positions and intensities are kept in double precision
+            assert sf.df0.airbrd.dtype == dtype
+            assert sf.df0.Pshft.dtype == dtype
+            for k in ["wav", "int", "A", "El"]:
+                assert sf.df0[k].dtype == np.float64
+
+            s = sf.eq_spectrum(Tgas=1500)
+            abscoeff[dtype] = s.get("abscoeff")[1]
+            assert abscoeff[dtype].dtype == np.float64
+
+        error = (
+            np.abs(abscoeff["float32"] - abscoeff["float64"]).max()
+            / abscoeff["float64"].max()
+        )
+        if verbose:
+            print(
+                f"{optimization}, {broadening_method}, sparse={sparse_ldm}: "
+                + f"float32 error {error:.1e} of max"
+            )
+        assert error < 5e-6
+
+
+@pytest.mark.fast
+def test_project_lines_on_grid(verbose=True, *args, **kwargs):
+    """Test the compiled rough projection of lines used for the pseudo-continuum:
+    linestrength is conserved, equilibrium and nonequilibrium versions match, and
+    the fused weak line classification matches its definition (see
+    :py:meth:`~radis.lbl.broadening.BroadenFactory._find_weak_lines`)"""
+
+    import numpy as np
+    import pandas as pd
+
+    from radis.lbl.broadening import (
+        _rough_sum_on_grid,
+        project_lines_on_grid,
+        project_lines_on_grid_noneq,
+    )
+
+    rng = np.random.default_rng(0)
+    N = 2000
+    wstep = 0.01
+    wavenumber = np.arange(1990, 2310, wstep)
+    df = pd.DataFrame(
+        {
+            "shiftwav": rng.uniform(2000, 2300, N),
+            "S": 10 ** rng.uniform(-25, -19, N),
+            "Ei": rng.random(N),
+            "hwhm_voigt": rng.uniform(0.001, 0.5, N),
+        }
+    )
+
+    k_rough, S_density, line2grid = project_lines_on_grid(df, wavenumber, wstep)
+    assert np.isclose(k_rough.sum() * wstep, df.S.sum(), rtol=1e-10)
+
+    k_rough_noneq, j_rough, S_density_noneq, _, _ = project_lines_on_grid_noneq(
+        df, wavenumber, wstep
+    )
+    assert np.array_equal(k_rough, k_rough_noneq)
+    assert np.array_equal(S_density, S_density_noneq)
+    assert np.isclose(j_rough.sum() * wstep, df.Ei.sum(), rtol=1e-10)
+
+    threshold = 0.01
+    line_is_weak = _rough_sum_on_grid(
+        wavenumber,
+        wstep,
+        df.shiftwav.values,
+        df.hwhm_voigt.values * 2,
+        np.atleast_2d(df.S.values),
+        threshold,
+    )[3]
+    assert np.array_equal(
+        line_is_weak, S_density < threshold * (k_rough[line2grid] - S_density)
+    )
+    if verbose:
+        print(f"{line_is_weak.sum()}/{N} weak lines")
+
+
 def test_truncations_and_neighbour_lines(*args, **kwargs):
     """Test new truncations introduced in https://github.com/radis/radis/issues/340
 
@@ -895,6 +1176,11 @@ def _run_testcases(plot=False, verbose=True, *args, **kwargs):
     test_broadening_LDM(plot=plot, verbose=verbose, *args, **kwargs)
     test_broadening_LDM_FT(plot=plot, verbose=3, *args, **kwargs)
     test_broadening_LDM_noneq(plot=plot, verbose=verbose, *args, **kwargs)
+    test_voigt_sum_on_grid(verbose=verbose, *args, **kwargs)
+    test_broadening_parallel(verbose=verbose, *args, **kwargs)
+    test_broadening_LDM_cache(verbose=verbose, *args, **kwargs)
+    test_broadening_float32(verbose=verbose, *args, **kwargs)
+    test_project_lines_on_grid(verbose=verbose, *args, **kwargs)
     test_truncations_and_neighbour_lines(*args, **kwargs)
 
     # Test warnings
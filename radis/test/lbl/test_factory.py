@@ -24,6 +24,7 @@ from os.path import basename
 import astropy.units as u
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import pytest
 
 import radis
@@ -644,6 +645,216 @@ def test_all_spectrum_using_wstep_auto(verbose=True, plot=False, *args, **kwargs
     assert sf._wstep == "auto"
 
 
+@pytest.mark.fast
+def test_eq_spectrum_batch(verbose=True, *args, **kwargs):
+    """Test that :py:meth:`~radis.lbl.factory.SpectrumFactory.eq_spectrum` with
+    arrays of conditions gives the same spectra as successive calls, with
+    and without LDM"""
+
+    from radis.tools.database import SpecList
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    Tgas = [500, 1000, 1500, 2000]
+    pressure = [0.5, 1, 1, 2]  # bar
+    path_length = [1, 2, 3, 4]  # cm
+
+    for optimization in ["simple", None]:
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            wstep=0.01,
+            truncation=5,
+            cutoff=1e-25,
+            isotope="1,2,3",
+            optimization=optimization,
+            verbose=verbose,
+        )
+        sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+        sf.warnings["NegativeEnergiesWarning"] = "ignore"
+        sf.warnings["HighTemperatureWarning"] = "ignore"
+        sf.load_databank("HITRAN-CO-TEST")
+
+        spectra = sf.eq_spectrum(Tgas=Tgas, pressure=pressure, path_length=path_length)
+        assert isinstance(spectra, SpecList)
+        assert len(spectra) == len(Tgas)
+
+        for s, T, p, L in zip(spectra, Tgas, pressure, path_length):
+            s_ref = sf.eq_spectrum(Tgas=T, pressure=p, path_length=L)
+            assert s.conditions["Tgas"] == T
+            assert s.conditions["lines_cutoff"] == s_ref.conditions["lines_cutoff"]
+            for var in ["abscoeff", "radiance_noslit"]:
+                assert np.allclose(s.get(var)[1], s_ref.get(var)[1], rtol=1e-12, atol=0)
+
+    # Scalars are broadcast
+    spectra = sf.eq_spectrum(Tgas=np.array([300, 400]), pressure=1)
+    assert [s.conditions["pressure_mbar"] for s in spectra] == [1000, 1000]
+
+    # Several blocks of conditions (2 conditions per block), with a cutoff that
+    # removes a different number of lines at each temperature
+    sf.params.cutoff = 1e-23
+    sf.misc.batch_blocksize = 2 * len(sf.df0)
+    spectra = sf.eq_spectrum(Tgas=Tgas, pressure=pressure, path_length=path_length)
+    for s, T, p, L in zip(spectra, Tgas, pressure, path_length):
+        s_ref = sf.eq_spectrum(Tgas=T, pressure=p, path_length=L)
+        assert s.conditions["lines_cutoff"] == s_ref.conditions["lines_cutoff"]
+        assert np.allclose(
+            s.get("abscoeff")[1], s_ref.get("abscoeff")[1], rtol=1e-12, atol=0
+        )
+
+    # Factory conditions are restored after the batch
+    s_ref = sf.eq_spectrum(Tgas=700, pressure=0.8, path_length=5)
+    sf.eq_spectrum(Tgas=Tgas, pressure=pressure, path_length=path_length)
+    assert sf.input.Tgas == 700
+    assert sf.input.pressure_mbar == 800
+    assert sf.input.path_length == 5
+
+    # With wstep="auto", the grid of each condition is the grid of a separate call
+    sf = SpectrumFactory(
+        wavenum_min=2000,
+        wavenum_max=2300,
+        wstep="auto",
+        truncation=5,
+        isotope="1,2,3",
+        verbose=verbose,
+    )
+    sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+    sf.warnings["NegativeEnergiesWarning"] = "ignore"
+    sf.warnings["HighTemperatureWarning"] = "ignore"
+    sf.load_databank("HITRAN-CO-TEST")
+    spectra = sf.eq_spectrum(Tgas=Tgas, pressure=pressure, path_length=path_length)
+    for s, T, p, L in zip(spectra, Tgas, pressure, path_length):
+        s_ref = sf.eq_spectrum(Tgas=T, pressure=p, path_length=L)
+        assert s.conditions["wstep"] == s_ref.conditions["wstep"]
+        w, k = s.get("abscoeff")
+        w_ref, k_ref = s_ref.get("abscoeff")
+        assert np.array_equal(w, w_ref)
+        assert np.allclose(k, k_ref, rtol=1e-12, atol=0)
+    assert len({s.conditions["wstep"] for s in spectra}) > 1
+
+    # Not implemented on GPU
+    with pytest.raises(NotImplementedError):
+        sf.eq_spectrum_gpu(Tgas=Tgas)
+
+
+@pytest.mark.fast
+def test_zero_copy_reinitialize(verbose=True, *args, **kwargs):
+    """Test that with ``sf.misc.zero_copy``, the line database ``df0`` is not
+    copied nor modified, even by the linestrength cutoff, that the columns
+    computed for each spectrum reuse the same buffers, and that spectra are
+    unchanged"""
+
+    from radis.lbl.base import _readonly_view
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    sf = SpectrumFactory(
+        wavenum_min=2000,
+        wavenum_max=2300,
+        wstep=0.01,
+        truncation=5,
+        isotope="1,2,3",
+        export_lines=True,
+        verbose=verbose,
+    )
+    sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+    sf.warnings["NegativeEnergiesWarning"] = "ignore"
+    sf.warnings["HighTemperatureWarning"] = "ignore"
+    sf.warnings["LinestrengthCutoffWarning"] = "ignore"
+    sf.load_databank("HITRAN-CO-TEST")
+    df0 = sf.df0.copy()
+
+    # Lines are views of df0, that cannot be modified
+    df1 = _readonly_view(sf.df0)
+    assert np.shares_memory(df1.wav.values, sf.df0.wav.values)
+    assert not df1.wav.values.flags.writeable
+    assert df1.attrs == sf.df0.attrs
+
+    # Default cutoff, then a cutoff that discards lines
+    for cutoff in [sf.params.cutoff, 1e-23]:
+        sf.params.cutoff = cutoff
+        sf.misc.zero_copy = False
+        s_ref = {T: sf.eq_spectrum(Tgas=T) for T in [1000, 1500]}
+        sf.misc.zero_copy = True
+
+        scratch = None
+        for T in [1500, 1000, 1500]:
+            s = sf.eq_spectrum(Tgas=T)
+            assert "S" not in sf.df0
+            assert s.conditions["lines_cutoff"] == s_ref[T].conditions["lines_cutoff"]
+            assert len(s.lines) == len(s_ref[T].lines)
+            # lines used for the spectrum are still views of df0
+            for k in ["wav", "int", "El"]:
+                assert np.shares_memory(sf.df1[k].values, sf.df0[k].values)
+            # columns computed for each spectrum are written in the same buffers
+            if scratch is not None:
+                for k, v in scratch.items():
+                    assert np.shares_memory(sf.df1[k].values, v)
+            scratch = {k: sf.df1[k].values for k in ["S", "shiftwav", "hwhm_lorentz"]}
+            # exported lines are a copy
+            assert not np.shares_memory(s.lines.S.values, scratch["S"])
+            assert np.array_equal(s.get("abscoeff")[1], s_ref[T].get("abscoeff")[1])
+    assert s.conditions["lines_cutoff"] > 0
+    pd.testing.assert_frame_equal(sf.df0, df0)
+
+
+@pytest.mark.fast
+def test_eq_spectrum_incremental(verbose=True, *args, **kwargs):
+    """Test that with ``sf.misc.incremental``, only the stages whose inputs
+    changed are recomputed, and spectra are unchanged"""
+
+    setup_test_line_databases()  # add HITRAN-CO-TEST in ~/radis.json if not there
+
+    conditions = [
+        (1000, 1, 0.1, 1),
+        (1000, 2, 0.1, 1),  # pressure
+        (1000, 2, 0.2, 1),  # mole fraction
+        (1000, 2, 0.2, 5),  # path length
+        (1500, 2, 0.2, 5),  # temperature
+    ]
+
+    spectra = {}
+    for incremental in [False, True]:
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            wstep=0.01,
+            truncation=5,
+            cutoff=1e-25,
+            isotope="1,2,3",
+            verbose=verbose,
+        )
+        sf.warnings["MissingSelfBroadeningWarning"] = "ignore"
+        sf.warnings["NegativeEnergiesWarning"] = "ignore"
+        sf.warnings["HighTemperatureWarning"] = "ignore"
+        sf.load_databank("HITRAN-CO-TEST")
+        sf.misc.incremental = incremental
+
+        spectra[incremental] = []
+        for Tgas, pressure, mole_fraction, path_length in conditions:
+            spectra[incremental].append(
+                sf.eq_spectrum(
+                    Tgas,
+                    pressure=pressure,
+                    mole_fraction=mole_fraction,
+                    path_length=path_length,
+                )
+            )
+            if incremental and (Tgas, pressure, path_length) == (1000, 2, 1):
+                # linestrengths were not recomputed
+                profile = sf.profiler.final["spectrum_calculation"]
+                assert "scaled_eq_linestrength" not in profile
+                assert "calc_hwhm" in profile
+
+    for s, s_ref in zip(spectra[True], spectra[False]):
+        assert s.conditions["lines_cutoff"] == s_ref.conditions["lines_cutoff"]
+        for var in ["abscoeff", "radiance_noslit"]:
+            assert np.array_equal(s.get(var)[1], s_ref.get(var)[1])
+
+    # The line database was not modified
+    assert "S" not in sf.df0
+
+
 # --------------------------
 if __name__ == "__main__":
 
@@ -222,12 +222,124 @@ def test_custom_abundance(verbose=True, plot=False, *args, **kwargs):
     assert s.compare_with((3 * s3.take("abscoeff")), "abscoeff", rtol=0.5e-2, plot=True)
 
 
+@pytest.mark.fast
+def test_load_multiple_files(verbose=True, *args, **kwargs):
+    """Test that a database split in several files is loaded (concurrently)
+    in the same order as the original file.
+
+    See :py:meth:`~radis.lbl.loader.DatabankLoader._load_databank`
+    """
+    import os
+    import tempfile
+
+    import numpy as np
+    import pandas as pd
+
+    # Split a database in 3 files
+    fname = getTestFile("hitran_co_3iso_2000_2300cm.par")
+    with open(fname) as f:
+        lines = f.readlines()
+    tempdir = tempfile.mkdtemp()
+    files = []
+    for i, chunk in enumerate(np.array_split(np.arange(len(lines)), 3)):
+        files.append(os.path.join(tempdir, f"co_part{i}.par"))
+        with open(files[-1], "w") as f:
+            f.writelines([lines[k] for k in chunk])
+
+    def load(path, nJobs):
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            molecule="CO",
+            isotope="1,2,3",
+            verbose=verbose,
+            nJobs=nJobs,
+        )
+        sf.load_databank(path=path, format="hitran", parfuncfmt="hapi")
+        return sf.df0
+
+    try:
+        df_ref = load(fname, 1)
+        for nJobs in [1, 3]:
+            df = load(files, nJobs)
+            pd.testing.assert_frame_equal(df, df_ref)
+    finally:
+        rmtree(tempdir)
+
+
+@pytest.mark.fast
+def test_skip_weak_tiers(verbose=False, *args, **kwargs):
+    """Test that the tiers of lines always below the linestrength cutoff are
+    skipped when loading a cache file grouped by tiers of linestrength, and
+    that the equilibrium spectrum is unchanged.
+
+    See :py:meth:`~radis.lbl.loader.DatabankLoader._get_tier_selector`
+    """
+    import os
+    import shutil
+    import tempfile
+
+    import numpy as np
+
+    from radis.io.cache_files import cache_file_name
+
+    tempdir = tempfile.mkdtemp()
+    fname = os.path.join(tempdir, "hitran_co_3iso_2000_2300cm.par")
+    shutil.copy(getTestFile("hitran_co_3iso_2000_2300cm.par"), fname)
+
+    def load(int_tiers, load_Tgas_max):
+        sf = SpectrumFactory(
+            wavenum_min=2000,
+            wavenum_max=2300,
+            molecule="CO",
+            isotope="1,2,3",
+            wstep=0.01,
+            cutoff=1e-23,
+            verbose=verbose,
+        )
+        sf.misc.int_tiers = int_tiers
+        sf.misc.load_Tgas_max = load_Tgas_max
+        sf.load_databank(path=fname, format="hitran", parfuncfmt="hapi")
+        return sf
+
+    try:
+        sf_ref = load(False, None)
+        s_ref = sf_ref.eq_spectrum(500)
+
+        # Regenerate the cache file, grouped by tiers of linestrength
+        os.remove(cache_file_name(fname))
+        load(True, 600)
+        sf = load(True, 600)
+        assert len(sf.df0) < len(sf_ref.df0)
+        s = sf.eq_spectrum(500)
+        assert np.array_equal(s.get("abscoeff")[1], s_ref.get("abscoeff")[1])
+
+        # Tiered cache reloaded without a linestrength selector : all lines,
+        # sorted by wavenumber
+        sf_all = load(True, None)
+        assert (np.diff(sf_all.df0.wav) >= 0).all()
+        assert len(sf_all.df0) == len(sf_ref.df0)
+
+        # Skipped lines may be above the cutoff
+        with pytest.raises(ValueError):
+            sf.eq_spectrum(1000)
+        sf.params.cutoff = 1e-25
+        with pytest.raises(ValueError):
+            sf.eq_spectrum(500)
+        with pytest.raises(NotImplementedError):
+            sf.non_eq_spectrum(500, 500)
+    finally:
+        rmtree(tempdir)
+
+
 def _run_testcases(verbose=True, plot=False):
 
     test_retrieve_from_database(plot=plot, verbose=verbose)
     test_ignore_cached_files()
     test_ignore_irrelevant_files(verbose=verbose)
     test_custom_abundance()
+    test_load_multiple_files(verbose=verbose)
+    test_skip_weak_tiers(verbose=verbose)
 
 
 if __name__ == "__main__":
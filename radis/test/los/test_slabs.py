@@ -209,6 +209,43 @@ def test_serial_slabs_radiance(
     return True
 
 
+@pytest.mark.fast
+def test_serial_slabs_nslabs(verbose=True, *args, **kwargs):
+    """Solve the RTE for many slabs at once, and compare with slabs added
+    2 by 2 along the line-of-sight"""
+
+    from functools import reduce
+
+    from radis.test.utils import getTestFile
+    from radis.tools.database import load_spec
+
+    s1 = load_spec(getTestFile("CO_Tgas1500K_mole_fraction0.01.spec"), binary=True)
+    s2 = load_spec(getTestFile("CO_Tgas1500K_mole_fraction0.5.spec"), binary=True)
+    s1.update("all", verbose=False)
+    s2.name = "slab2"
+
+    # s2 has only abscoeff : radiance and transmittance are computed on copies
+    for slabs in [[s1, s1.copy()] * 10, [s1, s2] * 10]:
+        vars_before = [s.get_vars() for s in slabs]
+        s_los = SerialSlabs(*slabs)
+        s_pairs = reduce(lambda s_los, s: SerialSlabs(s_los, s), slabs)
+
+        # input slabs are not modified
+        assert [s.get_vars() for s in slabs] == vars_before
+        for k in ["radiance_noslit", "transmittance_noslit"]:
+            assert np.allclose(s_los.get(k)[1], s_pairs.get(k)[1], rtol=1e-12, atol=0)
+        assert s_los.conditions == s_pairs.conditions
+        assert s_los.get_name() == s_pairs.get_name()
+        assert s_los.conditions["path_length"] == sum(
+            s.conditions["path_length"] for s in slabs
+        )
+
+    if verbose:
+        print("Tested SerialSlabs on {0} slabs at once: OK".format(len(slabs)))
+
+    return True
+
+
 def _run_testcases(
     verbose=True,
     plot=True,
@@ -237,6 +274,8 @@ def _run_testcases(
         verbose=verbose, plot=plot, debug=debug, warnings=warnings, *args, **kwargs
     )
 
+    test_serial_slabs_nslabs(verbose=verbose, *args, **kwargs)
+
     test_equilibrium_condition()
 
     return True
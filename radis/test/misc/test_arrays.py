@@ -27,6 +27,8 @@ from radis.misc.arrays import (
     last_nonnan_index,
     logspace,
     non_zero_values_around,
+    sparse_add_at,
+    sparse_add_at_grouped,
 )
 from radis.test.utils import setup_test_line_databases
 
@@ -365,6 +367,41 @@ def test_non_zero_values_around(*args, **kwargs):
     ).all()
 
 
+@pytest.mark.fast
+def test_sparse_add_at_grouped(*args, **kwargs):
+    """Test the vectorized version of :py:func:`~radis.misc.arrays.sparse_add_at`
+    applied on all groups at once gives the same ranges and intensities as a
+    loop on groups"""
+    from radis.misc.arrays import boolean_array_from_ranges
+
+    rng = np.random.default_rng(0)
+    N, max_range, truncation_pts = 1000, 20000, 30
+    ki0 = np.sort(rng.integers(0, max_range - 1, N)).astype(np.int32)
+    key = rng.integers(0, 12, N)
+    Iv0, Iv1, weight = rng.random(N), rng.random(N), rng.random(N)
+
+    keys, ranges_ptr, ranges, I_ptr, I_reduced = sparse_add_at_grouped(
+        np.hstack((key, key)),
+        np.hstack((ki0, ki0 + 1)).astype(np.int64),
+        np.hstack((Iv0 * weight, Iv1 * weight)),
+        max_range,
+        truncation_pts,
+    )
+
+    assert (keys == np.unique(key)).all()
+    for j, key_j in enumerate(keys):
+        b = key == key_j
+        ranges_ref, I_ref = sparse_add_at(
+            ki0[b], Iv0[b], Iv1[b], weight[b], max_range, truncation_pts
+        )
+        mask_ref = boolean_array_from_ranges(ranges_ref, max_range)
+        mask = boolean_array_from_ranges(
+            ranges[ranges_ptr[j] : ranges_ptr[j + 1]], max_range
+        )
+        assert (mask == mask_ref).all()
+        assert np.allclose(I_reduced[I_ptr[j] : I_ptr[j + 1]], I_ref[mask_ref])
+
+
 if __name__ == "__main__":
 
     pytest.main(["test_arrays.py", "-s"])  # -s for showing console output
@@ -458,6 +458,85 @@ def test_resampling_nan_function(verbose=True, *args, **kwargs):
         plot_diff(s, s2, show_points=True)
 
 
+@pytest.mark.fast
+def test_resampling_matrix(verbose=True, *args, **kwargs):
+    """Test resampling with a cached sparse matrix (``method='linear'`` and
+    ``method='binning'``) against the spline interpolation"""
+    from radis.misc.signal import get_resampling_matrix, resample
+    from radis.test.utils import getTestFile
+    from radis.tools.database import load_spec
+
+    s = load_spec(getTestFile("CO_Tgas1500K_mole_fraction0.01.spec"), binary=True)
+    s.update("transmittance_noslit")
+
+    # Resample on a grid that goes beyond the spectrum range, in cm-1 and nm
+    for w_new, unit in [
+        (np.linspace(2100, 2200, 3001), "cm-1"),
+        (np.linspace(4600, 4700, 3001), "nm"),
+    ]:
+        for out_of_bounds in ["nan", "transparent"]:
+            s_spline = s.resample(
+                w_new,
+                unit,
+                out_of_bounds=out_of_bounds,
+                energy_threshold=None,
+                inplace=False,
+            )
+            s_linear = s.resample(
+                w_new,
+                unit,
+                out_of_bounds=out_of_bounds,
+                energy_threshold=None,
+                inplace=False,
+                method="linear",
+            )
+            # spline interpolation of order 1 is linear interpolation
+            for k in ["abscoeff", "transmittance_noslit", "radiance_noslit"]:
+                assert np.allclose(
+                    s_spline.get(k, wunit=unit)[1],
+                    s_linear.get(k, wunit=unit)[1],
+                    rtol=1e-10,
+                    atol=0,
+                    equal_nan=True,
+                )
+
+    # Matrix is cached (for same grids, even if arrays are different)
+    w = s.get_wavenumber()
+    w_new = np.linspace(2150, 2160, 500)
+    R, _ = get_resampling_matrix(w, w_new)
+    assert get_resampling_matrix(w.copy(), w_new.copy())[0] is R
+
+    # Area-conserving binning on a coarser grid: integral is conserved, and
+    # each point is the average over its bin of the (oversampled) spline
+    # interpolation
+    w_new = np.linspace(2150, 2160, 101)
+    dw = w_new[1] - w_new[0]
+    I = s.get("abscoeff", wunit="cm-1")[1]
+    I_bin = resample(w, I, w_new, method="binning", energy_threshold=None)
+    b = (w >= w_new[0] - dw / 2) & (w <= w_new[-1] + dw / 2)
+    assert np.isclose(np.trapz(I[b], w[b]), np.sum(I_bin) * dw, rtol=1e-3)
+    for i in [0, 30, 50, 100]:
+        w_fine = np.linspace(w_new[i] - dw / 2, w_new[i] + dw / 2, 2001)
+        I_fine = resample(w, I, w_fine, energy_threshold=None)
+        assert np.isclose(I_bin[i], np.trapz(I_fine, w_fine) / dw, rtol=1e-3)
+
+    # Constant vectors are unchanged by binning, including on bins at the edges
+    I_one = resample(w, np.ones_like(w), w_new[::-1], method="binning")
+    assert np.allclose(I_one, 1)
+
+    # NaNs only spread to the new points they contribute to (no explicit
+    # zero weight for new points that fall on an old point)
+    x = np.arange(10.0)
+    y = np.ones_like(x)
+    y[5] = np.nan
+    y_new = resample(x, y, np.arange(0.0, 9.5, 0.5), method="linear")
+    assert np.isnan(y_new).sum() == 3
+    assert np.isnan(y_new[9:12]).all()
+
+    if verbose:
+        print("Resampling with a sparse matrix is consistent with spline path")
+
+
 @pytest.mark.fast
 def test_noplot_different_quantities(*args, **kwargs):
     """Prevents User Errors: Ensures an error is raised if plotting different
@@ -601,6 +680,7 @@ def _run_testcases(
         debug=debug, plot=plot, close_plots=close_plots, *args, **kwargs
     )
     test_resampling_nan_function(verbose=verbose, *args, **kwargs)
+    test_resampling_matrix(verbose=verbose, *args, **kwargs)
 
     test_normalization(*args, **kwargs)
 
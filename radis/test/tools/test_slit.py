@@ -40,6 +40,8 @@ from radis.spectrum.spectrum import _cut_slices
 from radis.test.utils import setup_test_line_databases
 from radis.tools.database import load_spec
 from radis.tools.slit import (
+    SlitPlan,
+    convolve_with_slit,
     get_effective_FWHM,
     get_FWHM,
     import_experimental_slit,
@@ -681,6 +683,152 @@ def test_auto_correct_dispersion(
     return True
 
 
+@pytest.mark.fast
+def test_slit_plan(verbose=False, *args, **kwargs):
+    """Test that a :py:class:`~radis.tools.slit.SlitPlan` built once gives the
+    same convolution as :py:func:`~radis.tools.slit.convolve_with_slit`, for
+    many spectra and several arrays at once"""
+
+    from radis.test.utils import getTestFile
+
+    w, I = np.loadtxt(getTestFile("calc_N2C_spectrum_Trot1200_Tvib3000.txt")).T
+    s = calculated_spectrum(w, I, Iunit="mW/cm2/sr/µm")
+
+    # Same convolution as convolve_with_slit
+    s1 = s.apply_slit(0.5, "nm", shape="gaussian", inplace=False, verbose=verbose)
+    w_conv, I_conv = convolve_with_slit(w, I, *s1.get_slit(), verbose=verbose)
+    assert np.allclose(s1.get("radiance")[1], I_conv, equal_nan=True)
+
+    # Reuse the plan for several spectra on the same grid, and several arrays
+    def slit_dispersion(w):
+        return linear_dispersion(w, f=750, phi=-6, m=1, gr=2400)
+
+    slit_measured_632nm = getTestFile("slitfunction.txt")
+    s2 = s.apply_slit(
+        slit_measured_632nm, slit_dispersion=slit_dispersion, inplace=False
+    )
+    plan = SlitPlan(
+        w, slit_measured_632nm, waveunit="nm", slit_dispersion=slit_dispersion
+    )
+    for k in [1, 2]:
+        s3 = (s * k).apply_slit(plan, inplace=False)
+        I3, I2 = s3.get("radiance")[1], s2.get("radiance")[1]
+        assert np.allclose(I3, k * I2, equal_nan=True)
+    assert s3.conditions["slit_dispersion"] is slit_dispersion
+
+    w_conv, I_conv = plan.convolve(np.vstack((I, 2 * I)))
+    assert np.array_equal(w_conv, s2.get_wavelength())
+    assert np.allclose(I_conv[1], 2 * I_conv[0], equal_nan=True)
+
+    # Plans are specific to a spectral grid
+    with pytest.raises(ValueError):
+        s.crop(w.min() + 1, w.max()).apply_slit(plan)
+
+
+@pytest.mark.fast
+def test_apply_slit_all_quantities(verbose=False, *args, **kwargs):
+    """Test that all the spectral arrays of a Spectrum, convolved at once, are
+    convolved as if they were convolved one by one"""
+
+    from radis import Spectrum
+    from radis.test.utils import getTestFile
+
+    w, I = np.loadtxt(getTestFile("calc_N2C_spectrum_Trot1200_Tvib3000.txt")).T
+    s = Spectrum(
+        {
+            "wavelength": w,
+            "radiance_noslit": I,
+            "transmittance_noslit": np.exp(-I / I.max()),
+        },
+        units={"radiance_noslit": "mW/cm2/sr/µm", "transmittance_noslit": ""},
+        wunit="nm",
+    )
+
+    s.apply_slit(0.5, "nm", verbose=verbose)
+    for q in ["radiance", "transmittance"]:
+        sq = s.take(q + "_noslit").apply_slit(0.5, "nm", verbose=verbose)
+        assert np.array_equal(sq.get(q)[1], s.get(q)[1], equal_nan=True)
+
+
+@pytest.mark.fast
+def test_exact_slit_dispersion(verbose=False, *args, **kwargs):
+    """Test the slit dilated at each point of the spectral range with
+    ``slit_dispersion_method='exact'``, against the slit dispersion corrected
+    by slices (see :py:func:`~radis.test.tools.test_slit.test_auto_correct_dispersion`)"""
+
+    from radis.test.utils import getTestFile
+    from radis.tools.slit import _DispersionSlitOperator
+
+    w, I = np.loadtxt(getTestFile("calc_N2C_spectrum_Trot1200_Tvib3000.txt")).T
+    w, I = w[::10], I[::10]
+    s = calculated_spectrum(w, I, Iunit="mW/cm2/sr/µm")
+    slit_measured_632nm = getTestFile("slitfunction.txt")
+
+    def slit_dispersion(w):
+        return linear_dispersion(w, f=750, phi=-6, m=1, gr=2400)
+
+    # Constant dispersion : same as without slit dispersion
+    s0 = s.apply_slit(slit_measured_632nm, inplace=False, verbose=verbose)
+    s1 = s.apply_slit(
+        slit_measured_632nm,
+        slit_dispersion=lambda w: np.ones_like(w),
+        slit_dispersion_method="exact",
+        inplace=False,
+        verbose=verbose,
+    )
+    I0, I1 = s0.get("radiance")[1], s1.get("radiance")[1]
+    b = ~np.isnan(I0) & ~np.isnan(I1)
+    assert b.sum() > 0.8 * len(w)
+    assert np.allclose(I1[b], I0[b], rtol=1e-3, atol=1e-4 * I0[b].max())
+
+    # Same dispersion effect as with slices
+    s2 = s.apply_slit(
+        slit_measured_632nm,
+        slit_dispersion=slit_dispersion,
+        slit_dispersion_method="exact",
+        inplace=False,
+        verbose=verbose,
+    )
+    s3 = s.apply_slit(
+        slit_measured_632nm,
+        slit_dispersion=slit_dispersion,
+        inplace=False,
+        verbose=verbose,
+    )
+    assert len(s2.get_wavelength()) == len(w)
+    assert np.isclose(s2.take("radiance").max(), s3.take("radiance").max(), rtol=1e-3)
+
+    # Weights recomputed at each call if they are not stored
+    plan = SlitPlan(
+        w,
+        slit_measured_632nm,
+        waveunit="nm",
+        slit_dispersion=slit_dispersion,
+        slit_dispersion_method="exact",
+        verbose=verbose,
+    )
+    assert plan._operator.matrix is not None
+    max_cached_weights = _DispersionSlitOperator.max_cached_weights
+    try:
+        _DispersionSlitOperator.max_cached_weights = 0
+        plan_nocache = SlitPlan(
+            w,
+            slit_measured_632nm,
+            waveunit="nm",
+            slit_dispersion=slit_dispersion,
+            slit_dispersion_method="exact",
+            verbose=verbose,
+        )
+    finally:
+        _DispersionSlitOperator.max_cached_weights = max_cached_weights
+    assert plan_nocache._operator.matrix is None
+    I2 = np.vstack((I, 2 * I))
+    assert np.allclose(
+        plan_nocache.convolve(I2)[1], plan.convolve(I2)[1], equal_nan=True
+    )
+    assert np.allclose(plan.convolve(I2)[1][0], s2.get("radiance")[1], equal_nan=True)
+
+
 @pytest.mark.fast
 def test_resampling(rtol=1e-2, verbose=True, plot=True, warnings=True, *args, **kwargs):
     """Test what happens when a spectrum in nm or cm-1, is convolved
@@ -835,6 +983,10 @@ def _run_testcases(plot=True, close_plots=False, verbose=True, *args, **kwargs):
 
     test_resampling(plot=plot, verbose=verbose, *args, **kwargs)
 
+    test_slit_plan(*args, **kwargs)
+    test_apply_slit_all_quantities(*args, **kwargs)
+    test_exact_slit_dispersion(*args, **kwargs)
+
     return True
 
 
@@ -6,6 +6,7 @@
 from .database import SpecDatabase, load_spec, plot_spec, save
 from .gascomp import get_eq_mole_fraction
 from .slit import (
+    SlitPlan,
     convolve_with_slit,
     crop_slit,
     get_effective_FWHM,
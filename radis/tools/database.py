@@ -1049,7 +1049,10 @@ class SpecList(object):
         if isinstance(columns, str):
             columns = [columns] + [k for k in args]
 
-        dg = self.df.set_index("file")  # note that this is a copy already.
+        if "file" in self.df:
+            dg = self.df.set_index("file")  # note that this is a copy already.
+        else:  # SpecList of Spectrum objects
+            dg = self.df.copy()
         # dont try to modify the output of "see"
         del dg["Spectrum"]  # for visibility"
 
@@ -1256,8 +1259,9 @@ class SpecList(object):
 
         if conditions == "" and kwconditions == {}:  # get all spectra
             # Get all unloaded Spectrum objects and load them
-            files = self.df["file"][self.df["Spectrum"].isnull()]
-            self._load_existing_files(files)
+            if "file" in self.df:  # (not in a SpecList of Spectrum objects)
+                files = self.df["file"][self.df["Spectrum"].isnull()]
+                self._load_existing_files(files)
             out = list(self.df["Spectrum"])
 
         else:
@@ -1300,9 +1304,9 @@ class SpecList(object):
                             printdbg("Database query: {0}".format(querypart))
                         dg = dg.query(querypart)
             # Get all unloaded Spectrum objects and load them
-            files = dg["file"][dg["Spectrum"].isnull()]
-
-            self._load_existing_files(files)
+            if "file" in dg:  # (not in a SpecList of Spectrum objects)
+                files = dg["file"][dg["Spectrum"].isnull()]
+                self._load_existing_files(files)
             out = list(self.df.loc[dg.index, "Spectrum"])
 
         if not inplace:
@@ -365,7 +365,8 @@ def fit_spectrum(
 
             figSpec.canvas.flush_events()
 
-        s.resample(s_exp, energy_threshold=2e-2)
+        # linear resampling matrix is cached : computed once for the whole fit
+        s.resample(s_exp, energy_threshold=2e-2, method="linear")
 
         return get_residual(s, s_exp, fit_variable, ignore_nan=True, norm="L2")
 
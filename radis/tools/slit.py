@@ -13,7 +13,10 @@ for slit dilation:
 - :func:`~radis.tools.slit.convolve_with_slit`
 
 This function is called directly by the Spectrum method
-:py:meth:`~radis.spectrum.spectrum.Spectrum.apply_slit`
+:py:meth:`~radis.spectrum.spectrum.Spectrum.apply_slit`, through a slit
+convolution plan that can be reused for many spectra on the same grid:
+
+- :class:`~radis.tools.slit.SlitPlan`
 
 predefined slit functions generators (triangular, gaussian, etc... see :data:`~radis.tools.slit.SLIT_SHAPES`)
 and experimental slit function importer:
@@ -47,6 +50,7 @@ import numpy as np
 from numpy import exp
 from numpy import log as ln
 from numpy import sqrt, trapz
+from scipy.fft import irfft, next_fast_len, rfft
 from scipy.interpolate import splev, splrep
 from scipy.signal import oaconvolve
 
@@ -642,6 +646,59 @@ def convolve_with_slit(
         )
         wunit = waveunit
 
+    # ... Resample if not evenly spaced
+    # TODO: add a criteria based based on FWHM rather than absolute?
+    wstep = abs(np.diff(w)).min()  # spectrum wavelength spacing
+    if assert_evenly_spaced:
+        if not evenly_distributed(w, tolerance=wstep * 1e-3):
+            # TODO: automatically find a resampling factor?
+            warn("Spectrum not evenly spaced. Resampling")
+            w, I = resample_even(w, I, resfactor=2, print_conservation=True)
+            wstep = abs(np.diff(w)).min()  # new spectrum wavelength spacing
+
+    # 2. Interpolate the slit function on the spectrum grid ; 3. Check aspect
+    # --------------
+    I_slit_interp = _get_slit_kernel(
+        w, wstep, w_slit, I_slit, mode, k=k, bplot=bplot, wunit=wunit, verbose=verbose
+    )
+
+    # 4. Convolve!
+    # --------------
+
+    # We actually do not use mode valid in np.convolve,
+    # instead we use mode=same and remove the same boundaries from I and W in remove_boundary()
+    I_conv = oaconvolve(I, I_slit_interp, mode="same") * wstep
+
+    # 5. Remove boundary effects
+    # --------------
+
+    w_conv, I_conv = remove_boundary(
+        w, I_conv, mode, len_I=len(I), len_I_slit_interp=len(I_slit_interp)
+    )
+
+    return w_conv, I_conv
+
+
+def _get_slit_kernel(
+    w, wstep, w_slit, I_slit, mode="valid", k=1, bplot=False, wunit="", verbose=True
+):
+    """Check the slit function ``(w_slit, I_slit)`` against the spectral range
+    of ``w``, and interpolate it on a grid of step ``wstep``.
+
+    Returns
+    -------
+    I_slit_interp: array
+        slit intensity, to be convolved with the spectral arrays on the grid
+        of step ``wstep``
+
+    See Also
+    --------
+    :py:func:`~radis.tools.slit.convolve_with_slit`,
+    :py:class:`~radis.tools.slit.SlitPlan`
+    """
+    # 1. Check input
+    # --------------
+
     # Assert slit function is thin enough
 
     w_range = abs(w[-1] - w[0])
@@ -659,8 +716,8 @@ def convolve_with_slit(
     if w_range < w_slit_range:
         if mode == "valid":
             raise AssertionError(
-                f"Slit function is provided with a spectral range ({w_slit_range:.1f} {waveunit}) larger than "
-                + f"the spectral range of the spectrum ({w_range:.1f} {waveunit}) : the output spectrum will therefore be empty "
+                f"Slit function is provided with a spectral range ({w_slit_range:.1f} {wunit}) larger than "
+                + f"the spectral range of the spectrum ({w_range:.1f} {wunit}) : the output spectrum will therefore be empty "
                 + f"as boundary effects of the convolution are automatically discarded. If you still want to apply the slit "
                 + f"despite potential boundary effects, set `mode='same'`. However, we recommend truncating the input slit function if possible, or compute the spectrum on a larger spectral range. "
                 + f"See radis documentation about convolve_with_slit for more information."
@@ -673,20 +730,9 @@ def convolve_with_slit(
                 + f"slit function. See radis documentation about convolve_with_slit for more information."
             )
 
-    # 2. Interpolate the slit function on the spectrum grid, resample it if not
-    #    evenly spaced
+    # 2. Interpolate the slit function on the spectrum grid
     # --------------
 
-    # ... Resample if not evenly spaced
-    # TODO: add a criteria based based on FWHM rather than absolute?
-    wstep = abs(np.diff(w)).min()  # spectrum wavelength spacing
-    if assert_evenly_spaced:
-        if not evenly_distributed(w, tolerance=wstep * 1e-3):
-            # TODO: automatically find a resampling factor?
-            warn("Spectrum not evenly spaced. Resampling")
-            w, I = resample_even(w, I, resfactor=2, print_conservation=True)
-            wstep = abs(np.diff(w)).min()  # new spectrum wavelength spacing
-
     # ... Check that the slit is not reversed (interpolation requires objects are sorted)
     reverse = w_slit[-1] < w_slit[0]
     if reverse:
@@ -733,27 +779,399 @@ def convolve_with_slit(
     if bplot:
         plot_slit(w_slit, I_slit, wunit="")
 
-    # 4. Convolve!
-    # --------------
+    return I_slit_interp
 
-    # We actually do not use mode valid in np.convolve,
-    # instead we use mode=same and remove the same boundaries from I and W in remove_boundary()
-    I_conv = oaconvolve(I, I_slit_interp, mode="same") * wstep
 
-    # 5. Remove boundary effects
-    # --------------
+class SlitPlan(object):
+    """Slit convolution precomputed for a spectral grid : the slit function is
+    generated (or imported), dilated with the spectrometer dispersion, and
+    interpolated on the grid once, and the Fourier transforms of the
+    resulting kernels are stored. Use it to apply the same slit to many
+    spectra, or to several spectral arrays at once.
 
-    w_conv, I_conv = remove_boundary(
-        w, I_conv, mode, len_I=len(I), len_I_slit_interp=len(I_slit_interp)
-    )
+    With ``slit_dispersion_method='exact'``, the slit is dilated at each point
+    of the grid instead, and stored as a sparse banded matrix (see
+    :py:class:`~radis.tools.slit._DispersionSlitOperator`).
 
-    # reverse back if needed
-    # Todo: add test case for that
-    if reverse:
-        w_slit = w_slit[::-1]
-        I_slit = I_slit[::-1]
+    Parameters
+    ----------
+    w: array
+        spectral grid (in ``waveunit``) of the arrays to convolve. Assumed
+        evenly spaced (as in a :py:class:`~radis.spectrum.spectrum.Spectrum`)
+    slit_function, unit, shape, center_wavespace, norm_by, mode, auto_recenter_crop:
+        slit parameters. See :py:meth:`~radis.spectrum.spectrum.Spectrum.apply_slit`
+    slit_dispersion, slit_dispersion_threshold, slit_dispersion_method:
+        slit dispersion parameters. See :py:meth:`~radis.spectrum.spectrum.Spectrum.apply_slit`
+    waveunit: ``'nm'``, ``'cm-1'``
+        wavespace of ``w``
 
-    return w_conv, I_conv
+    Other Parameters
+    ----------------
+    plot_slit: bool
+        if ``True``, plot slit
+    verbose: bool
+        print stuff
+    *args, **kwargs
+        are forwarded to slit generation or import function.
+        See :py:func:`~radis.tools.slit.get_slit_function`
+
+    Examples
+    --------
+    ::
+
+        plan = SlitPlan(s.get_wavenumber(), 0.5, "nm", waveunit="cm-1")
+        for s in spectra:    # spectra calculated on the same grid
+            s.apply_slit(plan)
+
+        # or directly on arrays (one per row) :
+        w_conv, I_conv = plan.convolve(np.vstack((I1, I2, I3)))
+
+    See Also
+    --------
+    :py:meth:`~radis.spectrum.spectrum.Spectrum.apply_slit`,
+    :py:func:`~radis.tools.slit.convolve_with_slit`
+    """
+
+    def __init__(
+        self,
+        w,
+        slit_function,
+        unit="nm",
+        shape="triangular",
+        center_wavespace=None,
+        norm_by="area",
+        mode="valid",
+        waveunit="nm",
+        slit_dispersion=None,
+        slit_dispersion_threshold=0.01,
+        slit_dispersion_method="slices",
+        auto_recenter_crop=True,
+        plot_slit=False,
+        verbose=True,
+        *args,
+        **kwargs,
+    ):
+        from radis.spectrum.spectrum import _cut_slices
+
+        unit = cast_waveunit(unit)
+        waveunit = cast_waveunit(waveunit)
+        self.w = w
+        self.waveunit = waveunit
+        self.slit_function = slit_function
+        self.unit = unit
+        self.shape = shape
+        self.norm_by = norm_by
+        self.mode = mode
+        self.slit_dispersion = slit_dispersion
+        self.slit_dispersion_threshold = slit_dispersion_threshold
+        self.slit_dispersion_method = slit_dispersion_method
+        if slit_dispersion_method not in ["slices", "exact"]:
+            raise ValueError(
+                "slit_dispersion_method should be 'slices' or 'exact'. "
+                + f"Got {slit_dispersion_method}"
+            )
+
+        # For non evenyly distributed cases we take the minimum wstep among the
+        # spectral range
+        wstep = abs(np.diff(w)).min()
+        assert wstep > 0
+
+        if center_wavespace is None:
+            # center_wavespace should be ~ unit
+            center_wavespace = w[len(w) // 2]  # w ~ waveunit
+            if waveunit == "cm-1" and unit == "nm":
+                center_wavespace = cm2nm(center_wavespace)  # wavenum > wavelen
+            elif waveunit == "nm" and unit == "cm-1":
+                center_wavespace = nm2cm(center_wavespace)  # wavelen > wavenum
+
+        # Get slit once and for all (and convert the slit unit
+        # to the Spectrum `waveunit` if wavespaces are different)
+        # -------
+        wslit0, Islit0 = get_slit_function(
+            slit_function,
+            unit=unit,
+            norm_by=norm_by,
+            shape=shape,
+            center_wavespace=center_wavespace,
+            return_unit=waveunit,
+            wstep=wstep,
+            auto_recenter_crop=auto_recenter_crop,
+            verbose=verbose,
+            plot=plot_slit,
+            *args,
+            **kwargs,
+        )
+        self.wslit = wslit0  #: array: slit function, in ``waveunit``
+        self.Islit = Islit0  #: array: slit function intensity
+
+        # Slit dilated for each point of the spectral range : banded operator
+        self._operator = None
+        if slit_dispersion is not None and slit_dispersion_method == "exact":
+            _get_slit_kernel(w, wstep, wslit0, Islit0, mode, wunit=waveunit)  # check
+            self._operator = _DispersionSlitOperator(
+                w, wslit0, Islit0, slit_dispersion, waveunit, norm_by
+            )
+            self._slices = []
+            self.w_conv = w
+            return
+
+        # Cut the spectral range in slices, if dispersion is specified
+        if slit_dispersion is not None:
+            if waveunit == "nm":
+                w_nm = w
+                wslit0_nm = wslit0
+            else:
+                w_nm = cm2nm(w)
+                wslit0_nm = cm2nm(wslit0)
+            slice_windows = _cut_slices(
+                w_nm, wslit0_nm, slit_dispersion, slit_dispersion_threshold
+            )
+        else:
+            slice_windows = [np.ones_like(w, dtype=bool)]
+
+        # Slit kernel of each slice, and its Fourier transform
+        self._slices = []
+        for slice_window in slice_windows:
+            # Scale slit
+            if slit_dispersion is not None:
+                # apply spectrometer linear dispersion function.
+                # dont forget it has to be added in nm and not cm-1
+                wslit, Islit = offset_dilate_slit_function(
+                    wslit0_nm,
+                    Islit0,
+                    w_nm[slice_window],
+                    slit_dispersion,
+                    threshold=slit_dispersion_threshold,
+                    verbose=verbose,
+                )
+                # Convert it back if needed
+                if waveunit == "cm-1":
+                    wslit = nm2cm(wslit)
+                # We need to renormalize now that Islit has changed
+                wslit, Islit = normalize_slit(wslit, Islit, norm_by=norm_by)
+            else:
+                wslit = wslit0
+                Islit = Islit0  # no need to renormalize it
+
+            index = np.flatnonzero(slice_window)
+            start, stop = index[0], index[-1] + 1  # slices are contiguous
+            w_window = w[start:stop]
+            wstep_window = abs(np.diff(w_window)).min()
+            I_slit_interp = _get_slit_kernel(
+                w_window,
+                wstep_window,
+                wslit,
+                Islit,
+                mode,
+                wunit=waveunit,
+                verbose=verbose,
+            )
+            len_slit = len(I_slit_interp)
+            n_fft = next_fast_len(len(w_window) + len_slit - 1, real=True)
+            slit_ft = rfft(I_slit_interp, n_fft)
+            self._slices.append((start, stop, wstep_window, len_slit, n_fft, slit_ft))
+
+        self.w_conv = np.hstack([w[start:stop] for start, stop, *_ in self._slices])
+        """array: spectral grid of the convolved arrays"""
+
+    def check_grid(self, w, waveunit):
+        """Raise a ``ValueError`` if the plan was not built for the spectral
+        grid ``w`` (in ``waveunit``)"""
+        if (
+            cast_waveunit(waveunit) != self.waveunit
+            or len(w) != len(self.w)
+            or not (w is self.w or np.array_equal(w, self.w))
+        ):
+            raise ValueError(
+                "SlitPlan was built for another spectral grid. Build a new "
+                + "SlitPlan for this Spectrum"
+            )
+
+    def convolve(self, I):
+        """Convolve spectral array(s) ``I`` with the slit.
+
+        Parameters
+        ----------
+        I: array
+            spectral array defined on the grid ``w`` of the plan, or 2D array
+            of several spectral arrays (one per row)
+
+        Returns
+        -------
+        w_conv, I_conv: arrays
+            convolved array(s), with boundary effects removed (see ``mode``).
+            If the slit changes over the spectral range (``slit_dispersion``),
+            the convolved slices of the spectral range are concatenated.
+        """
+        I = np.asarray(I)
+        if I.shape[-1] != len(self.w):
+            raise ValueError(
+                f"Spectral arrays have {I.shape[-1]} points but SlitPlan was built "
+                + f"for {len(self.w)} points"
+            )
+
+        if self._operator is not None:
+            I_conv = self._operator(I)
+            if self.mode == "valid":
+                I_conv[..., ~self._operator.valid] = np.nan
+            return self.w_conv, I_conv
+
+        I_conv_slices = []
+        for start, stop, wstep, len_slit, n_fft, slit_ft in self._slices:
+            # Convolve in Fourier space, and keep the centered part of the
+            # full convolution (as in ``mode="same"``)
+            I_conv = irfft(rfft(I[..., start:stop], n_fft) * slit_ft, n_fft)
+            offset = (len_slit - 1) // 2
+            I_conv = I_conv[..., offset : offset + stop - start] * wstep
+
+            # Remove boundary effects
+            _, I_conv = remove_boundary(
+                self.w[start:stop],
+                I_conv,
+                self.mode,
+                len_I=stop - start,
+                len_I_slit_interp=len_slit,
+            )
+            I_conv_slices.append(I_conv)
+
+        if len(I_conv_slices) == 1:
+            return self.w_conv, I_conv_slices[0]
+        return self.w_conv, np.concatenate(I_conv_slices, axis=-1)
+
+
+class _DispersionSlitOperator(object):
+    """Banded convolution operator of spectral arrays on grid ``w`` with the
+    slit ``(wslit, Islit)`` dilated with the spectrometer dispersion at each
+    point of ``w`` (see :py:func:`~radis.tools.slit.offset_dilate_slit_function`)
+
+    The band of weights is stored as a sparse matrix if it has less than
+    ``max_cached_weights`` elements, else it is recomputed at each call.
+
+    Parameters
+    ----------
+    w: array
+        evenly spaced spectral grid (in ``waveunit``)
+    wslit, Islit: array
+        slit function (in ``waveunit``)
+    slit_dispersion: func of (lambda, in ``'nm'``)
+        spectrometer reciprocal function. Must accept arrays.
+    waveunit: ``'nm'``, ``'cm-1'``
+    norm_by: ``'area'``, ``'max'``
+        the dilated slit of each point is normalized to an area of 1, or to a
+        maximum of 1
+
+    See Also
+    --------
+    :py:class:`~radis.tools.slit.SlitPlan`
+    """
+
+    max_cached_weights = 2e7
+
+    def __init__(self, w, wslit, Islit, slit_dispersion, waveunit, norm_by):
+        from scipy.sparse import dia_matrix
+
+        self.w = w
+        self.waveunit = waveunit
+        self.w_nm = self._to_nm(w)
+
+        # Center of the slit : same as in the convolution of evenly spaced arrays
+        # (see convolve_with_slit)
+        wstep = abs(np.diff(w)).min()
+        wslit_sorted = np.sort(wslit)
+        len_slit = len(np.arange(wslit_sorted[0], wslit_sorted[-1] + wstep, wstep))
+        self.wslit_center = self._to_nm(wslit_sorted[0] + (len_slit - 1) // 2 * wstep)
+
+        # Slit in nm, sorted, without the zeros on the sides
+        wslit_nm = self._to_nm(wslit)
+        order = np.argsort(wslit_nm)
+        wslit_nm, Islit = wslit_nm[order], Islit[order]
+        nonzero = np.flatnonzero(Islit != 0)
+        b = slice(max(nonzero[0] - 1, 0), nonzero[-1] + 2)
+        self.wslit_nm, self.Islit = wslit_nm[b], Islit[b]
+
+        # Dilation of the slit at each point of the spectral range
+        self.dilation = slit_dispersion(self.w_nm) / slit_dispersion(self.wslit_center)
+
+        # Half width of the widest dilated slit, in points of the grid
+        N = len(w)
+        self.dw = w[1] - w[0]
+        half_width = (
+            np.abs(self.wslit_nm[[0, -1]] - self.wslit_center).max() * self.dilation
+        )
+        if waveunit == "cm-1":
+            half_width = dnm2dcm(half_width, self.w_nm)
+        M = int(np.ceil(np.max(half_width) / wstep)) + 2
+        self.offsets = np.arange(-M, M + 1)
+
+        # Normalisation of the slit of each point, and points whose slit
+        # extends outside of the spectral range
+        cached = len(self.offsets) * N <= self.max_cached_weights
+        area = np.zeros(N)
+        outside = np.zeros(N)
+        if cached:
+            data = np.zeros((len(self.offsets), N))  # data[k, i+m] = weights[i]
+        for k, m in enumerate(self.offsets):
+            weights = self._weights(m)
+            area += weights
+            if m >= 0:
+                outside[N - m :] += weights[N - m :]
+                if cached:
+                    data[k, m:] = weights[: N - m]
+            else:
+                outside[:-m] += weights[:-m]
+                if cached:
+                    data[k, : N + m] = weights[-m:]
+        self.valid = outside == 0
+        """array of bool: points whose dilated slit is entirely within the
+        spectral range"""
+
+        if norm_by == "area":
+            if not (area > 0).all():
+                raise ValueError(
+                    "Slit function narrower than the spectral step. Use a finer "
+                    + "spectral grid"
+                )
+            self.scale = 1 / area
+        elif norm_by == "max":
+            self.scale = np.full(N, wstep)
+        else:
+            raise ValueError("Unknown normalization type: {0}".format(norm_by))
+
+        self.matrix = None
+        if cached:
+            self.matrix = dia_matrix((data, self.offsets), shape=(N, N)).tocsr()
+            self.matrix = self.matrix.multiply(self.scale[:, None]).tocsr()
+            self.matrix.eliminate_zeros()
+
+    def _to_nm(self, w):
+        return w if self.waveunit == "nm" else cm2nm(w)
+
+    def _weights(self, m):
+        """Weights of the points ``i+m`` of the spectral range for each point
+        ``i`` : slit interpolated at the corresponding undilated wavelength"""
+        wslit_i = (
+            self.wslit_center
+            - (self._to_nm(self.w + m * self.dw) - self.w_nm) / self.dilation
+        )
+        return np.interp(wslit_i, self.wslit_nm, self.Islit, left=0, right=0)
+
+    def __call__(self, I):
+        """Convolve spectral array(s) ``I`` (one per row)"""
+        if self.matrix is not None:
+            if I.ndim == 1:
+                return self.matrix @ I
+            I_conv = (self.matrix @ I.reshape(-1, I.shape[-1]).T).T
+            return I_conv.reshape(I.shape)
+
+        N = len(self.w)
+        I_conv = np.zeros(I.shape)
+        for m in self.offsets:
+            weights = self._weights(m) * self.scale
+            if m >= 0:
+                I_conv[..., : N - m] += weights[: N - m] * I[..., m:]
+            else:
+                I_conv[..., -m:] += weights[-m:] * I[..., : N + m]
+        return I_conv
 
 
 # %% Slit function methods
@@ -1077,8 +1495,8 @@ def remove_boundary(
         b = int((la) / 2)
         # I_conv = I[a:-b]    # former version : we would change the array size
         # w_conv = w[a:-b]
-        I_conv[:a] = np.nan
-        I_conv[-b:] = np.nan
+        I_conv[..., :a] = np.nan
+        I_conv[..., -b:] = np.nan
         w_conv = w
     elif mode == "same":
         I_conv = I_conv
@@ -1092,8 +1510,8 @@ def remove_boundary(
         # I_conv = I_conv[crop_left:_crop_right]
         # w_conv = w[crop_left:_crop_right]
         # assert len(I_conv) == l - crop_left - crop_right
-        I_conv[:crop_left] = np.nan
-        I_conv[_crop_right:] = np.nan
+        I_conv[..., :crop_left] = np.nan
+        I_conv[..., _crop_right:] = np.nan
     else:
         raise ValueError("Unexpected mode: {0}".format(mode))
 
@@ -259,7 +259,7 @@ def run_setup(with_binary):
             "h5py",  # HDF5
             "hjson",
             "ipython>=7.0.0",
-            "joblib",  # for parallel loading of SpecDatabase
+            "joblib>=1.3",  # for parallel loading of SpecDatabase, and of HITEMP files
             "json-tricks>=3.15.0",  # to deal with non jsonable formats
             "pandas>=1.0.5",
             "plotly>=2.5.1",